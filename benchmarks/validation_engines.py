@@ -0,0 +1,376 @@
+'''
+Reproducible timings of the great_expectations validation engines on synthetic data, compared against stored baselines.
+
+Benchmarks (each repeated --repeat times after --warmup untimed runs; the median is reported and compared):
+
+    metric_graph_build            building the metric dependency graphs of the suite (no metric is computed)
+    graph_validate[pandas|sqlite] Validator.graph_validate of the whole suite
+    metric_resolution[...]        resolving the same column / table metrics with PandasExecutionEngine vs. SqlAlchemyExecutionEngine on SQLite
+    checkpoint_run                end-to-end SimpleCheckpoint.run (validation, storing the result, updating data docs)
+    store_listing                 listing the keys of the validations store, suites and checkpoints
+    data_docs_build               rendering data docs of all stored validation results
+
+Metric caches are cleared before every timed run, so repeated runs do not read metrics computed by the earlier ones. The data is generated
+from --seed, so runs with the same parameters validate the same table. Run from the repository root, against the installed
+great_expectations or one of the vendored trees (to quantify the difference between versions, save a baseline with one and compare with another):
+
+    python benchmarks/validation_engines.py --rows 100000 --columns 20 --save-baseline benchmarks/baselines/ge-0.17.11.json \\
+        --ge-path temp/libs/ge/great_expectations-0.17.11
+    python benchmarks/validation_engines.py --rows 100000 --columns 20 --baseline benchmarks/baselines/ge-0.17.11.json \\
+        --ge-path temp/libs/ge/great_expectations-0.18.3 --fail-on-regression
+'''
+import argparse
+import inspect
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+DATASOURCE_NAMES = {"pandas": "BenchmarkPandasDatasource", "sqlite": "BenchmarkSqliteDatasource"}
+TABLE_NAME = "benchmark_table"
+SUITE_NAME = "BenchmarkSuite"
+CHECKPOINT_NAME = "BenchmarkCheckpoint"
+
+
+def makeData(rows, columns, cardinality, null_fraction, seed):
+
+    '''
+    Synthetic table of integer, float and string (categorical, with `cardinality` distinct values) columns, in turn; every column but the first
+    has about `null_fraction` nulls
+    '''
+
+    rng = np.random.default_rng(seed)
+    data = {}
+    for idx in range(columns):
+        kind = idx % 3
+        if kind == 0:
+            values = pd.Series(rng.integers(0, 1000000, size=rows), dtype="Int64")
+        elif kind == 1:
+            values = pd.Series(rng.normal(100.0, 15.0, size=rows))
+        else:
+            values = pd.Series(np.array([f"value_{i}" for i in range(cardinality)], dtype=object)[rng.integers(0, cardinality, size=rows)])
+        if idx > 0 and null_fraction > 0:
+            values[rng.random(rows) < null_fraction] = None
+        data[f"{['int', 'float', 'str'][kind]}_col_{idx}"] = values
+    return pd.DataFrame(data)
+
+
+def buildContext(root_directory, sqlite_path):
+
+    '''
+    File-backed context (so store listing and data docs measure real file I/O), with a pandas and an SQLite datasource
+    '''
+
+    from great_expectations.data_context import BaseDataContext
+    from great_expectations.data_context.types.base import DataContextConfig, FilesystemStoreBackendDefaults
+
+    context = BaseDataContext(
+        project_config=DataContextConfig(
+            store_backend_defaults=FilesystemStoreBackendDefaults(root_directory=root_directory),
+            anonymous_usage_statistics={"enabled": False},
+            progress_bars={"globally": False},
+        )
+    )
+    runtime_data_connector = {"runtime": {"class_name": "RuntimeDataConnector", "batch_identifiers": ["run_id"]}}
+    context.add_datasource(
+        DATASOURCE_NAMES["pandas"],
+        class_name="Datasource",
+        execution_engine={"class_name": "PandasExecutionEngine"},
+        data_connectors=runtime_data_connector,
+    )
+    context.add_datasource(
+        DATASOURCE_NAMES["sqlite"],
+        class_name="Datasource",
+        execution_engine={"class_name": "SqlAlchemyExecutionEngine", "connection_string": f"sqlite:///{sqlite_path}"},
+        data_connectors=runtime_data_connector,
+    )
+    return context
+
+
+def getBatchRequest(engine, df):
+    from great_expectations.core.batch import RuntimeBatchRequest
+
+    if engine == "pandas":
+        runtime_parameters = {"batch_data": df}
+        batch_spec_passthrough = None
+    else:
+        runtime_parameters = {"query": f"SELECT * FROM {TABLE_NAME}"}
+        batch_spec_passthrough = {"create_temp_table": False}
+    return RuntimeBatchRequest(
+        datasource_name=DATASOURCE_NAMES[engine],
+        data_connector_name="runtime",
+        data_asset_name=TABLE_NAME,
+        runtime_parameters=runtime_parameters,
+        batch_identifiers={"run_id": "benchmark"},
+        batch_spec_passthrough=batch_spec_passthrough,
+    )
+
+
+def addExpectations(validator, df):
+
+    '''
+    Per-column expectations typical of the generated suites (nulls, ranges, aggregates, sets), plus table-level ones
+    '''
+
+    validator.expect_table_row_count_to_be_between(min_value=0, max_value=len(df) * 2)
+    validator.expect_table_columns_to_match_ordered_list(column_list=list(df.columns))
+    for column in df.columns:
+        validator.expect_column_values_to_not_be_null(column, mostly=0.5)
+        if column.startswith("str_"):
+            values = sorted(df[column].dropna().unique())
+            validator.expect_column_values_to_be_in_set(column, value_set=values[:-1])
+            validator.expect_column_unique_value_count_to_be_between(column, min_value=1, max_value=len(values))
+        else:
+            validator.expect_column_values_to_be_between(column, min_value=df[column].min(), max_value=df[column].quantile(0.99))
+            validator.expect_column_mean_to_be_between(column, min_value=df[column].min(), max_value=df[column].max())
+            validator.expect_column_max_to_be_between(column, min_value=df[column].min(), max_value=df[column].max())
+    validator.save_expectation_suite(discard_failed_expectations=False)
+
+
+def getMetricConfigurations(validator, df):
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+    batch_id = validator.active_batch_id
+    metric_configurations = [MetricConfiguration("table.row_count", {"batch_id": batch_id}, None)]
+    for column in df.columns:
+        domain_kwargs = {"batch_id": batch_id, "column": column}
+        metric_configurations.append(MetricConfiguration("column_values.nonnull.unexpected_count", domain_kwargs, None))
+        if column.startswith("str_"):
+            metric_configurations.append(MetricConfiguration("column.distinct_values", domain_kwargs, None))
+        else:
+            for metric_name in ["column.min", "column.max", "column.mean", "column.standard_deviation"]:
+                metric_configurations.append(MetricConfiguration(metric_name, domain_kwargs, None))
+    return metric_configurations
+
+
+def clearMetricCache(execution_engine):
+    # Every supported version keeps resolved metrics of the engine in _metric_cache (a dict, or a no-op one with caching disabled)
+    metric_cache = getattr(execution_engine, "_metric_cache", None)
+    if metric_cache is not None:
+        metric_cache.clear()
+
+
+def buildMetricGraphs(validator, configurations):
+
+    '''
+    Builds the metric dependency graphs of all expectations, without resolving them (the first phase of Validator.graph_validate)
+    '''
+
+    build = validator._generate_metric_dependency_subgraphs_for_each_expectation_configuration
+    kwargs = {
+        "expectation_configurations": configurations,
+        "processed_configurations": [],
+        "catch_exceptions": False,
+        "runtime_configuration": {},
+    }
+    # 0.15 collects the graphs in a list passed in, later versions return them
+    if "expectation_validation_graphs" in inspect.signature(build).parameters:
+        kwargs["expectation_validation_graphs"] = []
+    return build(**kwargs)
+
+
+def timeRuns(fn, repeat, warmup, setup=None):
+    timings = []
+    for run_idx in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        if run_idx >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def runBenchmarks(args, df, root_directory):
+    import sqlalchemy as sa
+
+    sqlite_path = os.path.join(root_directory, "benchmark.sqlite")
+    df.to_sql(TABLE_NAME, sa.create_engine(f"sqlite:///{sqlite_path}"), index=False)
+
+    context = buildContext(os.path.join(root_directory, "gx"), sqlite_path)
+    validators = {}
+    for engine in DATASOURCE_NAMES:
+        validators[engine] = context.get_validator(
+            batch_request=getBatchRequest(engine, df),
+            create_expectation_suite_with_name=SUITE_NAME if engine == "pandas" else f"{SUITE_NAME}_{engine}",
+        )
+    addExpectations(validators["pandas"], df)
+    configurations = validators["pandas"].get_expectation_suite(discard_failed_expectations=False).expectations
+
+    def selected(name):
+        return not args.only or any(pattern in name for pattern in args.only)
+
+    results = {}
+
+    def record(name, fn, setup=None):
+        if selected(name):
+            results[name] = timeRuns(fn, args.repeat, args.warmup, setup)
+            report(name, results[name])
+
+    record("metric_graph_build", lambda: buildMetricGraphs(validators["pandas"], configurations))
+
+    for engine, validator in validators.items():
+        record(
+            f"graph_validate[{engine}]",
+            lambda validator=validator: validator.graph_validate(configurations=configurations),
+            setup=lambda validator=validator: clearMetricCache(validator.execution_engine),
+        )
+
+    for engine, validator in validators.items():
+        metric_configurations = getMetricConfigurations(validator, df)
+        record(
+            f"metric_resolution[{engine}]",
+            lambda validator=validator, metric_configurations=metric_configurations: validator.compute_metrics(metric_configurations),
+            setup=lambda validator=validator: clearMetricCache(validator.execution_engine),
+        )
+
+    context.add_checkpoint(name=CHECKPOINT_NAME, class_name="SimpleCheckpoint")
+    pandas_engine = context.datasources[DATASOURCE_NAMES["pandas"]].execution_engine
+    record(
+        "checkpoint_run",
+        lambda: context.run_checkpoint(
+            checkpoint_name=CHECKPOINT_NAME,
+            validations=[{"batch_request": getBatchRequest("pandas", df), "expectation_suite_name": SUITE_NAME}],
+        ),
+        setup=lambda: clearMetricCache(pandas_engine),
+    )
+
+    # Store listing and data docs are timed over --results stored validation results (the checkpoint runs above count towards them)
+    if selected("store_listing") or selected("data_docs_build"):
+        for _ in range(max(args.results - len(context.validations_store.list_keys()), 0)):
+            context.run_checkpoint(
+                checkpoint_name=CHECKPOINT_NAME,
+                validations=[{"batch_request": getBatchRequest("pandas", df), "expectation_suite_name": SUITE_NAME}],
+            )
+
+    def listStores():
+        context.validations_store.list_keys()
+        context.list_expectation_suite_names()
+        context.list_checkpoints()
+
+    record("store_listing", listStores)
+    record("data_docs_build", context.build_data_docs)
+
+    return results
+
+
+def report(name, timings, baseline_seconds=None, tolerance=None):
+    line = (
+        f"{name:<28} median {statistics.median(timings) * 1000:10.1f}ms  min {min(timings) * 1000:10.1f}ms  "
+        f"mean {statistics.mean(timings) * 1000:10.1f}ms"
+    )
+    if baseline_seconds:
+        ratio = statistics.median(timings) / baseline_seconds
+        status = "REGRESSION" if ratio > 1 + tolerance else ("faster" if ratio < 1 - tolerance else "ok")
+        line += f"  baseline {baseline_seconds * 1000:10.1f}ms  x{ratio:5.2f}  {status}"
+    print(line)
+
+
+def compareWithBaseline(results, baseline, parameters, tolerance):
+
+    '''
+    Prints every benchmark against its baseline median and returns the names of those slower than it by more than `tolerance` (relative)
+    '''
+
+    if baseline["parameters"] != parameters:
+        print(f"WARNING: baseline was recorded with parameters {baseline['parameters']}, not {parameters}; timings are not comparable")
+    tree = f" from {baseline['great_expectations_tree']}" if baseline.get("great_expectations_tree") else ""
+    print(f"\nCompared with baseline of great_expectations {baseline['great_expectations_version']}{tree} ({baseline['platform']}):")
+    regressions = []
+    for name, timings in results.items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            report(name, timings)
+            continue
+        report(name, timings, baseline_result["median_seconds"], tolerance)
+        if statistics.median(timings) > baseline_result["median_seconds"] * (1 + tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def saveBaseline(path, results, parameters, ge_path=None):
+    import great_expectations
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "great_expectations_version": great_expectations.__version__,
+                # Vendored trees may differ from the release they are named after, so the --ge-path directory (e.g. great_expectations-0.17.11) is kept too
+                "great_expectations_tree": os.path.basename(os.path.normpath(ge_path)) if ge_path else None,
+                "platform": f"{platform.platform()}, Python {platform.python_version()}",
+                "parameters": parameters,
+                "results": {
+                    name: {"median_seconds": statistics.median(timings), "min_seconds": min(timings), "timings_seconds": timings}
+                    for name, timings in results.items()
+                },
+            },
+            f,
+            indent=2,
+        )
+    print(f"Baseline saved to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=12)
+    parser.add_argument("--cardinality", type=int, default=50, help="distinct values of the string columns")
+    parser.add_argument("--null-fraction", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--results", type=int, default=20, help="stored validation results, for store listing and data docs")
+    parser.add_argument("--only", nargs="*", help="run only the benchmarks whose names contain one of these")
+    parser.add_argument("--ge-path", help="directory of a vendored great_expectations tree to benchmark instead of the installed one")
+    parser.add_argument("--baseline", help="JSON file of an earlier --save-baseline run to compare with")
+    parser.add_argument("--save-baseline", help="JSON file to store the timings of this run in")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="relative slowdown against the baseline reported as regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 if any benchmark regressed")
+    args = parser.parse_args()
+
+    if args.ge_path:
+        sys.path.insert(0, os.path.abspath(args.ge_path))
+    import great_expectations
+
+    parameters = {
+        "rows": args.rows,
+        "columns": args.columns,
+        "cardinality": args.cardinality,
+        "null_fraction": args.null_fraction,
+        "seed": args.seed,
+        "results": args.results,
+    }
+    print(f"great_expectations {great_expectations.__version__} from {os.path.dirname(great_expectations.__file__)}")
+    print(f"parameters {parameters}, {args.repeat} runs after {args.warmup} warmup run(s)\n")
+
+    df = makeData(args.rows, args.columns, args.cardinality, args.null_fraction, args.seed)
+    root_directory = tempfile.mkdtemp(prefix="gx_benchmark_")
+    try:
+        results = runBenchmarks(args, df, root_directory)
+    finally:
+        shutil.rmtree(root_directory, ignore_errors=True)
+
+    if args.save_baseline:
+        saveBaseline(args.save_baseline, results, parameters, args.ge_path)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compareWithBaseline(results, baseline, parameters, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            if args.fail_on_regression:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
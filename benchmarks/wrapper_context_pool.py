@@ -0,0 +1,72 @@
+'''
+Per-table overhead of the src wrapper, with a new context per table (as before) vs. the warm context of src.ContextPool.
+
+Every table runs the same steps as the usp_generateGEValidationResults sproc: context, batch request, suite, expectations and checkpoint run
+(loading results to Snowflake is left out). Run from the repository root:
+
+    python benchmarks/wrapper_context_pool.py --tables 50 --rows 1000
+'''
+import argparse
+import statistics
+import time
+
+import pandas as pd
+
+from src.BatchRequest import getBatchRequest
+from src.ContextPool import GEContextPool, getPooledContext
+from src.DataValidationContext import GEDataValidationContext
+from src.Expectations import createExpectationSuite, createExpectations
+from src.RunLoadExpectations import runExpectaionValidation
+
+
+def makeTable(rows):
+    return pd.DataFrame(
+        {
+            "ID": range(rows),
+            "CREATED_DATE": pd.Timestamp.now().normalize() - pd.to_timedelta([i % 60 for i in range(rows)], unit="d"),
+        }
+    )
+
+
+def validateTable(context, table_idx, pandasDF):
+    datasourcename = "BenchmarkDataSource"
+    suitename = f"BenchmarkSuite_{table_idx}"
+    batch_request = getBatchRequest(context, datasourcename, pandasDF)
+    createExpectationSuite(context, suitename)
+    createExpectations(context, suitename, batch_request, pandasDF)
+    return runExpectaionValidation(context, "BenchmarkCheckpoint", batch_request, suitename, datasourcename)
+
+
+def timeTables(getContextFn, tables, pandasDF):
+    timings = []
+    for table_idx in range(tables):
+        start = time.perf_counter()
+        validateTable(getContextFn(), table_idx, pandasDF)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label, timings):
+    # The first table of the warm pool pays for building the context once; the median shows the steady state per table
+    print(
+        f"{label:<12} total {sum(timings):8.2f}s  first {timings[0] * 1000:8.1f}ms  "
+        f"median {statistics.median(timings) * 1000:8.1f}ms  mean {statistics.mean(timings) * 1000:8.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    pandasDF = makeTable(args.rows)
+
+    report("new context", timeTables(lambda: GEDataValidationContext("BenchmarkDataSource").context, args.tables, pandasDF))
+
+    GEContextPool.clear()
+    report("pooled", timeTables(lambda: getPooledContext("BenchmarkDataSource"), args.tables, pandasDF))
+
+
+if __name__ == "__main__":
+    main()
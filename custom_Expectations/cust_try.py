@@ -1,63 +1,147 @@
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.execution_engine import PandasExecutionEngine, SqlAlchemyExecutionEngine
-from great_expectations.expectations.expectation import ColumnMapExpectation, InvalidExpectationConfigurationError
+from great_expectations.compatibility.pyspark import functions as F
+from great_expectations.execution_engine import PandasExecutionEngine, SparkDFExecutionEngine, SqlAlchemyExecutionEngine
+from great_expectations.expectations.expectation import ColumnAggregateExpectation, ColumnMapExpectation, InvalidExpectationConfigurationError
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import ColumnAggregateMetricProvider, column_aggregate_partial, column_aggregate_value
 from great_expectations.expectations.metrics.map_metric_provider import ColumnMapMetricProvider, column_condition_partial
 from great_expectations.expectations.registry import register_expectation
 import pandas as pd
-from sqlalchemy import func
+import sqlalchemy as sa
+
+
+def getFreshnessCutoff(freshness_days, tz=None):
+    # Midnight, freshness_days days ago (values at or after it are fresh)
+    return pd.Timestamp.now(tz=tz).normalize() - pd.to_timedelta(freshness_days, unit="d")
+
+
+def getSqlFreshnessCutoff(dialect_name, freshness_days):
+
+    '''
+    Same cutoff as getFreshnessCutoff, computed by the database (CURRENT_DATE minus freshness_days days) in the date arithmetic of its dialect
+    '''
+
+    days = int(freshness_days)
+    if dialect_name == "snowflake":
+        return sa.func.dateadd(sa.literal_column("day"), -days, sa.cast(sa.func.current_date(), sa.DateTime))
+    if dialect_name == "mssql":
+        return sa.func.dateadd(sa.literal_column("day"), -days, sa.cast(sa.cast(sa.func.getdate(), sa.Date), sa.DateTime))
+    if dialect_name in ("postgresql", "redshift"):
+        return sa.func.current_date() - days
+    if dialect_name == "sqlite":
+        return sa.func.date("now", f"-{days} days")
+    if dialect_name == "mysql":
+        return sa.func.date_sub(sa.func.current_date(), sa.literal_column(f"INTERVAL {days} DAY"))
+    if dialect_name == "bigquery":
+        return sa.func.timestamp(sa.func.date_sub(sa.func.current_date(), sa.literal_column(f"INTERVAL {days} DAY")))
+    return sa.func.current_date() - sa.literal_column(f"INTERVAL '{days}' DAY")
+
+
+def validateFreshnessDays(configuration):
+    if "freshness_days" not in configuration.kwargs:
+        raise InvalidExpectationConfigurationError("freshness_days must be provided")
+    freshness_days = configuration.kwargs["freshness_days"]
+    if isinstance(freshness_days, bool) or not isinstance(freshness_days, int) or freshness_days < 0:
+        raise InvalidExpectationConfigurationError("freshness_days must be a non-negative integer")
+
 
 # Define the custom metric for freshness
 class ColumnValuesWithinFreshness(ColumnMapMetricProvider):
     condition_metric_name = "column_values.within_freshness"
     condition_value_keys = ("freshness_days",)
+    # Compared with the current date, so results must never come from the persistent (cross-run) metric cache
+    persistent_cacheable = False
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
         freshness_days = kwargs.get("freshness_days", 30)
-        
-        # Calculate the latest allowed date (30 days before now)
-        latest_date = pd.Timestamp.now().normalize() - pd.to_timedelta(freshness_days, unit="d")
 
-        # Ensure the column and latest_date are both timezone-naive
-        if column.dt.tz is not None:  # If column is timezone-aware, make latest_date timezone-aware
-            latest_date = latest_date.tz_localize(column.dt.tz)
-        else:  # Column is timezone-naive
-            latest_date = latest_date.tz_localize(None)
+        # Comparing against a timezone-aware cutoff only if the column is timezone-aware
+        column = pd.to_datetime(column)
+        return column >= getFreshnessCutoff(freshness_days, tz=column.dt.tz)
 
-        # Debugging: Print the latest_date and the first few dates in the column
-        print(f"Debug - Latest date for comparison: {latest_date}")
-        print(f"Debug - First few dates in the column: {column.head()}")
+    @column_condition_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, _execution_engine, **kwargs):
+        freshness_days = kwargs.get("freshness_days", 30)
+        return column >= getSqlFreshnessCutoff(_execution_engine.dialect_name, freshness_days)
 
-        # Perform the comparison and print the result
-        comparison_result = column >= latest_date
-        print(f"Debug - Comparison result: {comparison_result.head()}")
+    @column_condition_partial(engine=SparkDFExecutionEngine)
+    def _spark(cls, column, **kwargs):
+        freshness_days = kwargs.get("freshness_days", 30)
+        return column >= F.date_sub(F.current_date(), int(freshness_days))
 
-        return comparison_result
+# Cutoff of the freshness of a column, taken from the same clock as the per-row comparison of column_values.within_freshness
+# (CURRENT_DATE of the database for SQL, of the Spark session for Spark); on SQL and Spark it is bundled into the aggregate query of MAX(column)
+class ColumnFreshnessCutoff(ColumnAggregateMetricProvider):
+    metric_name = "column.freshness_cutoff"
+    value_keys = ("freshness_days",)
+    # Depends on the current date, so it must never come from the persistent (cross-run) metric cache
+    persistent_cacheable = False
 
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, freshness_days, **kwargs):
+        return getFreshnessCutoff(freshness_days, tz=getattr(column.dtype, "tz", None))
 
-    @column_condition_partial(engine=SqlAlchemyExecutionEngine)
-    def _sqlalchemy(cls, column, **kwargs):
-        freshness_days = kwargs.get("freshness_days", 30)
-        latest_date = func.now() - func.cast(freshness_days, func.INTERVAL)
-        return column >= latest_date
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, freshness_days, _dialect, **kwargs):
+        return sa.func.max(getSqlFreshnessCutoff(_dialect.name, freshness_days))
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    def _spark(cls, column, freshness_days, **kwargs):
+        return F.max(F.date_sub(F.current_date(), int(freshness_days)))
 
 # Define the custom expectation for freshness
 class ExpectColumnValuesToBeWithinFreshnessExpectation(ColumnMapExpectation):
     map_metric = "column_values.within_freshness"
     success_keys = ("freshness_days",)
 
+    def validate_configuration(self, configuration: ExpectationConfiguration):
+        super().validate_configuration(configuration)
+        validateFreshnessDays(configuration)
+        return True
+
+
+class ExpectColumnMaxToBeWithinFreshness(ColumnAggregateExpectation):
+
+    '''
+    Freshness of a column decided by its latest value only: MAX(column) is computed as one aggregate
+    (bundled into the single aggregate query of SQL and Spark batches), instead of comparing every row against the cutoff.
+    The cutoff (column.freshness_cutoff) is computed by the same engine, so that both freshness expectations agree on "today".
+    '''
+
+    metric_dependencies = ("column.max", "column.freshness_cutoff")
+    success_keys = ("freshness_days",)
+    args_keys = ("column", "freshness_days")
+
     default_kwarg_values = {
-        "freshness_days": 30,
+        "result_format": "BASIC",
+        "include_config": True,
+        "catch_exceptions": False,
     }
 
     def validate_configuration(self, configuration: ExpectationConfiguration):
         super().validate_configuration(configuration)
-        if "freshness_days" not in configuration.kwargs:
-            raise InvalidExpectationConfigurationError("freshness_days must be provided")
+        validateFreshnessDays(configuration)
         return True
 
+    def _validate(self, configuration, metrics, runtime_configuration=None, execution_engine=None):
+        latest_value = metrics["column.max"]
+        if latest_value is None or pd.isnull(latest_value):
+            # No (non-null) values at all is stale
+            return {"success": False, "result": {"observed_value": None}}
+
+        # Databases return DATE, TIMESTAMP or (e.g. sqlite) strings; all of these compare as Timestamps
+        latest_timestamp = pd.Timestamp(latest_value)
+        cutoff = pd.Timestamp(metrics["column.freshness_cutoff"])
+        if cutoff.tz is None and latest_timestamp.tz is not None:
+            cutoff = cutoff.tz_localize(latest_timestamp.tz)
+        return {
+            "success": bool(latest_timestamp >= cutoff),
+            "result": {"observed_value": latest_value},
+        }
+
 # Register the expectation
 register_expectation(ExpectColumnValuesToBeWithinFreshnessExpectation)
+register_expectation(ExpectColumnMaxToBeWithinFreshness)
 
 
 
@@ -6,6 +6,8 @@ from great_expectations.expectations.registry import register_expectation
 
 class ExpectColumnValuesToBeWithinFreshness(ColumnMapMetricProvider):
     condition_metric_name = "column_values.within_freshness"
+    # Compared with the current date, so results must never come from the persistent (cross-run) metric cache
+    persistent_cacheable = False
     
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -4,17 +4,58 @@ from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
 
 
 from src.DataValidationContext import GEDataValidationContext
+from src.ContextPool import GEContextPool
+import pandas as pd
 
 def getBatchRequest(context,datasourcename,pandasDF):
 
     # print(context.getContext())
 
+    # With the pooled context the DS is added once per process; anything other than a DataFrame is validated chunk by chunk
+    pool = GEContextPool.forContext(context)
+    if pool is not None:
+        pool.getValidationContext(datasourcename, chunked=not isinstance(pandasDF, pd.DataFrame))
+
     #Creating the batch request which will be used while running the checkpoint
     batch_request = RuntimeBatchRequest(
                                 datasource_name=datasourcename,
                                     data_connector_name="default_runtime_data_connector_name",
                                     data_asset_name="PandasData",  # This can be anything that identifies this data_asset for you
-                                    runtime_parameters={"batch_data": pandasDF},  # df is your dataframe, you have created above.
+                                    runtime_parameters={"batch_data": pandasDF},  # df is your dataframe, you have created above (or an iterator of DataFrame chunks, with chunked context).
                                     batch_identifiers={"default_identifier_name": f'default_identifier_{datasourcename}'},
                                     )
-    return batch_request
\ No newline at end of file
+    return batch_request
+
+
+def getSqlBatchRequest(context,datasourcename,tablename=None,query=None):
+
+    # Batch request for a SQL datasource (see getSqlDatasourceConfig): the table (or query) is validated in Snowflake, nothing is pulled into pandas
+    batch_spec_passthrough = None
+    if query is None:
+        query = f"SELECT * FROM {tablename}"
+        # LAST_ALTERED of the table versions the batch for the persistent metric cache (if enabled)
+        batch_spec_passthrough = {"data_version_tables": [tablename]}
+
+    batch_request = RuntimeBatchRequest(
+                                datasource_name=datasourcename,
+                                    data_connector_name="default_runtime_data_connector_name",
+                                    data_asset_name=tablename or "SnowflakeQuery",
+                                    runtime_parameters={"query": query},
+                                    batch_identifiers={"default_identifier_name": f'default_identifier_{datasourcename}'},
+                                    batch_spec_passthrough=batch_spec_passthrough,
+                                    )
+    return batch_request
+
+
+def getTableBatchRequest(context,session,tablename,datasourcename,sql_datasourcename=None):
+
+    '''
+    Per table choice of the validation path: with sql_datasourcename the table is validated inside Snowflake (getSqlBatchRequest),
+    without it the table is pulled into a pandas DF (as before) and validated with datasourcename
+    '''
+
+    if sql_datasourcename is not None:
+        return getSqlBatchRequest(context,sql_datasourcename,tablename=tablename)
+
+    pandasDF = session.sql(f"select * from {tablename}").to_pandas()
+    return getBatchRequest(context,datasourcename,pandasDF)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import threading
+
+from src.DataValidationContext import GEDataValidationContext, buildDataContext
+
+
+
+class GEContextPool():
+
+    '''
+    Process level pool holding one warm GE context. The context (with its stores), the datasources and the checkpoints are built once per process and reused for every table validated afterwards,
+    instead of being built (and their configs validated and serialized) again for every table.
+    Expectation suites are kept in memory; every change of a cached suite is written through to the suite store, so that the store stays the source of truth for other processes.
+    '''
+
+    _lock = threading.RLock()
+    _pool = None
+
+    def __init__(self):
+        self.context = buildDataContext()
+        self._validation_contexts = {}  # datasource name -> GEDataValidationContext
+        self._suites = {}  # suite name -> ExpectationSuite
+        self._checkpoints = {}  # checkpoint name -> Checkpoint
+
+    @classmethod
+    def getPool(cls):
+        with cls._lock:
+            if cls._pool is None:
+                cls._pool = cls()
+            return cls._pool
+
+    @classmethod
+    def forContext(cls, context):
+        # Returns the pool owning this context, or None for contexts built outside of the pool (these keep the old, uncached behaviour)
+        pool = cls._pool
+        if pool is not None and pool.context is context:
+            return pool
+        return None
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._pool = None
+
+    def getValidationContext(self, datasourcename, chunked=False, connection_string=None, creator=None):
+        with self._lock:
+            validation_context = self._validation_contexts.get(datasourcename)
+            if validation_context is None or self._needsRebuild(validation_context, chunked, connection_string, creator):
+                validation_context = GEDataValidationContext(
+                    datasourcename, chunked, context=self.context, connection_string=connection_string, creator=creator
+                )
+                self._validation_contexts[datasourcename] = validation_context
+            return validation_context
+
+    @staticmethod
+    def _needsRebuild(validation_context, chunked, connection_string, creator):
+        # The DS is added again (replacing the pooled one of the same name) when it validates the other way (pandas vs SQL) or another database than asked for
+        if validation_context.sql != (connection_string is not None):
+            return True
+        if validation_context.sql:
+            return validation_context.connection_string != connection_string or validation_context.creator is not creator
+        # A chunked engine validates whole DataFrames too, so a chunked DS is never replaced by a plain one
+        return chunked and not validation_context.chunked
+
+    def createExpectationSuite(self, suitename):
+        # Same as context.create_expectation_suite(overwrite_existing=True), but the (empty) suite is kept in memory afterwards
+        with self._lock:
+            suite = self.context.add_or_update_expectation_suite(expectation_suite_name=suitename)
+            self._suites[suitename] = suite
+            return suite
+
+    def getExpectationSuite(self, suitename):
+        with self._lock:
+            suite = self._suites.get(suitename)
+            if suite is None:
+                suite = self.context.get_expectation_suite(expectation_suite_name=suitename)
+                self._suites[suitename] = suite
+            return suite
+
+    def saveExpectationSuite(self, suite):
+        with self._lock:
+            self.context.add_or_update_expectation_suite(expectation_suite=suite)
+            self._suites[suite.expectation_suite_name] = suite
+
+    def getCheckpoint(self, checkpoint_config):
+        with self._lock:
+            checkpoint = self._checkpoints.get(checkpoint_config["name"])
+            if checkpoint is None:
+                checkpoint = self.context.add_or_update_checkpoint(**checkpoint_config)
+                self._checkpoints[checkpoint_config["name"]] = checkpoint
+            return checkpoint
+
+
+def getPooledContext(sf_datasourcename, chunked=False, connection_string=None, creator=None):
+
+    '''
+    Drop-in replacement of GEDataValidationContext(sf_datasourcename, chunked, ...).getContext(), returning the warm context of this process (with the DS added once).
+    Pandas and SQL datasources (see getSqlDatasourceConfig) share the same context, so that the path can be chosen per table.
+    '''
+
+    pool = GEContextPool.getPool()
+    return pool.getValidationContext(sf_datasourcename, chunked, connection_string=connection_string, creator=creator).context
@@ -17,59 +17,196 @@ from great_expectations.data_context import DataContext
 from great_expectations.data_context.types.base import DataContextConfig, DatasourceConfig, FilesystemStoreBackendDefaults
 
 
+# Memory budget for the DataFrames loaded into one (pooled, long-lived) pandas execution engine. Batches of tables validated earlier are spilled
+# to local Arrow files (least recently used first) once it is exceeded, instead of staying in memory until the process exits
+BATCH_DATA_CACHE_MAX_BYTES = int(os.environ.get("GE_BATCH_DATA_CACHE_MAX_BYTES", 2 * 1024 ** 3))
+
+# Opt-in on-disk metric cache shared by runs (e.g. the hourly jobs): metrics of tables whose data has not changed since an earlier run (same DataFrame
+# fingerprint, or same LAST_ALTERED of the Snowflake table) are read from it instead of being computed again. Unset means no cross-run caching
+PERSISTENT_METRIC_CACHE_PATH = os.environ.get("GE_PERSISTENT_METRIC_CACHE_PATH")
+PERSISTENT_METRIC_CACHE_MAX_BYTES = int(os.environ.get("GE_PERSISTENT_METRIC_CACHE_MAX_BYTES", 512 * 1024 ** 2))
+
+# create_temp_table of the SQL execution engines: "auto" reads tables where they are, and copies the result of a batch query into a temp table only
+# when enough metric queries would otherwise re-run it (and EXPLAIN says it is costly); "true"/"false" always/never copy
+SQL_CREATE_TEMP_TABLE = {"true": True, "false": False}.get(os.environ.get("GE_SQL_CREATE_TEMP_TABLE", "auto").lower(), "auto")
+
+# schema_cache_ttl_seconds of the SQL execution engines: column metadata of a Snowflake table is reflected once per process and reused by its batches
+# for this long (the hourly jobs pick up DDL changes on their next run); 0 reflects it again for every batch
+SQL_SCHEMA_CACHE_TTL_SECONDS = float(os.environ.get("GE_SQL_SCHEMA_CACHE_TTL_SECONDS", 3600))
+
+
+# Opt-in multi-process validation of huge pandas batches: costly map conditions (regex, in_set, the freshness partial, ...) and mergeable
+# aggregates are evaluated over row shards by this many worker processes (e.g. 32 on the validation nodes). Batches whose estimated cost (rows of
+# string columns) is below GE_PANDAS_SHARDING_MIN_COST stay single-threaded, since shipping them to the workers costs more than it saves
+PANDAS_SHARDING_PROCESSES = int(os.environ.get("GE_PANDAS_SHARDING_PROCESSES", 0))
+PANDAS_SHARDING_MIN_COST = float(os.environ.get("GE_PANDAS_SHARDING_MIN_COST", 1e6))
+
+
+def getShardingConfig():
+
+    '''
+    sharding_config of the pandas execution engines (None, i.e. single-threaded, unless GE_PANDAS_SHARDING_PROCESSES is at least 2)
+    '''
+
+    if PANDAS_SHARDING_PROCESSES < 2:
+        return None
+    return {
+        "num_processes": PANDAS_SHARDING_PROCESSES,
+        "min_cost": PANDAS_SHARDING_MIN_COST,
+    }
+
+
+def getMetricCacheConfig():
+
+    '''
+    metric_cache_config of the execution engines (empty unless GE_PERSISTENT_METRIC_CACHE_PATH is set)
+    '''
+
+    if not PERSISTENT_METRIC_CACHE_PATH:
+        return {}
+    return {
+        "persistent_cache_path": PERSISTENT_METRIC_CACHE_PATH,
+        "persistent_cache_max_bytes": PERSISTENT_METRIC_CACHE_MAX_BYTES,
+    }
+
+
+
+def buildDataContext():
+
+    # create data context
+    # data_context_config = DataContextConfig( store_backend_defaults=FilesystemStoreBackendDefaults(root_directory=sf_rootdirectory) )
+    # context = BaseDataContext(project_config = data_context_config)
+    
+    data_context_config = DataContextConfig(
+                    datasources={
+                        "dataframe_datasource": DatasourceConfig(
+                            class_name="PandasDatasource",
+                            batch_kwargs_generators={
+                                "subdir_reader": {
+                                    "class_name": "SubdirReaderBatchKwargsGenerator",
+                                    "base_directory": "/tmp/great_expectation/",
+                                }
+                            },
+                        )
+                    },
+                    store_backend_defaults=FilesystemStoreBackendDefaults(root_directory="/tmp/great_expectation"),
+                    )
+               
+    # Creating the GE context here
+    context = BaseDataContext(project_config=data_context_config)
+    return context
+
+
+def getDatasourceConfig(sf_datasourcename,chunked=False):
+
+    '''
+    Providing the datasource details which here is the pandas DF. We define the actual DF in the batch request which is defined after creating the DS
+    '''
+
+    # chunked=True validates batch_data given as iterator of DataFrames (e.g. cursor.fetch_pandas_batches()) one chunk at a time
+    execution_engine_class_name = "ChunkedPandasExecutionEngine" if chunked else "PandasExecutionEngine"
+
+    datasource_config = {
+    "name": sf_datasourcename,
+    "class_name": "Datasource",
+    "module_name": "great_expectations.datasource",
+    "execution_engine": {
+        "module_name": "great_expectations.execution_engine",
+        "class_name": execution_engine_class_name,
+        "batch_data_cache_max_bytes": BATCH_DATA_CACHE_MAX_BYTES,
+        "metric_cache_config": getMetricCacheConfig(),
+        "sharding_config": getShardingConfig(),
+    },
+    "data_connectors": {
+        "default_runtime_data_connector_name": {
+            "class_name": "RuntimeDataConnector",
+            "module_name": "great_expectations.datasource.data_connector",
+            "batch_identifiers": ["default_identifier_name"],
+        },
+    },
+            }
+    return datasource_config
+
+
+def getSqlDatasourceConfig(sf_datasourcename,connection_string,creator=None):
+
+    '''
+    Providing the datasource details for validating Snowflake tables (or queries) inside the warehouse. Metrics are bundled into aggregate queries which Snowflake runs,
+    and only the unexpected-row samples are fetched, instead of the entire table being pulled into a pandas DF.
+    With a creator (see getSnowflakeConnectionCreator) the engine gets its connections from it, and connection_string only selects the dialect (e.g. "snowflake://").
+    '''
+
+    datasource_config = {
+    "name": sf_datasourcename,
+    "class_name": "Datasource",
+    "module_name": "great_expectations.datasource",
+    "execution_engine": {
+        "module_name": "great_expectations.execution_engine",
+        "class_name": "SqlAlchemyExecutionEngine",
+        "connection_string": connection_string,
+        # Tables are read where they are; query batches are copied to a temp table only when that is cheaper (see SQL_CREATE_TEMP_TABLE)
+        "create_temp_table": SQL_CREATE_TEMP_TABLE,
+        "schema_cache_ttl_seconds": SQL_SCHEMA_CACHE_TTL_SECONDS,
+        "metric_cache_config": getMetricCacheConfig(),
+    },
+    "data_connectors": {
+        "default_runtime_data_connector_name": {
+            "class_name": "RuntimeDataConnector",
+            "module_name": "great_expectations.datasource.data_connector",
+            "batch_identifiers": ["default_identifier_name"],
+        },
+    },
+            }
+    if creator is not None:
+        datasource_config["execution_engine"]["creator"] = creator
+    return datasource_config
+
+
+def getSnowflakeConnectionString(sf_conn):
+
+    '''
+    SQLAlchemy (snowflake-sqlalchemy) connection string from the same config dict the Snowpark session is built with (configs_conn.config.snowflake_connect)
+    '''
+
+    from urllib.parse import quote_plus, urlencode
+
+    params = {key: sf_conn[key] for key in ("warehouse", "role") if sf_conn.get(key)}
+    connection_string = f"snowflake://{quote_plus(sf_conn['user'])}:{quote_plus(sf_conn['password'])}@{sf_conn['account']}/{sf_conn['database']}/{sf_conn['schema']}"
+    if params:
+        connection_string = f"{connection_string}?{urlencode(params)}"
+    return connection_string
+
+
+def getSnowflakeConnectionCreator(session):
+
+    '''
+    Connection creator for a SQL DS running on the connection of a Snowpark session (e.g. inside the stored procedure, where no password is at hand);
+    pass it with connection_string "snowflake://". Needs the snowflake-sqlalchemy package (session.add_packages('snowflake-sqlalchemy') for the sproc).
+    '''
+
+    return lambda: session.connection
+
 
 class GEDataValidationContext():
     
-    def __init__(self,sf_datasourcename):
+    def __init__(self,sf_datasourcename,chunked=False,context=None,connection_string=None,creator=None):
         
         self.datasource_name = sf_datasourcename
+        self.chunked = chunked
+        self.connection_string = connection_string
+        self.creator = creator
+        # With a connection string (and optionally a connection creator) the DS validates tables in Snowflake (see getSqlDatasourceConfig), otherwise pandas DFs
+        self.sql = connection_string is not None
 
-        # create data context
-        # data_context_config = DataContextConfig( store_backend_defaults=FilesystemStoreBackendDefaults(root_directory=sf_rootdirectory) )
-        # context = BaseDataContext(project_config = data_context_config)
-        
-        data_context_config = DataContextConfig(
-                        datasources={
-                            "dataframe_datasource": DatasourceConfig(
-                                class_name="PandasDatasource",
-                                batch_kwargs_generators={
-                                    "subdir_reader": {
-                                        "class_name": "SubdirReaderBatchKwargsGenerator",
-                                        "base_directory": "/tmp/great_expectation/",
-                                    }
-                                },
-                            )
-                        },
-                        store_backend_defaults=FilesystemStoreBackendDefaults(root_directory="/tmp/great_expectation"),
-                        )
-                   
-            # Creating the GE context here
-        context = BaseDataContext(project_config=data_context_config)
-        
-        
-        '''
-        Providing the datasource details which here is the pandas DF. We define the actual DF in the batch request which is defined after creating the DS
-        '''
-
-        datasource_config = {
-        "name": self.datasource_name,
-        "class_name": "Datasource",
-        "module_name": "great_expectations.datasource",
-        "execution_engine": {
-            "module_name": "great_expectations.execution_engine",
-            "class_name": "PandasExecutionEngine",
-        },
-        "data_connectors": {
-            "default_runtime_data_connector_name": {
-                "class_name": "RuntimeDataConnector",
-                "module_name": "great_expectations.datasource.data_connector",
-                "batch_identifiers": ["default_identifier_name"],
-            },
-        },
-                }
+        # An existing context (e.g. the warm one of src.ContextPool) only gets the DS added, instead of being built again
+        if context is None:
+            context = buildDataContext()
 
         # Adding the DS to the context
-        context.add_datasource(**datasource_config)
+        if self.sql:
+            context.add_or_update_datasource(**getSqlDatasourceConfig(self.datasource_name,connection_string,creator))
+        else:
+            context.add_or_update_datasource(**getDatasourceConfig(self.datasource_name,chunked))
         
         self.context = context
     
@@ -9,8 +9,9 @@ import glob
 
 from src.DataValidationContext import GEDataValidationContext
 from src.BatchRequest import getBatchRequest 
+from src.ContextPool import GEContextPool
 from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
-from custom_Expectations.cust_try import ExpectColumnValuesToBeWithinFreshnessExpectation
+from custom_Expectations.cust_try import ExpectColumnMaxToBeWithinFreshness
 from great_expectations.expectations.registry import get_expectation_impl
 
 from configs_conn.config import snowflake_connect as snowflake_conn
@@ -18,29 +19,44 @@ from configs_conn.config import snowflake_connect as snowflake_conn
 
 # Register the custom expectation if not already done
 try:
-    get_expectation_impl("expect_column_values_to_be_within_freshness_expectation")
+    get_expectation_impl("expect_column_max_to_be_within_freshness")
 except Exception as e:
     print(f"Custom expectation registration issue: {str(e)}")
 
 
 
 def createExpectationSuite(context,suitename):
+    pool = GEContextPool.forContext(context)
+    if pool is not None:
+        pool.createExpectationSuite(suitename)
+        return
     context.create_expectation_suite(expectation_suite_name=suitename, overwrite_existing=True)
     
     
 def createExpectations(context,suitename,local_batch_request,pandasdataframe):
-    # Creating the validator which takes the batch request and expectation suite name
-    validator = context.get_validator(
-        batch_request=local_batch_request, expectation_suite_name=suitename
-    )
+    # Creating the validator which takes the batch request and expectation suite name (the pooled context hands over its in-memory suite instead of reading the store)
+    pool = GEContextPool.forContext(context)
+    if pool is not None:
+        validator = context.get_validator(
+            batch_request=local_batch_request, expectation_suite=pool.getExpectationSuite(suitename)
+        )
+    else:
+        validator = context.get_validator(
+            batch_request=local_batch_request, expectation_suite_name=suitename
+        )
     
     # Creating new validations based on data knowledge. 
-    # Add additional expectations as per the business needs 
-    # validator.expect_column_values_to_be_in_set("GENDER",["female","male"])
-    # validator.expect_column_min_to_be_between("math score",1,100)
-
-    validator.expect_column_values_to_be_within_freshness_expectation(column="CREATED_DATE", freshness_days=30)
-    # validator.expect_column_mean_to_be_between("VENDOR_ID",2,14)
+    # Add additional expectations as per the business needs (inside the deferred block, so that all of them are validated together, with their metrics bundled into shared queries)
+    with validator.deferred():
+        # validator.expect_column_values_to_be_in_set("GENDER",["female","male"])
+        # validator.expect_column_min_to_be_between("math score",1,100)
+
+        # Freshness decided by MAX(CREATED_DATE) in one aggregate, not by comparing every row with the cutoff
+        validator.expect_column_max_to_be_within_freshness(column="CREATED_DATE", freshness_days=30)
+        # validator.expect_column_mean_to_be_between("VENDOR_ID",2,14)
     
     #Saving the expectation 
-    validator.save_expectation_suite(discard_failed_expectations=False)
\ No newline at end of file
+    if pool is not None:
+        pool.saveExpectationSuite(validator.get_expectation_suite(discard_failed_expectations=False))
+    else:
+        validator.save_expectation_suite(discard_failed_expectations=False)
\ No newline at end of file
@@ -0,0 +1,202 @@
+'''
+Buffered sink for checkpoint results. Results are serialized straight to dicts (no str() / json.loads round trip) and written in batches,
+one append per table for many validated tables, instead of one warehouse write per validated table.
+
+Two tables are written:
+    - run table (one row per checkpoint result, same columns as loadValidationToDB has always written: RunStatus, RunId, RunValidation)
+    - expectation table (one row per expectation result, flattened into typed columns, so that it can be queried without parsing JSON)
+'''
+import threading
+import time
+
+from great_expectations.core.util import convert_to_json_serializable
+
+
+RUN_COLUMNS = ["RunStatus", "RunId", "RunValidation"]
+
+EXPECTATION_COLUMNS = [
+    "RUN_NAME",
+    "RUN_TIME",
+    "SUITE_NAME",
+    "DATA_ASSET_NAME",
+    "BATCH_ID",
+    "EXPECTATION_TYPE",
+    "COLUMN_NAME",
+    "SUCCESS",
+    "ELEMENT_COUNT",
+    "UNEXPECTED_COUNT",
+    "UNEXPECTED_PERCENT",
+    "OBSERVED_VALUE",
+    "KWARGS",
+    "EXCEPTION_MESSAGE",
+]
+
+
+def checkpointResultToRows(validationresult):
+
+    '''
+    Returns (run rows, expectation rows) of one CheckpointResult, as lists of dicts keyed by RUN_COLUMNS / EXPECTATION_COLUMNS
+    '''
+
+    run_id = validationresult.run_id
+    validation_results = validationresult.list_validation_results()
+
+    run_rows = [
+        {
+            "RunStatus": validationresult.success,
+            "RunId": run_id.to_json_dict(),
+            "RunValidation": [suite_result.to_json_dict() for suite_result in validation_results],
+        }
+    ]
+
+    expectation_rows = []
+    for suite_result in validation_results:
+        meta = suite_result.meta or {}
+        batch_definition = meta.get("active_batch_definition") or {}
+        for expectation_result in suite_result.results:
+            expectation_config = expectation_result.expectation_config
+            kwargs = expectation_config.kwargs if expectation_config else {}
+            result = expectation_result.result or {}
+            exception_info = expectation_result.exception_info or {}
+            expectation_rows.append(
+                {
+                    "RUN_NAME": run_id.run_name,
+                    "RUN_TIME": run_id.run_time,
+                    "SUITE_NAME": meta.get("expectation_suite_name"),
+                    "DATA_ASSET_NAME": batch_definition.get("data_asset_name"),
+                    "BATCH_ID": kwargs.get("batch_id"),
+                    "EXPECTATION_TYPE": expectation_config.expectation_type if expectation_config else None,
+                    "COLUMN_NAME": kwargs.get("column"),
+                    "SUCCESS": expectation_result.success,
+                    "ELEMENT_COUNT": result.get("element_count"),
+                    "UNEXPECTED_COUNT": result.get("unexpected_count"),
+                    "UNEXPECTED_PERCENT": result.get("unexpected_percent"),
+                    "OBSERVED_VALUE": convert_to_json_serializable(result.get("observed_value")),
+                    "KWARGS": convert_to_json_serializable(kwargs),
+                    "EXCEPTION_MESSAGE": exception_info.get("exception_message") if exception_info.get("raised_exception") else None,
+                }
+            )
+    return run_rows, expectation_rows
+
+
+class SnowparkResultWriter():
+
+    '''
+    Appends rows to Snowflake tables through a Snowpark session (one create_dataframe / saveAsTable per table and flush)
+    '''
+
+    def __init__(self, session):
+        self.session = session
+
+    def write(self, tablename, columns, rows):
+        from snowflake.snowpark.types import BooleanType, DoubleType, LongType, StringType, StructField, StructType, TimestampType, VariantType
+
+        column_types = {
+            "RunStatus": BooleanType(),
+            "RunId": VariantType(),
+            "RunValidation": VariantType(),
+            "RUN_TIME": TimestampType(),
+            "SUCCESS": BooleanType(),
+            "ELEMENT_COUNT": LongType(),
+            "UNEXPECTED_COUNT": LongType(),
+            "UNEXPECTED_PERCENT": DoubleType(),
+            "OBSERVED_VALUE": VariantType(),
+            "KWARGS": VariantType(),
+        }
+        schema = StructType([StructField(column, column_types.get(column, StringType())) for column in columns])
+        df = self.session.create_dataframe([[row[column] for column in columns] for row in rows], schema)
+        df.write.mode('append').saveAsTable(tablename)
+
+
+class ValidationResultSink():
+
+    '''
+    Collects CheckpointResults and writes them in batches, once max_rows rows (run and expectation rows) are buffered or max_seconds have passed since the oldest buffered result.
+    The time limit is kept by a background timer too, so buffered results are written even when no further result is added.
+    Call close() (or use the sink as context manager) at the end of the job, so that the last batch is written.
+    Without expectationtablename only the run table is written.
+    '''
+
+    def __init__(self, writer, runtablename, expectationtablename=None, max_rows=10000, max_seconds=60.0):
+        self.writer = writer
+        self.runtablename = runtablename
+        self.expectationtablename = expectationtablename
+        self.max_rows = max_rows
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+        self._run_rows = []
+        self._expectation_rows = []
+        self._oldest = None
+        self._timer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, validationresult):
+        run_rows, expectation_rows = checkpointResultToRows(validationresult)
+        with self._lock:
+            self._run_rows.extend(run_rows)
+            if self.expectationtablename is not None:
+                self._expectation_rows.extend(expectation_rows)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._scheduleFlush()
+            due = (
+                len(self._run_rows) + len(self._expectation_rows) >= self.max_rows
+                or time.monotonic() - self._oldest >= self.max_seconds
+            )
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            run_rows, self._run_rows = self._run_rows, []
+            expectation_rows, self._expectation_rows = self._expectation_rows, []
+            run_rows_written = []
+            self._oldest = None
+            self._cancelFlush()
+            try:
+                if run_rows:
+                    self.writer.write(self.runtablename, RUN_COLUMNS, run_rows)
+                    run_rows_written, run_rows = run_rows, []
+                if expectation_rows:
+                    self.writer.write(self.expectationtablename, EXPECTATION_COLUMNS, expectation_rows)
+            except Exception:
+                # Rows not written yet stay buffered for the next flush
+                self._run_rows[:0] = run_rows
+                self._expectation_rows[:0] = expectation_rows
+                self._oldest = time.monotonic()
+                self._scheduleFlush()
+                raise
+        if run_rows_written:
+            print(f" Loaded {len(run_rows_written)} Validation Results...")
+
+    def close(self):
+        '''
+        Writes the last batch and stops the flush timer (results added afterwards start a new batch)
+        '''
+        self.flush()
+
+    def _scheduleFlush(self):
+        # Called with the lock held, once the first row of a batch is buffered
+        if self._timer is not None:
+            return
+        self._timer = threading.Timer(self.max_seconds, self._flushOnTimer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancelFlush(self):
+        # Called with the lock held
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flushOnTimer(self):
+        try:
+            self.flush()
+        except Exception as e:
+            # The rows stay buffered and flush() has scheduled the next attempt
+            print(f" Failed to load buffered Validation Results: {e}")
@@ -1,13 +1,23 @@
-import json
+import os
+import time
 from configs_conn.config import snowflake_connect as snowflake_conn
 from src.DataValidationContext import GEDataValidationContext
 from src.BatchRequest import getBatchRequest 
+from src.ContextPool import GEContextPool
+from src.ResultSink import SnowparkResultWriter, ValidationResultSink
         
 
 from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
 from snowflake.snowpark.types import IntegerType, StringType, StructField,VariantType,StructType,BooleanType
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
 from great_expectations.checkpoint import Checkpoint
+from great_expectations.core.tracing import tracing
+
+
+# Opt-in tracing of checkpoint runs: when set, every run writes a Chrome trace (open in chrome://tracing or Perfetto) of graph building, metric
+# resolution passes, metric functions, SQL queries, batch loads and actions to this directory and prints the slowest spans
+TRACE_DIR = os.environ.get("GE_TRACE_DIR")
+TRACE_SUMMARY_ROWS = int(os.environ.get("GE_TRACE_SUMMARY_ROWS", 20))
 
 
 def runExpectaionValidation(context,checkpointname,batchrequest,expectationsuitename,datasourcename):
@@ -19,27 +29,82 @@ def runExpectaionValidation(context,checkpointname,batchrequest,expectationsuite
                 "class_name": "SimpleCheckpoint",
                 "run_name_template": "%Y%m%d-%H%M%S-my-pandas_run-name-template",
             }
-            
-    context.add_checkpoint(**checkpoint_config)
-
-    # run expectation_suite against Pandas dataframe
-    validation_result = context.run_checkpoint(
-            checkpoint_name = my_checkpoint_name,
-            validations=[
+    validations=[
                 {
                     "batch_request": batchrequest,
                     "expectation_suite_name": expectationsuitename,
                 }
-            ],
-        )
+            ]
+
+    # The pooled context adds the checkpoint once per process and runs the same Checkpoint object afterwards
+    pool = GEContextPool.forContext(context)
+    if pool is not None:
+        try:
+            return runTraced(my_checkpoint_name, lambda: pool.getCheckpoint(checkpoint_config).run(validations=validations))
+        finally:
+            dropTemporaryTables(context)
+            
+    context.add_checkpoint(**checkpoint_config)
+
+    # run expectation_suite against Pandas dataframe
+    try:
+        validation_result = runTraced(my_checkpoint_name, lambda: context.run_checkpoint(
+                checkpoint_name = my_checkpoint_name,
+                validations=validations,
+            ))
+    finally:
+        dropTemporaryTables(context)
     return validation_result
+
+def dropTemporaryTables(context):
+
+    '''
+    Drops the temp tables the SQL execution engines of the context materialized batch queries into during the run (create_temp_table "auto"),
+    so that they do not pile up in long-lived (pooled) Snowflake sessions
+    '''
+
+    for datasource in context.datasources.values():
+        execution_engine = getattr(datasource, "execution_engine", None)
+        if hasattr(execution_engine, "drop_temporary_tables"):
+            execution_engine.drop_temporary_tables()
+
+def runTraced(checkpointname,run):
+
+    '''
+    Calls run(); if GE_TRACE_DIR is set, the call is traced and the trace is written to <GE_TRACE_DIR>/<checkpointname>-<timestamp>.json
+    '''
+
+    if not TRACE_DIR:
+        return run()
+
+    os.makedirs(TRACE_DIR, exist_ok=True)
+    trace_path = os.path.join(TRACE_DIR, f"{checkpointname}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    with tracing(chrome_trace_path=trace_path) as tracer:
+        result = run()
+    print(f"Trace of checkpoint {checkpointname} written to {trace_path}")
+    print(tracer.summary().head(TRACE_SUMMARY_ROWS).to_string(index=False))
+    return result
     
-def loadValidationToDB(session,validationresult,tablename):
-            
-    # Defining the schema, creating the Snowpark DF and and writing the validation results to a table.
-    schema = StructType([StructField("RunStatus", BooleanType()),StructField("RunId", VariantType()), StructField("RunValidation", VariantType())])
+def createResultSink(session,tablename,expectationtablename=None):
+
+    '''
+    Returns the ValidationResultSink of a job: create it once per job (e.g. once per stored procedure call, around all validated tables),
+    pass it to every loadValidationToDB call and close it at the end of the job (or use it as context manager), so that results are appended in batches
+    '''
+
+    return ValidationResultSink(SnowparkResultWriter(session),tablename,expectationtablename)
+
+def loadValidationToDB(session,validationresult,tablename,sink=None):
+
+    '''
+    Writes a checkpoint result to tablename. With the job's sink (see createResultSink) the result is only buffered, and the sink appends many results
+    to the table at once when it flushes; without it, the result is written right away in a write of its own
+    '''
 
-    df=session.create_dataframe([[validationresult.success, json.loads(str(validationresult.run_id)),json.loads(str(validationresult.list_validation_results()))]], schema)
+    if sink is not None:
+        sink.add(validationresult)
+        return
 
-    df.write.mode('append').saveAsTable(tablename)
-    print(f" Loaded Validation Results...")
\ No newline at end of file
+    # Writing the validation result to the table right away (RunStatus, RunId and RunValidation columns)
+    with createResultSink(session,tablename) as result_sink:
+        result_sink.add(validationresult)
\ No newline at end of file
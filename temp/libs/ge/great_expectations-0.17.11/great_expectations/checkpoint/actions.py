@@ -9,14 +9,17 @@ import json
 import logging
 from typing import TYPE_CHECKING, Dict, Optional, Union
 
-import requests
-
 try:
     import pypd
 except ImportError:
     pypd = None
 
 
+from great_expectations.checkpoint.notification_dispatcher import (
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    dispatch_notification,
+    get_pooled_session,
+)
 from great_expectations.checkpoint.util import (
     send_email,
     send_microsoft_teams_notifications,
@@ -37,6 +40,8 @@ from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.exceptions import ClassInstantiationError, DataContextError
 
 if TYPE_CHECKING:
+    import requests
+
     from great_expectations.core.expectation_validation_result import (
         ExpectationSuiteValidationResult,
     )
@@ -196,6 +201,8 @@ class SlackNotificationAction(ValidationAction):
         notify_on: Specifies validation status that triggers notification. One of "all", "failure", "success".
         notify_with: List of DataDocs site names to display  in Slack messages. Defaults to all.
         show_failed_expectations: Shows a list of failed expectation types.
+        asynchronous: If True, the notification is queued for background delivery (and "slack_notification_result" is "queued");
+            Checkpoint run waits (for bounded time) for delivery of notifications it queued.
     """
 
     def __init__(  # noqa: PLR0913
@@ -208,6 +215,7 @@ class SlackNotificationAction(ValidationAction):
         notify_on: str = "all",
         notify_with: Optional[list[str]] = None,
         show_failed_expectations: bool = False,
+        asynchronous: bool = False,
     ) -> None:
         """Create a SlackNotificationAction"""
         super().__init__(data_context)
@@ -235,6 +243,7 @@ class SlackNotificationAction(ValidationAction):
         self.notify_on = notify_on
         self.notify_with = notify_with
         self.show_failed_expectations = show_failed_expectations
+        self.asynchronous = asynchronous
 
     def _run(  # type: ignore[override] # signature does not match parent  # noqa: PLR0913
         self,
@@ -313,7 +322,9 @@ class SlackNotificationAction(ValidationAction):
             )
 
             # this will actually send the POST request to the Slack webapp server
-            slack_notif_result = send_slack_notification(
+            slack_notif_result = dispatch_notification(
+                self.asynchronous,
+                send_slack_notification,
                 query,
                 slack_webhook=self.slack_webhook,
                 slack_token=self.slack_token,
@@ -451,14 +462,17 @@ class MicrosoftTeamsNotificationAction(ValidationAction):
             ```
         microsoft_teams_webhook: Incoming Microsoft Teams webhook to which to send notifications.
         notify_on: Specifies validation status that triggers notification. One of "all", "failure", "success".
+        asynchronous: If True, the notification is queued for background delivery (and "microsoft_teams_notification_result" is "queued");
+            Checkpoint run waits (for bounded time) for delivery of notifications it queued.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         data_context: AbstractDataContext,
         renderer: dict,
         microsoft_teams_webhook: str,
         notify_on: str = "all",
+        asynchronous: bool = False,
     ) -> None:
         """Create a MicrosoftTeamsNotificationAction"""
         super().__init__(data_context)
@@ -479,6 +493,7 @@ class MicrosoftTeamsNotificationAction(ValidationAction):
             microsoft_teams_webhook
         ), "No Microsoft teams webhook found in action config."
         self.notify_on = notify_on
+        self.asynchronous = asynchronous
 
     def _run(  # type: ignore[override] # signature does not match parent  # noqa: PLR0913
         self,
@@ -529,8 +544,11 @@ class MicrosoftTeamsNotificationAction(ValidationAction):
                 data_docs_pages,
             )
             # this will actually sent the POST request to the Microsoft Teams webapp server
-            teams_notif_result = send_microsoft_teams_notifications(
-                query, microsoft_teams_webhook=self.teams_webhook
+            teams_notif_result = dispatch_notification(
+                self.asynchronous,
+                send_microsoft_teams_notifications,
+                query,
+                microsoft_teams_webhook=self.teams_webhook,
             )
             return {"microsoft_teams_notification_result": teams_notif_result}
         else:
@@ -560,6 +578,8 @@ class OpsgenieAlertAction(ValidationAction):
         priority: Specifies the priority of the alert (P1 - P5).
         notify_on: Specifies validation status that triggers notification. One of "all", "failure", "success".
         tags: Tags to include in the alert
+        asynchronous: If True, the notification is queued for background delivery (and "opsgenie_alert_result" is "queued");
+            Checkpoint run waits (for bounded time) for delivery of notifications it queued.
     """
 
     def __init__(  # noqa: PLR0913
@@ -571,6 +591,7 @@ class OpsgenieAlertAction(ValidationAction):
         priority: str = "P3",
         notify_on: str = "failure",
         tags: Optional[list[str]] = None,
+        asynchronous: bool = False,
     ) -> None:
         """Create an OpsgenieAlertAction"""
         super().__init__(data_context)
@@ -593,6 +614,7 @@ class OpsgenieAlertAction(ValidationAction):
         self.priority = priority
         self.notify_on = notify_on
         self.tags = tags
+        self.asynchronous = asynchronous
 
     def _run(  # type: ignore[override] # signature does not match parent  # noqa: PLR0913
         self,
@@ -644,8 +666,12 @@ class OpsgenieAlertAction(ValidationAction):
 
             description = self.renderer.render(validation_result_suite, None, None)
 
-            alert_result = send_opsgenie_alert(
-                description, expectation_suite_name, settings
+            alert_result = dispatch_notification(
+                self.asynchronous,
+                send_opsgenie_alert,
+                description,
+                expectation_suite_name,
+                settings,
             )
 
             return {"opsgenie_alert_result": alert_result}
@@ -700,6 +726,8 @@ class EmailAction(ValidationAction):
         use_ssl: Optional. Use of SSL to send the email (using either TLS or SSL is highly recommended).
         notify_on: "Specifies validation status that triggers notification. One of "all", "failure", "success".
         notify_with: Optional list of DataDocs site names to display  in Slack messages. Defaults to all.
+        asynchronous: If True, the notification is queued for background delivery (and "email_result" is "queued");
+            Checkpoint run waits (for bounded time) for delivery of notifications it queued.
     """
 
     def __init__(  # noqa: PLR0913
@@ -716,6 +744,7 @@ class EmailAction(ValidationAction):
         use_ssl: Optional[bool] = None,
         notify_on: str = "all",
         notify_with: Optional[list[str]] = None,
+        asynchronous: bool = False,
     ) -> None:
         """Create an EmailAction"""
         super().__init__(data_context)
@@ -755,6 +784,7 @@ class EmailAction(ValidationAction):
         ), "No email addresses to send the email to in action config."
         self.notify_on = notify_on
         self.notify_with = notify_with
+        self.asynchronous = asynchronous
 
     def _run(  # type: ignore[override] # signature does not match parent  # noqa: PLR0913
         self,
@@ -802,7 +832,9 @@ class EmailAction(ValidationAction):
                 validation_result_suite, data_docs_pages, self.notify_with
             )
             # this will actually send the email
-            email_result = send_email(
+            email_result = dispatch_notification(
+                self.asynchronous,
+                send_email,
                 title,
                 html,
                 self.smtp_address,
@@ -1262,9 +1294,19 @@ class SNSNotificationAction(ValidationAction):
 
 
 class APINotificationAction(ValidationAction):
-    def __init__(self, data_context, url) -> None:
+    """Sends validation results (as JSON payload) to API endpoint with POST request.
+
+    Args:
+        data_context: Data Context that is used by the Action.
+        url: URL of API endpoint, to which to send validation results.
+        asynchronous: If True, the request is queued for background delivery (and the result of the action is "queued");
+            Checkpoint run waits (for bounded time) for delivery of notifications it queued.
+    """
+
+    def __init__(self, data_context, url, asynchronous: bool = False) -> None:
         super().__init__(data_context)
         self.url = url
+        self.asynchronous = asynchronous
 
     def _run(  # type: ignore[override] # signature does not match parent  # noqa: PLR0913
         self,
@@ -1300,6 +1342,9 @@ class APINotificationAction(ValidationAction):
             data_asset_name, suite_name, validation_results_serializable
         )
 
+        return dispatch_notification(self.asynchronous, self._post_results, payload)
+
+    def _post_results(self, payload) -> str:
         response = self.send_results(payload)
         return (
             f"Successfully Posted results to API, status code - {response.status_code}"
@@ -1308,7 +1353,12 @@ class APINotificationAction(ValidationAction):
     def send_results(self, payload) -> requests.Response:
         try:
             headers = {"Content-Type": "application/json"}
-            return requests.post(self.url, headers=headers, data=payload)
+            return get_pooled_session().post(
+                self.url,
+                headers=headers,
+                data=payload,
+                timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+            )
         except Exception as e:
             print(f"Exception when sending data to API - {e}")
             raise e
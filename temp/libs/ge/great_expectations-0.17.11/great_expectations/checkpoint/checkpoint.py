@@ -20,6 +20,7 @@ from great_expectations.checkpoint.configurator import (
     ActionDicts,
     SimpleCheckpointConfigurator,
 )
+from great_expectations.checkpoint.notification_dispatcher import notification_scope
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
 from great_expectations.checkpoint.util import (
     convert_validations_list_to_checkpoint_validation_configs,
@@ -291,8 +292,9 @@ class BaseCheckpoint(ConfigPeer):
         # Use AsyncExecutor to speed up I/O bound validations by running them in parallel with multithreading (if
         # concurrency is enabled in the data context configuration) -- please see the below arguments used to initialize
         # AsyncExecutor and the corresponding AsyncExecutor docstring for more details on when multiple threads are
-        # used.
-        with AsyncExecutor(
+        # used.  Notification actions, configured with "asynchronous: true", are awaited (for bounded time) on exit from
+        # "notification_scope()", which records only notifications dispatched by this run.
+        with notification_scope(), AsyncExecutor(
             self.data_context.concurrency, max_workers=len(validations)
         ) as async_executor:
             # noinspection PyUnresolvedReferences
@@ -476,6 +478,10 @@ class BaseCheckpoint(ConfigPeer):
                     self._data_context._determine_if_expectation_validation_result_include_rendered_content()
                 )
 
+            runtime_configuration_validation = substituted_validation_dict.get(
+                "runtime_configuration", {}
+            )
+
             validator: Validator = self._validator or self.data_context.get_validator(
                 batch_request=batch_request,
                 expectation_suite_name=expectation_suite_name
@@ -485,14 +491,14 @@ class BaseCheckpoint(ConfigPeer):
                     expectation_suite_ge_cloud_id if self._using_cloud_context else None
                 ),
                 include_rendered_content=include_rendered_content,
+                project_columns=bool(
+                    runtime_configuration_validation.get("project_columns", False)
+                ),
             )
 
             action_list: Sequence[ActionDict] | None = substituted_validation_dict.get(
                 "action_list"
             )
-            runtime_configuration_validation = substituted_validation_dict.get(
-                "runtime_configuration", {}
-            )
             catch_exceptions_validation = runtime_configuration_validation.get(
                 "catch_exceptions"
             )
@@ -0,0 +1,294 @@
+"""
+Background dispatch of Checkpoint notifications (Slack, Microsoft Teams, Opsgenie, webhooks, etc.).
+
+Notification actions configured with "asynchronous: true" hand their "send" calls to the process-wide
+"NotificationDispatcher" instead of executing them inline; the dispatcher delivers them from a small pool of worker
+threads, each of which holds a keep-alive "requests.Session" (with bounded request timeout, and with retry and
+exponential backoff only where the request is known not to have been processed).  "Checkpoint.run()" opens
+"notification_scope()", which waits (for bounded time) for the notifications dispatched during that run only, so that
+they are delivered (or have failed) by the time its result is available.
+"""
+from __future__ import annotations
+
+import atexit
+import concurrent.futures
+import contextlib
+import contextvars
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Iterator, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS: int = 4
+DEFAULT_MAX_QUEUE_SIZE: int = 256
+DEFAULT_MAX_RETRIES: int = 3
+DEFAULT_BACKOFF_FACTOR: float = 0.5
+# Statuses, with which server signals that request was not processed (so that retrying "POST" cannot duplicate it).
+RETRYABLE_STATUS_CODES: Tuple[int, ...] = (429, 503)
+# Seconds to wait for connection and for response of each notification request.
+DEFAULT_REQUEST_TIMEOUT_SECONDS: float = 30.0
+# Seconds, for which "notification_scope()" (e.g., end of Checkpoint run) waits for its notifications to be delivered.
+DEFAULT_FLUSH_TIMEOUT_SECONDS: float = 60.0
+
+NOTIFICATION_QUEUED_RESULT: str = "queued"
+
+_thread_local_sessions = threading.local()
+
+# Futures of notifications dispatched asynchronously within current "notification_scope()" (None outside of scope).
+_scope_futures: contextvars.ContextVar[Optional[List[Future]]] = contextvars.ContextVar(
+    "gx_notification_scope_futures", default=None
+)
+
+
+def get_pooled_session() -> requests.Session:
+    """
+    Returns keep-alive "requests.Session" owned by calling thread (created on first use), whose HTTP(S) adapters retry
+    failed connections and "429"/"503" responses with exponential backoff.  Reusing it across notifications avoids
+    paying for new TCP and TLS handshakes with every message.
+    """
+    session: Optional[requests.Session] = getattr(
+        _thread_local_sessions, "session", None
+    )
+    if session is None:
+        session = _build_pooled_session()
+        _thread_local_sessions.session = session
+
+    return session
+
+
+def _build_pooled_session(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+) -> requests.Session:
+    # Notifications are sent with "POST", which is not idempotent: connection errors (request never reached server) and
+    # "429"/"503" responses (request was refused) are retried, but read errors (request may have been processed) are not.
+    retry_kwargs: dict = {
+        "total": max_retries,
+        "connect": max_retries,
+        "read": 0,
+        "status": max_retries,
+        "backoff_factor": backoff_factor,
+        "status_forcelist": RETRYABLE_STATUS_CODES,
+        "respect_retry_after_header": True,
+        "raise_on_status": False,
+    }
+    try:
+        retry = Retry(allowed_methods=frozenset(["POST"]), **retry_kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        retry = Retry(method_whitelist=frozenset(["POST"]), **retry_kwargs)
+
+    adapter = HTTPAdapter(max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def wait_for_notifications(
+    futures: List[Future], timeout: Optional[float] = DEFAULT_FLUSH_TIMEOUT_SECONDS
+) -> List[Any]:
+    """
+    Waits (at most "timeout" seconds in total) until notifications of "futures" are delivered and returns their results
+    (in submission order).
+
+    Failed notifications are logged and notifications still undelivered at timeout are left running; their results are
+    None.
+    """
+    done: Set[Future]
+    done, _ = concurrent.futures.wait(futures, timeout=timeout)
+
+    results: List[Any] = []
+    future: Future
+    for future in futures:
+        if future not in done:
+            logger.warning(
+                f"Notification was not delivered within {timeout} seconds; it continues in background."
+            )
+            results.append(None)
+            continue
+
+        try:
+            results.append(future.result())
+        except Exception as e:
+            logger.error(f"Notification could not be delivered: {str(e)}")
+            results.append(None)
+
+    return results
+
+
+class NotificationDispatcher:
+    """
+    Delivers notifications in background worker threads.
+
+    Submitted "send" calls are placed on bounded queue (so that a burst of notifications applies backpressure instead
+    of growing memory without limit) and executed by "max_workers" daemon threads; "flush()" blocks until every call
+    submitted so far has completed (or until timeout).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    ) -> None:
+        """
+        Args:
+            max_workers: Number of worker threads (each holding its own keep-alive session).
+            max_queue_size: Maximum number of notifications waiting for delivery; "submit()" blocks when it is reached.
+        """
+        self._max_workers = max_workers
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+    @property
+    def num_pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def submit(
+        self, send_notification_fn: Callable[..., Any], *args, **kwargs
+    ) -> Future:
+        """
+        Queues call of "send_notification_fn(*args, **kwargs)" for delivery and returns its "Future" (which is also
+        recorded in current "notification_scope()", if any).
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit notifications to closed dispatcher.")
+
+            self._start_workers()
+            future: Future = Future()
+            self._pending.add(future)
+
+        future.add_done_callback(self._discard_pending)
+
+        scope_futures: Optional[List[Future]] = _scope_futures.get()
+        if scope_futures is not None:
+            scope_futures.append(future)
+
+        self._queue.put((future, send_notification_fn, args, kwargs))
+        return future
+
+    def flush(
+        self, timeout: Optional[float] = DEFAULT_FLUSH_TIMEOUT_SECONDS
+    ) -> List[Any]:
+        """
+        Waits (at most "timeout" seconds) until all notifications submitted so far are delivered and returns their
+        results.
+
+        Failed (or still undelivered) notifications are logged; their results are None.
+        """
+        with self._lock:
+            futures: List[Future] = list(self._pending)
+
+        return wait_for_notifications(futures=futures, timeout=timeout)
+
+    def close(self, timeout: Optional[float] = DEFAULT_FLUSH_TIMEOUT_SECONDS) -> None:
+        """Flushes pending notifications and stops worker threads."""
+        with self._lock:
+            if self._closed:
+                return
+
+            self._closed = True
+
+        self.flush(timeout=timeout)
+        for _ in self._workers:
+            self._queue.put(None)
+
+        worker: threading.Thread
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+
+        self._workers = []
+
+    def _discard_pending(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def _start_workers(self) -> None:
+        # Workers are started lazily (under lock), so that importing this module costs no threads.
+        idx: int
+        for idx in range(len(self._workers), self._max_workers):
+            worker = threading.Thread(
+                target=self._work,
+                name=f"gx-notification-dispatcher-{idx}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            item: Optional[tuple] = self._queue.get()
+            try:
+                if item is None:
+                    return
+
+                future, send_notification_fn, args, kwargs = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    future.set_result(send_notification_fn(*args, **kwargs))
+                except Exception as e:
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+
+_dispatcher: Optional[NotificationDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Returns process-wide "NotificationDispatcher" (created on first use and flushed at interpreter exit)."""
+    global _dispatcher  # noqa: PLW0603
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = NotificationDispatcher()
+            atexit.register(_dispatcher.close)
+
+        return _dispatcher
+
+
+@contextlib.contextmanager
+def notification_scope(
+    timeout: Optional[float] = DEFAULT_FLUSH_TIMEOUT_SECONDS,
+) -> Iterator[List[Future]]:
+    """
+    Records notifications dispatched asynchronously within "with" block (e.g., one Checkpoint run, including threads of
+    its "AsyncExecutor") and, on exit, waits (at most "timeout" seconds) for their delivery.  Notifications of other
+    scopes (e.g., of concurrently running Checkpoints) are not waited for.
+    """
+    futures: List[Future] = []
+    token: contextvars.Token = _scope_futures.set(futures)
+    try:
+        yield futures
+    finally:
+        _scope_futures.reset(token)
+        if futures:
+            wait_for_notifications(futures=futures, timeout=timeout)
+
+
+def dispatch_notification(
+    asynchronous: bool, send_notification_fn: Callable[..., Any], *args, **kwargs
+) -> Any:
+    """
+    Calls "send_notification_fn(*args, **kwargs)" inline (returning its result) or, if "asynchronous" is True, queues
+    it on process-wide "NotificationDispatcher" (returning "queued" marker).
+    """
+    if asynchronous:
+        get_notification_dispatcher().submit(send_notification_fn, *args, **kwargs)
+        return NOTIFICATION_QUEUED_RESULT
+
+    return send_notification_fn(*args, **kwargs)
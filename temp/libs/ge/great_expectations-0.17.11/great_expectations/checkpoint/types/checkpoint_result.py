@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import copy
 import json
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Optional, Tuple
 
 from marshmallow import Schema, fields, post_load, pre_dump
 
@@ -373,6 +373,22 @@ class CheckpointResult(SerializableDictDot):
             serializable_dict.pop("validation_result_url")
         return serializable_dict
 
+    def iter_json_dict_items(self) -> Iterator[Tuple[str, Any]]:
+        """Yields items of "to_json_dict()" output, leaving validation results in "run_results" to be streamed.
+
+        Used by "iter_json_serializable_chunks()" (and "write_json_serializable()") to write CheckpointResult to file
+        without building its complete JSON-serializable representation in memory.
+        """
+        if self.validation_result_url:
+            yield "validation_result_url", self.validation_result_url
+
+        yield "run_id", self.run_id.to_json_dict()
+        yield "run_results", recursively_convert_to_json_serializable(
+            test_obj=self.run_results
+        )
+        yield "checkpoint_config", self.checkpoint_config.to_json_dict()
+        yield "success", convert_to_json_serializable(data=self.success)
+
     def __getstate__(self):
         """
         In order for object to be picklable, its "__dict__" or or result of calling "__getstate__()" must be picklable.
@@ -12,6 +12,11 @@ from typing import List, Optional, Union
 import requests
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.checkpoint.notification_dispatcher import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    get_pooled_session,
+)
 from great_expectations.compatibility import aws
 from great_expectations.core.batch import (
     BatchRequest,
@@ -30,7 +35,7 @@ logger = logging.getLogger(__name__)
 def send_slack_notification(
     query, slack_webhook=None, slack_channel=None, slack_token=None
 ):
-    session = requests.Session()
+    session = get_pooled_session()
     url = slack_webhook
     headers = None
 
@@ -45,13 +50,20 @@ def send_slack_notification(
         headers = {"Authorization": f"Bearer {slack_token}"}
 
     try:
-        response = session.post(url=url, headers=headers, json=query)
+        response = session.post(
+            url=url,
+            headers=headers,
+            json=query,
+            timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        )
         if slack_webhook:
             ok_status = response.text == "ok"
         else:
             ok_status = response.json()["ok"]
     except requests.ConnectionError:
-        logger.warning(f"Failed to connect to Slack webhook after {10} retries.")
+        logger.warning(
+            f"Failed to connect to Slack webhook after {DEFAULT_MAX_RETRIES} retries."
+        )
     except Exception as e:
         logger.error(str(e))
     else:
@@ -81,10 +93,12 @@ def send_opsgenie_alert(query, suite_name, settings):
         "tags": settings["tags"],
     }
 
-    session = requests.Session()
+    session = get_pooled_session()
 
     try:
-        response = session.post(url, headers=headers, json=payload)
+        response = session.post(
+            url, headers=headers, json=payload, timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS
+        )
     except requests.ConnectionError:
         logger.warning("Failed to connect to Opsgenie")
     except Exception as e:
@@ -101,11 +115,17 @@ def send_opsgenie_alert(query, suite_name, settings):
 
 
 def send_microsoft_teams_notifications(query, microsoft_teams_webhook):
-    session = requests.Session()
+    session = get_pooled_session()
     try:
-        response = session.post(url=microsoft_teams_webhook, json=query)
+        response = session.post(
+            url=microsoft_teams_webhook,
+            json=query,
+            timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        )
     except requests.ConnectionError:
-        logger.warning("Failed to connect to Microsoft Teams webhook after 10 retries.")
+        logger.warning(
+            f"Failed to connect to Microsoft Teams webhook after {DEFAULT_MAX_RETRIES} retries."
+        )
 
     except Exception as e:
         logger.error(str(e))
@@ -121,12 +141,14 @@ def send_microsoft_teams_notifications(query, microsoft_teams_webhook):
 
 
 def send_webhook_notifications(query, webhook, target_platform):
-    session = requests.Session()
+    session = get_pooled_session()
     try:
-        response = session.post(url=webhook, json=query)
+        response = session.post(
+            url=webhook, json=query, timeout=DEFAULT_REQUEST_TIMEOUT_SECONDS
+        )
     except requests.ConnectionError:
         logger.warning(
-            f"Failed to connect to {target_platform} webhook after 10 retries."
+            f"Failed to connect to {target_platform} webhook after {DEFAULT_MAX_RETRIES} retries."
         )
     except Exception as e:
         logger.error(str(e))
@@ -10,3 +10,8 @@ try:
     import pyarrow
 except ImportError:
     pyarrow = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import feather
+except ImportError:
+    feather = PYARROW_NOT_IMPORTED
@@ -5,6 +5,7 @@ for both when concurrency is enabled and disabled.
 WARNING: This module is experimental.
 """
 
+import contextvars
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from typing import Generic, Optional, TypeVar
@@ -98,8 +99,11 @@ class AsyncExecutor(AbstractContextManager):
         on how the AsyncExecutor instance was initialized.
         """
         if self._execute_concurrently:
+            # Context variables of submitting thread (e.g., Checkpoint "notification_scope()") are visible to "fn".
             return AsyncResult(
-                future=self._thread_pool_executor.submit(fn, *args, **kwargs)  # type: ignore[union-attr]
+                future=self._thread_pool_executor.submit(  # type: ignore[union-attr]
+                    contextvars.copy_context().run, fn, *args, **kwargs
+                )
             )
         else:
             return AsyncResult(value=fn(*args, **kwargs))
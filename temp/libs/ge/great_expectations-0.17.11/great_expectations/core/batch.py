@@ -679,6 +679,8 @@ class BatchMarkers(BatchKwargs):
 class BatchData:
     def __init__(self, execution_engine) -> None:
         self._execution_engine = execution_engine
+        # Identifies data across runs (see "ExecutionEngine.get_batch_data_version()"); None if unknown.
+        self.data_version: str | None = None
 
     @property
     def execution_engine(self):
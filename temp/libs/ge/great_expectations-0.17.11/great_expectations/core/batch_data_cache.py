@@ -0,0 +1,178 @@
+"""
+Memory-bounded cache of loaded "BatchData" objects (used by "BatchManager").
+
+Without byte budget, cache holds all loaded "BatchData" objects in memory (for the lifetime of ExecutionEngine), as
+plain dictionary would.  With byte budget, whenever in-memory size of cached "PandasBatchData" objects exceeds it,
+least-recently-used ones (other than that of active Batch and that just loaded or accessed) are spilled to local Arrow
+files (see "PandasBatchData.spill()") and memory-mapped back when accessed again.  Other "BatchData" types (e.g., Spark
+DataFrames or SQL selectables) do not hold data in process memory and are never spilled.
+"""
+from __future__ import annotations
+
+import logging
+import tempfile
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Iterator, List, MutableMapping, Optional
+
+if TYPE_CHECKING:
+    from great_expectations.core.batch import BatchDataUnion
+
+logger = logging.getLogger(__name__)
+
+
+class BatchDataCache(MutableMapping[str, "BatchDataUnion"]):
+    """
+    Least-recently-used ordered mapping from Batch ID to "BatchData", spilling inactive "PandasBatchData" objects to
+    disk, once their total in-memory size exceeds "max_bytes" (None means no limit).
+
+    Args:
+        max_bytes: Budget for in-memory size of cached "PandasBatchData" objects (None means no limit).
+        spill_directory: Directory for spill files (default: new temporary directory, created when first needed).
+        get_active_batch_data_id: Callable returning ID of active "BatchData", which is never spilled.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        spill_directory: Optional[str] = None,
+        get_active_batch_data_id: Optional[Callable[[], Optional[str]]] = None,
+    ) -> None:
+        self._entries: OrderedDict[str, BatchDataUnion] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._spill_directory = spill_directory
+        self._get_active_batch_data_id = get_active_batch_data_id
+        self._spill_count: int = 0
+        self._warned_over_budget: bool = False
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]) -> None:
+        self._max_bytes = value
+        self._enforce_budget()
+
+    @property
+    def spill_directory(self) -> Optional[str]:
+        return self._spill_directory
+
+    @spill_directory.setter
+    def spill_directory(self, value: Optional[str]) -> None:
+        self._spill_directory = value
+
+    @property
+    def spill_count(self) -> int:
+        """Number of times "BatchData" objects were released from memory."""
+        return self._spill_count
+
+    @property
+    def memory_usage_bytes(self) -> int:
+        """In-memory size of cached "PandasBatchData" objects."""
+        return sum(
+            _get_memory_usage_bytes(batch_data=batch_data)
+            for batch_data in self._entries.values()
+        )
+
+    def spill(self, batch_id: str) -> bool:
+        """
+        Releases "PandasBatchData" of given Batch from memory (see "PandasBatchData.spill()"), unless it is active one.
+
+        Returns:
+            True if "BatchData" is not held in memory (since it was spilled now or before), False otherwise.
+        """
+        batch_data: BatchDataUnion = self._entries[batch_id]
+        if getattr(batch_data, "is_spilled", False):
+            return True
+
+        if _get_memory_usage_bytes(batch_data=batch_data) == 0:
+            return False
+
+        if (
+            self._get_active_batch_data_id is not None
+            and batch_id == self._get_active_batch_data_id()
+        ):
+            return False
+
+        if not batch_data.spill(spill_directory=self._get_spill_directory()):  # type: ignore[union-attr] # has memory usage
+            return False
+
+        self._spill_count += 1
+        return True
+
+    def __getitem__(self, batch_id: str) -> BatchDataUnion:
+        batch_data: BatchDataUnion = self._entries[batch_id]
+        self._entries.move_to_end(batch_id)
+        self._enforce_budget(accessed_batch_id=batch_id)
+        return batch_data
+
+    def __setitem__(self, batch_id: str, batch_data: BatchDataUnion) -> None:
+        self._entries[batch_id] = batch_data
+        self._entries.move_to_end(batch_id)
+        self._enforce_budget(accessed_batch_id=batch_id)
+
+    def __delitem__(self, batch_id: str) -> None:
+        del self._entries[batch_id]
+
+    def __contains__(self, batch_id: object) -> bool:
+        return batch_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._entries.keys())})"
+
+    def _enforce_budget(self, accessed_batch_id: Optional[str] = None) -> None:
+        if self._max_bytes is None:
+            return
+
+        memory_usage_bytes: int = self.memory_usage_bytes
+        if memory_usage_bytes <= self._max_bytes:
+            return
+
+        protected_batch_ids: List[Optional[str]] = [accessed_batch_id]
+        if self._get_active_batch_data_id is not None:
+            protected_batch_ids.append(self._get_active_batch_data_id())
+
+        batch_id: str
+        batch_data: BatchDataUnion
+        batch_data_memory_usage_bytes: int
+        for batch_id, batch_data in list(self._entries.items()):
+            if memory_usage_bytes <= self._max_bytes:
+                return
+
+            batch_data_memory_usage_bytes = _get_memory_usage_bytes(
+                batch_data=batch_data
+            )
+            if batch_id in protected_batch_ids or batch_data_memory_usage_bytes == 0:
+                continue
+
+            if batch_data.spill(spill_directory=self._get_spill_directory()):  # type: ignore[union-attr] # has memory usage
+                memory_usage_bytes -= batch_data_memory_usage_bytes
+                self._spill_count += 1
+                logger.debug(
+                    f"Spilled BatchData {batch_id} ({batch_data_memory_usage_bytes} bytes) to disk."
+                )
+
+        if memory_usage_bytes > self._max_bytes and not self._warned_over_budget:
+            self._warned_over_budget = True
+            logger.warning(
+                f"""Loaded BatchData occupy {memory_usage_bytes} bytes (more than {self._max_bytes} bytes budget), \
+because they are in use or cannot be spilled to disk (e.g., "pyarrow" is not installed).
+"""
+            )
+
+    def _get_spill_directory(self) -> str:
+        if self._spill_directory is None:
+            self._spill_directory = tempfile.mkdtemp(prefix="gx_batch_data_spill_")
+
+        return self._spill_directory
+
+
+def _get_memory_usage_bytes(batch_data: BatchDataUnion) -> int:
+    # Only "PandasBatchData" (and subclasses) hold data in process memory.
+    return getattr(batch_data, "memory_usage_bytes", 0)
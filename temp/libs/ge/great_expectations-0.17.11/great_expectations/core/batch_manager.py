@@ -11,6 +11,7 @@ from great_expectations.core.batch import (
     BatchMarkers,
     _get_fluent_batch_class,
 )
+from great_expectations.core.batch_data_cache import BatchDataCache
 
 if TYPE_CHECKING:
     from great_expectations.core.batch import AnyBatch
@@ -38,14 +39,16 @@ class BatchManager:
         self._active_batch_data_id: Optional[str] = None
 
         self._batch_cache: Dict[str, AnyBatch] = OrderedDict()
-        self._batch_data_cache: Dict[str, BatchDataUnion] = {}
+        self._batch_data_cache: BatchDataCache = BatchDataCache(
+            get_active_batch_data_id=lambda: self._active_batch_data_id
+        )
 
         if batch_list:
             self.load_batch_list(batch_list=batch_list)
 
     @property
-    def batch_data_cache(self) -> Dict[str, BatchDataUnion]:
-        """Dictionary of loaded BatchData objects."""
+    def batch_data_cache(self) -> BatchDataCache:
+        """Dictionary of loaded BatchData objects (see "BatchDataCache" for memory budget and spilling)."""
         return self._batch_data_cache
 
     @property
@@ -14,6 +14,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -62,6 +63,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Table-level Expectations, whose outcomes do not depend on which columns of "Batch" data are loaded.
+COLUMN_PROJECTION_NEUTRAL_TABLE_EXPECTATION_TYPES: Set[str] = {
+    "expect_table_row_count_to_be_between",
+    "expect_table_row_count_to_equal",
+}
+
 
 @public_api
 @deprecated_argument(argument_name="data_asset_type", version="0.14.0")
@@ -816,6 +823,66 @@ class ExpectationSuite(SerializableDictDot):
             indent=2,
         )
 
+    def get_column_projection(self) -> Optional[List[str]]:
+        """Return names of columns referenced by Expectations of this suite (in order of first reference).
+
+        Loading only these columns of "Batch" data suffices to validate this suite.  Returns None (meaning "all columns
+        are needed") if suite contains Expectations, which may depend on other columns: table-level Expectations (other
+        than row count ones, e.g., "expect_table_columns_to_match_set"), Expectations with "row_condition", and
+        Expectations, whose column names are given as evaluation parameters.
+        """
+        column_names: List[str] = []
+
+        expectation_configuration: ExpectationConfiguration
+        referenced_column_names: Optional[list]
+        column_name: Any
+        for expectation_configuration in self.expectations:
+            referenced_column_names = self._get_referenced_column_names(
+                expectation_configuration=expectation_configuration
+            )
+            if referenced_column_names is None:
+                return None
+
+            for column_name in referenced_column_names:
+                if not isinstance(column_name, str):
+                    return None
+
+                if column_name not in column_names:
+                    column_names.append(column_name)
+
+        return column_names or None
+
+    @staticmethod
+    def _get_referenced_column_names(
+        expectation_configuration: ExpectationConfiguration,
+    ) -> Optional[list]:
+        """Return column names (as configured) referenced by Expectation, or None if it may depend on other columns."""
+        kwargs: dict = expectation_configuration.kwargs
+
+        domain_type: Optional[MetricDomainTypes]
+        try:
+            domain_type = expectation_configuration.get_domain_type()
+        except ValueError:
+            domain_type = None
+
+        referenced_column_names: Optional[list] = None
+        if kwargs.get("row_condition") or domain_type is None:
+            pass
+        elif domain_type == MetricDomainTypes.TABLE:
+            if (
+                expectation_configuration.expectation_type
+                in COLUMN_PROJECTION_NEUTRAL_TABLE_EXPECTATION_TYPES
+            ):
+                referenced_column_names = []
+        elif domain_type == MetricDomainTypes.COLUMN:
+            referenced_column_names = [kwargs["column"]]
+        elif domain_type == MetricDomainTypes.COLUMN_PAIR:
+            referenced_column_names = [kwargs["column_A"], kwargs["column_B"]]
+        elif isinstance(kwargs["column_list"], (list, tuple)):
+            referenced_column_names = list(kwargs["column_list"])
+
+        return referenced_column_names
+
     def get_grouped_and_ordered_expectations_by_domain_type(
         self,
     ) -> Dict[str, List[ExpectationConfiguration]]:
@@ -3,8 +3,8 @@ from __future__ import annotations
 import datetime
 import json
 import logging
-from copy import deepcopy
-from typing import TYPE_CHECKING, List, Optional
+from copy import copy, deepcopy
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple
 
 from marshmallow import Schema, fields, post_dump, post_load, pre_dump
 from typing_extensions import TypedDict
@@ -565,6 +565,24 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
         myself = expectationSuiteValidationResultSchema.dump(myself)
         return myself
 
+    def iter_json_dict_items(self) -> Iterator[Tuple[str, Any]]:
+        """Yields items of "to_json_dict()" output, with "results" serialized lazily (one at a time).
+
+        Used by "iter_json_serializable_chunks()" (and "write_json_serializable()") to stream large validation results
+        without deep-copying and serializing all of them up front.
+        """
+        header: ExpectationSuiteValidationResult = copy(self)
+        header.results = []
+
+        key: str
+        value: Any
+        result: ExpectationValidationResult
+        for key, value in header.to_json_dict().items():
+            if key == "results":
+                yield key, (result.to_json_dict() for result in self.results)
+            else:
+                yield key, value
+
     def get_metric(self, metric_name, **kwargs):
         metric_name_parts = metric_name.split(".")
         metric_kwargs_id = get_metric_kwargs_id(metric_kwargs=kwargs)
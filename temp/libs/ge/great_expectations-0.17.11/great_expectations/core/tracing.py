@@ -0,0 +1,306 @@
+"""
+Tracing of metric resolution pipeline (graph building, resolution passes, metric functions, bundled queries, Batch
+loading, and Checkpoint actions).
+
+Tracing is disabled by default; while it is, "trace_span()" returns shared no-op span, so that instrumented code pays
+only for one function call.  Enable it with "tracing()" context manager (or "enable_tracing()"), which collects spans
+in "Tracer"; spans can then be exported as Chrome trace (JSON file, viewable in "chrome://tracing" or Perfetto), or
+summarized in-process as table (total, mean, and maximum duration per span name).  Additional consumers (e.g., metrics
+exporters) can be attached to "Tracer" with "add_hook()"; hooks are called with every finished span.
+
+Example:
+    with tracing(chrome_trace_path="checkpoint_trace.json") as tracer:
+        checkpoint.run()
+
+    print(tracer.summary().head(20))
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """Timed operation: "start_ns" is "time.perf_counter_ns()" value; "attributes" describe operation."""
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int = 0
+    thread_id: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.duration_ns / 1e9
+
+
+class _RecordingSpan:
+    # Context manager, which times block and hands resulting "Span" to "Tracer".
+
+    __slots__ = ("_tracer", "_span")
+
+    is_recording: bool = True
+
+    def __init__(
+        self, tracer: Tracer, name: str, category: str, attributes: Dict[str, Any]
+    ) -> None:
+        self._tracer = tracer
+        self._span = Span(
+            name=name,
+            category=category,
+            start_ns=0,
+            thread_id=threading.get_ident(),
+            attributes=attributes,
+        )
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self._span.attributes.update(attributes)
+
+    def __enter__(self) -> Self:
+        self._span.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._span.duration_ns = time.perf_counter_ns() - self._span.start_ns
+        if exc_type is not None:
+            self._span.attributes["error"] = exc_type.__name__
+
+        self._tracer.record(span=self._span)
+
+
+class _NoOpSpan:
+    # Shared span, returned while tracing is disabled.
+
+    __slots__ = ()
+
+    is_recording: bool = False
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+
+class Tracer:
+    """Collects finished spans (from all threads) and passes each of them to registered hooks."""
+
+    def __init__(self) -> None:
+        self._spans: List[Span] = []
+        self._hooks: List[Callable[[Span], None]] = []
+        self._lock = threading.Lock()
+        self._origin_ns: int = time.perf_counter_ns()
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def add_hook(self, hook: Callable[[Span], None]) -> None:
+        """Registers callable, which is called with every finished span (in thread, in which span finished)."""
+        self._hooks.append(hook)
+
+    def span(self, name: str, category: str, **attributes: Any) -> _RecordingSpan:
+        return _RecordingSpan(
+            tracer=self, name=name, category=category, attributes=attributes
+        )
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+        hook: Callable[[Span], None]
+        for hook in self._hooks:
+            try:
+                hook(span)
+            except Exception as e:
+                logger.warning(f"Tracing hook {hook} failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def to_chrome_trace(self) -> dict:
+        """Returns spans in Chrome trace event format (complete events, with times in microseconds)."""
+        pid: int = os.getpid()
+        span: Span
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start_ns - self._origin_ns) / 1e3,
+                    "dur": span.duration_ns / 1e3,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {
+                        key: _to_trace_argument(value)
+                        for key, value in span.attributes.items()
+                    },
+                }
+                for span in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def export_chrome_trace(self, path: str) -> None:
+        """Writes spans to JSON file in Chrome trace event format."""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Returns one row per span (with one column per attribute)."""
+        span: Span
+        return pd.DataFrame(
+            [
+                {
+                    "category": span.category,
+                    "name": span.name,
+                    "start_seconds": (span.start_ns - self._origin_ns) / 1e9,
+                    "duration_seconds": span.duration_seconds,
+                    "thread_id": span.thread_id,
+                    **span.attributes,
+                }
+                for span in self.spans
+            ],
+            columns=None if self._spans else _SPAN_COLUMNS,
+        )
+
+    def summary(self, by: Sequence[str] = ("category", "name")) -> pd.DataFrame:
+        """
+        Returns count, total, mean, and maximum duration (in seconds) of spans, grouped by given columns (see
+        "to_dataframe()"), in descending order of total duration.  Durations of nested spans are included in those of
+        enclosing spans.
+        """
+        df: pd.DataFrame = self.to_dataframe()
+        if df.empty:
+            return pd.DataFrame(
+                columns=[*by, "count", "total_seconds", "mean_seconds", "max_seconds"]
+            )
+
+        return (
+            df.groupby(list(by), dropna=False)["duration_seconds"]
+            .agg(
+                count="count",
+                total_seconds="sum",
+                mean_seconds="mean",
+                max_seconds="max",
+            )
+            .sort_values("total_seconds", ascending=False)
+            .reset_index()
+        )
+
+
+_SPAN_COLUMNS: List[str] = [
+    "category",
+    "name",
+    "start_seconds",
+    "duration_seconds",
+    "thread_id",
+]
+
+_active_tracer: Optional[Tracer] = None
+
+
+def get_active_tracer() -> Optional[Tracer]:
+    return _active_tracer
+
+
+def enable_tracing(tracer: Optional[Tracer] = None) -> Tracer:
+    """Makes given (or new) "Tracer" active for all threads, and returns it."""
+    global _active_tracer  # noqa: PLW0603
+    _active_tracer = tracer or Tracer()
+    return _active_tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """Deactivates tracing, and returns "Tracer", which was active (if any)."""
+    global _active_tracer  # noqa: PLW0603
+    tracer: Optional[Tracer] = _active_tracer
+    _active_tracer = None
+    return tracer
+
+
+@contextlib.contextmanager
+def tracing(
+    chrome_trace_path: Optional[str] = None, tracer: Optional[Tracer] = None
+) -> Iterator[Tracer]:
+    """
+    Enables tracing within block (restoring previously active "Tracer" afterwards); if "chrome_trace_path" is given,
+    spans are written to it in Chrome trace format, when block exits.
+    """
+    global _active_tracer  # noqa: PLW0603
+    previous_tracer: Optional[Tracer] = _active_tracer
+    active_tracer: Tracer = enable_tracing(tracer=tracer)
+    try:
+        yield active_tracer
+    finally:
+        _active_tracer = previous_tracer
+        if chrome_trace_path:
+            active_tracer.export_chrome_trace(path=chrome_trace_path)
+
+
+def trace_span(
+    name: str, category: str, **attributes: Any
+) -> _RecordingSpan | _NoOpSpan:
+    """
+    Returns context manager, timing enclosed block as span (if tracing is enabled).
+
+    Attributes, which are costly to compute (e.g., hash of SQL text), should be added with "set_attributes()" only if
+    "is_recording" property of returned span is True.
+    """
+    tracer: Optional[Tracer] = _active_tracer
+    if tracer is None:
+        return _NO_OP_SPAN
+
+    return tracer.span(name, category, **attributes)
+
+
+def _to_trace_argument(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    return str(value)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import copy
 import datetime
 import decimal
+import functools
+import io
 import json
 import logging
 import os
@@ -11,11 +13,15 @@ import re
 import sys
 import uuid
 from collections import OrderedDict
+from types import GeneratorType
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     MutableMapping,
@@ -246,14 +252,18 @@ def convert_to_json_serializable(
     ...
 
 
-@public_api  # - complexity 32
-def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
+@public_api
+def convert_to_json_serializable(
     data: JSONConvertable,
 ) -> JSONValues:
     """Converts an object to one that is JSON-serializable.
 
     WARNING, data may be converted in place.
 
+    Conversion is dispatched on type of "data": the most frequent types (Python primitives and containers, NumPy
+    arrays and scalars, Pandas "Index" and "Series", and Great Expectations serializable objects) have dedicated
+    handlers (NumPy and Pandas objects of numeric dtype are converted as whole arrays, rather than element by element).
+
     Args:
         data: an object to convert to a JSON-serializable object
 
@@ -272,6 +282,14 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     Raises:
         TypeError: A non-JSON-serializable field was found.
     """
+    return _convert_to_json_serializable(data)
+
+
+@functools.singledispatch
+def _convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912 # - complexity 32
+    data: JSONConvertable,
+) -> JSONValues:
+    # Handles types, for which no dedicated handler is registered (see below).
     if isinstance(data, pydantic.BaseModel):
         return json.loads(data.json())
 
@@ -417,6 +435,226 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     )
 
 
+# Types, whose instances are returned by "convert_to_json_serializable()" unchanged (checked inline by container
+# handlers in order to avoid dispatch overhead for every element).
+_JSON_NATIVE_TYPES: Tuple[type, ...] = (str, int, bool, type(None))
+
+# NumPy dtype kinds, whose arrays are converted with single "tolist()" call (bool, signed int, unsigned int, float).
+_VECTORIZED_DTYPE_KINDS: str = "biuf"
+
+
+def _convert_item_to_json_serializable(data: Any) -> JSONValues:
+    if type(data) in _JSON_NATIVE_TYPES:
+        return data
+
+    return _convert_to_json_serializable(data)
+
+
+@_convert_to_json_serializable.register(str)
+@_convert_to_json_serializable.register(int)
+@_convert_to_json_serializable.register(type(None))
+def _convert_json_native_to_json_serializable(data: Any) -> JSONValues:
+    # "bool" is subclass of "int"; "str" subclasses (e.g., "str" enums) are returned as they are as well.
+    return data
+
+
+@_convert_to_json_serializable.register(float)
+def _convert_float_to_json_serializable(data: float) -> Optional[float]:
+    # Also handles "np.float64" (subclass of "float").
+    if data != data:  # noqa: PLR0124 # NaN
+        return None
+
+    return data
+
+
+@_convert_to_json_serializable.register(dict)
+def _convert_dict_to_json_serializable(data: dict) -> dict:
+    # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string
+    return {
+        str(key): _convert_item_to_json_serializable(value)
+        for key, value in data.items()
+    }
+
+
+@_convert_to_json_serializable.register(list)
+@_convert_to_json_serializable.register(tuple)
+@_convert_to_json_serializable.register(set)
+def _convert_collection_to_json_serializable(
+    data: Union[list, tuple, set]
+) -> List[JSONValues]:
+    return [_convert_item_to_json_serializable(value) for value in data]
+
+
+@_convert_to_json_serializable.register(SerializableDictDot)
+@_convert_to_json_serializable.register(SerializableDotDict)
+def _convert_serializable_to_json_serializable(
+    data: Union[SerializableDictDot, SerializableDotDict]
+) -> JSONValues:
+    return data.to_json_dict()
+
+
+@_convert_to_json_serializable.register(pydantic.BaseModel)
+def _convert_pydantic_model_to_json_serializable(
+    data: pydantic.BaseModel,
+) -> JSONValues:
+    return json.loads(data.json())
+
+
+@_convert_to_json_serializable.register(np.bool_)
+def _convert_numpy_bool_to_json_serializable(data: np.bool_) -> bool:
+    return bool(data)
+
+
+@_convert_to_json_serializable.register(np.integer)
+def _convert_numpy_integer_to_json_serializable(data: np.integer) -> int:
+    return int(data)
+
+
+@_convert_to_json_serializable.register(np.ndarray)
+def _convert_numpy_array_to_json_serializable(data: np.ndarray) -> List[JSONValues]:
+    if data.ndim > 0 and data.dtype.kind in _VECTORIZED_DTYPE_KINDS:
+        return _convert_numeric_array_to_list(data=data)
+
+    # If we have an array or index, convert it first to a list--causing coercion to float--and then round
+    # to the number of digits for which the string representation will equal the float representation
+    return [_convert_item_to_json_serializable(x) for x in data.tolist()]
+
+
+@_convert_to_json_serializable.register(pd.Index)
+def _convert_pandas_index_to_json_serializable(data: pd.Index) -> List[JSONValues]:
+    if isinstance(data.dtype, np.dtype) and data.dtype.kind in _VECTORIZED_DTYPE_KINDS:
+        return _convert_numeric_array_to_list(data=data.to_numpy())
+
+    return [_convert_item_to_json_serializable(x) for x in data.tolist()]
+
+
+@_convert_to_json_serializable.register(pd.Series)
+def _convert_pandas_series_to_json_serializable(data: pd.Series) -> List[dict]:
+    # Converting a series is tricky since the index may not be a string, but all json
+    # keys must be strings. So, we use a very ugly serialization strategy
+    index_name = data.index.name or "index"
+    value_name = data.name or "value"
+    if isinstance(data.dtype, np.dtype) and data.dtype.kind in _VECTORIZED_DTYPE_KINDS:
+        values: List[JSONValues] = _convert_numeric_array_to_list(data=data.to_numpy())
+        return [
+            {
+                index_name: _convert_item_to_json_serializable(idx),
+                value_name: val,
+            }
+            for idx, val in zip(
+                _convert_pandas_index_to_json_serializable(data.index), values
+            )
+        ]
+
+    return [
+        {
+            index_name: _convert_to_json_serializable(idx),
+            value_name: _convert_to_json_serializable(val),
+        }
+        for idx, val in data.items()
+    ]
+
+
+def _convert_numeric_array_to_list(data: np.ndarray) -> List[JSONValues]:
+    """Converts numeric (bool, integer, or float) array to (nested) list of Python scalars, with NaN as None."""
+    if data.dtype.kind == "f":
+        nan_mask: np.ndarray = np.isnan(data)
+        if nan_mask.any():
+            converted: np.ndarray = data.astype(object)
+            converted[nan_mask] = None
+            return converted.tolist()
+
+    return data.tolist()
+
+
+def iter_json_serializable_chunks(data: Any) -> Iterator[str]:
+    """Encodes "data" as JSON incrementally, yielding string chunks.
+
+    Objects, providing "iter_json_dict_items()" method (e.g., "ExpectationSuiteValidationResult" and
+    "CheckpointResult"), are streamed one item at a time, as are dictionaries and generators; every other value (e.g.,
+    list of unexpected values) is converted by "convert_to_json_serializable()" and encoded on its own.  Hence, at no
+    point is JSON-serializable copy of the complete (possibly very large) object held in memory.
+
+    Args:
+        data: an object to encode (anything accepted by "convert_to_json_serializable()")
+
+    Yields:
+        Consecutive pieces of JSON document, which, concatenated, equal "json.dumps(convert_to_json_serializable(data))".
+    """
+    iter_json_dict_items: Optional[Callable[[], Iterator[Tuple[str, Any]]]] = getattr(
+        data, "iter_json_dict_items", None
+    )
+    if callable(iter_json_dict_items):
+        yield from _iter_json_object_chunks(items=iter_json_dict_items())
+    elif isinstance(data, (SerializableDictDot, SerializableDotDict)):
+        yield _JSON_STREAM_ENCODER.encode(data.to_json_dict())
+    elif type(data) is dict:
+        yield from _iter_json_object_chunks(items=data.items())
+    elif isinstance(data, GeneratorType):
+        yield "["
+        idx: int
+        value: Any
+        for idx, value in enumerate(data):
+            if idx:
+                yield ", "
+
+            yield from iter_json_serializable_chunks(data=value)
+
+        yield "]"
+    else:
+        yield _JSON_STREAM_ENCODER.encode(_convert_to_json_serializable(data))
+
+
+def _iter_json_object_chunks(items: Iterable[Tuple[Any, Any]]) -> Iterator[str]:
+    yield "{"
+    idx: int
+    key: Any
+    value: Any
+    for idx, (key, value) in enumerate(items):
+        if idx:
+            yield ", "
+
+        yield _JSON_STREAM_ENCODER.encode(str(key))
+        yield ": "
+        yield from iter_json_serializable_chunks(data=value)
+
+    yield "}"
+
+
+_JSON_STREAM_ENCODER = json.JSONEncoder()
+
+
+def write_json_serializable(
+    data: Any, file: Union[str, pathlib.Path, IO[str], IO[bytes]]
+) -> None:
+    """Writes "data" as JSON document to "file" (path, or text or binary file object), streaming it chunk by chunk.
+
+    Args:
+        data: an object to encode (anything accepted by "convert_to_json_serializable()")
+        file: file path or open file object
+    """
+    if isinstance(file, (str, pathlib.PurePath)):
+        with open(file, "w", encoding="utf-8") as f:
+            write_json_serializable(data=data, file=f)
+
+        return
+
+    chunk: str
+    if isinstance(file, io.TextIOBase):
+        for chunk in iter_json_serializable_chunks(data=data):
+            file.write(chunk)
+    else:
+        for chunk in iter_json_serializable_chunks(data=data):
+            file.write(chunk.encode("utf-8"))  # type: ignore[arg-type] # binary file
+
+
+def convert_to_json_bytes(data: Any) -> bytes:
+    """Encodes "data" as UTF-8 JSON document (via "iter_json_serializable_chunks()")."""
+    buffer = io.BytesIO()
+    write_json_serializable(data=data, file=buffer)
+    return buffer.getvalue()
+
+
 def ensure_json_serializable(data: Any) -> None:  # noqa: C901, PLR0911, PLR0912
     """
     Helper function to convert an object to one that is json serializable
@@ -2581,6 +2581,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         create_expectation_suite_with_name: Optional[str] = None,
         include_rendered_content: Optional[bool] = None,
         expectation_suite_id: Optional[str] = None,
+        project_columns: bool = False,
         **kwargs,
     ) -> Validator:
         """Retrieve a Validator with a batch list and an `ExpectationSuite`.
@@ -2624,6 +2625,9 @@ class AbstractDataContext(ConfigPeer, ABC):
             expectation_suite: The ExpectationSuite to use with the validator
             create_expectation_suite_with_name: Creates a Validator with a new ExpectationSuite with the provided name
             include_rendered_content: If `True` the ExpectationSuite will include rendered content when saved
+            project_columns: If `True`, only the columns referenced by the ExpectationSuite are loaded from files
+                (see `ExpectationSuite.get_column_projection`); Expectations on other columns cannot be validated
+                with the resulting Validator
             **kwargs: Used to specify either `batch_identifiers` or `batch_filter_parameters`
 
         Returns:
@@ -2709,6 +2713,16 @@ class AbstractDataContext(ConfigPeer, ABC):
             if not batch_request_list:
                 batch_request_list = [batch_request]  # type: ignore[list-item]
 
+            if project_columns:
+                (
+                    batch_request_list,
+                    batch_spec_passthrough,
+                ) = self._apply_column_projection(
+                    expectation_suite=expectation_suite,
+                    batch_request_list=batch_request_list,
+                    batch_spec_passthrough=batch_spec_passthrough,
+                )
+
             for batch_request in batch_request_list:
                 batch_list.extend(
                     self.get_batch_list(
@@ -2741,6 +2755,64 @@ class AbstractDataContext(ConfigPeer, ABC):
             include_rendered_content=include_rendered_content,
         )
 
+    @classmethod
+    def _apply_column_projection(
+        cls,
+        expectation_suite: Optional[ExpectationSuite],
+        batch_request_list: List[Optional[Union[BatchRequestBase, FluentBatchRequest]]],
+        batch_spec_passthrough: Optional[dict],
+    ) -> Tuple[
+        List[Optional[Union[BatchRequestBase, FluentBatchRequest]]], Optional[dict]
+    ]:
+        """Returns "batch_request_list" and "batch_spec_passthrough", directing ExecutionEngine to load only columns
+        referenced by "expectation_suite" (unchanged if all columns are needed)."""
+        column_projection: Optional[List[str]] = (
+            expectation_suite.get_column_projection()
+            if expectation_suite is not None
+            else None
+        )
+        if not column_projection:
+            return batch_request_list, batch_spec_passthrough
+
+        batch_request_list = [
+            cls._get_batch_request_with_column_projection(
+                batch_request=batch_request,
+                column_projection=column_projection,
+            )
+            for batch_request in batch_request_list
+        ]
+        if not any(batch_request_list):
+            # Batch is specified through keyword arguments of "get_validator()" (rather than through "BatchRequest").
+            batch_spec_passthrough = {
+                "column_projection": column_projection,
+                **(batch_spec_passthrough or {}),
+            }
+
+        return batch_request_list, batch_spec_passthrough
+
+    @staticmethod
+    def _get_batch_request_with_column_projection(
+        batch_request: Optional[Union[BatchRequestBase, FluentBatchRequest]],
+        column_projection: List[str],
+    ) -> Optional[Union[BatchRequestBase, FluentBatchRequest]]:
+        """Returns copy of "batch_request", directing ExecutionEngine to load only columns in "column_projection"."""
+        if batch_request is None:
+            return None
+
+        if isinstance(batch_request, BatchRequestBase):
+            batch_request = copy.copy(batch_request)
+            batch_request.batch_spec_passthrough = {
+                "column_projection": column_projection,
+                **(batch_request.batch_spec_passthrough or {}),
+            }
+            return batch_request
+
+        if hasattr(batch_request, "update_column_projection"):
+            batch_request = batch_request.copy()
+            batch_request.update_column_projection(value=column_projection)
+
+        return batch_request
+
     # noinspection PyUnusedLocal
     def get_validator_using_batch_list(
         self,
@@ -5259,6 +5331,8 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
             "active_batch_definition", {}
         ).get("data_asset_name")
 
+        # Metric values are collected first and then appended to target store together (in one batch).
+        keys_and_values: List[Tuple[ValidationMetricIdentifier, Any]] = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (  # noqa: PLR1714
                 expectation_suite_dependency != expectation_suite_name
@@ -5282,19 +5356,21 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
-                                ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_kwargs=metric_kwargs
+                        keys_and_values.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_kwargs=metric_kwargs
+                                    ),
                                 ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except gx_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -5303,6 +5379,8 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
                             "this validation result.".format(metric_name)
                         )
 
+        self.stores[target_store_name].set_many(keys_and_values=keys_and_values)
+
     def send_usage_message(
         self, event: str, event_payload: Optional[dict], success: Optional[bool] = None
     ) -> None:
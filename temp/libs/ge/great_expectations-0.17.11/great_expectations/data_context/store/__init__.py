@@ -14,6 +14,7 @@ from .tuple_store_backend import (  # isort:skip
     TupleAzureBlobStoreBackend,
 )
 from .database_store_backend import DatabaseStoreBackend  # isort:skip
+from .metric_history_store_backend import MetricHistoryStoreBackend  # isort:skip
 from .inline_store_backend import InlineStoreBackend  # isort:skip
 from .in_memory_store_backend import InMemoryStoreBackend  # isort:skip
 from .configuration_store import ConfigurationStore  # isort:skip
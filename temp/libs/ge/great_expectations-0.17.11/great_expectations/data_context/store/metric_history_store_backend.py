@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import uuid
+from numbers import Number
+from typing import Any, List, Optional, Tuple
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.util import filter_properties_dict, get_sqlalchemy_url
+
+if sa:
+    SQLAlchemyError = sqlalchemy.SQLAlchemyError
+
+
+logger = logging.getLogger(__name__)
+
+# Format, in which "RunIdentifier.to_tuple()" renders "run_time" as part of "ValidationMetricIdentifier" key.
+RUN_TIME_KEY_FORMAT: str = "%Y%m%dT%H%M%S.%fZ"
+
+
+class MetricHistoryStoreBackend(StoreBackend):
+    """
+    Columnar store backend for metric history (to be used with "MetricStore" and "EvaluationParameterStore").
+
+    Unlike "DatabaseStoreBackend", which keeps every key element and the serialized value as strings, this backend
+    stores each metric as one row of typed columns: "run_time" as a timestamp and the value both as a float (whenever
+    it is numeric) and as its serialized form.  Composite index on (metric_name, metric_kwargs_id, run_time) makes time
+    series queries (e.g., "the last 90 values of column.mean for column X") single indexed range scans, which are
+    served by "query_metric_history()" without deserializing unrelated rows.
+
+    Keys are "ValidationMetricIdentifier" fixed-length tuples:
+        (run_name, run_time, data_asset_name, expectation_suite_identifier, metric_name, metric_kwargs_id)
+    """
+
+    KEY_COLUMNS: Tuple[str, ...] = (
+        "run_name",
+        "run_time",
+        "data_asset_name",
+        "expectation_suite_identifier",
+        "metric_name",
+        "metric_kwargs_id",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        table_name: str = "ge_metric_history",
+        credentials: Optional[dict] = None,
+        url: Optional[str] = None,
+        connection_string: Optional[str] = None,
+        engine=None,
+        store_name: Optional[str] = None,
+        suppress_store_backend_id: bool = False,
+        manually_initialize_store_backend_id: str = "",
+        **kwargs,
+    ) -> None:
+        super().__init__(
+            fixed_length_key=True,
+            suppress_store_backend_id=suppress_store_backend_id,
+            manually_initialize_store_backend_id=manually_initialize_store_backend_id,
+            store_name=store_name,
+        )
+        if not sa:
+            raise gx_exceptions.DataContextError(
+                "ModuleNotFoundError: No module named 'sqlalchemy'"
+            )
+
+        if engine is not None:
+            self.engine = engine
+        elif credentials is not None:
+            credentials = dict(credentials)
+            drivername: str = credentials.pop("drivername")
+            self.engine = sa.create_engine(
+                get_sqlalchemy_url(drivername, **credentials), **kwargs
+            )
+        elif connection_string is not None:
+            self.engine = sa.create_engine(connection_string, **kwargs)
+        elif url is not None:
+            self.engine = sa.create_engine(url, **kwargs)
+        else:
+            raise gx_exceptions.InvalidConfigError(
+                "Credentials, url, connection_string, or an engine are required for a MetricHistoryStoreBackend."
+            )
+
+        meta = sa.MetaData()
+        table = sa.Table(
+            table_name,
+            meta,
+            sa.Column("run_name", sa.String(255), primary_key=True),
+            sa.Column("run_time", sa.DateTime, primary_key=True),
+            sa.Column("data_asset_name", sa.String(255), primary_key=True),
+            sa.Column("expectation_suite_identifier", sa.String(255), primary_key=True),
+            sa.Column("metric_name", sa.String(255), primary_key=True),
+            sa.Column("metric_kwargs_id", sa.String(255), primary_key=True),
+            sa.Column("numeric_value", sa.Float, nullable=True),
+            sa.Column("value", sa.Text),
+            sa.Index(
+                f"ix_{table_name}_metric_run_time",
+                "metric_name",
+                "metric_kwargs_id",
+                "run_time",
+            ),
+        )
+        try:
+            meta.create_all(self.engine)
+        except SQLAlchemyError as e:
+            raise gx_exceptions.StoreBackendError(
+                f"Unable to connect to table {table_name} because of an error.  SqlAlchemyError: {str(e)}"
+            )
+
+        self._table = table
+        # Initialize with store_backend_id
+        self._store_backend_id = None
+        self._store_backend_id = self.store_backend_id
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "table_name": table_name,
+            "credentials": credentials,
+            "url": url,
+            "connection_string": connection_string,
+            "engine": engine,
+            "store_name": store_name,
+            "suppress_store_backend_id": suppress_store_backend_id,
+            "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        self._config.update(kwargs)
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    @property
+    def store_backend_id(self) -> str:
+        """
+        Create a store_backend_id if one does not exist, and return it if it exists
+        Ephemeral store_backend_id for metric_history_store_backend until there is a place to store metadata
+        Returns:
+            store_backend_id which is a UUID(version=4)
+        """
+        if not self._store_backend_id:
+            store_id = (
+                self._manually_initialize_store_backend_id
+                if self._manually_initialize_store_backend_id
+                else str(uuid.uuid4())
+            )
+            self._store_backend_id = f"{self.STORE_BACKEND_ID_PREFIX}{store_id}"
+        return self._store_backend_id.replace(self.STORE_BACKEND_ID_PREFIX, "")
+
+    @property
+    def config(self) -> dict:
+        return self._config
+
+    def _get(self, key):
+        sel = sa.select(self._table.c.value).where(self._key_clause(key=key))
+        try:
+            with self.engine.begin() as connection:
+                return connection.execute(sel).fetchone()[0]
+        except (TypeError, IndexError, SQLAlchemyError) as e:
+            logger.debug(f"Error fetching value: {str(e)}")
+            raise gx_exceptions.StoreError(f"Unable to fetch value for key: {str(key)}")
+
+    def _set(self, key, value, **kwargs) -> None:
+        self.set_many(keys_and_values=[(key, value)])
+
+    def set_many(self, keys_and_values: List[Tuple[tuple, str]]) -> None:
+        """
+        Appends multiple (key, serialized value) pairs in one transaction, using single multi-row INSERT statement.
+
+        Rows, whose keys already exist (e.g., re-running validation under the same "run_id"), are replaced.
+        """
+        if not keys_and_values:
+            return
+
+        key: tuple
+        value: str
+        for key, _ in keys_and_values:
+            self._validate_key(key)
+
+        rows: List[dict] = [
+            self._build_row(key=key, value=value) for key, value in keys_and_values
+        ]
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(self._table.insert(), rows)
+        except sqlalchemy.IntegrityError:
+            with self.engine.begin() as connection:
+                for key, _ in keys_and_values:
+                    connection.execute(
+                        self._table.delete().where(self._key_clause(key=key))
+                    )
+
+                connection.execute(self._table.insert(), rows)
+        except SQLAlchemyError as e:
+            raise gx_exceptions.StoreBackendError(
+                f"Unable to append metric values: got sqlalchemy error {str(e)}"
+            )
+
+    def query_metric_history(  # noqa: PLR0913
+        self,
+        metric_name: str,
+        metric_kwargs_id: Optional[str] = None,
+        expectation_suite_name: Optional[str] = None,
+        data_asset_name: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[datetime.datetime, Any]]:
+        """
+        Returns (run_time, value) pairs of given metric in chronological order, optionally restricted to time range
+        [start_time, end_time] and to the most recent "limit" runs.  Numeric values are read (as float) from typed column
+        directly; only non-numeric values are deserialized.
+        """
+        table = self._table
+        conditions: list = [
+            table.c.metric_name == metric_name,
+            table.c.metric_kwargs_id == (metric_kwargs_id or "__"),
+        ]
+        if expectation_suite_name is not None:
+            conditions.append(
+                table.c.expectation_suite_identifier == expectation_suite_name
+            )
+
+        if data_asset_name is not None:
+            conditions.append(table.c.data_asset_name == data_asset_name)
+
+        if start_time is not None:
+            conditions.append(table.c.run_time >= _to_naive_utc(start_time))
+
+        if end_time is not None:
+            conditions.append(table.c.run_time <= _to_naive_utc(end_time))
+
+        sel = (
+            sa.select(table.c.run_time, table.c.numeric_value, table.c.value)
+            .where(sa.and_(*conditions))
+            .order_by(table.c.run_time.desc())
+        )
+        if limit is not None:
+            sel = sel.limit(limit)
+
+        with self.engine.begin() as connection:
+            rows: list = connection.execute(sel).fetchall()
+
+        run_time: datetime.datetime
+        numeric_value: Optional[float]
+        value: str
+        return [
+            (
+                run_time.replace(tzinfo=datetime.timezone.utc),
+                numeric_value
+                if numeric_value is not None
+                else json.loads(value)["value"],
+            )
+            for run_time, numeric_value, value in reversed(rows)
+        ]
+
+    def _move(self) -> None:  # type: ignore[override]
+        raise NotImplementedError
+
+    def list_keys(self, prefix=()):
+        table = self._table
+        key_columns = [
+            getattr(table.c, column_name) for column_name in self.KEY_COLUMNS
+        ]
+        sel = sa.select(*key_columns).where(
+            sa.and_(
+                True,
+                *(
+                    column == _to_column_value(column_name=column.name, value=value)
+                    for column, value in zip(key_columns[: len(prefix)], prefix)
+                ),
+            )
+        )
+        with self.engine.begin() as connection:
+            row_list: list = connection.execute(sel).fetchall()
+
+        return [
+            (row[0], row[1].strftime(RUN_TIME_KEY_FORMAT), *row[2:]) for row in row_list
+        ]
+
+    def _has_key(self, key) -> bool:
+        sel = (
+            sa.select(sa.func.count())
+            .select_from(self._table)
+            .where(self._key_clause(key=key))
+        )
+        try:
+            with self.engine.begin() as connection:
+                return connection.execute(sel).fetchone()[0] == 1
+        except (IndexError, SQLAlchemyError) as e:
+            logger.debug(f"Error checking for value: {str(e)}")
+            return False
+
+    def remove_key(self, key):
+        try:
+            with self.engine.begin() as connection:
+                return connection.execute(
+                    self._table.delete().where(self._key_clause(key=key))
+                )
+        except SQLAlchemyError as e:
+            raise gx_exceptions.StoreBackendError(
+                f"Unable to delete key: got sqlalchemy error {str(e)}"
+            )
+
+    def _key_clause(self, key: tuple):
+        return sa.and_(
+            *(
+                getattr(self._table.c, column_name)
+                == _to_column_value(column_name=column_name, value=value)
+                for column_name, value in zip(self.KEY_COLUMNS, key)
+            )
+        )
+
+    def _build_row(self, key: tuple, value: str) -> dict:
+        row: dict = {
+            column_name: _to_column_value(column_name=column_name, value=element)
+            for column_name, element in zip(self.KEY_COLUMNS, key)
+        }
+        row["numeric_value"] = _get_numeric_value(value=value)
+        row["value"] = value
+        return row
+
+
+def _to_naive_utc(value: datetime.datetime) -> datetime.datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(tz=datetime.timezone.utc).replace(tzinfo=None)
+
+    return value
+
+
+def _to_column_value(column_name: str, value: Any) -> Any:
+    if column_name == "run_time" and isinstance(value, str):
+        # Key "run_time" strings are UTC ("Z" suffix); column holds naive UTC timestamps.
+        return _to_naive_utc(
+            datetime.datetime.strptime(value, RUN_TIME_KEY_FORMAT).replace(
+                tzinfo=datetime.timezone.utc
+            )
+        )
+
+    return value
+
+
+def _get_numeric_value(value: str) -> Optional[float]:
+    try:
+        metric_value: Any = json.loads(value)["value"]
+    except (TypeError, ValueError, KeyError):
+        return None
+
+    if isinstance(metric_value, Number) and not isinstance(metric_value, bool):
+        return float(metric_value)
+
+    return None
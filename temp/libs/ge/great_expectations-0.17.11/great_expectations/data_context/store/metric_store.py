@@ -1,10 +1,17 @@
+from __future__ import annotations
+
+import datetime
 import json
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
-from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
+from great_expectations.data_context.store.metric_history_store_backend import (
+    MetricHistoryStoreBackend,
+)
 from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.data_context.types.resource_identifiers import (
     ValidationMetricIdentifier,
 )
@@ -14,6 +21,9 @@ from great_expectations.util import (
     verify_dynamic_loading_support,
 )
 
+if TYPE_CHECKING:
+    from great_expectations.core.run_identifier import RunIdentifier
+
 
 class MetricStore(Store):
     """
@@ -63,6 +73,102 @@ class MetricStore(Store):
         if value:
             return json.loads(value)["value"]
 
+    def set_many(
+        self, keys_and_values: List[Tuple[ValidationMetricIdentifier, Any]]
+    ) -> None:
+        """
+        Stores multiple metric values at once; store backends that support bulk appends (e.g.,
+        "MetricHistoryStoreBackend") write all of them in single transaction, others receive one "set()" per value.
+        """
+        key: ValidationMetricIdentifier
+        value: Any
+        if isinstance(self._store_backend, MetricHistoryStoreBackend):
+            for key, _ in keys_and_values:
+                self._validate_key(key)
+
+            self._store_backend.set_many(
+                keys_and_values=[
+                    (self.key_to_tuple(key), self.serialize(value))
+                    for key, value in keys_and_values
+                ]
+            )
+            return
+
+        for key, value in keys_and_values:
+            self.set(key, value)
+
+    def get_metric_history(  # noqa: PLR0913
+        self,
+        metric_name: str,
+        metric_kwargs_id: Optional[str] = None,
+        expectation_suite_name: Optional[str] = None,
+        data_asset_name: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[datetime.datetime, Any]]:
+        """
+        Returns (run_time, value) pairs of stored values of given metric in chronological order.
+
+        Args:
+            metric_name: Name of metric (e.g., "expect_column_mean_to_be_between.result.observed_value").
+            metric_kwargs_id: Identifier of metric kwargs (e.g., "column=X"); None selects metric without kwargs.
+            expectation_suite_name: If given, only values stored for this Expectation Suite are returned.
+            data_asset_name: If given, only values stored for this Data Asset are returned.
+            start_time: If given, only values of runs at or after this time are returned.
+            end_time: If given, only values of runs at or before this time are returned.
+            limit: If given, only values of (at most) this many most recent runs are returned.
+
+        Returns:
+            List of (run_time, value) tuples, oldest first.
+        """
+        if isinstance(self._store_backend, MetricHistoryStoreBackend):
+            return self._store_backend.query_metric_history(
+                metric_name=metric_name,
+                metric_kwargs_id=metric_kwargs_id,
+                expectation_suite_name=expectation_suite_name,
+                data_asset_name=data_asset_name,
+                start_time=start_time,
+                end_time=end_time,
+                limit=limit,
+            )
+
+        # Key-value store backends offer no typed columns; scan keys and deserialize only values that match.
+        if start_time is not None and start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=datetime.timezone.utc)
+
+        if end_time is not None and end_time.tzinfo is None:
+            end_time = end_time.replace(tzinfo=datetime.timezone.utc)
+
+        history: List[Tuple[datetime.datetime, Any]] = []
+        key: ValidationMetricIdentifier
+        for key_tuple in self._store_backend.list_keys():
+            if key_tuple == StoreBackend.STORE_BACKEND_ID_KEY:
+                continue
+
+            key = self.tuple_to_key(key_tuple)  # type: ignore[assignment]
+            if not (
+                key.metric_name == metric_name
+                and key.metric_kwargs_id == metric_kwargs_id
+                and (
+                    expectation_suite_name is None
+                    or key.expectation_suite_identifier.expectation_suite_name
+                    == expectation_suite_name
+                )
+                and (data_asset_name is None or key.data_asset_name == data_asset_name)
+                and (start_time is None or key.run_id.run_time >= start_time)
+                and (end_time is None or key.run_id.run_time <= end_time)
+            ):
+                continue
+
+            history.append((key.run_id.run_time, self.get(key)))
+
+        history.sort(key=lambda element: element[0])
+        if limit is not None:
+            history = history[-limit:] if limit > 0 else []
+
+        return history
+
 
 class EvaluationParameterStore(MetricStore):
     def __init__(self, store_backend=None, store_name=None) -> None:
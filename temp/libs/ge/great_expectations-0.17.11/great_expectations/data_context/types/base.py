@@ -1040,6 +1040,9 @@ class ExecutionEngineConfigSchema(Schema):
     connect_args = fields.Dict(
         keys=fields.Str(), values=fields.Raw(), required=False, allow_none=True
     )
+    # Callable, returning DBAPI connection (passed to "sqlalchemy.create_engine()"); it cannot be written to YAML, and hence
+    # it only suits Datasources, which are not persisted (e.g., of ephemeral Data Context).
+    creator = fields.Raw(required=False, allow_none=True)
     azure_options = fields.Dict(
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
@@ -1047,6 +1050,7 @@ class ExecutionEngineConfigSchema(Schema):
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
     caching = fields.Boolean(required=False, allow_none=True)
+    metric_cache_config = fields.Dict(required=False, allow_none=True)
     batch_spec_defaults = fields.Dict(required=False, allow_none=True)
     force_reuse_spark_context = fields.Boolean(required=False, allow_none=True)
     persist = fields.Boolean(required=False, allow_none=True)
@@ -1054,7 +1058,18 @@ class ExecutionEngineConfigSchema(Schema):
     # https://googleapis.dev/python/sqlalchemy-bigquery/latest/README.html#connection-string-parameters
     credentials_info = fields.Dict(required=False, allow_none=True)
 
-    create_temp_table = fields.Boolean(required=False, allow_none=True)
+    # Boolean, or "auto" (see "SqlAlchemyExecutionEngine").
+    create_temp_table = fields.Raw(required=False, allow_none=True)
+    schema_cache_ttl_seconds = fields.Float(required=False, allow_none=True)
+
+    # PandasExecutionEngine
+    batch_data_cache_max_bytes = fields.Integer(required=False, allow_none=True)
+    batch_data_spill_directory = fields.String(required=False, allow_none=True)
+    sharding_config = fields.Dict(required=False, allow_none=True)
+
+    # ChunkedPandasExecutionEngine
+    allow_materialization = fields.Boolean(required=False, allow_none=True)
+    spill_directory = fields.String(required=False, allow_none=True)
 
     # noinspection PyUnusedLocal
     @validates_schema
@@ -1071,6 +1086,12 @@ SqlAlchemyExecutionEngine requires this attribute (your execution engine is "{da
 configuration to continue.
                 """
             )
+        if data.get("create_temp_table") not in (None, True, False, "auto"):
+            raise gx_exceptions.InvalidConfigError(
+                f"""The "create_temp_table" key of an execution engine must be a boolean or "auto" (got \
+"{data['create_temp_table']}").  Please update your configuration to continue.
+                """
+            )
         if "spark_config" in data and not (
             data["class_name"] == "SparkDFExecutionEngine"
         ):
@@ -12,6 +12,7 @@ from great_expectations.core.batch import (
     BatchRequestBase,  # noqa: TCH001
 )
 from great_expectations.core.id_dict import BatchSpec
+from great_expectations.core.tracing import trace_span
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.metrics_calculator import MetricsCalculator
 
@@ -118,9 +119,13 @@ class DataConnector:
 
         """
         batch_spec: BatchSpec = self.build_batch_spec(batch_definition=batch_definition)
-        batch_data, batch_markers = self._execution_engine.get_batch_data_and_markers(
-            batch_spec=batch_spec
-        )
+        with trace_span(
+            "get_batch_data", "batch", batch_spec_type=type(batch_spec).__name__
+        ):
+            (
+                batch_data,
+                batch_markers,
+            ) = self._execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
         self._execution_engine.load_batch_data(batch_definition.id, batch_data)
         return (
             batch_data,
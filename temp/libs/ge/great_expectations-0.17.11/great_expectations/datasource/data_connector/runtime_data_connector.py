@@ -16,6 +16,7 @@ from great_expectations.core.batch_spec import (
     S3BatchSpec,
 )
 from great_expectations.core.id_dict import IDDict
+from great_expectations.core.tracing import trace_span
 from great_expectations.datasource.data_connector.data_connector import DataConnector
 from great_expectations.datasource.data_connector.util import _build_asset_from_config
 
@@ -212,9 +213,13 @@ class RuntimeDataConnector(DataConnector):
             batch_definition=batch_definition,
             runtime_parameters=runtime_parameters,
         )
-        batch_data, batch_markers = self._execution_engine.get_batch_data_and_markers(
-            batch_spec=batch_spec
-        )
+        with trace_span(
+            "get_batch_data", "batch", batch_spec_type=type(batch_spec).__name__
+        ):
+            (
+                batch_data,
+                batch_markers,
+            ) = self._execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
         self._execution_engine.load_batch_data(batch_definition.id, batch_data)
         return (
             batch_data,  # type: ignore[return-value]
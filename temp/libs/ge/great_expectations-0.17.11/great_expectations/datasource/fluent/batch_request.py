@@ -6,6 +6,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Mapping,
     Optional,
     Union,
@@ -79,6 +80,9 @@ class BatchRequest(pydantic.BaseModel):
     _batch_slice_input: Optional[BatchSlice] = pydantic.PrivateAttr(
         default=None,
     )
+    _column_projection: Optional[List[str]] = pydantic.PrivateAttr(
+        default=None,
+    )
 
     def __init__(self, **kwargs) -> None:
         _batch_slice_input: Optional[BatchSlice] = None
@@ -108,9 +112,28 @@ class BatchRequest(pydantic.BaseModel):
             raise ValueError(f"Failed to parse BatchSlice to slice: {e}")
         self._batch_slice_input = value
 
+    @property
+    def column_projection(self) -> Optional[List[str]]:
+        """Names of columns to load from files of the Data Asset (None means "all columns")."""
+        return self._column_projection
+
+    def update_column_projection(self, value: Optional[List[str]] = None) -> None:
+        """Updates the column_projection on this BatchRequest.
+
+        Args:
+            value: Names of the only columns to be loaded (if the ExecutionEngine and reader method support it).
+
+        Returns:
+            None
+        """
+        self._column_projection = None if value is None else list(value)
+
     class Config:
         extra = pydantic.Extra.forbid
-        property_set_methods = {"batch_slice": "update_batch_slice"}
+        property_set_methods = {
+            "batch_slice": "update_batch_slice",
+            "column_projection": "update_column_projection",
+        }
         validate_assignment = True
 
     def __setattr__(self, key, val):
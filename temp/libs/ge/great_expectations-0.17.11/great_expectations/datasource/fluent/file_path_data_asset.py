@@ -22,6 +22,7 @@ import pydantic
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core._docs_decorators import public_api
+from great_expectations.core.tracing import trace_span
 from great_expectations.datasource.fluent.batch_request import (
     BatchRequest,
     BatchRequestOptions,
@@ -267,9 +268,12 @@ class _FilePathDataAsset(DataAsset):
             )
             batch_spec.update(batch_spec_options)
 
-            batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
-                batch_spec=batch_spec
-            )
+            with trace_span(
+                "get_batch_data", "batch", batch_spec_type=type(batch_spec).__name__
+            ):
+                batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+                    batch_spec=batch_spec
+                )
 
             fully_specified_batch_request = copy.deepcopy(batch_request)
             fully_specified_batch_request.options.update(
@@ -370,6 +374,9 @@ class _FilePathDataAsset(DataAsset):
             )
             batch_spec_options["splitter_kwargs"] = splitter_kwargs
 
+        if batch_request.column_projection:
+            batch_spec_options["column_projection"] = batch_request.column_projection
+
         return batch_spec_options
 
     def test_connection(self) -> None:
@@ -37,6 +37,7 @@ from great_expectations.core._docs_decorators import (
     public_api,
 )
 from great_expectations.core.batch_spec import PandasBatchSpec, RuntimeDataBatchSpec
+from great_expectations.core.tracing import trace_span
 from great_expectations.datasource.fluent import BatchRequest
 from great_expectations.datasource.fluent.constants import (
     _DATA_CONNECTOR_NAME,
@@ -135,9 +136,12 @@ work-around, until "type" naming convention and method for obtaining 'reader_met
             ),
         )
         execution_engine: PandasExecutionEngine = self.datasource.get_execution_engine()
-        data, markers = execution_engine.get_batch_data_and_markers(
-            batch_spec=batch_spec
-        )
+        with trace_span(
+            "get_batch_data", "batch", batch_spec_type=type(batch_spec).__name__
+        ):
+            data, markers = execution_engine.get_batch_data_and_markers(
+                batch_spec=batch_spec
+            )
 
         # batch_definition (along with batch_spec and markers) is only here to satisfy a
         # legacy constraint when computing usage statistics in a validator. We hope to remove
@@ -408,9 +412,12 @@ class DataFrameAsset(_PandasDataAsset, Generic[_PandasDataFrameT]):
 
         batch_spec = RuntimeDataBatchSpec(batch_data=self.dataframe)
         execution_engine: PandasExecutionEngine = self.datasource.get_execution_engine()
-        data, markers = execution_engine.get_batch_data_and_markers(
-            batch_spec=batch_spec
-        )
+        with trace_span(
+            "get_batch_data", "batch", batch_spec_type=type(batch_spec).__name__
+        ):
+            data, markers = execution_engine.get_batch_data_and_markers(
+                batch_spec=batch_spec
+            )
 
         # batch_definition (along with batch_spec and markers) is only here to satisfy a
         # legacy constraint when computing usage statistics in a validator. We hope to remove
@@ -7,6 +7,7 @@ from typing import (
     Final,
     Generator,
     List,
+    Literal,
     NamedTuple,
     Optional,
     Type,
@@ -259,7 +260,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> SQLDatasource: ...
     def update_sql(  # noqa: PLR0913
         self,
@@ -268,7 +269,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> SQLDatasource: ...
     def add_or_update_sql(  # noqa: PLR0913
         self,
@@ -277,7 +278,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> SQLDatasource: ...
     def delete_sql(
         self,
@@ -290,7 +291,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> PostgresDatasource: ...
     def update_postgres(  # noqa: PLR0913
         self,
@@ -299,7 +300,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> PostgresDatasource: ...
     def add_or_update_postgres(  # noqa: PLR0913
         self,
@@ -308,7 +309,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> PostgresDatasource: ...
     def delete_postgres(
         self,
@@ -546,7 +547,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> SqliteDatasource: ...
     def update_sqlite(  # noqa: PLR0913
         self,
@@ -555,7 +556,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> SqliteDatasource: ...
     def add_or_update_sqlite(  # noqa: PLR0913
         self,
@@ -564,7 +565,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> SqliteDatasource: ...
     def delete_sqlite(
         self,
@@ -578,7 +579,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = ...,
         *,
         connection_string: Union[ConfigStr, SnowflakeDsn, str] = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, Literal["auto"]] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -596,7 +597,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = ...,
         *,
         connection_string: None = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, Literal["auto"]] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -614,7 +615,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = ...,
         *,
         connection_string: Union[ConfigStr, SnowflakeDsn, str] = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, Literal["auto"]] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -632,7 +633,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = ...,
         *,
         connection_string: None = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, Literal["auto"]] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -650,7 +651,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = ...,
         *,
         connection_string: Union[ConfigStr, SnowflakeDsn, str] = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, Literal["auto"]] = ...,
         account: None = ...,
         user: None = ...,
         password: None = ...,
@@ -668,7 +669,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = ...,
         *,
         connection_string: None = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, Literal["auto"]] = ...,
         account: str = ...,
         user: str = ...,
         password: Union[ConfigStr, str] = ...,
@@ -689,7 +690,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> DatabricksSQLDatasource: ...
     def update_databricks_sql(  # noqa: PLR0913
         self,
@@ -698,7 +699,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> DatabricksSQLDatasource: ...
     def add_or_update_databricks_sql(  # noqa: PLR0913
         self,
@@ -707,7 +708,7 @@ class _SourceFactories:
         datasource: Optional[Datasource] = None,
         *,
         connection_string: Union[ConfigStr, DatabricksDsn, str] = ...,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, Literal["auto"]] = True,
     ) -> DatabricksSQLDatasource: ...
     def delete_databricks_sql(
         self,
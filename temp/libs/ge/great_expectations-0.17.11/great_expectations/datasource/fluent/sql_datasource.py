@@ -27,6 +27,7 @@ from great_expectations.compatibility.sqlalchemy import (
 )
 from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.batch_spec import SqlAlchemyDatasourceBatchSpec
+from great_expectations.core.tracing import trace_span
 from great_expectations.datasource.fluent.batch_request import (
     BatchRequest,
     BatchRequestOptions,
@@ -662,9 +663,12 @@ class _SQLAsset(DataAsset):
             execution_engine: SqlAlchemyExecutionEngine = (
                 self.datasource.get_execution_engine()
             )
-            data, markers = execution_engine.get_batch_data_and_markers(
-                batch_spec=batch_spec
-            )
+            with trace_span(
+                "get_batch_data", "batch", batch_spec_type=type(batch_spec).__name__
+            ):
+                data, markers = execution_engine.get_batch_data_and_markers(
+                    batch_spec=batch_spec
+                )
 
             # batch_definition (along with batch_spec and markers) is only here to satisfy a
             # legacy constraint when computing usage statistics in a validator. We hope to remove
@@ -945,7 +949,8 @@ class SQLDatasource(Datasource):
         name: The name of this datasource.
         connection_string: The SQLAlchemy connection string used to connect to the database.
             For example: "postgresql+psycopg2://postgres:@localhost/test_database"
-        create_temp_table: Whether to leverage temporary tables during metric computation.
+        create_temp_table: Whether to leverage temporary tables during metric computation (or "auto", to
+            materialize query of Batch only when enough metric queries run against it).
         kwargs: Extra SQLAlchemy keyword arguments to pass to `create_engine()`. Note, only python
             primitive types will be serializable to config.
         assets: An optional dictionary whose keys are SQL DataAsset names and whose values
@@ -959,7 +964,7 @@ class SQLDatasource(Datasource):
     # left side enforces the names on instance creation
     type: Literal["sql"] = "sql"
     connection_string: Union[ConfigStr, str]
-    create_temp_table: bool = True
+    create_temp_table: Union[bool, Literal["auto"]] = True
     kwargs: Dict[str, Union[ConfigStr, Any]] = pydantic.Field(
         default={},
         description="Optional dictionary of `kwargs` will be passed to the SQLAlchemy Engine"
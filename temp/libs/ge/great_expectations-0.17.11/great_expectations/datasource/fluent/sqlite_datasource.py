@@ -186,7 +186,8 @@ class SqliteDatasource(SQLDatasource):
         name: The name of this sqlite datasource.
         connection_string: The SQLAlchemy connection string used to connect to the sqlite database.
             For example: "sqlite:///path/to/file.db"
-        create_temp_table: Whether to leverage temporary tables during metric computation.
+        create_temp_table: Whether to leverage temporary tables during metric computation (or "auto", to
+            materialize query of Batch only when enough metric queries run against it).
         assets: An optional dictionary whose keys are TableAsset names and whose values
             are TableAsset objects.
     """
@@ -414,6 +414,10 @@ class ExecutionEngineError(DataContextError):
         super().__init__(self.message)
 
 
+class ChunkedBatchDataAccessError(ExecutionEngineError):
+    pass
+
+
 class BatchFilterError(DataContextError):
     def __init__(self, message) -> None:
         self.message = message
@@ -1,4 +1,5 @@
-from .execution_engine import ExecutionEngine
-from .pandas_execution_engine import PandasExecutionEngine
+from .execution_engine import ExecutionEngine  # isort:skip
+from .pandas_execution_engine import PandasExecutionEngine  # isort:skip
+from .chunked_pandas_execution_engine import ChunkedPandasExecutionEngine
 from .sparkdf_execution_engine import SparkDFExecutionEngine
 from .sqlalchemy_execution_engine import SqlAlchemyExecutionEngine
@@ -0,0 +1,457 @@
+"""
+Mergeable aggregates of metric values, with which "ChunkedPandasExecutionEngine" computes metrics one chunk at a time.
+
+Every "MetricAggregate" turns metric, computed on one chunk of Batch, into partial state, merges partial states of
+successive chunks, and finalizes merged state into metric value equal to that computed on entire Batch at once.  Means
+and standard deviations are merged as (count, mean, sum of squared deviations) triples, using parallel form of Welford's
+algorithm (Chan et al.), which is numerically stable regardless of number and sizes of chunks.
+
+Metrics, for which no aggregate is registered here, are not mergeable; "ChunkedPandasExecutionEngine" computes them on
+entire Batch (or refuses to, if so configured).
+"""
+from __future__ import annotations
+
+import ast
+import math
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+    SummarizationMetricNameSuffixes,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import PandasExecutionEngine
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
+
+# Metrics with these suffixes evaluate to row-aligned Series (i.e., they are only meaningful within their own chunk).
+CHUNK_LOCAL_METRIC_NAME_SUFFIXES: Tuple[str, ...] = (
+    MetricPartialFunctionTypeSuffixes.MAP.value,
+    MetricPartialFunctionTypeSuffixes.CONDITION.value,
+)
+
+# Map metrics, whose value for row depends on other rows (e.g., uniqueness); their unexpected counts cannot be merged.
+NON_ROW_WISE_MAP_METRIC_NAMES: Set[str] = {
+    "column_values.unique",
+    "column_values.increasing",
+    "column_values.decreasing",
+    "compound_columns.count",
+    "compound_columns.unique",
+}
+
+
+class MetricNotMergeableError(gx_exceptions.MetricError):
+    pass
+
+
+class MetricAggregate:
+    """
+    Base class of mergeable metric aggregates.
+
+    By default, partial state of chunk is metric value, computed on that chunk ("uses_chunk_metric_value" is True);
+    aggregates, which need more state than metric value carries (e.g., count alongside mean), compute their partial
+    state from chunk data directly instead.
+    """
+
+    uses_chunk_metric_value: bool = True
+
+    def is_mergeable(self, metric_configuration: MetricConfiguration) -> bool:
+        return True
+
+    def compute_partial(
+        self,
+        execution_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+        chunk_metric_value: Any,
+    ) -> Any:
+        return chunk_metric_value
+
+    def merge(
+        self, metric_configuration: MetricConfiguration, state: Any, partial: Any
+    ) -> Any:
+        raise NotImplementedError
+
+    def finalize(self, metric_configuration: MetricConfiguration, state: Any) -> Any:
+        return state
+
+    def is_complete(
+        self, metric_configuration: MetricConfiguration, state: Any
+    ) -> bool:
+        """Returns True if remaining chunks cannot change value of metric (so that they need not be read for it)."""
+        return False
+
+
+class SumAggregate(MetricAggregate):
+    def merge(
+        self, metric_configuration: MetricConfiguration, state: Any, partial: Any
+    ) -> Any:
+        return state + partial
+
+
+class ExtremumAggregate(MetricAggregate):
+    def __init__(self, extremum_fn: Callable[[Any, Any], Any]) -> None:
+        self._extremum_fn = extremum_fn
+
+    def merge(
+        self, metric_configuration: MetricConfiguration, state: Any, partial: Any
+    ) -> Any:
+        # Extremum of empty (or all-null) chunk is null; it must not displace extremum of other chunks.
+        if _is_null_scalar(value=state):
+            return partial
+
+        if _is_null_scalar(value=partial):
+            return state
+
+        return self._extremum_fn(state, partial)
+
+
+class MomentsAggregate(MetricAggregate):
+    """Mean or (sample) standard deviation of column, merged from (count, mean, M2) triples of chunks."""
+
+    uses_chunk_metric_value = False
+
+    def __init__(self, statistic: str) -> None:
+        if statistic not in ("mean", "standard_deviation"):
+            raise ValueError(f'Unrecognized statistic "{statistic}".')
+
+        self._statistic = statistic
+
+    def compute_partial(
+        self,
+        execution_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+        chunk_metric_value: Any,
+    ) -> Tuple[int, float, float]:
+        df: pd.DataFrame
+        accessor_domain_kwargs: dict
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_configuration.metric_domain_kwargs,
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        column: pd.Series = df[accessor_domain_kwargs["column"]]
+        if not (
+            pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column)
+        ):
+            raise MetricNotMergeableError(
+                f'Column "{column.name}" of dtype "{column.dtype}" has no mergeable moments.'
+            )
+
+        values: np.ndarray = column.dropna().to_numpy(dtype="float64")
+        if values.size == 0:
+            return 0, 0.0, 0.0
+
+        mean: float = float(values.mean())
+        return int(values.size), mean, float(np.square(values - mean).sum())
+
+    def merge(
+        self,
+        metric_configuration: MetricConfiguration,
+        state: Tuple[int, float, float],
+        partial: Tuple[int, float, float],
+    ) -> Tuple[int, float, float]:
+        count_a, mean_a, m2_a = state
+        count_b, mean_b, m2_b = partial
+        count: int = count_a + count_b
+        if count == 0:
+            return state
+
+        delta: float = mean_b - mean_a
+        mean: float = mean_a + delta * count_b / count
+        m2: float = m2_a + m2_b + delta * delta * count_a * count_b / count
+        return count, mean, m2
+
+    def finalize(
+        self, metric_configuration: MetricConfiguration, state: Tuple[int, float, float]
+    ) -> float:
+        count, mean, m2 = state
+        if self._statistic == "mean":
+            return mean if count > 0 else np.nan
+
+        # Consistent with "pandas.Series.std()", which computes sample standard deviation (ddof=1).
+        return math.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+
+class SetUnionAggregate(MetricAggregate):
+    def merge(
+        self, metric_configuration: MetricConfiguration, state: set, partial: set
+    ) -> set:
+        return set(state) | set(partial)
+
+
+class ValueCountsAggregate(MetricAggregate):
+    def merge(
+        self,
+        metric_configuration: MetricConfiguration,
+        state: pd.Series,
+        partial: pd.Series,
+    ) -> pd.Series:
+        return state.add(partial, fill_value=0).astype("int64")
+
+    def finalize(
+        self, metric_configuration: MetricConfiguration, state: pd.Series
+    ) -> pd.Series:
+        sort: str = metric_configuration.metric_value_kwargs.get("sort") or "value"
+        if sort == "value":
+            try:
+                state = state.sort_index()
+            except TypeError:
+                state.index = state.index.astype(str)
+                state = state.sort_index()
+        else:
+            state = state.sort_values(ascending=False, kind="stable")
+
+        state.name = "count"
+        state.index.name = "value"
+        return state
+
+
+class ColumnTypesAggregate(MetricAggregate):
+    def merge(
+        self,
+        metric_configuration: MetricConfiguration,
+        state: List[dict],
+        partial: List[dict],
+    ) -> List[dict]:
+        # Dtypes may differ among chunks (e.g., integer column, which has nulls in only some chunks, becomes float).
+        partial_types_by_name: Dict[str, Any] = {
+            column_type["name"]: column_type["type"] for column_type in partial
+        }
+        merged: List[dict] = []
+        column_type: dict
+        for column_type in state:
+            merged.append(
+                {
+                    "name": column_type["name"],
+                    "type": _get_common_dtype(
+                        dtype_a=column_type["type"],
+                        dtype_b=partial_types_by_name.get(
+                            column_type["name"], column_type["type"]
+                        ),
+                    ),
+                }
+            )
+
+        return merged
+
+
+class FirstChunkAggregate(MetricAggregate):
+    """Metric (e.g., "table.columns"), whose value on first chunk is its value on entire Batch."""
+
+    def is_complete(
+        self, metric_configuration: MetricConfiguration, state: Any
+    ) -> bool:
+        return True
+
+
+class TableHeadAggregate(MetricAggregate):
+    def is_mergeable(self, metric_configuration: MetricConfiguration) -> bool:
+        n_rows: Optional[int] = _get_head_n_rows(
+            metric_configuration=metric_configuration
+        )
+        return (
+            not metric_configuration.metric_value_kwargs.get("fetch_all")
+            and n_rows is not None
+        )
+
+    def merge(
+        self,
+        metric_configuration: MetricConfiguration,
+        state: pd.DataFrame,
+        partial: pd.DataFrame,
+    ) -> pd.DataFrame:
+        return pd.concat([state, partial], axis=0).head(
+            _get_head_n_rows(metric_configuration=metric_configuration)
+        )
+
+    def is_complete(
+        self, metric_configuration: MetricConfiguration, state: pd.DataFrame
+    ) -> bool:
+        return len(state.index) >= _get_head_n_rows(  # type: ignore[operator] # is mergeable
+            metric_configuration=metric_configuration
+        )
+
+
+class BoundedConcatenationAggregate(MetricAggregate):
+    """Unexpected values, indices, or rows of chunks, concatenated up to "partial_unexpected_count" of "result_format"."""
+
+    def merge(
+        self, metric_configuration: MetricConfiguration, state: Any, partial: Any
+    ) -> Any:
+        limit: Optional[int] = _get_unexpected_list_limit(
+            metric_configuration=metric_configuration
+        )
+        if isinstance(state, pd.DataFrame):
+            merged: Any = pd.concat([state, partial], axis=0)
+            return merged if limit is None else merged.iloc[:limit]
+
+        if isinstance(state, tuple):
+            # Unexpected values of map metrics, which also compute mapped values, are pairs of parallel lists.
+            return tuple(
+                self.merge(
+                    metric_configuration=metric_configuration,
+                    state=state_element,
+                    partial=partial_element,
+                )
+                for state_element, partial_element in zip(state, partial)
+            )
+
+        merged = list(state) + list(partial)
+        return merged if limit is None else merged[:limit]
+
+    def is_complete(
+        self, metric_configuration: MetricConfiguration, state: Any
+    ) -> bool:
+        limit: Optional[int] = _get_unexpected_list_limit(
+            metric_configuration=metric_configuration
+        )
+        if limit is None:
+            return False
+
+        if isinstance(state, tuple):
+            return all(len(state_element) >= limit for state_element in state)
+
+        return len(state) >= limit
+
+
+class UnexpectedIndexQueryAggregate(MetricAggregate):
+    """Pandas unexpected index query ("df.filter(items=[...], axis=0)"), merged from index lists of chunks."""
+
+    _QUERY_PREFIX: str = "df.filter(items="
+    _QUERY_SUFFIX: str = ", axis=0)"
+
+    def compute_partial(
+        self,
+        execution_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+        chunk_metric_value: Optional[str],
+    ) -> Optional[list]:
+        if chunk_metric_value is None:
+            return None
+
+        try:
+            return ast.literal_eval(
+                chunk_metric_value[len(self._QUERY_PREFIX) : -len(self._QUERY_SUFFIX)]
+            )
+        except (ValueError, SyntaxError):
+            raise MetricNotMergeableError(
+                f'Unexpected index query "{chunk_metric_value[:100]}" cannot be merged.'
+            )
+
+    def merge(
+        self,
+        metric_configuration: MetricConfiguration,
+        state: Optional[list],
+        partial: Optional[list],
+    ) -> Optional[list]:
+        if state is None or partial is None:
+            return None
+
+        return state + partial
+
+    def finalize(
+        self, metric_configuration: MetricConfiguration, state: Optional[list]
+    ) -> Optional[str]:
+        if state is None:
+            return None
+
+        return f"{self._QUERY_PREFIX}{state}{self._QUERY_SUFFIX}"
+
+
+_METRIC_AGGREGATES_BY_METRIC_NAME: Dict[str, MetricAggregate] = {
+    "table.row_count": SumAggregate(),
+    "table.columns": FirstChunkAggregate(),
+    "table.column_types": ColumnTypesAggregate(),
+    "table.head": TableHeadAggregate(),
+    "column.sum": SumAggregate(),
+    "column.min": ExtremumAggregate(extremum_fn=min),
+    "column.max": ExtremumAggregate(extremum_fn=max),
+    "column.mean": MomentsAggregate(statistic="mean"),
+    "column.standard_deviation": MomentsAggregate(statistic="standard_deviation"),
+    "column.distinct_values": SetUnionAggregate(),
+    "column.value_counts": ValueCountsAggregate(),
+    "column_values.length.min": ExtremumAggregate(extremum_fn=min),
+    "column_values.length.max": ExtremumAggregate(extremum_fn=max),
+    "column_values.nonnull.count": SumAggregate(),
+}
+
+_METRIC_AGGREGATES_BY_METRIC_NAME_SUFFIX: Dict[str, MetricAggregate] = {
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value: SumAggregate(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value: BoundedConcatenationAggregate(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value: BoundedConcatenationAggregate(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value: BoundedConcatenationAggregate(),
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value: UnexpectedIndexQueryAggregate(),
+}
+
+
+def get_metric_aggregate(
+    metric_configuration: MetricConfiguration,
+) -> Optional[MetricAggregate]:
+    """Returns "MetricAggregate" for metric (if metric is mergeable across chunks with its value kwargs); else None."""
+    metric_name: str = metric_configuration.metric_name
+    metric_aggregate: Optional[MetricAggregate] = _METRIC_AGGREGATES_BY_METRIC_NAME.get(
+        metric_name
+    )
+    map_metric_name: str
+    metric_name_suffix: str
+    if metric_aggregate is None and "." in metric_name:
+        map_metric_name, metric_name_suffix = metric_name.rsplit(".", 1)
+        if map_metric_name not in NON_ROW_WISE_MAP_METRIC_NAMES:
+            metric_aggregate = _METRIC_AGGREGATES_BY_METRIC_NAME_SUFFIX.get(
+                metric_name_suffix
+            )
+
+    if metric_aggregate is None or not metric_aggregate.is_mergeable(
+        metric_configuration=metric_configuration
+    ):
+        return None
+
+    return metric_aggregate
+
+
+def is_chunk_local_metric(metric_name: str) -> bool:
+    return metric_name.rsplit(".", 1)[-1] in CHUNK_LOCAL_METRIC_NAME_SUFFIXES
+
+
+def _is_null_scalar(value: Any) -> bool:
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _get_common_dtype(dtype_a: Any, dtype_b: Any) -> Any:
+    if dtype_a == dtype_b:
+        return dtype_a
+
+    try:
+        return np.result_type(dtype_a, dtype_b)
+    except TypeError:
+        return np.dtype("object")
+
+
+def _get_head_n_rows(metric_configuration: MetricConfiguration) -> Optional[int]:
+    n_rows: Optional[int] = metric_configuration.metric_value_kwargs.get("n_rows")
+    if n_rows is None:
+        n_rows = 5
+
+    # Negative "n_rows" (all rows except last ones) cannot be determined before all chunks are read.
+    return n_rows if n_rows >= 0 else None
+
+
+def _get_unexpected_list_limit(
+    metric_configuration: MetricConfiguration,
+) -> Optional[int]:
+    result_format: dict = (
+        metric_configuration.metric_value_kwargs.get("result_format") or {}
+    )
+    if result_format.get("result_format") == "COMPLETE":
+        return None
+
+    return result_format.get("partial_unexpected_count", 20)
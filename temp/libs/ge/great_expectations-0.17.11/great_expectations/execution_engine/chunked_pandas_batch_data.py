@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import pathlib
+import tempfile
+from collections.abc import Sequence
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+
+logger = logging.getLogger(__name__)
+
+DataFrameChunksSource = Union[
+    Iterable[pd.DataFrame], Callable[[], Iterable[pd.DataFrame]]
+]
+DataFrameChunkTransformFn = Callable[[pd.DataFrame], pd.DataFrame]
+
+
+class ChunkedPandasBatchData(PandasBatchData):
+    """
+    Batch of Pandas data, held as sequence of "DataFrame" chunks (instead of one "DataFrame") and read one chunk at a time.
+
+    Chunks can be supplied as sequence (e.g., list), as callable returning new iterator on every call
+    (e.g., "lambda: pd.read_csv(path, chunksize=100_000)"), or as one-shot iterator (e.g., "TextFileReader" or
+    "cursor.fetch_pandas_batches()"); the latter is spilled to temporary directory (one pickle file per chunk) while it
+    is consumed for the first time, so that subsequent passes replay chunks from disk rather than from memory.
+
+    Chunks, whose index is "RangeIndex", are re-indexed to continue numbering of preceding chunks (as if all chunks had
+    been concatenated), so that row indices reported in validation results identify rows of entire Batch.
+
+    Outside of "ChunkedPandasExecutionEngine" chunk scopes, "dataframe" property is not available (accessing it raises
+    "ChunkedBatchDataAccessError"); "materialize()" returns entire Batch as one "DataFrame" explicitly.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunks: DataFrameChunksSource,
+        chunk_transform_fn: Optional[DataFrameChunkTransformFn] = None,
+        spill_directory: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            execution_engine: ExecutionEngine, to which this BatchData belongs.
+            chunks: Sequence of, callable returning iterator over, or one-shot iterator over DataFrames.
+            chunk_transform_fn: Optional function, applied to every chunk upon reading (e.g., row-wise splitting).
+            spill_directory: Parent directory for temporary spill files of one-shot iterator (default: system temp).
+        """
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type]
+        self._chunks = chunks
+        self._chunk_transform_fn = chunk_transform_fn
+        self._spill_directory = spill_directory
+        self._spilled_chunks: Optional[tempfile.TemporaryDirectory] = None
+        self._num_spilled_chunks: int = 0
+        self._spill_complete: bool = False
+        self._current_chunk: Optional[pd.DataFrame] = None
+        self._num_chunks: Optional[int] = None
+        self._row_count: Optional[int] = None
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        if self._current_chunk is None:
+            raise gx_exceptions.ChunkedBatchDataAccessError(
+                message="""ChunkedPandasBatchData is not available as single DataFrame outside of chunk scope; use \
+"materialize()" in order to load entire Batch into memory.
+"""
+            )
+
+        return self._current_chunk
+
+    @property
+    def num_chunks(self) -> Optional[int]:
+        """Number of chunks (known after first complete pass over chunks; None before then)."""
+        return self._num_chunks
+
+    @property
+    def row_count(self) -> Optional[int]:
+        """Number of rows in all chunks (known after first complete pass over chunks; None before then)."""
+        return self._row_count
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yields chunks of Batch (one "DataFrame" at a time), starting from first chunk on every call."""
+        source_row_offset: int = 0
+        row_count: int = 0
+        num_chunks: int = 0
+        num_source_rows: int
+        source_chunk: pd.DataFrame
+        chunk: pd.DataFrame
+        for source_chunk in self._iter_source_chunks():
+            chunk = source_chunk
+            num_source_rows = len(chunk.index)
+            if (
+                isinstance(chunk.index, pd.RangeIndex)
+                and chunk.index.start != source_row_offset
+            ):
+                chunk = chunk.set_axis(
+                    pd.RangeIndex(
+                        start=source_row_offset,
+                        stop=source_row_offset + num_source_rows,
+                    ),
+                    axis=0,
+                )
+
+            if self._chunk_transform_fn is not None:
+                chunk = self._chunk_transform_fn(chunk)
+
+            source_row_offset += num_source_rows
+            row_count += len(chunk.index)
+            num_chunks += 1
+            yield chunk
+
+        self._num_chunks = num_chunks
+        self._row_count = row_count
+
+    @contextlib.contextmanager
+    def chunk_scope(self, chunk: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        """Makes "chunk" available through "dataframe" property (as if it were entire Batch) for duration of scope."""
+        previous_chunk: Optional[pd.DataFrame] = self._current_chunk
+        self._current_chunk = chunk
+        try:
+            yield chunk
+        finally:
+            self._current_chunk = previous_chunk
+
+    def materialize(self) -> pd.DataFrame:
+        """Returns entire Batch as one "DataFrame" (concatenating all chunks in memory)."""
+        chunks: List[pd.DataFrame] = list(self.iter_chunks())
+        if not chunks:
+            return pd.DataFrame()
+
+        return pd.concat(chunks, axis=0, copy=False)
+
+    def _iter_source_chunks(self) -> Iterator[pd.DataFrame]:
+        if callable(self._chunks):
+            yield from self._chunks()
+            return
+
+        if isinstance(self._chunks, Sequence):
+            yield from self._chunks
+            return
+
+        # One-shot iterator: replay chunks spilled so far; then continue consuming (and spilling) source iterator.
+        yield from self._iter_spilled_chunks()
+        if not self._spill_complete:
+            yield from self._spill_chunks()
+
+    def _spill_chunks(self) -> Iterator[pd.DataFrame]:
+        if self._spilled_chunks is None:
+            self._spilled_chunks = tempfile.TemporaryDirectory(
+                prefix="gx_chunked_batch_data_", dir=self._spill_directory
+            )
+            logger.debug(
+                f"Spilling one-shot iterator of DataFrame chunks to {self._spilled_chunks.name}."
+            )
+
+        chunk: pd.DataFrame
+        for chunk in self._chunks:  # type: ignore[union-attr] # not callable here
+            chunk.to_pickle(self._get_spilled_chunk_path(idx=self._num_spilled_chunks))
+            self._num_spilled_chunks += 1
+            yield chunk
+
+        self._spill_complete = True
+
+    def _iter_spilled_chunks(self) -> Iterator[pd.DataFrame]:
+        idx: int
+        for idx in range(self._num_spilled_chunks):
+            yield pd.read_pickle(self._get_spilled_chunk_path(idx=idx))
+
+    def _get_spilled_chunk_path(self, idx: int) -> str:
+        return str(
+            pathlib.Path(self._spilled_chunks.name)  # type: ignore[union-attr] # spilled_chunks is set
+            / f"chunk_{idx:06d}.pkl"
+        )
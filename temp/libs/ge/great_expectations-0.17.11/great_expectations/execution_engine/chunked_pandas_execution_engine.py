@@ -0,0 +1,577 @@
+from __future__ import annotations
+
+import contextlib
+import datetime
+import logging
+import pathlib
+from collections import ChainMap
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core._docs_decorators import public_api
+from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.batch_spec import (
+    BatchSpec,
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+)
+from great_expectations.execution_engine.chunked_metric_aggregates import (
+    MetricAggregate,
+    MetricNotMergeableError,
+    get_metric_aggregate,
+    is_chunk_local_metric,
+)
+from great_expectations.execution_engine.chunked_pandas_batch_data import (
+    ChunkedPandasBatchData,
+)
+from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+    hash_pandas_dataframe,
+)
+
+if TYPE_CHECKING:
+    import os
+
+    from great_expectations.core.batch import BatchData
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class _ChunkLocalMetricValue:
+    """Stands in for value of chunk-local metric (e.g., map condition), which is recomputed within every chunk."""
+
+    def __repr__(self) -> str:
+        return "<chunk-local metric value>"
+
+
+CHUNK_LOCAL_METRIC_VALUE = _ChunkLocalMetricValue()
+
+_NO_STATE = object()
+
+
+@public_api
+class ChunkedPandasExecutionEngine(PandasExecutionEngine):
+    """ChunkedPandasExecutionEngine validates Pandas data, which is supplied (or read) as sequence of DataFrame chunks.
+
+    Peak memory stays close to that of one chunk: metrics are computed chunk by chunk and merged (counts, sums, minima
+    and maxima, means and standard deviations, value counts, unexpected counts, and bounded lists of unexpected values,
+    indices, and rows).  Metrics, which cannot be merged across chunks (e.g., median or quantiles), are computed on
+    entire Batch, concatenated in memory, with warning; if "allow_materialization" is False, an error is raised instead.
+
+    Batch data can be either passed as runtime "batch_data" (list of DataFrames, callable returning iterator over
+    DataFrames, or one-shot iterator, such as "pd.read_csv(path, chunksize=...)" or "cursor.fetch_pandas_batches()")
+    or read from file, whose "reader_options" include "chunksize".  Batches, given as single DataFrame, are validated
+    exactly as by "PandasExecutionEngine".
+
+    Args:
+        *args: Positional arguments for configuring ChunkedPandasExecutionEngine
+        allow_materialization: If False, metrics that cannot be merged across chunks raise an error.
+        spill_directory: Parent directory for temporary spill files of one-shot chunk iterators (default: system temp).
+        **kwargs: Keyword arguments for configuring ChunkedPandasExecutionEngine
+
+    For example:
+    ```python
+        execution_engine = ChunkedPandasExecutionEngine()
+        batch_request = RuntimeBatchRequest(
+            ...,
+            runtime_parameters={"batch_data": pd.read_csv(path, chunksize=100_000)},
+        )
+    ```
+    """
+
+    def __init__(
+        self,
+        *args,
+        allow_materialization: bool = True,
+        spill_directory: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        self._allow_materialization = allow_materialization
+        self._spill_directory = spill_directory
+
+        super().__init__(*args, **kwargs)
+
+        self._config.update(
+            {
+                "allow_materialization": self._allow_materialization,
+                "spill_directory": self._spill_directory,
+            }
+        )
+
+    def configure_validator(self, validator) -> None:
+        super().configure_validator(validator)
+        # Chunked Batch is never available as single DataFrame, whose methods could be exposed.
+        validator.expose_dataframe_methods = False
+
+    def get_batch_data_and_markers(
+        self, batch_spec: BatchSpec
+    ) -> Tuple[Any, BatchMarkers]:  # batch_data
+        if isinstance(batch_spec, RuntimeDataBatchSpec) and not isinstance(
+            batch_spec.batch_data, (pd.DataFrame, PandasBatchData, str)
+        ):
+            chunks: Any = batch_spec.batch_data
+            batch_spec.batch_data = "PandasDataFrameChunks"
+        elif (
+            isinstance(batch_spec, PathBatchSpec)
+            and not batch_spec.path.startswith(("s3", "gs", "wasb", "abfs"))
+            and (batch_spec.reader_options or {}).get("chunksize")
+        ):
+            # Files are re-opened on every pass over chunks (instead of being spilled).
+            chunks = partial(self._iter_file_chunks, batch_spec)
+        else:
+            return super().get_batch_data_and_markers(batch_spec=batch_spec)
+
+        batch_markers = BatchMarkers(
+            {
+                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
+                    "%Y%m%dT%H%M%S.%fZ"
+                )
+            }
+        )
+
+        if batch_spec.get("sampling_method") in (
+            "sample_using_limit",
+            "_sample_using_limit",
+        ):
+            raise gx_exceptions.ExecutionEngineError(
+                message=f"""ChunkedPandasExecutionEngine cannot apply sampling method \
+"{batch_spec['sampling_method']}", which is not row-wise, to chunks of Batch.
+"""
+            )
+
+        typed_batch_data = ChunkedPandasBatchData(
+            execution_engine=self,
+            chunks=chunks,
+            chunk_transform_fn=partial(
+                self._apply_splitting_and_sampling_methods, batch_spec
+            ),
+            spill_directory=self._spill_directory,
+        )
+        # One-shot iterators of chunks have no version (unless "data_version" is supplied in Batch Spec).
+        typed_batch_data.data_version = self._get_data_version(
+            batch_spec=batch_spec,
+            get_source_version=partial(_get_local_file_version, batch_spec.path)
+            if isinstance(batch_spec, PathBatchSpec)
+            else partial(_get_chunks_version, chunks),
+        )
+
+        return typed_batch_data, batch_markers
+
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics of chunked Batches chunk by chunk (see class docstring); delegates others to "PandasExecutionEngine"."""
+        if not metrics_to_resolve:
+            return metrics or {}
+
+        if metrics is None:
+            metrics = {}
+
+        metrics_by_chunked_batch_data: Dict[int, List[MetricConfiguration]] = {}
+        chunked_batch_data_by_id: Dict[int, ChunkedPandasBatchData] = {}
+        unchunked_metrics: List[MetricConfiguration] = []
+
+        batch_data: Optional[BatchData]
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            batch_data = self._get_metric_batch_data(
+                metric_configuration=metric_configuration
+            )
+            if isinstance(batch_data, ChunkedPandasBatchData):
+                chunked_batch_data_by_id[id(batch_data)] = batch_data
+                metrics_by_chunked_batch_data.setdefault(id(batch_data), []).append(
+                    metric_configuration
+                )
+            else:
+                unchunked_metrics.append(metric_configuration)
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if unchunked_metrics:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=unchunked_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        chunked_batch_data: ChunkedPandasBatchData
+        mergeable_metrics: List[Tuple[MetricConfiguration, MetricAggregate]]
+        unmergeable_metrics: List[MetricConfiguration]
+        metric_aggregate: Optional[MetricAggregate]
+        for batch_data_id, chunked_batch_data in chunked_batch_data_by_id.items():
+            mergeable_metrics = []
+            unmergeable_metrics = []
+            for metric_configuration in metrics_by_chunked_batch_data[batch_data_id]:
+                if is_chunk_local_metric(metric_name=metric_configuration.metric_name):
+                    resolved_metrics[metric_configuration.id] = CHUNK_LOCAL_METRIC_VALUE
+                    continue
+
+                metric_aggregate = get_metric_aggregate(
+                    metric_configuration=metric_configuration
+                )
+                if metric_aggregate is None:
+                    unmergeable_metrics.append(metric_configuration)
+                else:
+                    mergeable_metrics.append((metric_configuration, metric_aggregate))
+
+            resolved_metrics.update(
+                self._resolve_mergeable_metrics(
+                    batch_data=chunked_batch_data,
+                    mergeable_metrics=mergeable_metrics,
+                    unmergeable_metrics=unmergeable_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+            resolved_metrics.update(
+                self._resolve_unmergeable_metrics(
+                    batch_data=chunked_batch_data,
+                    unmergeable_metrics=unmergeable_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        self._cache_resolved_metrics(
+            resolved_metrics=resolved_metrics,
+            metric_configurations=metrics_to_resolve,
+        )
+
+        return resolved_metrics
+
+    def _resolve_mergeable_metrics(  # noqa: PLR0913
+        self,
+        batch_data: ChunkedPandasBatchData,
+        mergeable_metrics: List[Tuple[MetricConfiguration, MetricAggregate]],
+        unmergeable_metrics: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Computes metrics in single pass over chunks, merging partial states of successive chunks.
+
+        Metrics, which turn out not to be mergeable (e.g., mean of non-numeric column), are moved to "unmergeable_metrics".
+        """
+        if not mergeable_metrics:
+            return {}
+
+        states: Dict[Tuple[str, str, str], Any] = {
+            metric_configuration.id: _NO_STATE
+            for metric_configuration, _ in mergeable_metrics
+        }
+        pending_metrics: List[Tuple[MetricConfiguration, MetricAggregate]] = list(
+            mergeable_metrics
+        )
+
+        chunk: pd.DataFrame
+        chunk_metrics: Dict[Tuple[str, str, str], MetricValue]
+        metric_configuration: MetricConfiguration
+        metric_aggregate: MetricAggregate
+        partial_state: Any
+        for chunk in batch_data.iter_chunks():
+            with batch_data.chunk_scope(chunk=chunk), self._chunk_scoped_metric_cache():
+                chunk_metrics = self._resolve_on_current_chunk(
+                    metrics_to_resolve=[
+                        metric_configuration
+                        for metric_configuration, metric_aggregate in pending_metrics
+                        if metric_aggregate.uses_chunk_metric_value
+                    ],
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+                for metric_configuration, metric_aggregate in list(pending_metrics):
+                    try:
+                        partial_state = metric_aggregate.compute_partial(
+                            execution_engine=self,
+                            metric_configuration=metric_configuration,
+                            chunk_metric_value=chunk_metrics.get(
+                                metric_configuration.id
+                            ),
+                        )
+                    except MetricNotMergeableError as e:
+                        logger.debug(str(e))
+                        pending_metrics.remove((metric_configuration, metric_aggregate))
+                        del states[metric_configuration.id]
+                        unmergeable_metrics.append(metric_configuration)
+                        continue
+
+                    if states[metric_configuration.id] is _NO_STATE:
+                        states[metric_configuration.id] = partial_state
+                    else:
+                        states[metric_configuration.id] = metric_aggregate.merge(
+                            metric_configuration=metric_configuration,
+                            state=states[metric_configuration.id],
+                            partial=partial_state,
+                        )
+
+                    if metric_aggregate.is_complete(
+                        metric_configuration=metric_configuration,
+                        state=states[metric_configuration.id],
+                    ):
+                        pending_metrics.remove((metric_configuration, metric_aggregate))
+
+            if not pending_metrics:
+                break
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        empty_batch_metrics: List[MetricConfiguration] = []
+        for metric_configuration, metric_aggregate in mergeable_metrics:
+            if metric_configuration.id not in states:
+                continue
+
+            if states[metric_configuration.id] is _NO_STATE:
+                # Batch has no chunks; metric is computed on empty DataFrame (as it would be on empty Batch).
+                empty_batch_metrics.append(metric_configuration)
+                continue
+
+            resolved_metrics[metric_configuration.id] = metric_aggregate.finalize(
+                metric_configuration=metric_configuration,
+                state=states[metric_configuration.id],
+            )
+
+        if empty_batch_metrics:
+            with batch_data.chunk_scope(
+                chunk=pd.DataFrame()
+            ), self._chunk_scoped_metric_cache():
+                resolved_metrics.update(
+                    self._resolve_on_current_chunk(
+                        metrics_to_resolve=empty_batch_metrics,
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+
+        return resolved_metrics
+
+    def _resolve_unmergeable_metrics(
+        self,
+        batch_data: ChunkedPandasBatchData,
+        unmergeable_metrics: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Computes metrics, which cannot be merged across chunks.
+
+        Metrics, which do not access data (e.g., those derived from other metrics only), are computed as is; remaining
+        ones are computed on entire Batch, materialized in memory (unless "allow_materialization" is False).
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        materialized_metrics: List[MetricConfiguration] = []
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in unmergeable_metrics:
+            if self._depends_on_chunk_local_metrics(
+                metric_configuration=metric_configuration, metrics=metrics
+            ):
+                materialized_metrics.append(metric_configuration)
+                continue
+
+            try:
+                resolved_metrics.update(
+                    super().resolve_metrics(
+                        metrics_to_resolve=[metric_configuration],
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+            except gx_exceptions.MetricResolutionError as e:
+                if not isinstance(
+                    e.__cause__, gx_exceptions.ChunkedBatchDataAccessError
+                ):
+                    raise
+
+                materialized_metrics.append(metric_configuration)
+
+        if not materialized_metrics:
+            return resolved_metrics
+
+        metric_names: List[str] = sorted(
+            {
+                metric_configuration.metric_name
+                for metric_configuration in materialized_metrics
+            }
+        )
+        if not self._allow_materialization:
+            raise gx_exceptions.MetricResolutionError(
+                message=f"""Metrics {metric_names} cannot be merged across chunks, and ChunkedPandasExecutionEngine \
+is configured with "allow_materialization: false".
+""",
+                failed_metrics=materialized_metrics,
+            )
+
+        logger.warning(
+            f"""Metrics {metric_names} cannot be merged across chunks; computing them on entire Batch, loaded into \
+memory at once."""
+        )
+        with batch_data.chunk_scope(
+            chunk=batch_data.materialize()
+        ), self._chunk_scoped_metric_cache():
+            resolved_metrics.update(
+                self._resolve_on_current_chunk(
+                    metrics_to_resolve=materialized_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    def _resolve_on_current_chunk(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics (together with their chunk-local dependencies) on chunk, which is currently in scope."""
+        if not metrics_to_resolve:
+            return {}
+
+        chunk_metrics: Dict[Tuple[str, str, str], MetricValue] = dict(metrics)
+        chunk_local_dependencies: List[MetricConfiguration] = []
+        self._collect_chunk_local_dependencies(
+            metric_configurations=metrics_to_resolve,
+            metrics=metrics,
+            collected=chunk_local_dependencies,
+            visited=set(),
+        )
+        metric_configuration: MetricConfiguration
+        for metric_configuration in chunk_local_dependencies:
+            # Dependencies are collected in topological order (each one follows those, on which it depends).
+            chunk_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=[metric_configuration],
+                    metrics=chunk_metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return super().resolve_metrics(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=chunk_metrics,
+            runtime_configuration=runtime_configuration,
+        )
+
+    def _collect_chunk_local_dependencies(
+        self,
+        metric_configurations: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        collected: List[MetricConfiguration],
+        visited: Set[Tuple[str, str, str]],
+    ) -> None:
+        metric_configuration: MetricConfiguration
+        dependency: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            for dependency in metric_configuration.metric_dependencies.values():
+                if dependency.id in visited or not self._is_chunk_local_value(
+                    metric_configuration=dependency, metrics=metrics
+                ):
+                    continue
+
+                visited.add(dependency.id)
+                self._collect_chunk_local_dependencies(
+                    metric_configurations=[dependency],
+                    metrics=metrics,
+                    collected=collected,
+                    visited=visited,
+                )
+                collected.append(dependency)
+
+    def _depends_on_chunk_local_metrics(
+        self,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> bool:
+        return any(
+            self._is_chunk_local_value(metric_configuration=dependency, metrics=metrics)
+            for dependency in metric_configuration.metric_dependencies.values()
+        )
+
+    def _is_chunk_local_value(
+        self,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> bool:
+        if metric_configuration.id in metrics:
+            return metrics[metric_configuration.id] is CHUNK_LOCAL_METRIC_VALUE
+
+        return (
+            self._metric_cache.get(metric_configuration.id)  # type: ignore[union-attr] # NoOpDict
+            is CHUNK_LOCAL_METRIC_VALUE
+            if self._caching
+            else False
+        )
+
+    def _get_metric_batch_data(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[BatchData]:
+        batch_id: Optional[str] = metric_configuration.metric_domain_kwargs.get(
+            "batch_id"
+        )
+        if batch_id is None:
+            return self.batch_manager.active_batch_data
+
+        return self.batch_manager.batch_data_cache.get(batch_id)
+
+    @contextlib.contextmanager
+    def _chunk_scoped_metric_cache(self) -> Iterator[None]:
+        # Values, computed on one chunk, must never be cached as values of entire Batch; they are written to scratch
+        # layer (discarded at end of scope), while values cached so far remain readable.
+        if not self._caching:
+            yield
+            return
+
+        metric_cache: Dict = self._metric_cache  # type: ignore[assignment] # caching is enabled
+        self._metric_cache = ChainMap({}, metric_cache)  # type: ignore[assignment] # mapping
+        try:
+            yield
+        finally:
+            self._metric_cache = metric_cache
+
+    def _iter_file_chunks(self, batch_spec: PathBatchSpec) -> Iterator[pd.DataFrame]:
+        reader_method: str = batch_spec.reader_method
+        reader_options: dict = batch_spec.reader_options or {}
+        path: str = batch_spec.path
+        reader_fn = self._get_reader_fn(reader_method, path)
+        with self._read_file(reader_fn, path, reader_options, batch_spec) as reader:
+            yield from reader
+
+
+def _get_local_file_version(path: str) -> Optional[str]:
+    try:
+        stat_result: os.stat_result = pathlib.Path(path).stat()
+    except OSError:
+        return None
+
+    return f"{stat_result.st_mtime_ns}:{stat_result.st_size}"
+
+
+def _get_chunks_version(chunks: Any) -> Optional[str]:
+    # Only sequences of chunks can be fingerprinted without consuming them (columns and dtypes of every chunk included).
+    if not isinstance(chunks, Sequence):
+        return None
+
+    return ":".join(hash_pandas_dataframe(chunk) for chunk in chunks)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
@@ -21,7 +23,15 @@ import great_expectations.exceptions as gx_exceptions
 from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.tracing import trace_span
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    MetricCacheConfig,
+)
+from great_expectations.execution_engine.persistent_metric_cache import (
+    PersistentMetricCache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -58,7 +68,7 @@ class NoOpDict:
         return None
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
-    def update(self, value):
+    def update(self, value, batch_ids=None):
         return None
 
 
@@ -131,6 +141,8 @@ class ExecutionEngine(ABC):
     Args:
         name: (str) name of this ExecutionEngine
         caching: (Boolean) if True (default), then resolved (computed) metrics are added to local in-memory cache.
+        metric_cache_config: dictionary of "MetricCacheConfig" options (bounds, expiration, and release of intermediate
+            metrics, applicable if "caching" is True; and location and bounds of persistent cross-run metric cache).
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
@@ -145,19 +157,34 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        metric_cache_config: Optional[dict] = None,
     ) -> None:
         self.name = name
         self._validator = validator
 
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
-        # (e.g. self.spark_df) over the lifetime of the dataset instance
+        # (e.g. self.spark_df) over the lifetime of the dataset instance; metrics of Batch are invalidated, whenever
+        # different data is loaded under its Batch ID.
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
+        metric_cache_config_obj: MetricCacheConfig = MetricCacheConfig.from_dict(
+            metric_cache_config
+        )
         if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+            self._metric_cache: Union[MetricCache, NoOpDict] = MetricCache(
+                config=metric_cache_config_obj
+            )
         else:
             self._metric_cache = NoOpDict()
 
+        self._persistent_metric_cache: Optional[PersistentMetricCache] = None
+        if metric_cache_config_obj.persistent_cache_path:
+            self._persistent_metric_cache = PersistentMetricCache(
+                path=metric_cache_config_obj.persistent_cache_path,
+                max_bytes=metric_cache_config_obj.persistent_cache_max_bytes,
+                max_entries=metric_cache_config_obj.persistent_cache_max_entries,
+                ttl_seconds=metric_cache_config_obj.persistent_cache_ttl_seconds,
+            )
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
 
@@ -190,6 +217,7 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache_config": metric_cache_config,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -214,6 +242,96 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def metric_cache(self) -> Optional[MetricCache]:
+        """Cache of resolved metrics (None if caching is disabled)."""
+        if isinstance(self._metric_cache, MetricCache):
+            return self._metric_cache
+
+        return None
+
+    @property
+    def release_intermediate_metrics(self) -> bool:
+        """
+        If True, "ValidationGraph" releases metrics, which are only dependencies of requested metrics, as soon as all
+        metrics depending on them are resolved (and they are not kept in metric cache).
+        """
+        metric_cache: Optional[MetricCache] = self.metric_cache
+        return (
+            metric_cache is not None
+            and metric_cache.config.release_intermediate_metrics
+        )
+
+    @property
+    def persistent_metric_cache(self) -> Optional[PersistentMetricCache]:
+        """Cache of metrics, kept across runs (None if not configured)."""
+        return self._persistent_metric_cache
+
+    def get_batch_data_version(self, batch_id: Optional[str] = None) -> Optional[str]:
+        """
+        Returns data version of loaded Batch (active Batch, if "batch_id" is None), or None if it is unknown.
+
+        Data version is set by "get_batch_data_and_markers()" (only if persistent metric cache is configured), and
+        identifies data of Batch across runs; metrics of Batches without data version are not cached across runs.
+        """
+        if batch_id is None:
+            batch_id = self._batch_manager.active_batch_data_id
+
+        if batch_id is None or batch_id not in self._batch_manager.batch_data_cache:
+            return None
+
+        return getattr(
+            self._batch_manager.batch_data_cache[batch_id], "data_version", None
+        )
+
+    def _get_data_version(
+        self,
+        batch_spec: BatchSpec,
+        get_source_version: Callable[[], Any],
+    ) -> Optional[str]:
+        """
+        Returns data version for Batch, loaded according to "batch_spec" (None if persistent metric cache is not
+        configured, or if version of source data is unknown).
+
+        Version of source data (e.g., fingerprint of DataFrame, or modification time of table) is taken from
+        "data_version" directive of "batch_spec" (e.g., supplied through "batch_spec_passthrough"), if present, or else
+        is obtained by calling "get_source_version"; it is combined with "batch_spec" itself (which determines, how
+        source data is split, sampled, etc.) and with type of this ExecutionEngine.
+        """
+        if self._persistent_metric_cache is None:
+            return None
+
+        source_version: Any = batch_spec.get("data_version")
+        if source_version is None:
+            source_version = get_source_version()
+
+        if source_version is None:
+            return None
+
+        try:
+            batch_spec_id: Any = batch_spec.to_id(id_ignore_keys={"batch_data"})
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Data version of Batch cannot be determined: {e}")
+            return None
+
+        return hashlib.md5(
+            json.dumps(
+                [self.__class__.__name__, str(batch_spec_id), str(source_version)]
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def discard_cached_metrics(
+        self, metric_ids: Iterable[Tuple[str, str, str]]
+    ) -> None:
+        """Removes given metrics from metric cache (if cached)."""
+        metric_cache: Optional[MetricCache] = self.metric_cache
+        if metric_cache is None:
+            return
+
+        metric_id: Tuple[str, str, str]
+        for metric_id in metric_ids:
+            metric_cache.discard(metric_id=metric_id)
+
     def _load_batch_data_from_dict(
         self, batch_data_dict: Dict[str, BatchDataType]
     ) -> None:
@@ -226,6 +344,15 @@ class ExecutionEngine(ABC):
             self.load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
+        metric_cache: Optional[MetricCache] = self.metric_cache
+        if (
+            metric_cache is not None
+            and batch_id in self._batch_manager.batch_data_cache
+            and self._batch_manager.batch_data_cache[batch_id] is not batch_data
+        ):
+            # Metrics, computed on data previously loaded under this Batch ID, are stale.
+            metric_cache.invalidate(batch_id=batch_id)
+
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
     def get_batch_data(
@@ -248,6 +375,19 @@ class ExecutionEngine(ABC):
     def get_batch_data_and_markers(self, batch_spec) -> Tuple[BatchData, BatchMarkers]:
         raise NotImplementedError
 
+    def prepare_for_metric_resolution(  # noqa: B027 # optional hook, no-op by default
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """
+        Called with all metrics of validation graph, before any of them is resolved, so that execution engine can prepare
+        Batch data for them (e.g., "SqlAlchemyExecutionEngine" materializes query of Batch, against which many metric
+        queries will run).  Does nothing by default.
+
+        Args:
+            metric_configurations: metrics, which are about to be resolved
+        """
+        pass
+
     def resolve_metrics(
         self,
         metrics_to_resolve: Iterable[MetricConfiguration],
@@ -541,11 +681,21 @@ class ExecutionEngine(ABC):
 
         for metric_computation_configuration in metric_fn_direct_configurations:
             try:
-                resolved_metrics[
-                    metric_computation_configuration.metric_configuration.id
-                ] = metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
-                    **metric_computation_configuration.metric_provider_kwargs
-                )
+                with trace_span(
+                    metric_computation_configuration.metric_configuration.metric_name,
+                    "metric",
+                ) as span:
+                    if span.is_recording:
+                        span.set_attributes(
+                            metric_domain_kwargs_id=metric_computation_configuration.metric_configuration.metric_domain_kwargs_id,
+                            metric_value_kwargs_id=metric_computation_configuration.metric_configuration.metric_value_kwargs_id,
+                        )
+
+                    resolved_metrics[
+                        metric_computation_configuration.metric_configuration.id
+                    ] = metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+                        **metric_computation_configuration.metric_provider_kwargs
+                    )
             except Exception as e:
                 raise gx_exceptions.MetricResolutionError(
                     message=str(e),
@@ -556,11 +706,16 @@ class ExecutionEngine(ABC):
 
         try:
             # an engine-specific way of computing metrics together
-            resolved_metric_bundle: Dict[
-                Tuple[str, str, str], MetricValue
-            ] = self.resolve_metric_bundle(
-                metric_fn_bundle=metric_fn_bundle_configurations
-            )
+            with trace_span(
+                "resolve_metric_bundle",
+                "metric",
+                num_metrics=len(metric_fn_bundle_configurations),
+            ):
+                resolved_metric_bundle: Dict[
+                    Tuple[str, str, str], MetricValue
+                ] = self.resolve_metric_bundle(
+                    metric_fn_bundle=metric_fn_bundle_configurations
+                )
             resolved_metrics.update(resolved_metric_bundle)
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
@@ -571,11 +726,48 @@ class ExecutionEngine(ABC):
                 ],
             ) from e
 
-        if self._caching:
-            self._metric_cache.update(resolved_metrics)
+        self._cache_resolved_metrics(
+            resolved_metrics=resolved_metrics,
+            metric_configurations=[
+                metric_computation_configuration.metric_configuration
+                for metric_computation_configuration in metric_fn_direct_configurations
+                + metric_fn_bundle_configurations
+            ],
+        )
 
         return resolved_metrics
 
+    def _cache_resolved_metrics(
+        self,
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+        metric_configurations: Iterable[MetricConfiguration],
+    ) -> None:
+        """
+        Adds resolved metrics to metric cache, indexed by ID of Batch, on which each of them was computed.
+
+        Args:
+            resolved_metrics: values of metrics, just resolved, keyed by metric ID
+            metric_configurations: "MetricConfiguration" objects of resolved metrics
+        """
+        if not self._caching:
+            return
+
+        if not isinstance(self._metric_cache, MetricCache):
+            # Scratch (e.g., chunk-scoped) cache layer.
+            self._metric_cache.update(resolved_metrics)
+            return
+
+        active_batch_id: Optional[str] = self._batch_manager.active_batch_data_id
+        batch_ids: Dict[Tuple[str, str, str], Optional[str]] = {}
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            batch_ids[metric_configuration.id] = (
+                metric_configuration.metric_domain_kwargs.get("batch_id")
+                or active_batch_id
+            )
+
+        self._metric_cache.update(resolved_metrics, batch_ids=batch_ids)
+
     def _split_domain_kwargs(
         self,
         domain_kwargs: Dict[str, Any],
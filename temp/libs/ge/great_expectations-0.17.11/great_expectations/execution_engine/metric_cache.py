@@ -0,0 +1,260 @@
+"""
+Cache of resolved metrics, kept by "ExecutionEngine" (see "ExecutionEngine.metric_cache").
+
+Entries are indexed by ID of Batch, on which metric was computed, so that all metrics of Batch can be invalidated at
+once (e.g., when Batch is replaced by new data under same Batch ID).  Cache is bounded by number of entries and/or by
+estimated size of values (least-recently-used entries are evicted first), and entries can expire after "ttl_seconds".
+
+Estimated sizes are shallow: Pandas and NumPy objects count their buffers (not contents of "object" columns), and
+tuples of metric partial functions count their elements; other values count their "sys.getsizeof()".
+"""
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from great_expectations.validator.computed_metric import MetricValue
+
+logger = logging.getLogger(__name__)
+
+_MetricKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class MetricCacheConfig:
+    """
+    Bounds and policies of "MetricCache".
+
+    Args:
+        max_bytes: Budget for estimated size of cached metric values (None means no limit).
+        max_entries: Maximum number of cached metric values (None means no limit).
+        ttl_seconds: Time, after which cached metric values expire (None means never).
+        release_intermediate_metrics: If True, metrics, which are only dependencies of other metrics (e.g., boolean
+            condition arrays of map metrics), are released (from "ValidationGraph" resolution and from cache) as soon
+            as all metrics depending on them are resolved.
+        persistent_cache_path: If set, metrics are also kept (across runs) in "PersistentMetricCache" at this path
+            (SQLite database file, or directory for it), keyed by data version of Batch.
+        persistent_cache_max_bytes: Budget for total size of values in persistent cache (None means no limit).
+        persistent_cache_max_entries: Maximum number of values in persistent cache (None means no limit).
+        persistent_cache_ttl_seconds: Time, after which values in persistent cache expire (None means never).
+    """
+
+    max_bytes: Optional[int] = None
+    max_entries: Optional[int] = None
+    ttl_seconds: Optional[float] = None
+    release_intermediate_metrics: bool = False
+    persistent_cache_path: Optional[str] = None
+    persistent_cache_max_bytes: Optional[int] = None
+    persistent_cache_max_entries: Optional[int] = None
+    persistent_cache_ttl_seconds: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, config: Optional[dict]) -> MetricCacheConfig:
+        return cls(**(config or {}))
+
+    def to_dict(self) -> dict:
+        return {
+            key: value
+            for key, value in (
+                ("max_bytes", self.max_bytes),
+                ("max_entries", self.max_entries),
+                ("ttl_seconds", self.ttl_seconds),
+                ("release_intermediate_metrics", self.release_intermediate_metrics),
+                ("persistent_cache_path", self.persistent_cache_path),
+                ("persistent_cache_max_bytes", self.persistent_cache_max_bytes),
+                ("persistent_cache_max_entries", self.persistent_cache_max_entries),
+                ("persistent_cache_ttl_seconds", self.persistent_cache_ttl_seconds),
+            )
+            if value
+        }
+
+
+@dataclass
+class _MetricCacheEntry:
+    value: Any
+    batch_id: Optional[str]
+    size_bytes: int
+    stored_at: float
+
+
+class MetricCache(Mapping[_MetricKey, "MetricValue"]):
+    """
+    Least-recently-used mapping from metric ID to resolved metric value, indexed by Batch ID, with size accounting.
+
+    Besides "Mapping" methods, "update()" (with optional Batch ID of every metric), "invalidate()", "discard()", and
+    "clear()" are supported.
+    """
+
+    def __init__(self, config: Optional[MetricCacheConfig] = None) -> None:
+        self._config: MetricCacheConfig = config or MetricCacheConfig()
+        self._entries: OrderedDict[_MetricKey, _MetricCacheEntry] = OrderedDict()
+        self._metric_ids_by_batch_id: Dict[Optional[str], Set[_MetricKey]] = {}
+        self._size_bytes: int = 0
+        self._evictions: int = 0
+
+    @property
+    def config(self) -> MetricCacheConfig:
+        return self._config
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated size of cached metric values."""
+        return self._size_bytes
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries evicted (because of bounds or expiration)."""
+        return self._evictions
+
+    @property
+    def batch_ids(self) -> Set[Optional[str]]:
+        return set(self._metric_ids_by_batch_id.keys())
+
+    def __getitem__(self, metric_id: _MetricKey) -> MetricValue:
+        entry: _MetricCacheEntry = self._entries[metric_id]
+        if self._is_expired(entry=entry):
+            self._remove(metric_id=metric_id)
+            self._evictions += 1
+            raise KeyError(metric_id)
+
+        self._entries.move_to_end(metric_id)
+        return entry.value
+
+    def __contains__(self, metric_id: object) -> bool:
+        entry: Optional[_MetricCacheEntry] = self._entries.get(metric_id)  # type: ignore[call-overload] # metric ID
+        return entry is not None and not self._is_expired(entry=entry)
+
+    def __iter__(self) -> Iterator[_MetricKey]:
+        return iter(list(self._entries.keys()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(entries={len(self._entries)}, size_bytes={self._size_bytes})"
+
+    def update(
+        self,
+        metrics: Mapping[_MetricKey, MetricValue],
+        batch_ids: Optional[Mapping[_MetricKey, Optional[str]]] = None,
+    ) -> None:
+        """Stores resolved metrics ("batch_ids" maps metric IDs to IDs of Batches, on which they were computed)."""
+        stored_at: float = time.monotonic()
+        metric_id: _MetricKey
+        value: MetricValue
+        batch_id: Optional[str]
+        for metric_id, value in metrics.items():
+            batch_id = batch_ids.get(metric_id) if batch_ids else None
+            self._remove(metric_id=metric_id)
+            self._entries[metric_id] = _MetricCacheEntry(
+                value=value,
+                batch_id=batch_id,
+                size_bytes=estimate_metric_value_size_bytes(value=value),
+                stored_at=stored_at,
+            )
+            self._metric_ids_by_batch_id.setdefault(batch_id, set()).add(metric_id)
+            self._size_bytes += self._entries[metric_id].size_bytes
+
+        self._evict()
+
+    def discard(self, metric_id: _MetricKey) -> None:
+        """Removes metric (if cached)."""
+        self._remove(metric_id=metric_id)
+
+    def invalidate(self, batch_id: Optional[str]) -> int:
+        """
+        Removes all metrics computed on Batch with given ID.
+
+        Returns:
+            Number of removed metrics.
+        """
+        metric_ids: Set[_MetricKey] = self._metric_ids_by_batch_id.get(batch_id, set())
+        metric_id: _MetricKey
+        for metric_id in list(metric_ids):
+            self._remove(metric_id=metric_id)
+
+        logger.debug(
+            f"Invalidated {len(metric_ids)} cached metrics of Batch {batch_id}."
+        )
+        return len(metric_ids)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._metric_ids_by_batch_id.clear()
+        self._size_bytes = 0
+
+    def _remove(self, metric_id: _MetricKey) -> None:
+        entry: Optional[_MetricCacheEntry] = self._entries.pop(metric_id, None)
+        if entry is None:
+            return
+
+        self._size_bytes -= entry.size_bytes
+        metric_ids: Set[_MetricKey] = self._metric_ids_by_batch_id[entry.batch_id]
+        metric_ids.discard(metric_id)
+        if not metric_ids:
+            del self._metric_ids_by_batch_id[entry.batch_id]
+
+    def _is_expired(self, entry: _MetricCacheEntry) -> bool:
+        return (
+            self._config.ttl_seconds is not None
+            and time.monotonic() - entry.stored_at > self._config.ttl_seconds
+        )
+
+    def _evict(self) -> None:
+        metric_id: _MetricKey
+        entry: _MetricCacheEntry
+        if self._config.ttl_seconds is not None:
+            for metric_id, entry in list(self._entries.items()):
+                if self._is_expired(entry=entry):
+                    self._remove(metric_id=metric_id)
+                    self._evictions += 1
+
+        while self._entries and (
+            (
+                self._config.max_entries is not None
+                and len(self._entries) > self._config.max_entries
+            )
+            or (
+                self._config.max_bytes is not None
+                and self._size_bytes > self._config.max_bytes
+            )
+        ):
+            metric_id = next(iter(self._entries))
+            self._remove(metric_id=metric_id)
+            self._evictions += 1
+
+
+def estimate_metric_value_size_bytes(value: Any) -> int:
+    """Returns (shallow) estimate of memory, occupied by metric value."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=False))
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    if isinstance(value, (tuple, list, set)):
+        return sys.getsizeof(value) + sum(
+            estimate_metric_value_size_bytes(value=element) for element in value
+        )
+
+    return sys.getsizeof(value)
@@ -1,13 +1,141 @@
-import pandas as pd
+from __future__ import annotations
 
+import contextlib
+import logging
+import pathlib
+import uuid
+import weakref
+from typing import TYPE_CHECKING, Optional
+
+from great_expectations.compatibility.pyarrow import feather, pyarrow
 from great_expectations.core.batch import BatchData
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
 
 class PandasBatchData(BatchData):
     def __init__(self, execution_engine, dataframe: pd.DataFrame) -> None:
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        self._memory_usage_bytes: Optional[int] = None
+        self._spilled_memory_usage_bytes: int = 0
+        self._spill_path: Optional[str] = None
 
     @property
     def dataframe(self):
+        if self._dataframe is None and self._spill_path is not None:
+            self._dataframe = _read_spilled_dataframe(path=self._spill_path)
+
         return self._dataframe
+
+    @property
+    def is_spilled(self) -> bool:
+        """True if "DataFrame" was written to spill file and is not held in memory (until next "dataframe" access)."""
+        return self._dataframe is None and self._spill_path is not None
+
+    @property
+    def memory_usage_bytes(self) -> int:
+        """Size of "DataFrame" held in memory (measured once, including contents of "object" columns); 0 if spilled."""
+        if self._dataframe is None:
+            return 0
+
+        if self._memory_usage_bytes is None:
+            self._memory_usage_bytes = int(
+                self._dataframe.memory_usage(index=True, deep=True).sum()
+            )
+
+        return self._memory_usage_bytes
+
+    @property
+    def loaded_memory_usage_bytes(self) -> int:
+        """Size of "DataFrame" when held in memory (also while spilled, as measured before it was spilled)."""
+        if self._dataframe is None:
+            return self._spilled_memory_usage_bytes
+
+        return self.memory_usage_bytes
+
+    def spill(self, spill_directory: str) -> bool:
+        """
+        Releases "DataFrame" from memory, after writing it (once) to uncompressed Arrow IPC (Feather) file in
+        "spill_directory"; next access of "dataframe" memory-maps that file back, so that (for columns, whose Arrow
+        representation is compatible with NumPy, such as numeric columns without nulls) no data is copied.  Reloaded
+        "DataFrame" may thus be read-only.  Spill file is removed, when this object is garbage-collected.
+
+        "DataFrame" is spilled only if it is read back from spill file equal to original (including column and index
+        dtypes); e.g., "object" column of integers, which Arrow would read back as "int64" column, is kept in memory.
+
+        Returns:
+            False if "DataFrame" could not be spilled (e.g., "pyarrow" is not installed, columns contain values of
+            mixed types, which Arrow cannot represent, or Arrow round trip changes it); "DataFrame" then stays in
+            memory.
+        """
+        if self._dataframe is None:
+            return self._spill_path is not None
+
+        if self._spill_path is None:
+            if not pyarrow:
+                return False
+
+            spill_path: str = str(
+                pathlib.Path(spill_directory)
+                / f"gx_batch_data_{uuid.uuid4().hex}.arrow"
+            )
+            try:
+                _write_spilled_dataframe(dataframe=self._dataframe, path=spill_path)
+                is_exact: bool = _is_exact_round_trip(
+                    dataframe=self._dataframe,
+                    reloaded_dataframe=_read_spilled_dataframe(path=spill_path),
+                )
+            except (pyarrow.ArrowException, TypeError, ValueError, OSError) as e:
+                logger.debug(f"Batch data could not be spilled to {spill_path}: {e}")
+                _remove_spill_file(path=spill_path)
+                return False
+
+            if not is_exact:
+                logger.debug(
+                    "Batch data was not spilled, since Arrow cannot represent it exactly."
+                )
+                _remove_spill_file(path=spill_path)
+                return False
+
+            self._spill_path = spill_path
+            weakref.finalize(self, _remove_spill_file, spill_path)
+
+        # Spill file is written only once: data is not modified after it has been loaded.
+        self._spilled_memory_usage_bytes = self.memory_usage_bytes
+        self._dataframe = None
+        self._memory_usage_bytes = None
+        return True
+
+
+def _write_spilled_dataframe(dataframe: pd.DataFrame, path: str) -> None:
+    # Single record batch (and "RangeIndex" kept as metadata), since reading chunked columns back requires copying.
+    feather.write_feather(
+        pyarrow.Table.from_pandas(dataframe, preserve_index=None),
+        path,
+        compression="uncompressed",
+        chunksize=max(len(dataframe.index), 1),
+    )
+
+
+def _read_spilled_dataframe(path: str) -> pd.DataFrame:
+    return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+
+
+def _is_exact_round_trip(
+    dataframe: pd.DataFrame, reloaded_dataframe: pd.DataFrame
+) -> bool:
+    # "DataFrame.equals()" also requires columns of same dtypes; dtypes of column labels and of index are compared here.
+    return (
+        reloaded_dataframe.columns.dtype == dataframe.columns.dtype
+        and reloaded_dataframe.index.dtype == dataframe.index.dtype
+        and reloaded_dataframe.equals(dataframe)
+    )
+
+
+def _remove_spill_file(path: str) -> None:
+    with contextlib.suppress(OSError):
+        pathlib.Path(path).unlink()
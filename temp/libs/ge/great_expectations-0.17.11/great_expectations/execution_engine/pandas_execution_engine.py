@@ -5,13 +5,14 @@ import hashlib
 import logging
 import pickle
 from functools import partial
-from io import BytesIO
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Iterable,
+    List,
     Optional,
     Tuple,
     Union,
@@ -46,6 +47,16 @@ from great_expectations.execution_engine.execution_engine import (
     SplitDomainKwargs,  # noqa: TCH001
 )
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_sharding import (
+    NOT_SHARDED,
+    PandasShardExecutor,
+    PandasShardingConfig,
+)
+from great_expectations.execution_engine.ranged_object_reader import (
+    AzureRangedObjectReader,
+    GCSRangedObjectReader,
+    S3RangedObjectReader,
+)
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
@@ -63,6 +74,20 @@ HASH_THRESHOLD = 1e9
 
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
+# Keyword arguments, through which Pandas reader methods accept names of columns to load ("column_projection").
+COLUMN_PROJECTION_READER_KWARGS: Dict[str, str] = {
+    "read_csv": "usecols",
+    "read_table": "usecols",
+    "read_fwf": "usecols",
+    "read_excel": "usecols",
+    "read_parquet": "columns",
+    "read_feather": "columns",
+    "read_orc": "columns",
+}
+
+# Keyword arguments, through which splitter and sampler methods name columns they read (after "column_projection").
+SPLITTER_AND_SAMPLER_COLUMN_KWARGS: Tuple[str, ...] = ("column_name", "column_names")
+
 
 @public_api
 class PandasExecutionEngine(ExecutionEngine):
@@ -112,6 +137,13 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        batch_data_cache_max_bytes: Optional[int] = kwargs.pop(
+            "batch_data_cache_max_bytes", None
+        )
+        batch_data_spill_directory: Optional[str] = kwargs.pop(
+            "batch_data_spill_directory", None
+        )
+        sharding_config: Optional[dict] = kwargs.pop("sharding_config", None)
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -130,6 +162,22 @@ class PandasExecutionEngine(ExecutionEngine):
             }
         )
 
+        # Loaded Batches beyond memory budget are spilled to local Arrow files (least-recently-used first).
+        if batch_data_cache_max_bytes is not None:
+            self._config["batch_data_cache_max_bytes"] = batch_data_cache_max_bytes
+        if batch_data_spill_directory is not None:
+            self._config["batch_data_spill_directory"] = batch_data_spill_directory
+        self.batch_manager.batch_data_cache.spill_directory = batch_data_spill_directory
+        self.batch_manager.batch_data_cache.max_bytes = batch_data_cache_max_bytes
+
+        # Costly map conditions and mergeable column aggregates are evaluated over row shards in worker processes.
+        self._shard_executor: Optional[PandasShardExecutor] = None
+        if sharding_config is not None:
+            self._config["sharding_config"] = sharding_config
+            self._shard_executor = PandasShardExecutor(
+                config=PandasShardingConfig.from_dict(sharding_config)
+            )
+
         self._data_splitter = PandasDataSplitter()
         self._data_sampler = PandasDataSampler()
 
@@ -247,10 +295,9 @@ class PandasExecutionEngine(ExecutionEngine):
                     inferred_compression_param = sniff_s3_compression(s3_url)
                     if inferred_compression_param is not None:
                         reader_options["compression"] = inferred_compression_param
-                if s3_engine:
-                    s3_object: dict = s3_engine.get_object(
-                        Bucket=s3_url.bucket, Key=s3_url.key
-                    )
+                s3_reader = S3RangedObjectReader(
+                    s3_client=s3_engine, bucket=s3_url.bucket, key=s3_url.key
+                )
             except (
                 aws.exceptions.ParamValidationError,
                 aws.exceptions.ClientError,
@@ -264,9 +311,8 @@ class PandasExecutionEngine(ExecutionEngine):
             reader_fn: DataFrameFactoryFn = self._get_reader_fn(
                 reader_method, s3_url.key
             )
-            buf = BytesIO(s3_object["Body"].read())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            with s3_reader.open_buffered() as buf:
+                df = self._read_file(reader_fn, buf, reader_options, batch_spec)
 
         elif isinstance(batch_spec, AzureBatchSpec):
             if self._azure is None:
@@ -285,14 +331,14 @@ class PandasExecutionEngine(ExecutionEngine):
             blob_client = azure_engine.get_blob_client(
                 container=azure_url.container, blob=azure_url.blob
             )
-            azure_object = blob_client.download_blob()
             logger.debug(
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
             )
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
-            buf = BytesIO(azure_object.readall())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            with AzureRangedObjectReader(
+                blob_client=blob_client
+            ).open_buffered() as buf:
+                df = self._read_file(reader_fn, buf, reader_options, batch_spec)
 
         elif isinstance(batch_spec, GCSBatchSpec):
             if self._gcs is None:
@@ -308,8 +354,9 @@ class PandasExecutionEngine(ExecutionEngine):
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options or {}
             try:
-                gcs_bucket = gcs_engine.get_bucket(gcs_url.bucket)
-                gcs_blob = gcs_bucket.blob(gcs_url.blob)
+                # "bucket()" makes no request; "get_blob()" fetches blob metadata (including size) in one request.
+                gcs_bucket = gcs_engine.bucket(gcs_url.bucket)
+                gcs_blob = gcs_bucket.get_blob(gcs_url.blob)
                 logger.debug(
                     f"Fetching GCS blob. Bucket: {gcs_url.bucket} Blob: {gcs_url.blob}"
                 )
@@ -318,10 +365,13 @@ class PandasExecutionEngine(ExecutionEngine):
                     f"""PandasExecutionEngine encountered the following error while trying to read data from GCS \
 Bucket: {error}"""
                 )
+            if gcs_blob is None:
+                raise gx_exceptions.ExecutionEngineError(
+                    f"""PandasExecutionEngine could not find blob "{gcs_url.blob}" in GCS Bucket "{gcs_url.bucket}"."""
+                )
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
-            buf = BytesIO(gcs_blob.download_as_bytes())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            with GCSRangedObjectReader(blob=gcs_blob).open_buffered() as buf:
+                df = self._read_file(reader_fn, buf, reader_options, batch_spec)
 
         # Experimental datasources will go down this code path
         elif isinstance(batch_spec, PathBatchSpec):
@@ -329,7 +379,7 @@ Bucket: {error}"""
             reader_options = batch_spec.reader_options
             path = batch_spec.path
             reader_fn = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            df = self._read_file(reader_fn, path, reader_options, batch_spec)
 
         elif isinstance(batch_spec, PandasBatchSpec):
             reader_method = batch_spec.reader_method
@@ -360,9 +410,64 @@ not {batch_spec.__class__.__name__}"""
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
 
         typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+        typed_batch_data.data_version = self._get_data_version(
+            batch_spec=batch_spec,
+            get_source_version=lambda: batch_markers.get("pandas_data_fingerprint")
+            or hash_pandas_dataframe(df),
+        )
 
         return typed_batch_data, batch_markers
 
+    @staticmethod
+    def _read_file(
+        reader_fn: DataFrameFactoryFn,
+        source: Union[str, IO[bytes]],
+        reader_options: dict,
+        batch_spec: BatchSpec,
+    ) -> pd.DataFrame:
+        """Reads "source" (path or buffer) using "reader_fn".
+
+        If "batch_spec" contains "column_projection" directive (list of column names) and reader method accepts list
+        of columns to load (e.g., "columns" for "read_parquet", "usecols" for "read_csv"), only those columns (together
+        with columns, on which splitter and sampler of "batch_spec" operate) are read.
+        """
+        column_projection: Optional[list] = _get_column_projection(
+            batch_spec=batch_spec
+        )
+        if not column_projection:
+            return reader_fn(source, **reader_options)
+
+        # Options, bound by "_get_reader_fn()" (e.g., inferred compression), are overridden by explicit ones.
+        if isinstance(reader_fn, partial):
+            reader_options = {**reader_fn.keywords, **reader_options}
+            reader_fn = reader_fn.func
+
+        reader_kwarg: Optional[str] = COLUMN_PROJECTION_READER_KWARGS.get(
+            getattr(reader_fn, "__name__", "")
+        )
+        if reader_kwarg is None or reader_kwarg in reader_options:
+            return reader_fn(source, **reader_options)
+
+        projected_columns: Union[list, Callable[[Any], bool]] = list(column_projection)
+        if reader_kwarg == "usecols":
+            # Callable "usecols" selects columns present in the file without failing on absent ones.
+            projected_column_names: set = set(column_projection)
+            projected_columns = projected_column_names.__contains__
+
+        try:
+            return reader_fn(
+                source, **reader_options, **{reader_kwarg: projected_columns}
+            )
+        except (KeyError, ValueError) as e:
+            # Some column is absent from the file; load all columns, so that validation can report it as missing.
+            logger.debug(
+                f"Unable to load column projection {column_projection} ({str(e)}); loading all columns."
+            )
+            if not isinstance(source, str):
+                source.seek(0)
+
+            return reader_fn(source, **reader_options)
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         splitter_method_name: Optional[str] = batch_spec.get("splitter_method")
         if splitter_method_name:
@@ -491,6 +596,67 @@ not {batch_spec.__class__.__name__}"""
             {}
         )  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).
 
+    def map_condition_in_shards(  # noqa: PLR0913
+        self,
+        metric_provider: type,
+        metric_fn: Callable,
+        data: pd.DataFrame,
+        column_names: List[str],
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        source: Optional[pd.DataFrame] = None,
+        as_frame: bool = False,
+    ) -> Optional[pd.Series]:
+        """Evaluates map condition over row shards (if sharding is configured and pays off); see "PandasShardExecutor".
+
+        Returns:
+            Boolean Series, aligned with "data", or None, if condition must be evaluated serially.
+        """
+        if self._shard_executor is None:
+            return None
+
+        return self._shard_executor.map_condition(
+            metric_provider=metric_provider,
+            metric_fn=metric_fn,
+            data=data,
+            column_names=column_names,
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
+            source=source,
+            as_frame=as_frame,
+        )
+
+    def aggregate_column_in_shards(  # noqa: PLR0913
+        self,
+        metric_provider: type,
+        metric_fn: Callable,
+        data: pd.DataFrame,
+        column_name: str,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        source: Optional[pd.DataFrame] = None,
+    ) -> Any:
+        """Evaluates mergeable column aggregate over row shards (if sharding is configured and pays off).
+
+        Returns:
+            Metric value, or "NOT_SHARDED", if metric must be evaluated serially.
+        """
+        if self._shard_executor is None:
+            return NOT_SHARDED
+
+        return self._shard_executor.aggregate(
+            metric_provider=metric_provider,
+            metric_fn=metric_fn,
+            data=data,
+            column_name=column_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
+            execution_engine=self,
+            source=source,
+        )
+
     @public_api
     def get_domain_records(  # noqa: C901, PLR0912
         self,
@@ -656,4 +822,44 @@ def hash_pandas_dataframe(df):
         # In case of facing unhashable objects (like dict), use pickle
         obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
 
-    return hashlib.md5(obj).hexdigest()
+    md5 = hashlib.md5(obj)
+    # "hash_pandas_object()" hashes values only; renamed or retyped columns must change fingerprint too.
+    md5.update(
+        repr((tuple(df.columns), tuple(str(dtype) for dtype in df.dtypes))).encode(
+            "utf-8"
+        )
+    )
+    return md5.hexdigest()
+
+
+def _get_column_projection(batch_spec: BatchSpec) -> Optional[list]:
+    """Returns "column_projection" directive of "batch_spec" (if any), extended with columns, named in its "splitter_kwargs"
+    and "sampling_kwargs" (splitting and sampling are applied to data after it is read).
+    """
+    column_projection: Optional[list] = batch_spec.get("column_projection")
+    if not column_projection:
+        return None
+
+    column_names: list = list(column_projection)
+
+    method_kwargs_key: str
+    method_kwargs: dict
+    column_kwarg: str
+    column_kwarg_value: Any
+    for method_kwargs_key in ("splitter_kwargs", "sampling_kwargs"):
+        method_kwargs = batch_spec.get(method_kwargs_key) or {}
+        for column_kwarg in SPLITTER_AND_SAMPLER_COLUMN_KWARGS:
+            column_kwarg_value = method_kwargs.get(column_kwarg)
+            if column_kwarg_value is None:
+                continue
+
+            if isinstance(column_kwarg_value, str):
+                column_kwarg_value = [column_kwarg_value]
+
+            column_names.extend(
+                column_name
+                for column_name in column_kwarg_value
+                if column_name not in column_names
+            )
+
+    return column_names
@@ -0,0 +1,723 @@
+"""
+Evaluation of Pandas metric functions over row shards of Batch in pool of worker processes.
+
+Map conditions (e.g., of "column_values.match_regex", "column_values.in_set", or custom column condition partials), and
+column aggregates, which are mergeable across shards (see "chunked_metric_aggregates"), are evaluated by calling their
+metric function on every shard in worker process, and merging per-shard results (boolean condition arrays are
+concatenated in row order; aggregate values are merged with "MetricAggregate").  Unexpected counts, values, indices,
+and rows are then derived from merged condition as usual, so that they equal those of serial evaluation (merged sums of
+floating-point columns may differ from serial ones by rounding, since values are added in different order).
+
+Columns of shards are written once (as Arrow IPC stream) into shared memory segment, which workers attach to, and which
+is reused by all metrics computed on same columns of same DataFrame; workers write condition arrays directly into
+shared output segment.  Metrics are evaluated serially whenever sharding would not pay off (estimated cost below
+"min_cost"), or cannot be done faithfully (Arrow round trip changes dtype or values of column, metric function or its
+arguments cannot be pickled, metric depends on row-aligned values of other metrics, or metric function fails or
+returns non-boolean result in worker).
+"""
+from __future__ import annotations
+
+import atexit
+import inspect
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.compatibility.pyarrow import pyarrow as pa
+from great_expectations.core.tracing import trace_span
+from great_expectations.execution_engine.chunked_metric_aggregates import (
+    get_metric_aggregate,
+    is_chunk_local_metric,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import PandasExecutionEngine
+    from great_expectations.execution_engine.chunked_metric_aggregates import (
+        MetricAggregate,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Estimated cost of evaluating metric function on one row of column, relative to that on one row of "object" (e.g.,
+# string) column; vectorized operations on numeric, boolean, and datetime columns rarely pay for transfer to workers.
+OBJECT_ROW_COST: float = 1.0
+NON_OBJECT_ROW_COST: float = 0.02
+
+DEFAULT_MIN_SHARDING_COST: float = 1.0e6
+DEFAULT_MIN_ROWS_PER_SHARD: int = 50000
+DEFAULT_MAX_CACHED_SEGMENTS: int = 2
+
+# Number of leading rows, whose Arrow round trip is compared with original column.
+_ROUND_TRIP_SAMPLE_ROWS: int = 1000
+
+# Number of input segments, which every worker keeps attached.
+_MAX_WORKER_SEGMENTS: int = 2
+
+
+class _NotSharded:
+    """Returned by "PandasShardExecutor.aggregate()" when metric must be computed serially."""
+
+    def __repr__(self) -> str:
+        return "<not sharded>"
+
+
+NOT_SHARDED = _NotSharded()
+
+
+@dataclass
+class PandasShardingConfig:
+    """
+    Options of sharded (multi-process) evaluation of Pandas metric functions.
+
+    Args:
+        num_processes: Number of worker processes (None means number of CPUs).
+        min_cost: Estimated serial cost (rows of "object" columns, plus rows of other columns weighted by
+            "NON_OBJECT_ROW_COST"), below which metric functions are evaluated serially.
+        min_rows_per_shard: Minimum number of rows of every shard (fewer shards than workers are used for smaller data).
+        start_method: Start method of worker processes (None means "spawn", whose workers inherit "sys.path" of
+            parent process, e.g., packages added at runtime; "fork" and "forkserver" workers may not import them).
+        max_cached_segments: Number of shared memory segments (columns of DataFrame), kept for reuse by other metrics.
+    """
+
+    num_processes: Optional[int] = None
+    min_cost: float = DEFAULT_MIN_SHARDING_COST
+    min_rows_per_shard: int = DEFAULT_MIN_ROWS_PER_SHARD
+    start_method: Optional[str] = None
+    max_cached_segments: int = DEFAULT_MAX_CACHED_SEGMENTS
+
+    @classmethod
+    def from_dict(cls, config: Optional[dict]) -> PandasShardingConfig:
+        return cls(**(config or {}))
+
+    def to_dict(self) -> dict:
+        return {
+            "num_processes": self.num_processes,
+            "min_cost": self.min_cost,
+            "min_rows_per_shard": self.min_rows_per_shard,
+            "start_method": self.start_method,
+            "max_cached_segments": self.max_cached_segments,
+        }
+
+
+@dataclass(frozen=True)
+class _ShardTask:
+    segment_name: str
+    column_names: Tuple[str, ...]
+    start: int
+    stop: int
+    metric_provider: type
+    metric_fn_name: str
+    # Pickled "(metric_value_kwargs, metrics)", shared by all tasks of metric.
+    arguments: bytes
+    as_frame: bool = False
+    column_keyword: Optional[str] = None
+    output_segment_name: Optional[str] = None
+
+
+class _ShardSegment:
+    # Columns of DataFrame, written as Arrow IPC stream into shared memory; "source" is DataFrame, whose columns these
+    # are (segment is reused only while same DataFrame object is alive).
+
+    def __init__(
+        self,
+        memory: Optional[shared_memory.SharedMemory],
+        source: weakref.ref,
+        num_rows: int,
+    ) -> None:
+        self.memory = memory
+        self.source = source
+        self.num_rows = num_rows
+
+    @property
+    def is_shardable(self) -> bool:
+        return self.memory is not None
+
+    def release(self) -> None:
+        if self.memory is not None:
+            _release_shared_memory(memory=self.memory)
+            self.memory = None
+
+
+class PandasShardExecutor:
+    """
+    Evaluates Pandas map conditions and mergeable column aggregates over row shards in worker processes.
+
+    Worker pools are shared by all executors with same number of processes and start method; shared memory segments
+    are owned by executor (and are released, when it is garbage collected, or when "release()" is called).
+    """
+
+    def __init__(self, config: PandasShardingConfig) -> None:
+        self._config = config
+        self._num_processes: int = config.num_processes or os.cpu_count() or 1
+        self._segments: OrderedDict[tuple, _ShardSegment] = OrderedDict()
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _release_segments, self._segments)
+
+    @property
+    def config(self) -> PandasShardingConfig:
+        return self._config
+
+    def estimate_cost(self, data: pd.DataFrame, column_names: Sequence[str]) -> float:
+        """Estimates cost of serial evaluation of metric function on given columns (see "PandasShardingConfig")."""
+        cost_per_row: float = sum(
+            OBJECT_ROW_COST
+            if data[column_name].dtype == object
+            else NON_OBJECT_ROW_COST
+            for column_name in column_names
+        )
+        return len(data.index) * cost_per_row
+
+    def map_condition(  # noqa: PLR0913
+        self,
+        metric_provider: type,
+        metric_fn: Callable,
+        data: pd.DataFrame,
+        column_names: Sequence[str],
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        source: Optional[pd.DataFrame] = None,
+        as_frame: bool = False,
+    ) -> Optional[pd.Series]:
+        """
+        Evaluates map condition function on shards of given columns of "data" (passed to it as Series, one per column,
+        or, if "as_frame" is True, as DataFrame), and returns merged boolean Series, aligned with "data".
+
+        Args:
+            source: DataFrame, from which "data" was derived by row filtering (if any); used as identity of shared
+                memory segment, so that other metrics, computed on same columns, reuse it.
+
+        Returns:
+            Boolean Series, or None, if condition must be evaluated serially.
+        """
+        plan: Optional[Tuple[_ShardSegment, bytes, List[Tuple[int, int]]]] = self._plan(
+            metric_provider=metric_provider,
+            metric_fn=metric_fn,
+            data=data,
+            column_names=column_names,
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
+            source=source,
+        )
+        if plan is None:
+            return None
+
+        segment, arguments, shard_bounds = plan
+        output: shared_memory.SharedMemory = shared_memory.SharedMemory(
+            create=True, size=max(segment.num_rows, 1)
+        )
+        try:
+            with trace_span(
+                name="evaluate_map_condition_in_shards",
+                category="sharding",
+                metric_provider=metric_provider.__name__,
+                num_rows=segment.num_rows,
+                num_shards=len(shard_bounds),
+            ):
+                results: Optional[list] = self._run(
+                    tasks=[
+                        _ShardTask(
+                            segment_name=segment.memory.name,  # type: ignore[union-attr] # is shardable
+                            column_names=tuple(column_names),
+                            start=start,
+                            stop=stop,
+                            metric_provider=metric_provider,
+                            metric_fn_name=metric_fn.__name__,
+                            arguments=arguments,
+                            as_frame=as_frame,
+                            output_segment_name=output.name,
+                        )
+                        for start, stop in shard_bounds
+                    ]
+                )
+                if results is None:
+                    return None
+
+                condition: np.ndarray = np.ndarray(
+                    (segment.num_rows,), dtype=np.bool_, buffer=output.buf
+                ).copy()
+        finally:
+            _release_shared_memory(memory=output)
+
+        return pd.Series(condition, index=data.index)
+
+    def aggregate(  # noqa: PLR0913
+        self,
+        metric_provider: type,
+        metric_fn: Callable,
+        data: pd.DataFrame,
+        column_name: str,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        execution_engine: PandasExecutionEngine,
+        source: Optional[pd.DataFrame] = None,
+    ) -> Any:
+        """
+        Evaluates column aggregate function (passed column as "column" keyword argument) on shards of column of
+        "data", and merges per-shard values with "MetricAggregate" of metric (see "chunked_metric_aggregates").
+
+        Returns:
+            Metric value, or "NOT_SHARDED", if metric is not mergeable, or must be evaluated serially.
+        """
+        metric_configuration = MetricConfiguration(
+            metric_name=getattr(metric_provider, "metric_name", ""),
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+        )
+        metric_aggregate: Optional[MetricAggregate] = get_metric_aggregate(
+            metric_configuration=metric_configuration
+        )
+        if metric_aggregate is None or not metric_aggregate.uses_chunk_metric_value:
+            return NOT_SHARDED
+
+        plan: Optional[Tuple[_ShardSegment, bytes, List[Tuple[int, int]]]] = self._plan(
+            metric_provider=metric_provider,
+            metric_fn=metric_fn,
+            data=data,
+            column_names=[column_name],
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
+            source=source,
+        )
+        if plan is None:
+            return NOT_SHARDED
+
+        segment, arguments, shard_bounds = plan
+        with trace_span(
+            name="evaluate_aggregate_in_shards",
+            category="sharding",
+            metric_name=metric_configuration.metric_name,
+            num_rows=segment.num_rows,
+            num_shards=len(shard_bounds),
+        ):
+            results: Optional[list] = self._run(
+                tasks=[
+                    _ShardTask(
+                        segment_name=segment.memory.name,  # type: ignore[union-attr] # is shardable
+                        column_names=(column_name,),
+                        start=start,
+                        stop=stop,
+                        metric_provider=metric_provider,
+                        metric_fn_name=metric_fn.__name__,
+                        arguments=arguments,
+                        column_keyword="column",
+                    )
+                    for start, stop in shard_bounds
+                ]
+            )
+            if results is None:
+                return NOT_SHARDED
+
+            state: Any = NOT_SHARDED
+            shard_metric_value: Any
+            for shard_metric_value in results:
+                partial: Any = metric_aggregate.compute_partial(
+                    execution_engine=execution_engine,
+                    metric_configuration=metric_configuration,
+                    chunk_metric_value=shard_metric_value,
+                )
+                state = (
+                    partial
+                    if state is NOT_SHARDED
+                    else metric_aggregate.merge(
+                        metric_configuration=metric_configuration,
+                        state=state,
+                        partial=partial,
+                    )
+                )
+
+            return metric_aggregate.finalize(
+                metric_configuration=metric_configuration, state=state
+            )
+
+    def release(self) -> None:
+        """Releases shared memory segments, kept for reuse."""
+        with self._lock:
+            _release_segments(segments=self._segments)
+
+    def _plan(  # noqa: PLR0913
+        self,
+        metric_provider: type,
+        metric_fn: Callable,
+        data: pd.DataFrame,
+        column_names: Sequence[str],
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        source: Optional[pd.DataFrame],
+    ) -> Optional[Tuple[_ShardSegment, bytes, List[Tuple[int, int]]]]:
+        num_rows: int = len(data.index)
+        num_shards: int = min(
+            self._num_processes, num_rows // max(self._config.min_rows_per_shard, 1)
+        )
+        if num_shards < 2:  # noqa: PLR2004
+            return None
+
+        if (
+            self.estimate_cost(data=data, column_names=column_names)
+            < self._config.min_cost
+        ):
+            return None
+
+        arguments: Optional[bytes] = _pickle_shard_arguments(
+            metric_provider=metric_provider,
+            metric_fn=metric_fn,
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
+        )
+        if arguments is None:
+            return None
+
+        segment: _ShardSegment = self._get_segment(
+            data=data, column_names=column_names, source=source
+        )
+        if not segment.is_shardable:
+            return None
+
+        shard_size: int = -(-num_rows // num_shards)
+        shard_bounds: List[Tuple[int, int]] = [
+            (start, min(start + shard_size, num_rows))
+            for start in range(0, num_rows, shard_size)
+        ]
+        return segment, arguments, shard_bounds
+
+    def _get_segment(
+        self,
+        data: pd.DataFrame,
+        column_names: Sequence[str],
+        source: Optional[pd.DataFrame],
+    ) -> _ShardSegment:
+        # Rows of "data", filtered from same columns of same "source", are identical, if their number is.
+        if source is None:
+            source = data
+
+        key: tuple = (id(source), tuple(column_names), len(data.index))
+        with self._lock:
+            segment: Optional[_ShardSegment] = self._segments.get(key)
+            if segment is not None and segment.source() is source:
+                self._segments.move_to_end(key)
+                return segment
+
+            if segment is not None:
+                segment.release()
+                del self._segments[key]
+
+            segment = _ShardSegment(
+                memory=_write_segment(data=data, column_names=column_names),
+                source=weakref.ref(source),
+                num_rows=len(data.index),
+            )
+            self._segments[key] = segment
+            while len(self._segments) > max(self._config.max_cached_segments, 1):
+                _, evicted_segment = self._segments.popitem(last=False)
+                evicted_segment.release()
+
+            return segment
+
+    def _run(self, tasks: List[_ShardTask]) -> Optional[list]:
+        pool: ProcessPoolExecutor = _get_process_pool(
+            num_processes=self._num_processes, start_method=self._config.start_method
+        )
+        try:
+            outcomes: List[Tuple[bool, Any]] = list(pool.map(_evaluate_shard, tasks))
+        except BrokenProcessPool as e:
+            logger.warning(
+                f"""Pool of shard workers broke (e.g., workers could not import Great Expectations or metric provider); \
+evaluating {tasks[0].metric_provider.__name__}.{tasks[0].metric_fn_name} serially: {e}"""
+            )
+            _discard_process_pool(
+                num_processes=self._num_processes,
+                start_method=self._config.start_method,
+            )
+            return None
+        except Exception as e:
+            # E.g., metric provider class cannot be imported in worker (if it is defined in notebook).
+            logger.debug(
+                f"Shards could not be evaluated in workers; evaluating serially: {type(e).__name__}: {e}"
+            )
+            return None
+
+        succeeded: bool
+        result: Any
+        results: list = []
+        for succeeded, result in outcomes:
+            if not succeeded:
+                logger.debug(
+                    f"{tasks[0].metric_provider.__name__}.{tasks[0].metric_fn_name} could not be evaluated in shards; evaluating serially: {result}"
+                )
+                return None
+
+            results.append(result)
+
+        return results
+
+
+def _pickle_shard_arguments(
+    metric_provider: type,
+    metric_fn: Callable,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+) -> Optional[bytes]:
+    # Returns pickled arguments of metric function for workers (None if metric cannot be evaluated in workers).
+    # Workers look metric function up by name on metric provider class, and unwrap its decorators.
+    if (
+        inspect.unwrap(getattr(metric_provider, metric_fn.__name__, None))
+        is not metric_fn
+    ):
+        return None
+
+    # Values of map metrics (e.g., "column_values.z_score.map") are aligned with rows of entire DataFrame.
+    metric_name: str
+    metric_value: Any
+    for metric_name, metric_value in metrics.items():
+        if is_chunk_local_metric(metric_name=metric_name) or isinstance(
+            metric_value, (pd.Series, pd.DataFrame, np.ndarray, tuple)
+        ):
+            return None
+
+    try:
+        arguments: bytes = pickle.dumps(
+            (metric_value_kwargs, metrics), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        pickle.dumps(metric_provider, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        logger.debug(f"Arguments of {metric_provider.__name__} cannot be sharded: {e}")
+        return None
+
+    return arguments
+
+
+def _write_segment(
+    data: pd.DataFrame, column_names: Sequence[str]
+) -> Optional[shared_memory.SharedMemory]:
+    if not pa:
+        logger.debug("Sharding of Pandas metrics requires pyarrow.")
+        return None
+
+    # Arrow columns are named by position, since names of DataFrame columns need not be strings (or unique).
+    try:
+        table: pa.Table = pa.Table.from_arrays(
+            [pa.Array.from_pandas(data[column_name]) for column_name in column_names],
+            names=[str(index) for index in range(len(column_names))],
+        )
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logger.debug(f"Columns {list(column_names)} cannot be sharded: {e}")
+        return None
+
+    if not _is_round_trip_exact(table=table, data=data, column_names=column_names):
+        return None
+
+    sink: pa.MockOutputStream = pa.MockOutputStream()
+    _write_table(table=table, sink=sink)
+    segment: shared_memory.SharedMemory = shared_memory.SharedMemory(
+        create=True, size=max(sink.size(), 1)
+    )
+    try:
+        _write_table(
+            table=table, sink=pa.FixedSizeBufferWriter(pa.py_buffer(segment.buf))
+        )
+    except BaseException:
+        _release_shared_memory(memory=segment)
+        raise
+
+    return segment
+
+
+def _write_table(table: pa.Table, sink: Any) -> None:
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _is_round_trip_exact(
+    table: pa.Table, data: pd.DataFrame, column_names: Sequence[str]
+) -> bool:
+    # E.g., "object" column of Python integers, or of "datetime.date" values, comes back with different dtype.
+    sample: pd.DataFrame = table.slice(0, _ROUND_TRIP_SAMPLE_ROWS).to_pandas()
+    index: int
+    column_name: str
+    for index, column_name in enumerate(column_names):
+        if not sample[str(index)].equals(
+            data[column_name].iloc[:_ROUND_TRIP_SAMPLE_ROWS].reset_index(drop=True)
+        ):
+            logger.debug(
+                f'Column "{column_name}" of dtype "{data[column_name].dtype}" changes in Arrow round trip; it is not sharded.'
+            )
+            return False
+
+    return True
+
+
+def _release_shared_memory(memory: shared_memory.SharedMemory) -> None:
+    try:
+        memory.close()
+    except BufferError:
+        # Views of segment are still referenced; segment is unmapped, once they are garbage collected.
+        pass
+
+    try:
+        memory.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _release_segments(segments: OrderedDict) -> None:
+    segment: _ShardSegment
+    for segment in segments.values():
+        segment.release()
+
+    segments.clear()
+
+
+_process_pools: Dict[Tuple[int, str], ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def _get_start_method(start_method: Optional[str]) -> str:
+    return start_method or "spawn"
+
+
+def _get_process_pool(
+    num_processes: int, start_method: Optional[str]
+) -> ProcessPoolExecutor:
+    key: Tuple[int, str] = (num_processes, _get_start_method(start_method))
+    with _process_pools_lock:
+        pool: Optional[ProcessPoolExecutor] = _process_pools.get(key)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=num_processes,
+                mp_context=multiprocessing.get_context(key[1]),
+            )
+            _process_pools[key] = pool
+
+        return pool
+
+
+def _discard_process_pool(num_processes: int, start_method: Optional[str]) -> None:
+    with _process_pools_lock:
+        pool: Optional[ProcessPoolExecutor] = _process_pools.pop(
+            (num_processes, _get_start_method(start_method)), None
+        )
+
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+@atexit.register
+def shutdown_process_pools() -> None:
+    """Shuts worker pools down (they are started again, when needed)."""
+    with _process_pools_lock:
+        pools: List[ProcessPoolExecutor] = list(_process_pools.values())
+        _process_pools.clear()
+
+    pool: ProcessPoolExecutor
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+# Input segments, attached in worker process (most recently used last).
+_worker_segments: OrderedDict[
+    str, Tuple[shared_memory.SharedMemory, pa.Table]
+] = OrderedDict()
+
+
+def _evaluate_shard(task: _ShardTask) -> Tuple[bool, Any]:
+    # Runs in worker process; failures are returned (rather than raised), so that metric is evaluated serially.
+    try:
+        return True, _evaluate_shard_task(task=task)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+def _evaluate_shard_task(task: _ShardTask) -> Any:
+    table: pa.Table = _attach_worker_segment(segment_name=task.segment_name)
+    data: pd.DataFrame = table.slice(task.start, task.stop - task.start).to_pandas()
+    data.columns = list(task.column_names)
+
+    metric_value_kwargs: dict
+    metrics: Dict[str, Any]
+    metric_value_kwargs, metrics = pickle.loads(task.arguments)
+    metric_fn: Callable = inspect.unwrap(
+        getattr(task.metric_provider, task.metric_fn_name)
+    )
+
+    if task.column_keyword:
+        result: Any = metric_fn(
+            task.metric_provider,
+            **{task.column_keyword: data.iloc[:, 0]},
+            **metric_value_kwargs,
+            _metrics=metrics,
+        )
+    elif task.as_frame:
+        result = metric_fn(
+            task.metric_provider, data, **metric_value_kwargs, _metrics=metrics
+        )
+    else:
+        result = metric_fn(
+            task.metric_provider,
+            *[data.iloc[:, index] for index in range(len(task.column_names))],
+            **metric_value_kwargs,
+            _metrics=metrics,
+        )
+
+    if task.output_segment_name is None:
+        return result
+
+    condition: np.ndarray = np.asarray(result)
+    if condition.dtype != np.bool_ or condition.shape != (len(data.index),):
+        raise TypeError(
+            f"Map condition of shard is not boolean array of {len(data.index)} rows ({condition.dtype}, {condition.shape})."
+        )
+
+    output: shared_memory.SharedMemory = shared_memory.SharedMemory(
+        name=task.output_segment_name
+    )
+    try:
+        output_array: np.ndarray = np.ndarray(
+            (task.stop,), dtype=np.bool_, buffer=output.buf
+        )
+        output_array[task.start : task.stop] = condition
+        del output_array
+    finally:
+        output.close()
+
+    return None
+
+
+def _attach_worker_segment(segment_name: str) -> pa.Table:
+    if segment_name in _worker_segments:
+        _worker_segments.move_to_end(segment_name)
+        return _worker_segments[segment_name][1]
+
+    segment: shared_memory.SharedMemory = shared_memory.SharedMemory(name=segment_name)
+    table: pa.Table = pa.ipc.open_stream(pa.py_buffer(segment.buf)).read_all()
+    _worker_segments[segment_name] = (segment, table)
+    while len(_worker_segments) > _MAX_WORKER_SEGMENTS:
+        _, (evicted_segment, evicted_table) = _worker_segments.popitem(last=False)
+        del evicted_table
+        try:
+            evicted_segment.close()
+        except BufferError:
+            pass
+
+    return table
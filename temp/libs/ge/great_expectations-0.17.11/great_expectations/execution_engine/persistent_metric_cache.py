@@ -0,0 +1,360 @@
+"""
+On-disk cache of resolved metrics, shared across runs (and processes), kept in local SQLite database.
+
+Metric values are keyed by data version of Batch, on which they were computed, and by metric (name, domain kwargs other
+than Batch ID, and value kwargs), since Batch IDs of runtime Batches change from run to run.  Data version is opaque token,
+set by "ExecutionEngine.get_batch_data_and_markers()" (e.g., fingerprint of Pandas DataFrame, or "LAST_ALTERED" time of
+Snowflake table, together with Batch Spec); Batches without data version are never cached.
+
+Only values of metrics, which are neither partial functions (e.g., "column_values.in_set.condition"), nor unpicklable,
+are stored.  Cache is bounded by number of entries and/or by total size of pickled values (least-recently-used entries
+are evicted first), and entries can expire after "ttl_seconds".
+"""
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import pathlib
+import pickle
+import sqlite3
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
+
+logger = logging.getLogger(__name__)
+
+_MetricKey = Tuple[str, str, str]
+
+PERSISTENT_METRIC_CACHE_FILE_NAME: str = "gx_metric_cache.db"
+
+# SQLite limits number of bound parameters per statement (999 in older versions).
+_MAX_QUERY_PARAMETERS: int = 900
+
+_NON_PERSISTENT_METRIC_NAME_SUFFIXES: Tuple[str, ...] = tuple(
+    suffix.value for suffix in MetricPartialFunctionTypeSuffixes
+)
+
+
+class PersistentMetricCache:
+    """
+    SQLite-backed cache of metric values, keyed by data version of Batch and by metric.
+
+    Args:
+        path: Path of SQLite database file (or of directory, in which "gx_metric_cache.db" is kept).
+        max_bytes: Budget for total size of pickled metric values (None means no limit).
+        max_entries: Maximum number of cached metric values (None means no limit).
+        ttl_seconds: Time, after which cached metric values expire (None means never).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        if pathlib.Path(path).is_dir() or path.endswith(os.sep):
+            path = str(pathlib.Path(path) / PERSISTENT_METRIC_CACHE_FILE_NAME)
+
+        self._path = path
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+
+        pathlib.Path(path).absolute().parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS metric_values (
+    data_version TEXT NOT NULL,
+    metric_key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (data_version, metric_key)
+)"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS metric_values_last_used_at ON metric_values (last_used_at)"
+            )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of pickled metric values."""
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM metric_values"
+            ).fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._connect() as connection:
+            return connection.execute("SELECT COUNT(*) FROM metric_values").fetchone()[
+                0
+            ]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self._path!r})"
+
+    @staticmethod
+    def get_metric_key(metric_configuration: MetricConfiguration) -> str:
+        """Returns key of metric, independent of Batch ID (which is replaced by data version of Batch)."""
+        metric_domain_kwargs = IDDict(
+            {
+                key: value
+                for key, value in metric_configuration.metric_domain_kwargs.items()
+                if key != "batch_id"
+            }
+        )
+        return "|".join(
+            [
+                metric_configuration.metric_name,
+                str(metric_domain_kwargs.to_id()),
+                str(metric_configuration.metric_value_kwargs_id),
+            ]
+        )
+
+    @staticmethod
+    def is_persistent_metric(metric_configuration: MetricConfiguration) -> bool:
+        """Partial functions (e.g., conditions of map metrics) are specific to process and are never stored."""
+        return not metric_configuration.metric_name.endswith(
+            _NON_PERSISTENT_METRIC_NAME_SUFFIXES
+        )
+
+    def get(
+        self,
+        data_version: str,
+        metric_configurations: Iterable[MetricConfiguration],
+    ) -> Dict[_MetricKey, MetricValue]:
+        """
+        Returns cached values of given metrics, computed on Batch with given data version.
+
+        Returns:
+            Dictionary of metric values, keyed by metric ID (of given "MetricConfiguration" objects).
+        """
+        metric_ids_by_metric_key: Dict[str, List[_MetricKey]] = {}
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            if self.is_persistent_metric(metric_configuration=metric_configuration):
+                metric_ids_by_metric_key.setdefault(
+                    self.get_metric_key(metric_configuration=metric_configuration), []
+                ).append(metric_configuration.id)
+
+        if not metric_ids_by_metric_key:
+            return {}
+
+        metrics: Dict[_MetricKey, MetricValue] = {}
+        try:
+            self._get(
+                data_version=data_version,
+                metric_ids_by_metric_key=metric_ids_by_metric_key,
+                metrics=metrics,
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                f"Persistent metric cache {self._path} could not be read: {e}"
+            )
+
+        return metrics
+
+    def _get(
+        self,
+        data_version: str,
+        metric_ids_by_metric_key: Dict[str, List[_MetricKey]],
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        now: float = time.time()
+        min_stored_at: float = (
+            now - self._ttl_seconds if self._ttl_seconds is not None else 0.0
+        )
+        unreadable_metric_keys: List[str] = []
+        metric_keys: List[str] = list(metric_ids_by_metric_key.keys())
+        metric_key: str
+        value: Any
+        with self._connect() as connection:
+            for start in range(0, len(metric_keys), _MAX_QUERY_PARAMETERS):
+                batch_metric_keys: List[str] = metric_keys[
+                    start : start + _MAX_QUERY_PARAMETERS
+                ]
+                rows: List[Tuple[str, bytes]] = connection.execute(
+                    f"""SELECT metric_key, value FROM metric_values
+WHERE data_version = ? AND stored_at >= ? AND metric_key IN ({", ".join("?" * len(batch_metric_keys))})""",
+                    [data_version, min_stored_at, *batch_metric_keys],
+                ).fetchall()
+                for metric_key, serialized_value in rows:
+                    try:
+                        value = pickle.loads(serialized_value)
+                    except Exception as e:
+                        # E.g., class of value no longer exists in installed versions of libraries.
+                        logger.debug(
+                            f"Cached value of metric {metric_key} could not be read: {e}"
+                        )
+                        unreadable_metric_keys.append(metric_key)
+                        continue
+
+                    for metric_id in metric_ids_by_metric_key[metric_key]:
+                        metrics[metric_id] = value
+
+                if rows:
+                    connection.execute(
+                        f"""UPDATE metric_values SET last_used_at = ?
+WHERE data_version = ? AND metric_key IN ({", ".join("?" * len(rows))})""",
+                        [now, data_version, *[row[0] for row in rows]],
+                    )
+
+            if unreadable_metric_keys:
+                connection.executemany(
+                    "DELETE FROM metric_values WHERE data_version = ? AND metric_key = ?",
+                    [
+                        (data_version, metric_key)
+                        for metric_key in unreadable_metric_keys
+                    ],
+                )
+
+    def put(
+        self,
+        data_version: str,
+        metrics: Iterable[Tuple[MetricConfiguration, MetricValue]],
+    ) -> int:
+        """
+        Stores values of metrics, computed on Batch with given data version.
+
+        Returns:
+            Number of stored metric values.
+        """
+        now: float = time.time()
+        rows: List[Tuple[str, str, bytes, int, float, float]] = []
+        metric_configuration: MetricConfiguration
+        value: MetricValue
+        serialized_value: bytes
+        for metric_configuration, value in metrics:
+            if not self.is_persistent_metric(metric_configuration=metric_configuration):
+                continue
+
+            try:
+                serialized_value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.debug(
+                    f"Value of metric {metric_configuration.id} cannot be stored in persistent metric cache: {e}"
+                )
+                continue
+
+            rows.append(
+                (
+                    data_version,
+                    self.get_metric_key(metric_configuration=metric_configuration),
+                    serialized_value,
+                    len(serialized_value),
+                    now,
+                    now,
+                )
+            )
+
+        if not rows:
+            return 0
+
+        try:
+            with self._connect() as connection:
+                connection.executemany(
+                    """INSERT OR REPLACE INTO metric_values
+(data_version, metric_key, value, size_bytes, stored_at, last_used_at) VALUES (?, ?, ?, ?, ?, ?)""",
+                    rows,
+                )
+                self._evict(connection=connection, now=now)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                f"Persistent metric cache {self._path} could not be written: {e}"
+            )
+            return 0
+
+        return len(rows)
+
+    def invalidate(self, data_version: Optional[str] = None) -> int:
+        """
+        Removes metric values, computed on Batch with given data version (or all values, if "data_version" is None).
+
+        Returns:
+            Number of removed metric values.
+        """
+        with self._connect() as connection:
+            if data_version is None:
+                return connection.execute("DELETE FROM metric_values").rowcount
+
+            return connection.execute(
+                "DELETE FROM metric_values WHERE data_version = ?", [data_version]
+            ).rowcount
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        if self._ttl_seconds is not None:
+            connection.execute(
+                "DELETE FROM metric_values WHERE stored_at < ?",
+                [now - self._ttl_seconds],
+            )
+
+        if self._max_entries is None and self._max_bytes is None:
+            return
+
+        num_entries: int
+        total_size_bytes: int
+        num_entries, total_size_bytes = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM metric_values"
+        ).fetchone()
+
+        rowids: List[int] = []
+        rowid: int
+        size_bytes: int
+        cursor: sqlite3.Cursor = connection.execute(
+            "SELECT rowid, size_bytes FROM metric_values ORDER BY last_used_at, rowid"
+        )
+        for rowid, size_bytes in cursor:
+            if (self._max_entries is None or num_entries <= self._max_entries) and (
+                self._max_bytes is None or total_size_bytes <= self._max_bytes
+            ):
+                break
+
+            rowids.append(rowid)
+            num_entries -= 1
+            total_size_bytes -= size_bytes
+
+        cursor.close()
+        connection.executemany(
+            "DELETE FROM metric_values WHERE rowid = ?", [(rowid,) for rowid in rowids]
+        )
+        if rowids:
+            logger.debug(f"Evicted {len(rowids)} entries from persistent metric cache.")
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Connection per operation, so that cache can be used from several threads (and processes).
+        connection: sqlite3.Connection = sqlite3.connect(self._path, timeout=30.0)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
@@ -0,0 +1,180 @@
+"""
+Seekable, read-only file-like access to cloud storage objects (S3, GCS, Azure Blob Storage) through ranged requests.
+
+Rather than downloading an entire object into memory before parsing it, "PandasExecutionEngine" passes one of the
+readers below to Pandas reader methods.  Columnar formats (Parquet, Feather) then fetch only their footer and the
+column chunks they need, while row-oriented formats (CSV, JSON) are consumed sequentially, one buffer at a time, so that
+peak memory stays bounded by the parsed "DataFrame" (plus one buffer) instead of twice the object size.
+"""
+from __future__ import annotations
+
+import io
+import logging
+from abc import ABCMeta, abstractmethod
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Minimum size of single ranged request; large enough to amortize request latency on sequential reads.
+DEFAULT_RANGED_READ_BLOCK_SIZE: int = 8 * 1024 * 1024
+
+
+class RangedObjectReader(io.RawIOBase, metaclass=ABCMeta):
+    """
+    Unbuffered, seekable, read-only file-like view of remote object, fetching requested byte ranges on demand.
+
+    Subclasses implement "_fetch_range()" for particular storage client.  Every request fetches at least "block_size"
+    bytes (or the rest of object), and the most recently fetched block is kept, so that small reads (e.g., by CSV
+    parser) are served from it instead of each making request of its own.
+    """
+
+    def __init__(
+        self, size: int, name: str, block_size: int = DEFAULT_RANGED_READ_BLOCK_SIZE
+    ) -> None:
+        """
+        Args:
+            size: Size of remote object (in bytes).
+            name: Name of remote object (used for logging and by readers, which inspect "name" attribute).
+            block_size: Minimum number of bytes fetched by single ranged request.
+        """
+        super().__init__()
+        self._size = size
+        self._name = name
+        self._block_size = block_size
+        self._position = 0
+        self._block_start = 0
+        self._block = b""
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def open_buffered(self) -> io.BufferedReader:
+        return io.BufferedReader(self)  # type: ignore[arg-type] # RawIOBase
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}.")
+
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        length: int = min(len(buffer), self._size - self._position)
+        if length <= 0:
+            return 0
+
+        offset: int = self._position - self._block_start
+        if not (0 <= offset and offset + length <= len(self._block)):
+            self._block_start = self._position
+            self._block = self._fetch_range(
+                start=self._position,
+                length=min(max(length, self._block_size), self._size - self._position),
+            )
+            offset = 0
+
+        data: bytes = self._block[offset : offset + length]
+        num_bytes: int = len(data)
+        buffer[:num_bytes] = data
+        self._position += num_bytes
+        return num_bytes
+
+    def readall(self) -> bytes:
+        length: int = self._size - self._position
+        if length <= 0:
+            return b""
+
+        data: bytes = self._fetch_range(start=self._position, length=length)
+        self._position += len(data)
+        return data
+
+    @abstractmethod
+    def _fetch_range(self, start: int, length: int) -> bytes:
+        """Returns (at most) "length" bytes of remote object, starting at offset "start"."""
+        pass
+
+
+class S3RangedObjectReader(RangedObjectReader):
+    """Ranged reads of S3 object through "boto3" S3 client (whose connection pool is reused across requests)."""
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        block_size: int = DEFAULT_RANGED_READ_BLOCK_SIZE,
+    ) -> None:
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        size: int = s3_client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        super().__init__(size=size, name=key, block_size=block_size)
+
+    def _fetch_range(self, start: int, length: int) -> bytes:
+        logger.debug(
+            f"Fetching bytes {start}-{start + length - 1} of s3 object. Bucket: {self._bucket} Key: {self._key}"
+        )
+        return self._s3_client.get_object(
+            Bucket=self._bucket,
+            Key=self._key,
+            Range=f"bytes={start}-{start + length - 1}",
+        )["Body"].read()
+
+
+class GCSRangedObjectReader(RangedObjectReader):
+    """Ranged reads of GCS blob through "google.cloud.storage" Blob (obtained with its metadata, including size)."""
+
+    def __init__(
+        self, blob: Any, block_size: int = DEFAULT_RANGED_READ_BLOCK_SIZE
+    ) -> None:
+        self._blob = blob
+        super().__init__(size=blob.size, name=blob.name, block_size=block_size)
+
+    def _fetch_range(self, start: int, length: int) -> bytes:
+        logger.debug(
+            f"Fetching bytes {start}-{start + length - 1} of GCS blob. Blob: {self._blob.name}"
+        )
+        # Note: "end" is inclusive.
+        return self._blob.download_as_bytes(start=start, end=start + length - 1)
+
+
+class AzureRangedObjectReader(RangedObjectReader):
+    """Ranged reads of Azure blob through "azure.storage.blob" BlobClient."""
+
+    def __init__(
+        self, blob_client: Any, block_size: int = DEFAULT_RANGED_READ_BLOCK_SIZE
+    ) -> None:
+        self._blob_client = blob_client
+        size: int = blob_client.get_blob_properties().size
+        super().__init__(size=size, name=blob_client.blob_name, block_size=block_size)
+
+    def _fetch_range(self, start: int, length: int) -> bytes:
+        logger.debug(
+            f"Fetching bytes {start}-{start + length - 1} of Azure blob. Blob: {self._blob_client.blob_name}"
+        )
+        return self._blob_client.download_blob(offset=start, length=length).readall()
@@ -36,6 +36,7 @@ from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import (
     MetricDomainTypes,  # noqa: TCH001
 )
+from great_expectations.core.tracing import trace_span
 from great_expectations.core.util import (
     AzureUrl,
     convert_to_json_serializable,
@@ -368,10 +369,31 @@ illegal.  Please check your config."""
             )
 
         batch_data = self._apply_splitting_and_sampling_methods(batch_spec, batch_data)
+        batch_data = self._apply_column_projection(batch_spec, batch_data)
         typed_batch_data = SparkDFBatchData(execution_engine=self, dataframe=batch_data)
 
         return typed_batch_data, batch_markers
 
+    @staticmethod
+    def _apply_column_projection(batch_spec, batch_data):
+        """Selects columns, listed in "column_projection" directive of "batch_spec" (if any), before data is persisted.
+
+        Columns absent from "batch_data" are skipped, so that validation can report them as missing.
+        """
+        column_projection: Optional[List[str]] = batch_spec.get("column_projection")
+        if not column_projection:
+            return batch_data
+
+        column_names: List[str] = [
+            column_name
+            for column_name in column_projection
+            if column_name in batch_data.columns
+        ]
+        if not column_names:
+            return batch_data
+
+        return batch_data.select(*column_names)
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         # Note this is to get a batch from tables in AWS Glue Data Catalog by its partitions
         partitions: Optional[List[str]] = batch_spec.get("partitions")
@@ -756,7 +778,16 @@ illegal.  Please check your config."""
 
             assert len(aggregate["column_aggregates"]) == len(aggregate["metric_ids"])
 
-            res = df.agg(*aggregate["column_aggregates"]).collect()
+            with trace_span(
+                "metric_bundle_aggregation",
+                "query",
+                num_metrics=len(aggregate["metric_ids"]),
+            ) as span:
+                if span.is_recording:
+                    span.set_attributes(domain_id=str(IDDict(domain_kwargs).to_id()))
+
+                res = df.agg(*aggregate["column_aggregates"]).collect()
+                span.set_attributes(row_count=len(res))
 
             logger.debug(
                 f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
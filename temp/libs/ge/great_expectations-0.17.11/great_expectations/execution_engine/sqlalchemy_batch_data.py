@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Optional, Tuple, overload
+from typing import TYPE_CHECKING, Optional, Tuple, Union, overload
 
 from great_expectations.compatibility import sqlalchemy
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
 from great_expectations.core.batch import BatchData
+from great_expectations.core.tracing import trace_span
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_temp_table_policy import (
+    AUTO_CREATE_TEMP_TABLE,
+)
 from great_expectations.util import generate_temporary_table_name
 
 if TYPE_CHECKING:
@@ -33,7 +37,7 @@ class SqlAlchemyBatchData(BatchData):
         query: None = ...,
         # Option 3
         selectable: None = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, str] = ...,
         temp_table_schema_name: None = ...,
         use_quoted_name: bool = ...,
         source_schema_name: None = ...,
@@ -52,7 +56,7 @@ class SqlAlchemyBatchData(BatchData):
         query: str = ...,
         # Option 3
         selectable: None = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, str] = ...,
         temp_table_schema_name: Optional[str] = ...,
         use_quoted_name: bool = ...,
         source_schema_name: None = ...,
@@ -71,7 +75,7 @@ class SqlAlchemyBatchData(BatchData):
         query: None = ...,
         # Option 3
         selectable: Selectable = ...,
-        create_temp_table: bool = ...,
+        create_temp_table: Union[bool, str] = ...,
         temp_table_schema_name: Optional[str] = ...,
         use_quoted_name: bool = ...,
         source_schema_name: Optional[str] = ...,
@@ -89,7 +93,7 @@ class SqlAlchemyBatchData(BatchData):
         query: Optional[str] = None,
         # Option 3
         selectable: Optional[Selectable] = None,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, str] = True,
         temp_table_schema_name: Optional[str] = None,
         use_quoted_name: bool = False,
         source_schema_name: Optional[str] = None,
@@ -110,10 +114,11 @@ class SqlAlchemyBatchData(BatchData):
                     A query string representing a domain, which will be used to create a temporary table
                 selectable (Sqlalchemy Selectable or None): \
                     A SqlAlchemy selectable representing a domain, which will be used to create a temporary table
-                create_temp_table (bool): \
+                create_temp_table (bool or "auto"): \
                     When building the batch data object from a query, this flag determines whether a temporary table should
                     be created against which to validate data from the query. If False, a subselect statement will be used
-                    in each validation.
+                    in each validation. If "auto", subselect statements are used until the execution engine decides (from
+                    the number of metric queries and the estimated cost of the query) to materialize the query.
                 temp_table_schema_name (str or None): \
                     The name of the schema in which a temporary table should be created. If None, the default schema will be
                     used if a temporary table is requested.
@@ -135,6 +140,7 @@ class SqlAlchemyBatchData(BatchData):
         In the case of (2) and (3) you have the option to execute the query either as a temporary table, or as a subselect statement.
 
         In general, temporary tables invite more optimization from the query engine itself. Subselect statements may sometimes be preferred, because they do not require write access on the database.
+        Creating a temporary table only pays off if enough metric queries are executed against it, which "auto" leaves to "SqlAlchemyExecutionEngine" to decide (see "materialize()").
 
 
         """
@@ -145,6 +151,23 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        self._temp_table_schema_name = temp_table_schema_name
+        self._temp_table_name: Optional[str] = None
+        # Query, materialization of which is deferred (None unless "create_temp_table" is "auto").
+        self._materialization_query: Optional[str] = None
+        self._subquery_selectable: Optional[Selectable] = None
+        self._num_metric_queries: int = 0
+
+        if isinstance(create_temp_table, str) and (
+            create_temp_table != AUTO_CREATE_TEMP_TABLE
+        ):
+            raise ValueError(
+                f'create_temp_table must be a boolean or "{AUTO_CREATE_TEMP_TABLE}" (got "{create_temp_table}").'
+            )
+
+        defer_temp_table: bool = create_temp_table == AUTO_CREATE_TEMP_TABLE
+        if defer_temp_table:
+            create_temp_table = False
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -174,13 +197,25 @@ class SqlAlchemyBatchData(BatchData):
                 )
             )
         elif query:
+            self._subquery_selectable = sa.text(query)
             self._selectable = self._generate_selectable_from_query(
                 query, dialect, create_temp_table, temp_table_schema_name
             )
+            if defer_temp_table:
+                self._materialization_query = query
         else:
+            self._subquery_selectable = (
+                sa.text(selectable)
+                if isinstance(selectable, str)
+                else selectable.alias()
+            )
             self._selectable = self._generate_selectable_from_selectable(
                 selectable, dialect, create_temp_table, temp_table_schema_name
             )
+            if defer_temp_table:
+                self._materialization_query = str(
+                    self._compile_selectable(selectable=selectable, dialect=dialect)
+                )
 
     @property
     def dialect(self) -> GXSqlDialect:
@@ -207,6 +242,81 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def temp_table_schema_name(self) -> Optional[str]:
+        return self._temp_table_schema_name
+
+    @property
+    def temp_table_name(self) -> Optional[str]:
+        """Name of temporary table, in which query of this Batch is materialized (None if it is not)."""
+        return self._temp_table_name
+
+    @property
+    def materialization_query(self) -> Optional[str]:
+        """Query, materialization of which is deferred (None, unless "create_temp_table" is "auto")."""
+        return self._materialization_query
+
+    @property
+    def is_materialization_deferred(self) -> bool:
+        return self._materialization_query is not None and self._temp_table_name is None
+
+    @property
+    def num_metric_queries(self) -> int:
+        """Estimated number of metric queries, planned against this Batch so far (see "materialize()")."""
+        return self._num_metric_queries
+
+    @num_metric_queries.setter
+    def num_metric_queries(self, value: int) -> None:
+        self._num_metric_queries = value
+
+    def materialize(self, temp_table_name: Optional[str] = None) -> str:
+        """
+        Materializes deferred query of this Batch as temporary table, against which all further metric queries run.
+
+        Args:
+            temp_table_name: Name of existing temporary table, holding result of same query, to use instead of creating
+            new one.
+
+        Returns:
+            Name of temporary table.
+        """
+        if not self.is_materialization_deferred:
+            raise ValueError(
+                'Only Batch with deferred materialization (create_temp_table set to "auto") can be materialized.'
+            )
+
+        if temp_table_name is None:
+            with trace_span("create_temporary_table", "batch"):
+                _, temp_table_name = self._create_temporary_table(
+                    dialect=self._dialect,
+                    query=self._materialization_query,
+                    temp_table_schema_name=self._temp_table_schema_name,
+                )
+
+        self._temp_table_name = temp_table_name
+        self._selectable = sa.Table(
+            temp_table_name,
+            sa.MetaData(),
+            schema=self._temp_table_schema_name,
+        )
+        return temp_table_name
+
+    def release_temporary_table(self) -> Optional[str]:
+        """
+        Switches this Batch back to subselect statements (e.g., before its temporary table is dropped); Batch with
+        deferred materialization may be materialized again later.
+
+        Returns:
+            Name of temporary table, which this Batch used (None if it used none).
+        """
+        temp_table_name: Optional[str] = self._temp_table_name
+        if temp_table_name is not None:
+            self._selectable = self._subquery_selectable
+            self._temp_table_name = None
+            self._num_metric_queries = 0
+
+        return temp_table_name
+
     def _create_temporary_table(  # noqa: C901, PLR0912, PLR0915
         self, dialect, query, temp_table_schema_name=None
     ) -> Tuple[str, str]:
@@ -309,6 +419,32 @@ class SqlAlchemyBatchData(BatchData):
             self.execution_engine.execute_query_in_transaction(sa.text(stmt))
         return (stmt, temp_table_name)
 
+    @staticmethod
+    def get_drop_temporary_table_statement(
+        dialect: Union[GXSqlDialect, str], temp_table_name: str
+    ) -> str:
+        """Statement, which drops temporary table created by "_create_temporary_table()" (quoted the same way)."""
+        if dialect in [GXSqlDialect.BIGQUERY, GXSqlDialect.HIVE]:
+            return f"DROP TABLE IF EXISTS `{temp_table_name}`"
+        elif dialect == GXSqlDialect.DREMIO:
+            return f"DROP VDS {temp_table_name}"
+        elif dialect == GXSqlDialect.ORACLE:
+            return f"DROP TABLE {temp_table_name}"
+        elif dialect == GXSqlDialect.TERADATASQL:
+            return f'DROP TABLE "{temp_table_name}"'
+        elif dialect in [
+            GXSqlDialect.SNOWFLAKE,
+            GXSqlDialect.MYSQL,
+            GXSqlDialect.MSSQL,
+            GXSqlDialect.TRINO,
+            GXSqlDialect.CLICKHOUSE,
+            GXSqlDialect.AWSATHENA,
+            GXSqlDialect.VERTICA,
+        ]:
+            return f"DROP TABLE IF EXISTS {temp_table_name}"
+
+        return f'DROP TABLE IF EXISTS "{temp_table_name}"'
+
     def _generate_selectable_from_schema_name_and_table_name(
         self,
         dialect: GXSqlDialect,
@@ -371,6 +507,7 @@ class SqlAlchemyBatchData(BatchData):
             query=query,
             temp_table_schema_name=temp_table_schema_name,
         )
+        self._temp_table_name = temp_table_name
 
         return sa.Table(
             temp_table_name,
@@ -400,26 +537,30 @@ class SqlAlchemyBatchData(BatchData):
         if not create_temp_table:
             return selectable.alias()
 
-        if dialect in [GXSqlDialect.ORACLE, GXSqlDialect.MSSQL] and isinstance(
-            selectable, str
-        ):
-            # oracle, mssql query could already be passed as a string
-            query = selectable
-        else:
-            # compile selectable to sql statement
-            query = selectable.compile(
-                dialect=self.sql_engine_dialect,
-                compile_kwargs={"literal_binds": True},
-            )
+        query = self._compile_selectable(selectable=selectable, dialect=dialect)
 
         _, temp_table_name = self._create_temporary_table(
             dialect=dialect,
             query=query,
             temp_table_schema_name=temp_table_schema_name,
         )
+        self._temp_table_name = temp_table_name
 
         return sa.Table(
             temp_table_name,
             sa.MetaData(),
             schema=temp_table_schema_name,
         )
+
+    def _compile_selectable(self, selectable, dialect: GXSqlDialect):
+        if dialect in [GXSqlDialect.ORACLE, GXSqlDialect.MSSQL] and isinstance(
+            selectable, str
+        ):
+            # oracle, mssql query could already be passed as a string
+            return selectable
+
+        # compile selectable to sql statement
+        return selectable.compile(
+            dialect=self.sql_engine_dialect,
+            compile_kwargs={"literal_binds": True},
+        )
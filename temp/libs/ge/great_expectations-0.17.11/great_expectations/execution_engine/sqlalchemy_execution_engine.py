@@ -40,6 +40,7 @@ from great_expectations.compatibility.sqlalchemy import (
 )
 from great_expectations.core._docs_decorators import new_method_or_class, public_api
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.tracing import trace_span
 from great_expectations.core.usage_statistics.events import UsageStatsEvents
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine.execution_engine import (
@@ -77,6 +78,20 @@ from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_schema_cache import (
+    DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
+    get_schema_cache,
+)
+from great_expectations.execution_engine.sqlalchemy_temp_table_policy import (
+    estimate_metric_queries,
+    estimate_query_cost_ratio,
+    should_materialize,
+)
+from great_expectations.execution_engine.sqlalchemy_unexpected_samples import (
+    UnexpectedSampleQuery,
+    build_unexpected_samples_query,
+    demultiplex_unexpected_samples,
+)
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -284,6 +299,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
         concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+        create_temp_table (bool or "auto"): Whether query-defined Batches are materialized as temporary tables. If \
+            "auto", a Batch is materialized only once enough metric queries are planned against it, given the cost of \
+            its query as estimated with EXPLAIN (see "prepare_for_metric_resolution()").
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -302,17 +320,29 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         connection_string: Optional[str] = None,
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, str] = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        schema_cache_ttl_seconds: Optional[float] = DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
+        metric_cache_config: Optional[dict] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache_config=metric_cache_config,
+        )
         self._name = name
+        self._schema_cache_ttl_seconds = schema_cache_ttl_seconds
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        # Temporary tables of materialized Batch queries, keyed by query, schema, and data version of Batch, so that
+        # Batches with identical queries share them until "drop_temporary_tables()" is called.
+        self._temporary_tables: Dict[Tuple[str, Optional[str], Optional[str]], str] = {}
+        self._failed_materializations: set = set()
+        self._query_cost_ratios: Dict[str, Optional[float]] = {}
         os.environ["SF_PARTNER"] = "great_expectations_oss"
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by
@@ -463,11 +493,15 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "metric_cache_config": metric_cache_config,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         self._config.update(kwargs)
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+        # Explicitly disabled schema cache (0) is Falsy, and hence it is added after filtering.
+        if schema_cache_ttl_seconds != DEFAULT_SCHEMA_CACHE_TTL_SECONDS:
+            self._config["schema_cache_ttl_seconds"] = schema_cache_ttl_seconds
 
         self._data_splitter = SqlAlchemyDataSplitter(dialect=self.dialect_name)
         self._data_sampler = SqlAlchemyDataSampler()
@@ -542,6 +576,27 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         return self.engine.dialect.name.lower()
 
+    @property
+    def schema_cache_ttl_seconds(self) -> Optional[float]:
+        """Lifetime of cached column metadata (reflected schema) of tables; None or 0 means that it is not cached."""
+        return self._schema_cache_ttl_seconds
+
+    def invalidate_schema_cache(
+        self, table_name: Optional[str] = None, schema_name: Optional[str] = None
+    ) -> int:
+        """Discards cached column metadata of tables in database of this engine (e.g., after their DDL has changed).
+
+        Args:
+            table_name: Name of table, whose column metadata is discarded (all tables, if omitted).
+            schema_name: Name of schema, in which column metadata of tables is discarded (all schemas, if omitted).
+
+        Returns:
+            Number of discarded schema cache entries.
+        """
+        return get_schema_cache().invalidate(
+            engine=self.engine, schema_name=schema_name, table_name=table_name
+        )
+
     def _build_engine(self, credentials: dict, **kwargs) -> sa.engine.Engine:
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -1016,6 +1071,152 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return SplitDomainKwargs(compute_domain_kwargs, accessor_domain_kwargs)
 
+    def _process_direct_and_bundled_metric_computation_configurations(
+        self,
+        metric_fn_direct_configurations: List[MetricComputationConfiguration],
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        In addition to processing of "ExecutionEngine", executes unexpected-row sample queries of directly-computable
+        metrics, whose metric functions have "unexpected_sample_query_fn" attribute, as one "UNION ALL" query per Batch.
+
+        Metrics of Batches with single such query, as well as metrics of groups, for which combined query fails, are
+        computed directly (one query per metric), as before.
+        """
+        resolved_sample_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        remaining_direct_configurations: List[MetricComputationConfiguration] = []
+        sample_groups: Dict[
+            Tuple[Optional[str], Optional[str]],
+            List[Tuple[MetricComputationConfiguration, UnexpectedSampleQuery]],
+        ] = {}
+
+        metric_computation_configuration: MetricComputationConfiguration
+        unexpected_sample_query_fn: Optional[Callable]
+        sample_query: Optional[UnexpectedSampleQuery]
+        metric_domain_kwargs: dict
+        group_key: Tuple[Optional[str], Optional[str]]
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            unexpected_sample_query_fn = getattr(
+                metric_computation_configuration.metric_fn,
+                "unexpected_sample_query_fn",
+                None,
+            )
+            if unexpected_sample_query_fn is None:
+                remaining_direct_configurations.append(metric_computation_configuration)
+                continue
+
+            try:
+                sample_query = unexpected_sample_query_fn(
+                    **metric_computation_configuration.metric_provider_kwargs
+                )
+            except Exception as e:
+                # Errors are reported by (and attributed to the failed metric in) direct computation.
+                logger.debug(
+                    f"""Building unexpected sample query for metric "{metric_computation_configuration.metric_configuration.metric_name}" failed: {e}"""
+                )
+                remaining_direct_configurations.append(metric_computation_configuration)
+                continue
+
+            if sample_query is None:
+                resolved_sample_metrics[
+                    metric_computation_configuration.metric_configuration.id
+                ] = None
+                continue
+
+            metric_domain_kwargs = (
+                metric_computation_configuration.metric_configuration.metric_domain_kwargs
+                or {}
+            )
+            group_key = (
+                metric_domain_kwargs.get("batch_id")
+                or self.batch_manager.active_batch_data_id,
+                metric_domain_kwargs.get("table"),
+            )
+            sample_groups.setdefault(group_key, []).append(
+                (metric_computation_configuration, sample_query)
+            )
+
+        group: List[Tuple[MetricComputationConfiguration, UnexpectedSampleQuery]]
+        for group in sample_groups.values():
+            if len(group) < 2:  # noqa: PLR2004
+                remaining_direct_configurations.extend(
+                    metric_computation_configuration
+                    for metric_computation_configuration, _ in group
+                )
+                continue
+
+            try:
+                resolved_sample_metrics.update(
+                    self._resolve_unexpected_sample_group(group=group)
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Combined unexpected sample query of {len(group)} metrics failed; computing them one by one: {e}"
+                )
+                remaining_direct_configurations.extend(
+                    metric_computation_configuration
+                    for metric_computation_configuration, _ in group
+                )
+
+        resolved_metrics: Dict[
+            Tuple[str, str, str], MetricValue
+        ] = super()._process_direct_and_bundled_metric_computation_configurations(
+            metric_fn_direct_configurations=remaining_direct_configurations,
+            metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+        )
+        resolved_metrics.update(resolved_sample_metrics)
+
+        self._cache_resolved_metrics(
+            resolved_metrics=resolved_sample_metrics,
+            metric_configurations=[
+                metric_computation_configuration.metric_configuration
+                for group in sample_groups.values()
+                for metric_computation_configuration, _ in group
+            ],
+        )
+
+        return resolved_metrics
+
+    def _resolve_unexpected_sample_group(
+        self,
+        group: List[Tuple[MetricComputationConfiguration, UnexpectedSampleQuery]],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        sample_queries: List[UnexpectedSampleQuery] = [
+            sample_query for _, sample_query in group
+        ]
+        query: sqlalchemy.Select
+        output_column_labels: Dict[str, str]
+        query, output_column_labels = build_unexpected_samples_query(
+            sample_queries=sample_queries
+        )
+
+        logger.debug(f"Attempting query {str(query)}")
+        rows: List[sqlalchemy.Row]
+        with trace_span(
+            "unexpected_samples_query", "query", num_metrics=len(group)
+        ) as span:
+            if span.is_recording:
+                span.set_attributes(sql_hash=self._get_sql_text_hash(query=query))
+
+            rows = self.execute_query(query).fetchall()
+            span.set_attributes(row_count=len(rows))
+        metric_values: List[MetricValue] = demultiplex_unexpected_samples(
+            sample_queries=sample_queries,
+            rows=rows,
+            output_column_labels=output_column_labels,
+        )
+        logger.debug(
+            f"SqlAlchemyExecutionEngine computed {len(metric_values)} unexpected samples with one query."
+        )
+
+        return {
+            metric_computation_configuration.metric_configuration.id: metric_value
+            for (metric_computation_configuration, _), metric_value in zip(
+                group, metric_values
+            )
+        }
+
     def resolve_metric_bundle(
         self,
         metric_fn_bundle: Iterable[MetricComputationConfiguration],
@@ -1114,7 +1315,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     )
 
                 logger.debug(f"Attempting query {str(sa_query_object)}")
-                res = self.execute_query(sa_query_object).fetchall()
+                with trace_span(
+                    "metric_bundle_query",
+                    "query",
+                    num_metrics=len(query["metric_ids"]),
+                ) as span:
+                    if span.is_recording:
+                        span.set_attributes(
+                            sql_hash=self._get_sql_text_hash(query=sa_query_object),
+                            domain_id=str(IDDict(domain_kwargs).to_id()),
+                        )
+
+                    res = self.execute_query(sa_query_object).fetchall()
+                    span.set_attributes(row_count=len(res))
 
                 logger.debug(
                     f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
@@ -1145,6 +1358,137 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def prepare_for_metric_resolution(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """
+        Materializes query of every Batch with deferred materialization ("create_temp_table" set to "auto") as temporary
+        table, once number of metric queries planned against it (in this and earlier validation graphs) makes it pay
+        off, given cost of query estimated with EXPLAIN (see "sqlalchemy_temp_table_policy" module).  Batch, which has
+        same query (and data version) as Batch already materialized, reuses its temporary table.
+
+        Args:
+            metric_configurations: metrics, which are about to be resolved
+        """
+        num_metric_queries_by_batch_id: Dict[str, int] = estimate_metric_queries(
+            metric_configurations=metric_configurations,
+            default_batch_id=self.batch_manager.active_batch_data_id,
+        )
+        batch_id: str
+        num_metric_queries: int
+        batch_data: Any
+        for batch_id, num_metric_queries in num_metric_queries_by_batch_id.items():
+            if batch_id not in self.batch_manager.batch_data_cache:
+                continue
+
+            batch_data = self.batch_manager.batch_data_cache[batch_id]
+            if (
+                isinstance(batch_data, SqlAlchemyBatchData)
+                and batch_data.is_materialization_deferred
+            ):
+                batch_data.num_metric_queries += num_metric_queries
+                self._materialize_batch_data_if_beneficial(batch_data=batch_data)
+
+    def _materialize_batch_data_if_beneficial(
+        self, batch_data: SqlAlchemyBatchData
+    ) -> None:
+        query: str = cast(str, batch_data.materialization_query)
+        key: Tuple[str, Optional[str], Optional[str]] = (
+            query,
+            batch_data.temp_table_schema_name,
+            batch_data.data_version,
+        )
+        if key in self._temporary_tables:
+            batch_data.materialize(temp_table_name=self._temporary_tables[key])
+            return
+
+        # Single metric query executes query of Batch once either way.
+        if (
+            key in self._failed_materializations
+            or batch_data.num_metric_queries < 2  # noqa: PLR2004
+        ):
+            return
+
+        if query not in self._query_cost_ratios:
+            self._query_cost_ratios[query] = estimate_query_cost_ratio(
+                execution_engine=self, query=query
+            )
+
+        if not should_materialize(
+            num_metric_queries=batch_data.num_metric_queries,
+            query_cost_ratio=self._query_cost_ratios[query],
+        ):
+            return
+
+        try:
+            self._temporary_tables[key] = batch_data.materialize()
+        except Exception as e:
+            # E.g., no privilege to create tables; metric queries keep using query of Batch as subquery.
+            logger.warning(
+                f"Query of Batch could not be materialized as temporary table (using it as subquery instead): {e}"
+            )
+            self._failed_materializations.add(key)
+            return
+
+        logger.debug(
+            f"Materialized query of Batch as temporary table {self._temporary_tables[key]} for {batch_data.num_metric_queries} metric queries."
+        )
+
+    def drop_temporary_tables(self) -> int:
+        """
+        Drops temporary tables, in which queries of loaded Batches are materialized; these Batches switch back to
+        subselect statements (and those with deferred materialization may be materialized again).  Materialized query
+        results are reused by Batches with identical query until this method is called (e.g., after Checkpoint run).
+
+        Returns:
+            Number of dropped temporary tables.
+        """
+        temp_table_names: List[str] = list(self._temporary_tables.values())
+        batch_id: str
+        batch_data: Any
+        temp_table_name: Optional[str]
+        # Keys are copied, since accessing "BatchDataCache" entry moves it (least-recently-used order).
+        for batch_id in list(self.batch_manager.batch_data_cache.keys()):
+            batch_data = self.batch_manager.batch_data_cache[batch_id]
+            if isinstance(batch_data, SqlAlchemyBatchData):
+                temp_table_name = batch_data.release_temporary_table()
+                if (
+                    temp_table_name is not None
+                    and temp_table_name not in temp_table_names
+                ):
+                    temp_table_names.append(temp_table_name)
+
+        self._temporary_tables.clear()
+        self._failed_materializations.clear()
+        self._query_cost_ratios.clear()
+
+        num_dropped_tables: int = 0
+        for temp_table_name in temp_table_names:
+            try:
+                self.execute_query_in_transaction(
+                    sa.text(
+                        SqlAlchemyBatchData.get_drop_temporary_table_statement(
+                            dialect=self.dialect_name, temp_table_name=temp_table_name
+                        )
+                    )
+                )
+                num_dropped_tables += 1
+            except Exception as e:
+                logger.warning(
+                    f"Temporary table {temp_table_name} could not be dropped: {e}"
+                )
+
+        return num_dropped_tables
+
+    def _get_sql_text_hash(self, query: sqlalchemy.Selectable) -> str:
+        # Hash of SQL text identifies query across traces, without storing (potentially sensitive) literals.
+        try:
+            sql_text = str(query.compile(dialect=self.engine.dialect))
+        except Exception:
+            sql_text = str(query)
+
+        return hashlib.md5(sql_text.encode("utf-8")).hexdigest()
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1350,7 +1694,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 DeprecationWarning,
             )
 
-        create_temp_table: bool = batch_spec.get(
+        create_temp_table: Union[bool, str] = batch_spec.get(
             "create_temp_table", self._create_temp_table
         )
         if isinstance(batch_spec, RuntimeQueryBatchSpec):
@@ -1375,8 +1719,88 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 source_schema_name=source_schema_name,
             )
 
+        batch_data.data_version = self._get_data_version(  # type: ignore[union-attr] # batch_data is set above
+            batch_spec=batch_spec,
+            get_source_version=lambda: self._get_source_tables_version(
+                batch_spec=batch_spec
+            ),
+        )
+
         return batch_data, batch_markers
 
+    def _get_source_tables_version(self, batch_spec: BatchSpec) -> Optional[str]:
+        """
+        Returns version of tables, from which Batch is selected (None if unknown): source table of Batch Spec, or tables
+        listed in its "data_version_tables" directive (e.g., tables, from which query of "RuntimeQueryBatchSpec" reads).
+
+        Only Snowflake exposes modification time of tables ("LAST_ALTERED", which also changes on DML); on other
+        databases, version of source data must be supplied in "data_version" directive of Batch Spec.
+        """
+        if self.dialect_name != GXSqlDialect.SNOWFLAKE:
+            return None
+
+        table_names: List[str] = list(batch_spec.get("data_version_tables") or [])
+        if not table_names and batch_spec.get("table_name"):
+            table_names = [
+                ".".join(
+                    name
+                    for name in (
+                        batch_spec.get("schema_name"),
+                        batch_spec["table_name"],
+                    )
+                    if name
+                )
+            ]
+
+        if not table_names:
+            return None
+
+        table_versions: List[Tuple[str, ...]] = []
+        table_name: str
+        table_version: Optional[Tuple[str, ...]]
+        for table_name in table_names:
+            table_version = self._get_snowflake_table_version(table_name=table_name)
+            if table_version is None:
+                return None
+
+            table_versions.append(table_version)
+
+        return str(table_versions)
+
+    def _get_snowflake_table_version(
+        self, table_name: str
+    ) -> Optional[Tuple[str, ...]]:
+        # Table name may be qualified by schema and database; unquoted identifiers are stored in upper case.
+        name_parts: List[str] = [part.strip() for part in table_name.split(".")]
+        identifiers: List[str] = [
+            part[1:-1] if part.startswith('"') and part.endswith('"') else part.upper()
+            for part in name_parts
+        ]
+        information_schema_tables: str = "INFORMATION_SCHEMA.TABLES"
+        if len(name_parts) > 2:  # noqa: PLR2004
+            information_schema_tables = f"{name_parts[-3]}.{information_schema_tables}"
+
+        schema_condition: str = "CURRENT_SCHEMA()"
+        parameters: Dict[str, str] = {"table_name": identifiers[-1]}
+        if len(identifiers) > 1:
+            schema_condition = ":schema_name"
+            parameters["schema_name"] = identifiers[-2]
+
+        query: sqlalchemy.TextClause = sa.text(
+            f"""SELECT LAST_ALTERED, ROW_COUNT, BYTES FROM {information_schema_tables}
+WHERE TABLE_SCHEMA = {schema_condition} AND TABLE_NAME = :table_name"""
+        ).bindparams(**parameters)
+        try:
+            rows: List[sqlalchemy.Row] = self.execute_query(query).fetchall()  # type: ignore[arg-type] # text query
+        except Exception as e:
+            logger.debug(f"Version of table {table_name} cannot be determined: {e}")
+            return None
+
+        if len(rows) != 1:
+            return None
+
+        return tuple(str(value) for value in rows[0])
+
     @contextmanager
     def get_connection(self) -> sqlalchemy.Connection:
         """Get a connection for executing queries.
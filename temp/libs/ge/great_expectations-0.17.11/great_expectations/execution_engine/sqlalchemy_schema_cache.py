@@ -0,0 +1,208 @@
+"""
+Process-wide cache of reflected SQL column metadata (used by "table.columns" and "table.column_types" metrics).
+
+Reflecting columns costs at least one database round trip (e.g., "SHOW COLUMNS" or "information_schema" query on
+Snowflake), which otherwise is paid for every Batch of every validation.  Caching is opt-in (through positive
+"schema_cache_ttl_seconds" of "SqlAlchemyExecutionEngine"), since cached metadata may go stale when DDL is executed outside
+of Great Expectations.  Entries are keyed by database URL (rendered without password) or, for in-memory and otherwise
+ambiguous URLs (e.g., "sqlite://"), by identity of SQLAlchemy Engine, as well as by schema name, and table name (or hash
+of custom query text); they expire after "ttl_seconds" and can be invalidated explicitly (e.g., after DDL changes table).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# None (or 0) means that column metadata is not cached (reflected for every Batch).
+DEFAULT_SCHEMA_CACHE_TTL_SECONDS: Optional[float] = None
+DEFAULT_SCHEMA_CACHE_MAX_ENTRIES: int = 4096
+# Longest table name used as cache key verbatim (longer names, like custom query texts, are hashed).
+MAX_VERBATIM_KEY_LENGTH: int = 256
+
+SchemaCacheKey = Tuple[str, Optional[str], str]
+
+
+class SqlAlchemySchemaCache:
+    """
+    Thread-safe, size-bounded (least-recently-used entries are evicted first) cache of column metadata lists with TTL.
+
+    Returned column metadata lists are shallow copies (one new dictionary per column dictionary), so that callers may
+    modify them.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SCHEMA_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[
+            SchemaCacheKey, Tuple[float, List[Dict[str, Any]]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def build_key(
+        engine: Any, table_name_or_query: str, schema_name: Optional[str] = None
+    ) -> SchemaCacheKey:
+        """
+        Builds cache key for table (or custom query) in database, to which SQLAlchemy Engine (or Connection) connects.
+
+        Custom queries are represented by hash of their text (so that arbitrarily long queries make short keys).
+        """
+        return (
+            get_engine_url_key(engine=engine),
+            schema_name,
+            table_name_or_query
+            if _is_identifier(value=table_name_or_query)
+            else f"query:{hashlib.sha256(table_name_or_query.encode('utf-8')).hexdigest()}",
+        )
+
+    def get(self, key: SchemaCacheKey) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry: Optional[Tuple[float, List[Dict[str, Any]]]] = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            columns: List[Dict[str, Any]] = entry[1]
+
+        return _copy_columns(columns=columns)
+
+    def set(
+        self,
+        key: SchemaCacheKey,
+        columns: List[Dict[str, Any]],
+        ttl_seconds: float,
+    ) -> None:
+        expires_at: float = time.monotonic() + ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, _copy_columns(columns=columns))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        engine: Optional[Any] = None,
+        schema_name: Optional[str] = None,
+        table_name: Optional[str] = None,
+    ) -> int:
+        """
+        Removes entries matching all given criteria (entries of all databases, schemas, or tables for criteria omitted).
+
+        Returns:
+            Number of removed entries.
+        """
+        url_key: Optional[str] = (
+            None if engine is None else get_engine_url_key(engine=engine)
+        )
+        with self._lock:
+            keys: List[SchemaCacheKey] = [
+                key
+                for key in self._entries
+                if (url_key is None or key[0] == url_key)
+                and (schema_name is None or key[1] == schema_name)
+                and (table_name is None or key[2] == table_name)
+            ]
+            key: SchemaCacheKey
+            for key in keys:
+                del self._entries[key]
+
+        logger.debug(f"Invalidated {len(keys)} schema cache entries.")
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_schema_cache = SqlAlchemySchemaCache()
+
+
+def get_schema_cache() -> SqlAlchemySchemaCache:
+    """Returns process-wide "SqlAlchemySchemaCache"."""
+    return _schema_cache
+
+
+# Unique tokens of SQLAlchemy Engine objects, whose URLs do not identify database (tokens die together with engines).
+_engine_tokens: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_engine_tokens_lock = threading.Lock()
+
+
+def get_engine_url_key(engine: Any) -> str:
+    # Connection objects expose their Engine as "engine" attribute; Engine objects return themselves.
+    sa_engine: Any = getattr(engine, "engine", engine)
+    url: Any = getattr(sa_engine, "url", None)
+    if url is None or _is_ambiguous_url(url=url):
+        return f"engine:{_get_engine_token(engine=sa_engine)}"
+
+    if hasattr(url, "render_as_string"):
+        return url.render_as_string(hide_password=True)
+
+    return repr(url)
+
+
+def _is_ambiguous_url(url: Any) -> bool:
+    # In-memory databases (e.g., "sqlite://", "sqlite:///:memory:") are private to each engine; URLs without host and
+    # database (e.g., "postgresql://", relying on environment variables) may also connect different engines differently.
+    database: Optional[str] = getattr(url, "database", None)
+    if not database:
+        return not getattr(url, "host", None)
+
+    query: Any = getattr(url, "query", None) or {}
+    return (
+        database == ":memory:"
+        or database.startswith("file::memory:")
+        or query.get("mode") == "memory"
+    )
+
+
+def _get_engine_token(engine: Any) -> str:
+    with _engine_tokens_lock:
+        try:
+            token: Optional[str] = _engine_tokens.get(engine)
+            if token is None:
+                token = uuid.uuid4().hex
+                _engine_tokens[engine] = token
+        except TypeError:
+            # Object cannot be weakly referenced; identity is only stable while it is alive.
+            token = str(id(engine))
+
+    return token
+
+
+def _copy_columns(columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Columns of custom queries may be reported as SQLAlchemy "ColumnClause" objects, rather than as dictionaries.
+    return [dict(column) if isinstance(column, dict) else column for column in columns]
+
+
+def _is_identifier(value: str) -> bool:
+    return len(value) <= MAX_VERBATIM_KEY_LENGTH and not any(
+        character.isspace() for character in value
+    )
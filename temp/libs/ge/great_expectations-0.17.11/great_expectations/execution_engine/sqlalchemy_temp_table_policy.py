@@ -0,0 +1,256 @@
+"""
+Cost-based decision, whether to materialize query-defined SQL Batch (created with "create_temp_table" set to "auto") as
+temporary table.
+
+Without temporary table, every metric query executes query of Batch as subquery; with it, query of Batch is executed
+once (and its result written), and metric queries scan materialized result.  Hence, materialization pays off, when
+enough metric queries run against Batch, and when executing query of Batch costs more than scanning its result.
+
+Number of metric queries is estimated from metric dependency graph (all bundled aggregate metrics of same compute
+domain share one query).  Cost of query of Batch, relative to cost of scanning its result, is estimated with "EXPLAIN"
+on dialects, which offer it (SQLite, PostgreSQL, and Snowflake); on other dialects, Batch is materialized, once number
+of metric queries reaches "DEFAULT_MIN_METRIC_QUERIES".
+"""
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+AUTO_CREATE_TEMP_TABLE: str = "auto"
+
+# Used when cost of query of Batch cannot be estimated (dialect without supported "EXPLAIN").
+DEFAULT_MIN_METRIC_QUERIES: int = 4
+
+# Cost of writing result of query into temporary table, relative to cost of scanning it once.
+TEMP_TABLE_WRITE_COST: float = 1.0
+
+# Relative cost, assumed for every join, aggregation, sort, or additional table scan in plan, which reports no cost.
+PLAN_OPERATION_COST: float = 2.0
+
+# Domain keys, which do not change compute domain of bundled aggregate metrics (they are computed in one query per
+# table-level domain).
+_ACCESSOR_DOMAIN_KEYS: Tuple[str, ...] = (
+    "column",
+    "column_A",
+    "column_B",
+    "column_list",
+)
+
+# Metrics, computed from database metadata (or from other metrics) without scanning Batch.
+_METADATA_METRIC_NAMES: Set[str] = {
+    "table.columns",
+    "table.column_types",
+    "table.head",
+}
+
+_SQLITE_COMPLEX_PLAN_MARKERS: Tuple[str, ...] = (
+    "TEMP B-TREE",
+    "CO-ROUTINE",
+    "MATERIALIZE",
+    "COMPOUND",
+    "CORRELATED",
+)
+
+_SNOWFLAKE_SIMPLE_OPERATIONS: Set[str] = {
+    "Result",
+    "Projection",
+    "TableScan",
+    "Filter",
+    "Limit",
+}
+
+
+def estimate_metric_queries(
+    metric_configurations: Iterable[MetricConfiguration],
+    default_batch_id: Optional[str],
+) -> Dict[str, int]:
+    """
+    Estimates number of queries, which computing given metrics executes against each Batch.
+
+    Returns:
+        Dictionary of estimated numbers of metric queries, keyed by Batch ID.
+    """
+    num_metric_queries: Dict[str, int] = {}
+    bundled_compute_domains: Set[Tuple[str, str]] = set()
+    metric_configuration: MetricConfiguration
+    batch_id: Optional[str]
+    for metric_configuration in metric_configurations:
+        batch_id = (
+            metric_configuration.metric_domain_kwargs.get("batch_id")
+            or default_batch_id
+        )
+        if batch_id is None or not _is_metric_query(metric_configuration):
+            continue
+
+        if metric_configuration.metric_name.endswith(
+            f".{MetricPartialFunctionTypeSuffixes.AGGREGATE_FUNCTION.value}"
+        ):
+            compute_domain_id: str = IDDict(
+                {
+                    key: value
+                    for key, value in metric_configuration.metric_domain_kwargs.items()
+                    if key not in _ACCESSOR_DOMAIN_KEYS
+                }
+            ).to_id()
+            if (batch_id, compute_domain_id) in bundled_compute_domains:
+                continue
+
+            bundled_compute_domains.add((batch_id, compute_domain_id))
+
+        num_metric_queries[batch_id] = num_metric_queries.get(batch_id, 0) + 1
+
+    return num_metric_queries
+
+
+def _is_metric_query(metric_configuration: MetricConfiguration) -> bool:
+    metric_name: str = metric_configuration.metric_name
+    if metric_name in _METADATA_METRIC_NAMES:
+        return False
+
+    if metric_name.endswith(
+        (
+            f".{MetricPartialFunctionTypeSuffixes.MAP.value}",
+            f".{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        )
+    ):
+        return False
+
+    # Value of aggregate metric is read from result of its bundled "aggregate_fn" partial metric.
+    aggregate_fn_metric_name: str = (
+        f"{metric_name}.{MetricPartialFunctionTypeSuffixes.AGGREGATE_FUNCTION.value}"
+    )
+    return not any(
+        dependency.metric_name == aggregate_fn_metric_name
+        for dependency in (metric_configuration.metric_dependencies or {}).values()
+    )
+
+
+def should_materialize(
+    num_metric_queries: int,
+    query_cost_ratio: Optional[float],
+    min_metric_queries: int = DEFAULT_MIN_METRIC_QUERIES,
+) -> bool:
+    """
+    Decides, whether to materialize Batch, against which "num_metric_queries" metric queries are executed.
+
+    With relative cost "r" of query of Batch (1.0 meaning that executing it costs as much as scanning its result), "n"
+    subqueries cost "n * r", while materialization costs "r + TEMP_TABLE_WRITE_COST + n".
+    """
+    if num_metric_queries < 2:  # noqa: PLR2004
+        return False
+
+    if query_cost_ratio is None:
+        return num_metric_queries >= min_metric_queries
+
+    return (
+        num_metric_queries * query_cost_ratio
+        > query_cost_ratio + TEMP_TABLE_WRITE_COST + num_metric_queries
+    )
+
+
+def estimate_query_cost_ratio(
+    execution_engine: SqlAlchemyExecutionEngine, query: str
+) -> Optional[float]:
+    """
+    Estimates cost of executing query, relative to cost of scanning its (materialized) result, with "EXPLAIN".
+
+    Returns:
+        Relative cost (at least 1.0), or None, if dialect offers no supported "EXPLAIN" (or if it fails).
+    """
+    dialect_name: str = execution_engine.dialect_name
+    try:
+        if dialect_name == GXSqlDialect.SQLITE:
+            return _get_sqlite_query_cost_ratio(
+                plan_details=[
+                    row[-1]
+                    for row in execution_engine.execute_query(
+                        sa.text(f"EXPLAIN QUERY PLAN {query}")
+                    ).fetchall()
+                ]
+            )
+
+        if dialect_name == GXSqlDialect.POSTGRESQL:
+            plan: dict = _load_json(
+                execution_engine.execute_query(
+                    sa.text(f"EXPLAIN (FORMAT JSON) {query}")
+                ).scalar()
+            )[0]["Plan"]
+            return _get_postgresql_query_cost_ratio(plan=plan)
+
+        if dialect_name == GXSqlDialect.SNOWFLAKE:
+            return _get_snowflake_query_cost_ratio(
+                plan=_load_json(
+                    execution_engine.execute_query(
+                        sa.text(f"EXPLAIN USING JSON {query}")
+                    ).scalar()
+                )
+            )
+    except Exception as e:
+        logger.debug(f"Cost of query could not be estimated with EXPLAIN: {e}")
+
+    return None
+
+
+def _get_sqlite_query_cost_ratio(plan_details: List[str]) -> float:
+    # "EXPLAIN QUERY PLAN" of SQLite reports no cost; plan of single table scan (or search) costs as much as scan of
+    # its result, and every additional table access, or temporary structure, adds to cost.
+    num_table_accesses: int = sum(
+        1 for detail in plan_details if detail.startswith(("SCAN", "SEARCH"))
+    )
+    num_complex_operations: int = sum(
+        1
+        for detail in plan_details
+        if any(marker in detail for marker in _SQLITE_COMPLEX_PLAN_MARKERS)
+    )
+    return 1.0 + PLAN_OPERATION_COST * (
+        max(num_table_accesses - 1, 0) + num_complex_operations
+    )
+
+
+def _get_postgresql_query_cost_ratio(plan: dict) -> float:
+    # Cost of sequential scan of materialized result, in planner units (one per page, and "cpu_tuple_cost" per row).
+    num_rows: float = float(plan.get("Plan Rows", 0))
+    row_width: float = float(plan.get("Plan Width", 0))
+    num_pages: float = max(num_rows * row_width / 8192.0, 1.0)
+    scan_cost: float = num_pages + 0.01 * num_rows
+    return max(float(plan["Total Cost"]) / scan_cost, 1.0)
+
+
+def _get_snowflake_query_cost_ratio(plan: dict) -> float:
+    # Snowflake plan reports partitions and bytes to be scanned, but not size of result; scan of single table (with
+    # filters) reads only columns needed by each metric query, so it costs no more than scanning copy of its result.
+    operations: List[str] = [
+        operation.get("operation", "")
+        for step in plan.get("Operations", [])
+        for operation in step
+    ]
+    num_table_scans: int = operations.count("TableScan")
+    num_complex_operations: int = sum(
+        1 for operation in operations if operation not in _SNOWFLAKE_SIMPLE_OPERATIONS
+    )
+    return 1.0 + PLAN_OPERATION_COST * (
+        max(num_table_scans - 1, 0) + num_complex_operations
+    )
+
+
+def _load_json(value) -> list | dict:
+    if isinstance(value, (list, dict)):
+        return value
+
+    return json.loads(value)
@@ -0,0 +1,113 @@
+"""
+Batching of unexpected-row samples (e.g., "column_values.in_set.unexpected_values") into one SQL statement per Batch.
+
+With result formats other than "BOOLEAN_ONLY", every map Expectation follows its (bundled) unexpected count with query of
+its own ("SELECT <columns> ... WHERE <unexpected_condition> LIMIT <partial_unexpected_count>").  Instead, metric
+functions, which have "unexpected_sample_query_fn" attribute, only build their queries; these are combined as
+"UNION ALL" of limited subqueries (each tagged by its position), executed together, and rows are demultiplexed by tag.
+
+In order for all branches of "UNION ALL" to have the same columns (of compatible types), every distinct table column,
+selected by any branch, gets output column of its own; branches not selecting it yield NULL in it.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import sqlalchemy
+
+logger = logging.getLogger(__name__)
+
+UNEXPECTED_SAMPLE_TAG_COLUMN_NAME: str = "gx_unexpected_sample_tag"
+UNEXPECTED_SAMPLE_COLUMN_NAME_PREFIX: str = "gx_unexpected_sample_column_"
+
+
+@dataclass(frozen=True)
+class UnexpectedSampleQuery:
+    """
+    Query for unexpected-row sample of one metric, together with function, converting fetched rows to metric value.
+
+    "column_names" are names of table columns, selected by "query" (in order); rows passed to "build_result" are tuples
+    of their values (in the same order).
+    """
+
+    query: sqlalchemy.Select
+    column_names: Sequence[str]
+    build_result: Callable[[List[Tuple[Any, ...]]], Any]
+
+
+def build_unexpected_samples_query(
+    sample_queries: Sequence[UnexpectedSampleQuery],
+) -> Tuple[sqlalchemy.Select, Dict[str, str]]:
+    """
+    Combines unexpected-row sample queries into single "UNION ALL" query.
+
+    Returns:
+        Combined query and mapping from table column name to its output column label.
+    """
+    output_column_labels: Dict[str, str] = {}
+    column_name: str
+    for sample_query in sample_queries:
+        for column_name in sample_query.column_names:
+            if str(column_name) not in output_column_labels:
+                output_column_labels[
+                    str(column_name)
+                ] = f"{UNEXPECTED_SAMPLE_COLUMN_NAME_PREFIX}{len(output_column_labels)}"
+
+    branches: List[sqlalchemy.Select] = []
+    subquery: sqlalchemy.Subquery
+    selected_columns: Dict[str, Any]
+    tag: int
+    for tag, sample_query in enumerate(sample_queries):
+        # Inner columns are relabeled by position, since the same table column may be selected more than once.
+        subquery = sample_query.query.with_only_columns(
+            *[
+                column.label(f"gx_c{idx}")
+                for idx, column in enumerate(sample_query.query.selected_columns)
+            ]
+        ).subquery()
+        selected_columns = {}
+        for idx, column_name in enumerate(sample_query.column_names):
+            selected_columns.setdefault(str(column_name), subquery.c[f"gx_c{idx}"])
+
+        branches.append(
+            sa.select(
+                sa.literal_column(str(tag)).label(UNEXPECTED_SAMPLE_TAG_COLUMN_NAME),
+                *[
+                    selected_columns.get(column_name, sa.null()).label(label)
+                    for column_name, label in output_column_labels.items()
+                ],
+            ).select_from(subquery)
+        )
+
+    return sa.union_all(*branches), output_column_labels
+
+
+def demultiplex_unexpected_samples(
+    sample_queries: Sequence[UnexpectedSampleQuery],
+    rows: Sequence[Any],
+    output_column_labels: Dict[str, str],
+) -> List[Any]:
+    """Splits rows of combined query by tag and returns metric values (in order of "sample_queries")."""
+    rows_by_tag: List[List[Tuple[Any, ...]]] = [[] for _ in sample_queries]
+    row: Any
+    row_mapping: Any
+    tag: int
+    for row in rows:
+        row_mapping = row._mapping
+        tag = int(row_mapping[UNEXPECTED_SAMPLE_TAG_COLUMN_NAME])
+        rows_by_tag[tag].append(
+            tuple(
+                row_mapping[output_column_labels[str(column_name)]]
+                for column_name in sample_queries[tag].column_names
+            )
+        )
+
+    return [
+        sample_query.build_result(sample_rows)
+        for sample_query, sample_rows in zip(sample_queries, rows_by_tag)
+    ]
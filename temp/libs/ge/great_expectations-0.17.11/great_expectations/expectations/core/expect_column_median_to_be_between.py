@@ -54,6 +54,10 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
             If True, the column median must be strictly larger than min_value, default=False
         strict_max (boolean): \
             If True, the column median must be strictly smaller than max_value, default=False
+        allow_relative_error (boolean or float): \
+            On SQL backends with native sketch functions (e.g., Snowflake, BigQuery, Trino), True or a float relative \
+            error computes approximate median in the same query as other column aggregates (instead of sorting \
+            column), default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -102,6 +106,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         "strict_min",
         "max_value",
         "strict_max",
+        "allow_relative_error",
         "auto",
         "profiler_config",
     )
@@ -179,6 +184,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
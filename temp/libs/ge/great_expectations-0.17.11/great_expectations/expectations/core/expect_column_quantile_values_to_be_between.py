@@ -14,6 +14,10 @@ from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
 )
+from great_expectations.expectations.metrics.util import (
+    get_approximate_quantile_rank_error,
+    use_approximate_quantiles,
+)
 from great_expectations.render import (
     AtomicDiagnosticRendererType,
     AtomicPrescriptiveRendererType,
@@ -103,7 +107,9 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             for the corresponding quantile (with [min, max] ordering). The length of the 'quantiles' list \
             and the 'value_ranges' list must be equal.
         allow_relative_error (boolean or string): \
-            Whether to allow relative error in quantile communications on backends that support or require it.
+            Whether to allow relative error in quantile communications on backends that support or require it. \
+            On SQL backends with native sketch functions (e.g., Snowflake, BigQuery, Trino), True or a float relative \
+            error computes approximate quantiles in the same query as other column aggregates.
 
     Other Parameters:
         result_format (str or None): \
@@ -746,10 +752,24 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             for idx, range_ in enumerate(comparison_quantile_ranges)
         ]
 
+        details: dict = {"success_details": success_details}
+        allow_relative_error = configuration.kwargs.get("allow_relative_error")
+        if use_approximate_quantiles(
+            execution_engine=execution_engine,
+            allow_relative_error=allow_relative_error,
+        ):
+            # Report error bound of approximate (sketch-based) quantiles (None if backend documents no fixed bound).
+            details[
+                "approximate_quantile_rank_error"
+            ] = get_approximate_quantile_rank_error(
+                dialect_name=execution_engine.dialect_name,  # type: ignore[union-attr] # checked above
+                allow_relative_error=allow_relative_error,
+            )
+
         return {
             "success": np.all(success_details),
             "result": {
                 "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
+                "details": details,
             },
         }
@@ -8,6 +8,7 @@ from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.pandas_sharding import NOT_SHARDED
 from great_expectations.execution_engine.sparkdf_execution_engine import (
     SparkDFExecutionEngine,
 )
@@ -30,6 +31,8 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from great_expectations.compatibility import sqlalchemy
 
 
@@ -84,9 +87,23 @@ def column_aggregate_value(
                     str, sqlalchemy.quoted_name
                 ] = accessor_domain_kwargs["column"]
 
+                domain_records: pd.DataFrame = df
                 if filter_column_isnull:
                     df = df[df[column_name].notnull()]
 
+                metric_value: Any = execution_engine.aggregate_column_in_shards(
+                    metric_provider=cls,
+                    metric_fn=metric_fn,
+                    data=df,
+                    column_name=column_name,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    metric_value_kwargs=metric_value_kwargs,
+                    metrics=metrics,
+                    source=domain_records,
+                )
+                if metric_value is not NOT_SHARDED:
+                    return metric_value
+
                 return metric_fn(
                     cls,
                     column=df[column_name],
@@ -1,3 +1,4 @@
+from .column_approximate_quantile import ColumnApproximateQuantile
 from .column_distinct_values import (
     ColumnDistinctValues,
     ColumnDistinctValuesCount,
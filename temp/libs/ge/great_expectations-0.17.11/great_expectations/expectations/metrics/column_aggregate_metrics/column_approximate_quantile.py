@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any
+
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_partial,
+)
+from great_expectations.expectations.metrics.util import (
+    get_approximate_quantile_aggregate,
+)
+
+
+class ColumnApproximateQuantile(ColumnAggregateMetricProvider):
+    """
+    Approximate quantile of column values, computed by native sketch function of SQL backend (e.g., "APPROX_PERCENTILE"
+    or "percentile_approx").  Being aggregate partial, it is resolved in the same query as other aggregate metrics of
+    the same domain (instead of a separate sorting query); "column.quantile_values" and "column.median" depend on it
+    whenever approximation is allowed through "allow_relative_error" (e.g., of "expect_column_median_to_be_between").
+    """
+
+    metric_name = "column.approximate_quantile"
+    value_keys = ("quantile", "allow_relative_error")
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        column,
+        quantile: float,
+        allow_relative_error: Any = True,
+        _dialect=None,
+        **kwargs,
+    ):
+        return get_approximate_quantile_aggregate(
+            column=column,
+            quantile=quantile,
+            allow_relative_error=allow_relative_error,
+            dialect=_dialect,
+        )
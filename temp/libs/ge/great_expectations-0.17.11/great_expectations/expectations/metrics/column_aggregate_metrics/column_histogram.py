@@ -1,10 +1,10 @@
-import copy
+from __future__ import annotations
+
 import logging
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-from great_expectations.compatibility import pyspark
 from great_expectations.compatibility.pyspark import (
     functions as F,
 )
@@ -27,6 +27,8 @@ from great_expectations.expectations.metrics.metric_provider import metric_value
 if TYPE_CHECKING:
     import pandas as pd
 
+    from great_expectations.compatibility import pyspark, sqlalchemy
+
 logger = logging.getLogger(__name__)
 
 
@@ -137,6 +139,15 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 list(execution_engine.execute_query(query).fetchone())
             )
 
+        if len(bins) > 2:  # noqa: PLR2004
+            # One scan, grouped by bin index, instead of one "SUM(CASE ...)" term (evaluated for every row) per bin.
+            return _get_sqlalchemy_bucketed_histogram(
+                execution_engine=execution_engine,
+                selectable=selectable,
+                column=column,
+                bins=bins,
+            )
+
         idx = 0
 
         # If we have an infinite lower bound, don't express that in sql
@@ -244,65 +255,137 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         column = metric_domain_kwargs["column"]
 
         """return a list of counts corresponding to bins"""
-        bins = list(
-            copy.deepcopy(bins)
-        )  # take a copy since we are inserting and popping
-
-        if bins[0] == -np.inf or bins[0] == -float("inf"):  # noqa: PLR1714
-            added_min = False
-            bins[0] = -float("inf")
-        else:
-            added_min = True
-            bins.insert(0, -float("inf"))
+        bins = list(bins)
+        if len(bins) < 2:  # noqa: PLR2004
+            return []
+
+        # Bins are assigned by single "CASE WHEN" expression (same bin semantics as SQL), so that histogram takes one
+        # "groupBy" job (rather than "Bucketizer" transform followed by separate count of values on upper bound).
+        # Values outside of bins are assigned to index -1 (below) and len(bins) - 1 (above), and discarded.
+        bin_count: int = len(bins) - 1
+        bucket_expression = None
+        condition: pyspark.Column
+        bin_index: int
+        for condition, bin_index in _get_bin_conditions(
+            column=F.col(column), bins=bins, below_bin_index=-1
+        ):
+            bucket_expression = (
+                F.when(condition, bin_index)
+                if bucket_expression is None
+                else bucket_expression.when(condition, bin_index)
+            )
 
-        if bins[-1] == np.inf or bins[-1] == float("inf"):
-            added_max = False
-            bins[-1] = float("inf")
-        else:
-            added_max = True
-            bins.append(float("inf"))
+        bucket_expression = bucket_expression.otherwise(bin_count)
 
-        temp_column = df.select(column).where(F.col(column).isNotNull())
-        bucketizer = pyspark.Bucketizer(
-            splits=bins, inputCol=column, outputCol="buckets"
+        hist_rows = (
+            df.where(F.col(column).isNotNull() & ~F.isnan(F.col(column)))
+            .select(bucket_expression.alias("buckets"))
+            .groupBy("buckets")
+            .count()
+            .collect()
         )
-        bucketed = bucketizer.setHandleInvalid("skip").transform(temp_column)
-
-        # This is painful to do, but: bucketizer cannot handle values outside of a range
-        # (hence adding -/+ infinity above)
-
-        # Further, it *always* follows the numpy convention of lower_bound <= bin < upper_bound
-        # for all but the last bin
-
-        # But, since the last bin in our case will often be +infinity, we need to
-        # find the number of values exactly equal to the upper bound to add those
-
-        # We'll try for an optimization by asking for it at the same time
-        if added_max:
-            upper_bound_count = (
-                temp_column.select(column).filter(F.col(column) == bins[-2]).count()
-            )
-        else:
-            upper_bound_count = 0
-
-        hist_rows = bucketed.groupBy("buckets").count().collect()
         # Spark only returns buckets that have nonzero counts.
-        hist = [0] * (len(bins) - 1)
+        hist: List[int] = [0] * bin_count
+        below_bins: int = 0
+        above_bins: int = 0
         for row in hist_rows:
-            hist[int(row["buckets"])] = row["count"]
+            if row["buckets"] < 0:
+                below_bins += row["count"]
+            elif row["buckets"] >= bin_count:
+                above_bins += row["count"]
+            else:
+                hist[int(row["buckets"])] = row["count"]
 
-        hist[-2] += upper_bound_count
+        if below_bins > 0:
+            logger.warning("Discarding histogram values below lowest bin.")
 
-        if added_min:
-            below_bins = hist.pop(0)
-            bins.pop(0)
-            if below_bins > 0:
-                logger.warning("Discarding histogram values below lowest bin.")
-
-        if added_max:
-            above_bins = hist.pop(-1)
-            bins.pop(-1)
-            if above_bins > 0:
-                logger.warning("Discarding histogram values above highest bin.")
+        if above_bins > 0:
+            logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _is_negative_infinity(value: Any) -> bool:
+    return value in (
+        get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=True),
+        get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=True),
+    )
+
+
+def _is_positive_infinity(value: Any) -> bool:
+    return value in (
+        get_sql_dialect_floating_point_infinity_value(schema="api_np", negative=False),
+        get_sql_dialect_floating_point_infinity_value(
+            schema="api_cast", negative=False
+        ),
+    )
+
+
+def _get_bin_conditions(
+    column: Any, bins: List[Any], below_bin_index: Optional[int]
+) -> List[Tuple[Any, Optional[int]]]:
+    """
+    Returns (condition, bin index) pairs, which assign values of "column" to bins, when evaluated in order (first
+    satisfied condition wins); values satisfying none of conditions lie above highest bin.
+
+    Bins are half-open ("bins[i] <= value < bins[i + 1]"), except for last bin, which is closed; infinite lowest (or
+    highest) bin edge makes first (or last) bin unbounded below (or above).  Values below lowest bin get
+    "below_bin_index".
+    """
+    bin_conditions: List[Tuple[Any, Optional[int]]] = []
+    if not _is_negative_infinity(value=bins[0]):
+        bin_conditions.append((column < float(bins[0]), below_bin_index))
+
+    idx: int
+    for idx in range(len(bins) - 2):
+        bin_conditions.append((column < float(bins[idx + 1]), idx))
+
+    if _is_positive_infinity(value=bins[-1]):
+        bin_conditions.append((column >= float(bins[-2]), len(bins) - 2))
+    else:
+        bin_conditions.append((column <= float(bins[-1]), len(bins) - 2))
+
+    return bin_conditions
+
+
+def _get_sqlalchemy_bucketed_histogram(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: sqlalchemy.Selectable,
+    column: str,
+    bins: List[Any],
+) -> List[Optional[int]]:
+    bucket_expression: sqlalchemy.Case = sa.case(
+        *[
+            (condition, sa.null() if bin_index is None else bin_index)
+            for condition, bin_index in _get_bin_conditions(
+                column=sa.column(column), bins=bins, below_bin_index=None
+            )
+        ],
+        else_=sa.null(),
+    )
+    # Bin index is computed in subquery, since some dialects (e.g., PostgreSQL) do not recognize "GROUP BY" expression
+    # with bound parameters as the same expression in "SELECT" list.
+    buckets: sqlalchemy.Subquery = (
+        sa.select(bucket_expression.label("bucket"))
+        .where(
+            sa.column(column) != None,  # noqa: E711
+        )
+        .select_from(selectable)
+        .subquery()
+    )
+    query: sqlalchemy.Select = sa.select(
+        buckets.c.bucket, sa.func.count().label("bucket_count")
+    ).group_by(buckets.c.bucket)
+
+    rows: List[sqlalchemy.Row] = execution_engine.execute_query(query).fetchall()
+    if not rows:
+        # Same as "SUM()" over no rows.
+        return [None] * (len(bins) - 1)
+
+    hist: List[Optional[int]] = [0] * (len(bins) - 1)
+    row: sqlalchemy.Row
+    for row in rows:
+        if row[0] is not None:
+            hist[int(row[0])] = int(row[1])
+
+    return hist
@@ -16,6 +16,9 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import (
+    use_approximate_quantiles,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -26,6 +29,7 @@ class ColumnMedian(ColumnAggregateMetricProvider):
     """MetricProvider Class for Aggregate Mean MetricProvider"""
 
     metric_name = "column.median"
+    value_keys = ("allow_relative_error",)
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -43,6 +47,13 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
+        if use_approximate_quantiles(
+            execution_engine=execution_engine,
+            allow_relative_error=metric_value_kwargs.get("allow_relative_error"),
+        ):
+            # Sketch aggregate was computed as dependency (together with other aggregate metrics of this domain).
+            return metrics["column.approximate_quantile"]
+
         (
             selectable,
             compute_domain_kwargs,
@@ -142,7 +153,20 @@ class ColumnMedian(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+        allow_relative_error = metric.metric_value_kwargs.get("allow_relative_error")
+        if use_approximate_quantiles(
+            execution_engine=execution_engine,
+            allow_relative_error=allow_relative_error,
+        ):
+            dependencies["column.approximate_quantile"] = MetricConfiguration(
+                metric_name="column.approximate_quantile",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={
+                    "quantile": 0.5,
+                    "allow_relative_error": allow_relative_error,
+                },
+            )
+        elif isinstance(execution_engine, SqlAlchemyExecutionEngine):
             dependencies["column_values.nonnull.count"] = MetricConfiguration(
                 metric_name="column_values.nonnull.count",
                 metric_domain_kwargs=metric.metric_domain_kwargs,
@@ -5,7 +5,7 @@ import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
@@ -15,6 +15,7 @@ from great_expectations.compatibility.sqlalchemy import (
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
@@ -26,7 +27,14 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.expectations.metrics.util import (
+    attempt_allowing_relative_error,
+    use_approximate_quantiles,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.core import ExpectationConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +81,16 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         quantiles = metric_value_kwargs["quantiles"]
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         table_row_count = metrics.get("table.row_count")
-        if dialect_name == GXSqlDialect.MSSQL:
+        if use_approximate_quantiles(
+            execution_engine=execution_engine,
+            allow_relative_error=allow_relative_error,
+        ):
+            # Sketch aggregates were computed as dependencies (together with other aggregate metrics of this domain).
+            return [
+                metrics[_get_approximate_quantile_dependency_name(idx=idx)]
+                for idx in range(len(quantiles))
+            ]
+        elif dialect_name == GXSqlDialect.MSSQL:
             return _get_column_quantiles_mssql(
                 column=column,
                 quantiles=quantiles,
@@ -182,6 +199,46 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
 
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        allow_relative_error = metric.metric_value_kwargs.get("allow_relative_error")
+        if use_approximate_quantiles(
+            execution_engine=execution_engine,
+            allow_relative_error=allow_relative_error,
+        ):
+            idx: int
+            quantile: float
+            for idx, quantile in enumerate(metric.metric_value_kwargs["quantiles"]):
+                dependencies[
+                    _get_approximate_quantile_dependency_name(idx=idx)
+                ] = MetricConfiguration(
+                    metric_name="column.approximate_quantile",
+                    metric_domain_kwargs=metric.metric_domain_kwargs,
+                    metric_value_kwargs={
+                        "quantile": float(quantile),
+                        "allow_relative_error": allow_relative_error,
+                    },
+                )
+
+        return dependencies
+
+
+def _get_approximate_quantile_dependency_name(idx: int) -> str:
+    return f"column.approximate_quantile.{idx}"
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
@@ -36,6 +36,8 @@ from great_expectations.expectations.metrics.util import (
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from great_expectations.compatibility import sqlalchemy
 
 
@@ -110,18 +112,30 @@ def column_condition_partial(  # noqa: C901, PLR0915
                     str, sqlalchemy.quoted_name
                 ] = accessor_domain_kwargs["column"]
 
+                domain_records: pd.DataFrame = df
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
                 )
                 if filter_column_isnull:
                     df = df[df[column_name].notnull()]
 
-                meets_expectation_series = metric_fn(
-                    cls,
-                    df[column_name],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
+                meets_expectation_series = execution_engine.map_condition_in_shards(
+                    metric_provider=cls,
+                    metric_fn=metric_fn,
+                    data=df,
+                    column_names=[column_name],
+                    metric_value_kwargs=metric_value_kwargs,
+                    metrics=metrics,
+                    source=domain_records,
                 )
+                if meets_expectation_series is None:
+                    meets_expectation_series = metric_fn(
+                        cls,
+                        df[column_name],
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
                 return (
                     ~meets_expectation_series,
                     compute_domain_kwargs,
@@ -24,6 +24,9 @@ if TYPE_CHECKING:
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_unexpected_samples import (
+    UnexpectedSampleQuery,
+)
 from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (
     _is_sqlalchemy_metric_selectable,
 )
@@ -245,6 +248,32 @@ def _sqlalchemy_column_map_condition_values(
     Particularly for the purpose of finding unexpected values, returns all the metric values which do not meet an
     expected Expectation condition for ColumnMapExpectation Expectations.
     """
+    sample_query: UnexpectedSampleQuery = (
+        _sqlalchemy_column_map_condition_values_sample_query(
+            cls=cls,
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
+        )
+    )
+    return sample_query.build_result(
+        execution_engine.execute_query(sample_query.query).fetchall()
+    )
+
+
+def _sqlalchemy_column_map_condition_values_sample_query(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Tuple],
+    **kwargs,
+) -> UnexpectedSampleQuery:
+    """
+    Builds (without executing) query of "_sqlalchemy_column_map_condition_values()", so that SqlAlchemyExecutionEngine
+    can combine it with unexpected-row sample queries of other metrics into one statement.
+    """
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[
         "unexpected_condition"
     ]
@@ -286,10 +315,14 @@ def _sqlalchemy_column_map_condition_values(
         )
         query = query.limit(10000)  # BigQuery upper bound on query parameters
 
-    return [
-        val.unexpected_values
-        for val in execution_engine.execute_query(query).fetchall()
-    ]
+    return UnexpectedSampleQuery(
+        query=query,
+        column_names=[column_name],
+        build_result=lambda rows: [row[0] for row in rows],
+    )
+
+
+_sqlalchemy_column_map_condition_values.unexpected_sample_query_fn = _sqlalchemy_column_map_condition_values_sample_query  # type: ignore[attr-defined]
 
 
 def _sqlalchemy_column_map_condition_value_counts(
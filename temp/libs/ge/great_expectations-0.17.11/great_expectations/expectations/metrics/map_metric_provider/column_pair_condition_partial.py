@@ -109,13 +109,23 @@ def column_pair_condition_partial(  # noqa: C901 - 16
                 # noinspection PyPep8Naming
                 column_B_name = accessor_domain_kwargs["column_B"]
 
-                meets_expectation_series = metric_fn(
-                    cls,
-                    df[column_A_name],
-                    df[column_B_name],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
+                meets_expectation_series = execution_engine.map_condition_in_shards(
+                    metric_provider=cls,
+                    metric_fn=metric_fn,
+                    data=df,
+                    column_names=[column_A_name, column_B_name],
+                    metric_value_kwargs=metric_value_kwargs,
+                    metrics=metrics,
                 )
+                if meets_expectation_series is None:
+                    meets_expectation_series = metric_fn(
+                        cls,
+                        df[column_A_name],
+                        df[column_B_name],
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
                 return (
                     ~meets_expectation_series,
                     compute_domain_kwargs,
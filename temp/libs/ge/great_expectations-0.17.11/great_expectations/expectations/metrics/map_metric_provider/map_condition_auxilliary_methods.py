@@ -7,6 +7,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -24,6 +25,9 @@ from great_expectations.core.metric_function_types import (
 )
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_unexpected_samples import (
+    UnexpectedSampleQuery,
+)
 from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_metric_selectable import (
     _is_sqlalchemy_metric_selectable,
 )
@@ -519,6 +523,35 @@ def _sqlalchemy_map_condition_index(
     Requires `unexpected_index_column_names` to be part of `result_format` dict to specify primary_key columns
     to return.
     """
+    sample_query: UnexpectedSampleQuery | None = (
+        _sqlalchemy_map_condition_index_sample_query(
+            cls=cls,
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
+        )
+    )
+    if sample_query is None:
+        return None
+
+    return sample_query.build_result(
+        execution_engine.execute_query(sample_query.query).fetchall()
+    )
+
+
+def _sqlalchemy_map_condition_index_sample_query(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> UnexpectedSampleQuery | None:
+    """
+    Builds (without executing) query of "_sqlalchemy_map_condition_index()", so that SqlAlchemyExecutionEngine can
+    combine it with unexpected-row sample queries of other metrics into one statement (None if no query is needed).
+    """
     (
         unexpected_condition,
         compute_domain_kwargs,
@@ -587,22 +620,32 @@ def _sqlalchemy_map_condition_index(
             domain_records_as_selectable
         ).limit(result_format["partial_unexpected_count"])
     )
-    query_result: List[sqlalchemy.Row] = execution_engine.execute_query(
-        final_query
-    ).fetchall()
 
-    unexpected_index_list: List[Dict[str, Any]] = []
+    all_columns: List[str] = unexpected_index_column_names + domain_column_name_list
 
-    for row in query_result:
-        primary_key_dict: Dict[str, Any] = {}
-        # add the actual unexpected value
-        all_columns = unexpected_index_column_names + domain_column_name_list
-        for index in range(len(all_columns)):
-            name: str = all_columns[index]
-            primary_key_dict[name] = row[index]
-        unexpected_index_list.append(primary_key_dict)
+    def _build_unexpected_index_list(
+        query_result: List[Tuple[Any, ...]]
+    ) -> List[Dict[str, Any]]:
+        unexpected_index_list: List[Dict[str, Any]] = []
 
-    return unexpected_index_list
+        for row in query_result:
+            primary_key_dict: Dict[str, Any] = {}
+            # add the actual unexpected value
+            for index in range(len(all_columns)):
+                name: str = all_columns[index]
+                primary_key_dict[name] = row[index]
+            unexpected_index_list.append(primary_key_dict)
+
+        return unexpected_index_list
+
+    return UnexpectedSampleQuery(
+        query=final_query,
+        column_names=all_columns,
+        build_result=_build_unexpected_index_list,
+    )
+
+
+_sqlalchemy_map_condition_index.unexpected_sample_query_fn = _sqlalchemy_map_condition_index_sample_query  # type: ignore[attr-defined]
 
 
 def _spark_map_condition_unexpected_count_aggregate_fn(
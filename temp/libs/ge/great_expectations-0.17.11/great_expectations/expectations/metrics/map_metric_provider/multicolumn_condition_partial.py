@@ -109,12 +109,23 @@ def multicolumn_condition_partial(  # noqa: C901 - 16
                     Union[str, sqlalchemy.quoted_name]
                 ] = accessor_domain_kwargs["column_list"]
 
-                meets_expectation_series = metric_fn(
-                    cls,
-                    df[column_list],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
+                meets_expectation_series = execution_engine.map_condition_in_shards(
+                    metric_provider=cls,
+                    metric_fn=metric_fn,
+                    data=df,
+                    column_names=column_list,
+                    metric_value_kwargs=metric_value_kwargs,
+                    metrics=metrics,
+                    as_frame=True,
                 )
+                if meets_expectation_series is None:
+                    meets_expectation_series = metric_fn(
+                        cls,
+                        df[column_list],
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
                 return (
                     ~meets_expectation_series,
                     compute_domain_kwargs,
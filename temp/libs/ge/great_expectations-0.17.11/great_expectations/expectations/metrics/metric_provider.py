@@ -115,7 +115,9 @@ class MetricProvider(metaclass=MetaMetricProvider):
     In some cases, subclasses of Expectation, such as TableMetricProvider will already
     have correct values that may simply be inherited.
 
-    They *may* optionally override the `default_kwarg_values` attribute.
+    They *may* optionally override the `default_kwarg_values` attribute, and the `persistent_cacheable` attribute
+    (set it to False, if values of metric depend on anything besides data of Batch and metric kwargs, such as current
+    time, so that they are never reused across runs from persistent metric cache).
 
     MetricProvider classes *must* implement the following:
         1. `_get_evaluation_dependencies`. Note that often, _get_evaluation_dependencies should
@@ -133,6 +135,7 @@ class MetricProvider(metaclass=MetaMetricProvider):
     domain_keys: Tuple[str, ...] = tuple()
     value_keys: Tuple[str, ...] = tuple()
     default_kwarg_values: dict = {}
+    persistent_cacheable: bool = True
 
     @classmethod
     def _register_metric_functions(cls) -> None:
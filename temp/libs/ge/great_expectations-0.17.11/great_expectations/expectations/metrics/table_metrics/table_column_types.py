@@ -68,7 +68,11 @@ class ColumnTypes(TableMetricProvider):
                 "the requested batch is not available; please load the batch into the execution engine."
             )
 
-        return _get_sqlalchemy_column_metadata(execution_engine.engine, batch_data)
+        return _get_sqlalchemy_column_metadata(
+            engine=execution_engine.engine,
+            batch_data=batch_data,
+            cache_ttl_seconds=execution_engine.schema_cache_ttl_seconds,
+        )
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(  # noqa: PLR0913
@@ -87,7 +91,11 @@ class ColumnTypes(TableMetricProvider):
         )
 
 
-def _get_sqlalchemy_column_metadata(engine, batch_data: SqlAlchemyBatchData):
+def _get_sqlalchemy_column_metadata(
+    engine,
+    batch_data: SqlAlchemyBatchData,
+    cache_ttl_seconds: Optional[float] = None,
+):
     # if a custom query was passed
     if sqlalchemy.TextClause and isinstance(
         batch_data.selectable, sqlalchemy.TextClause
@@ -104,6 +112,7 @@ def _get_sqlalchemy_column_metadata(engine, batch_data: SqlAlchemyBatchData):
         engine=engine,
         table_selectable=table_selectable,
         schema_name=schema_name,
+        cache_ttl_seconds=cache_ttl_seconds,
     )
 
 
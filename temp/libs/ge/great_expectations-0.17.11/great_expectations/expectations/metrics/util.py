@@ -21,6 +21,11 @@ from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_schema_cache import (
+    DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
+    SchemaCacheKey,
+    get_schema_cache,
+)
 from great_expectations.execution_engine.util import check_sql_engine_dialect
 from great_expectations.util import get_sqlalchemy_inspector
 
@@ -58,6 +63,8 @@ from great_expectations.compatibility.bigquery import bigquery_types_tuple
 if TYPE_CHECKING:
     import pandas as pd
 
+    from great_expectations.execution_engine import ExecutionEngine
+
 try:
     import teradatasqlalchemy.dialect
     import teradatasqlalchemy.types as teradatatypes
@@ -306,15 +313,156 @@ def attempt_allowing_relative_error(dialect):
     return detected_redshift or detected_psycopg2
 
 
+# Dialects, whose native approximate (sketch-based) quantile functions can be computed as single aggregate expression.
+APPROXIMATE_QUANTILE_DIALECTS: Tuple[str, ...] = (
+    GXSqlDialect.AWSATHENA.value,
+    GXSqlDialect.BIGQUERY.value,
+    GXSqlDialect.CLICKHOUSE.value,
+    "databricks",
+    GXSqlDialect.REDSHIFT.value,
+    GXSqlDialect.SNOWFLAKE.value,
+    GXSqlDialect.TRINO.value,
+)
+
+# Number of quantile buckets (BigQuery "APPROX_QUANTILES") and accuracy (Databricks "percentile_approx"), used when
+# "allow_relative_error" is True (as opposed to explicit relative error, from which these values are derived).
+DEFAULT_APPROXIMATE_QUANTILE_BUCKETS: int = 1000
+DEFAULT_APPROXIMATE_QUANTILE_ACCURACY: int = 10000
+
+# Documented worst-case rank error of sketches with fixed accuracy (Trino/Athena "approx_percentile" uses q-digest).
+_APPROXIMATE_QUANTILE_FIXED_RANK_ERRORS: Dict[str, float] = {
+    GXSqlDialect.AWSATHENA.value: 1.0e-2,
+    GXSqlDialect.TRINO.value: 1.0e-2,
+}
+
+
+def is_approximate_quantile_requested(allow_relative_error: Any) -> bool:
+    """
+    Returns True if "allow_relative_error" requests approximate quantiles for SQL backends: either True or relative
+    rank error as float in (0, 1).  String values are interpolation options of Pandas and do not request approximation.
+    """
+    if isinstance(allow_relative_error, bool):
+        return allow_relative_error
+
+    return (
+        isinstance(allow_relative_error, float)
+        and 0.0 < allow_relative_error < 1.0  # noqa: PLR2004
+    )
+
+
+def use_approximate_quantiles(
+    execution_engine: Optional[ExecutionEngine], allow_relative_error: Any
+) -> bool:
+    """
+    Returns True if quantiles should be computed by native sketch aggregate: "allow_relative_error" requests them and
+    "execution_engine" is "SqlAlchemyExecutionEngine" for dialect that supports them (only SQL engines have dialect).
+    """
+    dialect_name: Optional[str] = getattr(execution_engine, "dialect_name", None)
+    return (
+        isinstance(dialect_name, str)
+        and is_approximate_quantile_requested(allow_relative_error=allow_relative_error)
+        and dialect_name.lower() in APPROXIMATE_QUANTILE_DIALECTS
+    )
+
+
+def get_approximate_quantile_rank_error(
+    dialect_name: str, allow_relative_error: Any
+) -> Optional[float]:
+    """
+    Returns upper bound on rank error (as fraction of row count) of approximate quantiles computed for "dialect_name"
+    (None if backend does not document deterministic bound, as is the case for t-digest and reservoir sketches).
+    """
+    dialect_name = dialect_name.lower()
+    if dialect_name == GXSqlDialect.BIGQUERY:
+        return 1.0 / _get_approximate_quantile_buckets(
+            allow_relative_error=allow_relative_error
+        )
+
+    if dialect_name == "databricks":
+        return 1.0 / _get_approximate_quantile_accuracy(
+            allow_relative_error=allow_relative_error
+        )
+
+    return _APPROXIMATE_QUANTILE_FIXED_RANK_ERRORS.get(dialect_name)
+
+
+def get_approximate_quantile_aggregate(
+    column: sqlalchemy.ColumnClause,
+    quantile: float,
+    allow_relative_error: Any,
+    dialect: Any,
+) -> sqlalchemy.ColumnElement:
+    """
+    Returns aggregate SQL expression, computing approximate "quantile" of "column" using native sketch function of
+    "dialect".  As ordinary aggregate, it is evaluated in the same query as other aggregate metrics on the same domain.
+    """
+    dialect_name: str = dialect.name.lower()
+    quantile = float(quantile)
+    if dialect_name in (
+        GXSqlDialect.AWSATHENA,
+        GXSqlDialect.SNOWFLAKE,
+        GXSqlDialect.TRINO,
+    ):
+        return sa.func.approx_percentile(column, quantile)
+
+    if dialect_name == "databricks":
+        return sa.func.percentile_approx(
+            column,
+            quantile,
+            _get_approximate_quantile_accuracy(
+                allow_relative_error=allow_relative_error
+            ),
+        )
+
+    column_sql: str = str(column.compile(dialect=dialect))
+    if dialect_name == GXSqlDialect.BIGQUERY:
+        num_buckets: int = _get_approximate_quantile_buckets(
+            allow_relative_error=allow_relative_error
+        )
+        return sa.literal_column(
+            f"APPROX_QUANTILES({column_sql}, {num_buckets})[OFFSET({int(round(quantile * num_buckets))})]"
+        )
+
+    if dialect_name == GXSqlDialect.CLICKHOUSE:
+        return sa.literal_column(f"quantile({quantile})({column_sql})")
+
+    if dialect_name == GXSqlDialect.REDSHIFT:
+        return sa.literal_column(
+            f"APPROXIMATE PERCENTILE_DISC({quantile}) WITHIN GROUP (ORDER BY {column_sql})"
+        )
+
+    raise ValueError(
+        f'The SQL engine dialect "{dialect_name}" does not support computing approximate quantiles.'
+    )
+
+
+def _get_approximate_quantile_buckets(allow_relative_error: Any) -> int:
+    if isinstance(allow_relative_error, float):
+        return int(np.ceil(1.0 / allow_relative_error))
+
+    return DEFAULT_APPROXIMATE_QUANTILE_BUCKETS
+
+
+def _get_approximate_quantile_accuracy(allow_relative_error: Any) -> int:
+    if isinstance(allow_relative_error, float):
+        return int(np.ceil(1.0 / allow_relative_error))
+
+    return DEFAULT_APPROXIMATE_QUANTILE_ACCURACY
+
+
 def is_column_present_in_table(
     engine: sqlalchemy.Engine,
     table_selectable: sqlalchemy.Select,
     column_name: str,
     schema_name: Optional[str] = None,
+    cache_ttl_seconds: Optional[float] = DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
 ) -> bool:
     all_columns_metadata: List[Dict[str, Any]] = (
         get_sqlalchemy_column_metadata(
-            engine=engine, table_selectable=table_selectable, schema_name=schema_name
+            engine=engine,
+            table_selectable=table_selectable,
+            schema_name=schema_name,
+            cache_ttl_seconds=cache_ttl_seconds,
         )
         or []
     )
@@ -327,6 +475,45 @@ def get_sqlalchemy_column_metadata(
     engine: sqlalchemy.Engine,
     table_selectable: sqlalchemy.Select,
     schema_name: Optional[str] = None,
+    cache_ttl_seconds: Optional[float] = DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Returns metadata of columns of table (or custom query), reflected from database (or queried, if reflection fails).
+
+    Results are kept in process-wide schema cache for "cache_ttl_seconds" (reflection is performed every time, if
+    "cache_ttl_seconds" is None or not positive); "SqlAlchemyExecutionEngine.invalidate_schema_cache()" discards them.
+    """
+    use_cache: bool = cache_ttl_seconds is not None and cache_ttl_seconds > 0
+    cache_key: Optional[SchemaCacheKey] = None
+    columns: Optional[List[Dict[str, Any]]]
+    if use_cache:
+        cache_key = get_schema_cache().build_key(
+            engine=engine,
+            table_name_or_query=str(table_selectable),
+            schema_name=schema_name,
+        )
+        columns = get_schema_cache().get(key=cache_key)
+        if columns is not None:
+            return columns
+
+    columns = _reflect_sqlalchemy_column_metadata(
+        engine=engine, table_selectable=table_selectable, schema_name=schema_name
+    )
+    # Failed (or empty) reflection is not cached, so that it is retried (e.g., once table has been created).
+    if cache_key is not None and columns:
+        get_schema_cache().set(
+            key=cache_key,
+            columns=columns,
+            ttl_seconds=cache_ttl_seconds,  # type: ignore[arg-type] # checked above
+        )
+
+    return columns
+
+
+def _reflect_sqlalchemy_column_metadata(
+    engine: sqlalchemy.Engine,
+    table_selectable: sqlalchemy.Select,
+    schema_name: Optional[str] = None,
 ) -> Optional[List[Dict[str, Any]]]:
     try:
         columns: List[Dict[str, Any]]
@@ -296,12 +296,26 @@ def register_metric(  # noqa: PLR0913
     return res
 
 
+def _get_registered_metric_provider(
+    metric_definition: dict, execution_engine: ExecutionEngine
+) -> Tuple[MetricProvider, Callable]:
+    # Subclasses of ExecutionEngine (e.g., "ChunkedPandasExecutionEngine") use providers registered for their bases.
+    engine_class: type
+    for engine_class in type(execution_engine).__mro__:
+        if engine_class.__name__ in metric_definition["providers"]:
+            return metric_definition["providers"][engine_class.__name__]
+
+    raise KeyError(type(execution_engine).__name__)
+
+
 def get_metric_provider(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Tuple[MetricProvider, Callable]:
     try:
         metric_definition = _registered_metrics[metric_name]
-        return metric_definition["providers"][type(execution_engine).__name__]
+        return _get_registered_metric_provider(
+            metric_definition=metric_definition, execution_engine=execution_engine
+        )
     except KeyError:
         raise gx_exceptions.MetricProviderError(
             f"No provider found for {metric_name} using {type(execution_engine).__name__}"
@@ -313,9 +327,9 @@ def get_metric_function_type(
 ) -> Optional[Union[MetricPartialFunctionTypes, MetricFunctionTypes]]:
     try:
         metric_definition = _registered_metrics[metric_name]
-        provider_fn, provider_class = metric_definition["providers"][
-            type(execution_engine).__name__
-        ]
+        provider_fn, provider_class = _get_registered_metric_provider(
+            metric_definition=metric_definition, execution_engine=execution_engine
+        )
         return getattr(provider_fn, "metric_fn_type", None)
     except KeyError:
         raise gx_exceptions.MetricProviderError(
@@ -18,6 +18,9 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.rule_based_profiler.helpers.profiling_session import (
+        ProfilingSession,
+    )
 
 
 class Builder(SerializableDictDot):
@@ -29,6 +32,7 @@ class Builder(SerializableDictDot):
         "batch_list",
         "batch_request",
         "data_context",
+        "profiling_session",
     }
 
     def __init__(
@@ -42,6 +46,7 @@ class Builder(SerializableDictDot):
         self._batch_list: Optional[List[Batch]] = None
         self._batch_request: Union[BatchRequestBase, dict, None] = None
         self._data_context: Optional[AbstractDataContext] = data_context
+        self._profiling_session: Optional[ProfilingSession] = None
 
     """
     Full getter/setter accessors for "batch_request" and "batch_list" are for configuring Builder dynamically.
@@ -70,6 +75,14 @@ class Builder(SerializableDictDot):
     def data_context(self) -> Optional[AbstractDataContext]:
         return self._data_context
 
+    @property
+    def profiling_session(self) -> Optional[ProfilingSession]:
+        return self._profiling_session
+
+    @profiling_session.setter
+    def profiling_session(self, value: Optional[ProfilingSession]) -> None:
+        self._profiling_session = value
+
     def set_batch_list_if_null_batch_request(
         self,
         batch_list: Optional[List[Batch]] = None,
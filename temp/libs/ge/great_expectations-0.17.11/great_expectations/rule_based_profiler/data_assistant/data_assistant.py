@@ -529,7 +529,7 @@ class DataAssistant(metaclass=MetaDataAssistant):
             )
 
     @public_api
-    def run(
+    def run(  # noqa: PLR0913
         self,
         variables: Optional[Dict[str, Any]] = None,
         rules: Optional[Dict[str, Dict[str, Any]]] = None,
@@ -539,6 +539,7 @@ class DataAssistant(metaclass=MetaDataAssistant):
         domain_type_directives_list: Optional[
             List[RuntimeEnvironmentDomainTypeDirectives]
         ] = None,
+        runtime_configuration: Optional[dict] = None,
     ) -> DataAssistantResult:
         """Run the DataAssistant as it is currently configured.
 
@@ -558,6 +559,7 @@ class DataAssistant(metaclass=MetaDataAssistant):
             rules: Name/configuration dictionary (overrides)
             variables_directives_list: Additional/override runtime variables directives (modify `BaseRuleBasedProfiler`).
             domain_type_directives_list: Additional/override runtime domain directives (modify `BaseRuleBasedProfiler`).
+            runtime_configuration: Additional run-time settings (e.g., `max_batch_workers` for parallel per-Batch metrics).
 
         Returns:
             An instance of `DataAssistantResult`.
@@ -584,6 +586,7 @@ class DataAssistant(metaclass=MetaDataAssistant):
             batch_request=None,
             variables_directives_list=variables_directives_list,
             domain_type_directives_list=domain_type_directives_list,
+            runtime_configuration=runtime_configuration,
         )
         return self._build_data_assistant_result(
             data_assistant_result=data_assistant_result
@@ -741,6 +744,7 @@ def run_profiler_on_data(  # noqa: PLR0913
     domain_type_directives_list: Optional[
         List[RuntimeEnvironmentDomainTypeDirectives]
     ] = None,
+    runtime_configuration: Optional[dict] = None,
 ) -> None:
     """
     This method executes "run()" of effective "RuleBasedProfiler" and fills "DataAssistantResult" object with outputs.
@@ -755,6 +759,7 @@ def run_profiler_on_data(  # noqa: PLR0913
         batch_request: Explicit batch_request used to supply data at runtime
         variables_directives_list: additional/override runtime variables directives (modify "BaseRuleBasedProfiler")
         domain_type_directives_list: additional/override runtime domain directives (modify "BaseRuleBasedProfiler")
+        runtime_configuration: additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION")
     """
     comment: str = f"""Created by effective Rule-Based Profiler of {data_assistant.__class__.__name__} with the \
 configuration included.
@@ -764,7 +769,7 @@ configuration included.
         rules=rules,
         batch_list=batch_list,
         batch_request=batch_request,
-        runtime_configuration=None,
+        runtime_configuration=runtime_configuration,
         reconciliation_directives=DEFAULT_RECONCILATION_DIRECTIVES,
         variables_directives_list=variables_directives_list,
         domain_type_directives_list=domain_type_directives_list,
@@ -109,6 +109,7 @@ class DataAssistantRunner:
         def run(
             batch_request: Optional[Union[BatchRequestBase, dict]] = None,
             estimation: Optional[Union[str, NumericRangeEstimatorType]] = None,
+            runtime_configuration: Optional[dict] = None,
             **kwargs,
         ) -> DataAssistantResult:
             """
@@ -121,6 +122,10 @@ class DataAssistantRunner:
                     If set to "exact" (default), all "Rule" objects using "NumericMetricRangeMultiBatchParameterBuilder"
                     will have the value of "estimator" property (referred to by "$variables.estimator") equal "exact".
                     If set to "flag_outliers", then "bootstrap" estimator (default in "Rule" variables) takes effect.
+                runtime_configuration: Additional run-time settings; e.g., "max_batch_workers" (number of parallel
+                    per-"Batch" metric computation workers) and "max_concurrent_batch_bytes" (bound on total size of
+                    in-memory "Batch" data, on which these workers compute metrics at once; other Pandas "Batch" data
+                    is spilled to disk meanwhile).
                 kwargs: placeholder for "makefun.create_function()" to propagate dynamically generated signature
 
             Returns:
@@ -190,12 +195,14 @@ class DataAssistantRunner:
             data_assistant_result: DataAssistantResult = data_assistant.run(
                 variables_directives_list=variables_directives_list,
                 domain_type_directives_list=domain_type_directives_list,
+                runtime_configuration=runtime_configuration,
             )
             return data_assistant_result
 
         # Construct arguments to "DataAssistantRunner.run()" method, implemented using "DataAssistantRunner.run_impl()".
 
-        # 1. The signature includes "batch_request" and "estimation" arguments for all "DataAssistant" implementations.
+        # 1. The signature includes "batch_request", "estimation", and "runtime_configuration" arguments for all
+        # "DataAssistant" implementations.
         parameters: List[Parameter] = [
             Parameter(
                 name="batch_request",
@@ -208,6 +215,12 @@ class DataAssistantRunner:
                 default="exact",
                 annotation=Optional[Union[str, NumericRangeEstimatorType]],
             ),
+            Parameter(
+                name="runtime_configuration",
+                kind=Parameter.POSITIONAL_OR_KEYWORD,
+                default=None,
+                annotation=Optional[dict],
+            ),
         ]
 
         # 2. Extend the signature to include "DataAssistant"-specific "Domain"-level arguments/directives.
@@ -152,6 +152,17 @@ class DomainBuilder(ABC, Builder):
         self,
         variables: Optional[ParameterContainer] = None,
     ) -> Optional[Validator]:
+        if self.profiling_session is not None:
+            return self.profiling_session.get_validator(
+                purpose="domain_builder",
+                data_context=self.data_context,
+                batch_list=self.batch_list,
+                batch_request=self.batch_request,
+                domain=None,
+                variables=variables,
+                parameters=None,
+            )
+
         return get_validator_using_batch_list_or_batch_request(
             purpose="domain_builder",
             data_context=self.data_context,
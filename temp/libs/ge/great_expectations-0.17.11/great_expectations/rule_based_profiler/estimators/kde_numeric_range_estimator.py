@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 import numpy as np
 
@@ -12,7 +12,7 @@ from great_expectations.rule_based_profiler.estimators.numeric_range_estimator i
     NumericRangeEstimator,
 )
 from great_expectations.rule_based_profiler.helpers.util import (
-    compute_kde_quantiles_point_estimate,
+    compute_kde_quantiles_point_estimates,
     get_false_positive_rate_from_rule_state,
     get_parameter_value_and_validate_return_type,
     get_quantile_statistic_interpolation_method_from_rule_state,
@@ -54,10 +54,28 @@ class KdeNumericRangeEstimator(NumericRangeEstimator):
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
     ) -> NumericRangeEstimationResult:
-        if is_ndarray_datetime_dtype(
-            data=metric_values,
-            parse_strings_as_datetimes=True,
-            fuzzy=False,
+        return self._get_numeric_range_estimates(
+            metric_values=np.reshape(metric_values, (-1, 1)),
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )[0]
+
+    def _get_numeric_range_estimates(
+        self,
+        metric_values: np.ndarray,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        column_idx: int
+        if any(
+            is_ndarray_datetime_dtype(
+                data=metric_values[:, column_idx],
+                parse_strings_as_datetimes=True,
+                fuzzy=False,
+            )
+            for column_idx in range(metric_values.shape[1])
         ):
             raise gx_exceptions.ProfilerExecutionError(
                 message=f'Estimator "{self.__class__.__name__}" does not support DateTime/TimeStamp data types.'
@@ -116,7 +134,7 @@ class KdeNumericRangeEstimator(NumericRangeEstimator):
         if bw_method is None:
             bw_method = DEFAULT_KDE_BW_METHOD
 
-        return compute_kde_quantiles_point_estimate(
+        return compute_kde_quantiles_point_estimates(
             metric_values=metric_values,
             false_positive_rate=false_positive_rate,
             n_resamples=n_resamples,
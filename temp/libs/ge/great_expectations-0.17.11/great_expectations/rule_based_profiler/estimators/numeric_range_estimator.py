@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 
@@ -77,6 +77,31 @@ class NumericRangeEstimator(ABC, SerializableDictDot):
             parameters=parameters,
         )
 
+    def get_numeric_range_estimates(
+        self,
+        metric_values: np.ndarray,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        """
+        Method that invokes implementation of the estimation algorithm for several independent sample vectors at once.
+        Args:
+            metric_values: 2-dimensional "numpy.ndarray"; each column is vector of samples (one per "Batch" of data).
+            domain: "Domain" object that is context for execution of this "NumericRangeEstimator" object.
+            variables: attribute name/value pairs
+            parameters: Dictionary of "ParameterContainer" objects corresponding to all "Domain" objects in memory.
+
+        Returns:
+            List of "NumericRangeEstimationResult" objects, one per column of "metric_values".
+        """
+        return self._get_numeric_range_estimates(
+            metric_values=metric_values,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
     @abstractmethod
     def _get_numeric_range_estimate(
         self,
@@ -90,6 +115,27 @@ class NumericRangeEstimator(ABC, SerializableDictDot):
         """
         pass
 
+    def _get_numeric_range_estimates(
+        self,
+        metric_values: np.ndarray,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        """
+        Estimates every column of "metric_values" separately (subclasses override this method with vectorized versions).
+        """
+        column_idx: int
+        return [
+            self._get_numeric_range_estimate(
+                metric_values=metric_values[:, column_idx],
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+            for column_idx in range(metric_values.shape[1])
+        ]
+
     def to_dict(self) -> dict:
         """
         Returns dictionary equivalent of this object.
@@ -26,6 +26,9 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.rule_based_profiler.helpers.profiling_session import (
+        ProfilingSession,
+    )
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -154,6 +157,14 @@ class ExpectationConfigurationBuilder(ABC, Builder):
     def validation_parameter_builders(self) -> Optional[List[ParameterBuilder]]:
         return self._validation_parameter_builders
 
+    @Builder.profiling_session.setter  # type: ignore[attr-defined]
+    def profiling_session(self, value: Optional[ProfilingSession]) -> None:
+        self._profiling_session = value
+
+        validation_parameter_builder: ParameterBuilder
+        for validation_parameter_builder in self.validation_parameter_builders or []:
+            validation_parameter_builder.profiling_session = value
+
 
 def init_rule_expectation_configuration_builders(
     expectation_configuration_builder_configs: List[dict],
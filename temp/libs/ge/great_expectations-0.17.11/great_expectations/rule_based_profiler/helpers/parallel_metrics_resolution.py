@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+
+from great_expectations.core.batch_manager import BatchManager
+from great_expectations.execution_engine.execution_engine import NoOpDict
+from great_expectations.execution_engine.metric_cache import MetricCache
+from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    _PERSISTED_CONNECTION_DIALECTS,
+)
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+if TYPE_CHECKING:
+    from great_expectations.core.batch_data_cache import BatchDataCache
+    from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.exception_info import ExceptionInfo
+    from great_expectations.validator.metric_configuration import (
+        MetricConfiguration,
+    )
+    from great_expectations.validator.metrics_calculator import _MetricKey
+    from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# "runtime_configuration" directives, recognized by multi-Batch "ParameterBuilder" metric computations.
+MAX_BATCH_WORKERS_KEY: str = "max_batch_workers"
+MAX_CONCURRENT_BATCH_BYTES_KEY: str = "max_concurrent_batch_bytes"
+
+
+class ConcurrentBatchComputationLimit:
+    """
+    ConcurrentBatchComputationLimit bounds total size of "Batch" data, on which parallel workers compute metrics at once.
+
+    A worker acquires size of its "Batch" data before computing metrics and releases it afterwards.  A "Batch" larger
+    than entire limit is admitted only when no other "Batch" is in flight (so that progress is always possible).
+
+    With limit, Pandas "Batch" data, which is not in flight, is spilled to disk (see "BatchDataCache.spill()"), so that
+    only "Batch" data of running workers (and of active "Batch") is resident in memory at once.
+    """
+
+    def __init__(self, max_concurrent_bytes: Optional[int] = None) -> None:
+        """
+        Args:
+            max_concurrent_bytes: Upper bound on total size of "Batch" data in flight (None means "unbounded").
+        """
+        self._max_concurrent_bytes: Optional[int] = max_concurrent_bytes
+        self._in_flight_bytes: int = 0
+        self._condition = threading.Condition()
+
+    @property
+    def is_bounded(self) -> bool:
+        return self._max_concurrent_bytes is not None
+
+    @property
+    def in_flight_bytes(self) -> int:
+        return self._in_flight_bytes
+
+    def acquire(self, num_bytes: int) -> None:
+        if self._max_concurrent_bytes is None:
+            return
+
+        with self._condition:
+            while (
+                self._in_flight_bytes > 0
+                and self._in_flight_bytes + num_bytes > self._max_concurrent_bytes
+            ):
+                self._condition.wait()
+
+            self._in_flight_bytes += num_bytes
+
+    def release(self, num_bytes: int) -> None:
+        if self._max_concurrent_bytes is None:
+            return
+
+        with self._condition:
+            self._in_flight_bytes -= num_bytes
+            self._condition.notify_all()
+
+
+def get_parallel_batch_workers(
+    validator: Validator,
+    batch_ids: List[str],
+    runtime_configuration: Optional[dict] = None,
+) -> int:
+    """
+    Returns number of parallel per-"Batch" workers, requested through "runtime_configuration" directive (and capped by
+    number of "Batch" objects); returns 1 (i.e., "serial") if engine of "validator" cannot resolve metrics in parallel.
+    """
+    runtime_configuration = runtime_configuration or {}
+    max_batch_workers: Optional[int] = runtime_configuration.get(MAX_BATCH_WORKERS_KEY)
+    if not max_batch_workers or max_batch_workers <= 1 or len(batch_ids) <= 1:
+        return 1
+
+    dialect_name: Optional[str] = getattr(
+        validator.execution_engine, "dialect_name", None
+    )
+    # "SqlAlchemyExecutionEngine" keeps single persisted connection for these dialects (it cannot be shared by threads).
+    if dialect_name is not None and dialect_name in _PERSISTED_CONNECTION_DIALECTS:
+        logger.debug(
+            f'Parallel per-Batch metrics resolution is not supported for "{dialect_name}" dialect; resolving serially.'
+        )
+        return 1
+
+    return min(max_batch_workers, len(batch_ids))
+
+
+def resolve_metrics_by_batch_in_parallel(
+    validator: Validator,
+    metric_configurations: List[MetricConfiguration],
+    max_workers: int,
+    runtime_configuration: Optional[dict] = None,
+) -> Tuple[
+    Dict[_MetricKey, MetricValue],
+    Dict[
+        _MetricKey,
+        Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+    ],
+]:
+    """
+    Resolves "metric_configurations" by grouping them on "batch_id" and computing metric sets of different "Batch"
+    objects in parallel workers, each of which uses its own copy of execution engine of "validator" (holding only the
+    "Batch" data it works on).  Outputs of workers are merged into single "resolved_metrics" and "aborted_metrics_info"
+    dictionaries (same format as is returned by "MetricsCalculator.resolve_validation_graph()").
+
+    Args:
+        validator: Validator, whose execution engine has all "Batch" objects of interest loaded.
+        metric_configurations: List of "MetricConfiguration" objects; each must contain "batch_id" in its domain kwargs.
+        max_workers: Maximum number of parallel workers.
+        runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+
+    Returns:
+        Tuple of resolved metrics and aborted metrics information, both with metric ID as key.
+    """
+    runtime_configuration = runtime_configuration or {}
+
+    metric_configurations_by_batch_id: Dict[
+        str, List[MetricConfiguration]
+    ] = defaultdict(list)
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metric_configurations:
+        metric_configurations_by_batch_id[
+            metric_configuration.metric_domain_kwargs["batch_id"]
+        ].append(metric_configuration)
+
+    computation_limit = ConcurrentBatchComputationLimit(
+        max_concurrent_bytes=runtime_configuration.get(MAX_CONCURRENT_BATCH_BYTES_KEY)
+    )
+    metric_cache: Optional[
+        Dict[_MetricKey, MetricValue]
+    ] = validator.metrics_calculator.metric_cache
+    batch_data_cache: BatchDataCache = (
+        validator.execution_engine.batch_manager.batch_data_cache
+    )
+
+    batch_id: str
+    if computation_limit.is_bounded:
+        # Batch data is loaded back (memory-mapped) by worker, which computes its metrics.
+        for batch_id in metric_configurations_by_batch_id:
+            batch_data_cache.spill(batch_id=batch_id)
+
+    def _resolve_metrics_for_batch(
+        batch_id: str,
+    ) -> Tuple[
+        Dict[_MetricKey, MetricValue],
+        Dict[
+            _MetricKey,
+            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+        ],
+    ]:
+        batch_data: Any = batch_data_cache[batch_id]
+        num_bytes: int = _get_batch_data_size_in_bytes(batch_data=batch_data)
+        computation_limit.acquire(num_bytes=num_bytes)
+        try:
+            metrics_calculator = MetricsCalculator(
+                execution_engine=_clone_execution_engine_for_batch(
+                    execution_engine=validator.execution_engine,
+                    batch_id=batch_id,
+                    batch_data=batch_data,
+                ),
+                show_progress_bars=False,
+                metric_cache=metric_cache,
+            )
+            graph = metrics_calculator.build_metric_dependency_graph(
+                metric_configurations=metric_configurations_by_batch_id[batch_id],
+                runtime_configuration=runtime_configuration,
+            )
+            return metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
+                graph=graph,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
+            )
+        finally:
+            if computation_limit.is_bounded:
+                batch_data_cache.spill(batch_id=batch_id)
+
+            computation_limit.release(num_bytes=num_bytes)
+
+    resolved_metrics: Dict[_MetricKey, MetricValue] = {}
+    aborted_metrics_info: Dict[
+        _MetricKey,
+        Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+    ] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch_resolved_metrics, batch_aborted_metrics_info in executor.map(
+            _resolve_metrics_for_batch, list(metric_configurations_by_batch_id.keys())
+        ):
+            resolved_metrics.update(batch_resolved_metrics)
+            aborted_metrics_info.update(batch_aborted_metrics_info)
+
+    return resolved_metrics, aborted_metrics_info
+
+
+def _clone_execution_engine_for_batch(
+    execution_engine: ExecutionEngine,
+    batch_id: str,
+    batch_data: Any,
+) -> ExecutionEngine:
+    """
+    Returns shallow copy of "execution_engine" with its own metric cache and "BatchManager", holding only "batch_data".
+
+    Connection-level resources (e.g., SQLAlchemy engine and its connection pool, Spark session) are shared by copies.
+    """
+    clone: ExecutionEngine = copy.copy(execution_engine)
+    metric_cache: Optional[MetricCache] = execution_engine.metric_cache
+    # noinspection PyProtectedMember
+    clone._metric_cache = (
+        MetricCache(config=metric_cache.config)
+        if metric_cache is not None
+        else NoOpDict()
+    )
+    clone._batch_manager = BatchManager(execution_engine=clone)
+    clone.batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
+    return clone
+
+
+def _get_batch_data_size_in_bytes(batch_data: Any) -> int:
+    # Only in-memory (Pandas) "Batch" data counts against limit; SQL and Spark data reside in their respective backends.
+    # Size is known without loading spilled "Batch" data back into memory.
+    if isinstance(batch_data, PandasBatchData):
+        return batch_data.loaded_memory_usage_bytes
+
+    return 0
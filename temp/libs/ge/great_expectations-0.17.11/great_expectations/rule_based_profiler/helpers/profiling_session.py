@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from great_expectations.core.batch import (
+    Batch,
+    BatchRequestBase,
+    get_batch_request_as_dict,
+)
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.rule_based_profiler.helpers.util import (
+    build_batch_request,
+)
+from great_expectations.rule_based_profiler.helpers.util import (
+    get_validator as get_validator_using_batch_list_or_batch_request,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.core.domain import Domain
+    from great_expectations.data_context.data_context.abstract_data_context import (
+        AbstractDataContext,
+    )
+    from great_expectations.rule_based_profiler.parameter_container import (
+        ParameterContainer,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metrics_calculator import _MetricKey
+    from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class ProfilingSession:
+    """
+    ProfilingSession holds state shared by all "Rule" objects (and their "DomainBuilder" and "ParameterBuilder"
+    components) for the duration of a single "RuleBasedProfiler.run()" invocation.
+
+    It owns exactly one "Validator" for every distinct Batch specification (Batch list or Batch Request) as well as a
+    run-scoped metric cache, keyed by metric ID.  Every "Validator" handed out by the session resolves metrics through
+    this cache; hence, each distinct metric (e.g., "table.row_count" or "column.min" for a given "batch_id") is computed
+    only once per run, regardless of how many rules, domains, and parameter builders request it.
+    """
+
+    def __init__(
+        self,
+        data_context: Optional[AbstractDataContext] = None,
+    ) -> None:
+        """
+        Args:
+            data_context: AbstractDataContext used to load Batch data and instantiate "Validator" objects.
+        """
+        self._data_context: Optional[AbstractDataContext] = data_context
+        self._validators: Dict[str, Validator] = {}
+        self._metric_cache: Dict[_MetricKey, MetricValue] = {}
+
+    @property
+    def data_context(self) -> Optional[AbstractDataContext]:
+        return self._data_context
+
+    @property
+    def metric_cache(self) -> Dict[_MetricKey, MetricValue]:
+        return self._metric_cache
+
+    @property
+    def num_validators(self) -> int:
+        return len(self._validators)
+
+    def get_validator(  # noqa: PLR0913
+        self,
+        purpose: str,
+        data_context: Optional[AbstractDataContext] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[str, BatchRequestBase, dict]] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Optional[Validator]:
+        """
+        Returns "Validator" for Batch specification, given by "batch_list" or "batch_request" (resolved using "domain",
+        "variables", and "parameters"), instantiating it (and attaching shared metric cache to it) on first request.
+        """
+        if data_context is None:
+            data_context = self._data_context
+
+        if batch_list is None or all(batch is None for batch in batch_list):
+            if batch_request is None:
+                return None
+
+            batch_request = build_batch_request(
+                batch_request=batch_request,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+            batch_list = None
+
+        key: str = self._get_validator_key(
+            batch_list=batch_list, batch_request=batch_request
+        )
+
+        validator: Optional[Validator] = self._validators.get(key)
+        if validator is None:
+            validator = get_validator_using_batch_list_or_batch_request(
+                purpose=purpose,
+                data_context=data_context,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                domain=None,
+                variables=variables,
+                parameters=parameters,
+            )
+            if validator is None:
+                return None
+
+            validator.metrics_calculator.metric_cache = self._metric_cache
+            self._validators[key] = validator
+            logger.debug(
+                f'ProfilingSession created Validator for "{purpose}" ({len(self._validators)} in total).'
+            )
+
+        return validator
+
+    def close(self) -> None:
+        """Releases all "Validator" objects and cached metrics, owned by this session."""
+        validator: Validator
+        for validator in self._validators.values():
+            validator.metrics_calculator.metric_cache = None
+
+        self._validators.clear()
+        self._metric_cache.clear()
+
+    @staticmethod
+    def _get_validator_key(
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+    ) -> str:
+        batch: Batch
+        if batch_list is not None:
+            return json.dumps([batch.id for batch in batch_list if batch is not None])
+
+        batch_request_as_dict: dict = dict(
+            get_batch_request_as_dict(batch_request=batch_request) or {}
+        )
+        runtime_parameters: Optional[dict] = batch_request_as_dict.get(
+            "runtime_parameters"
+        )
+        if runtime_parameters and runtime_parameters.get("batch_data") is not None:
+            # In-memory Batch data is identified by object identity (it is neither hashable nor cheaply serializable).
+            runtime_parameters = dict(runtime_parameters)
+            runtime_parameters[
+                "batch_data"
+            ] = f"batch_data:{id(runtime_parameters['batch_data'])}"
+            batch_request_as_dict["runtime_parameters"] = runtime_parameters
+
+        return json.dumps(
+            convert_to_json_serializable(data=batch_request_as_dict),
+            sort_keys=True,
+        )
+
+    def __deepcopy__(self, memo):
+        # Session state is shared by design; copies of "Builder" objects must continue to reference the same session.
+        memo[id(self)] = self
+        return self
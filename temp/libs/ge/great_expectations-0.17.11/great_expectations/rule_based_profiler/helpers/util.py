@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import copy
-import datetime
 import hashlib
 import itertools
 import logging
@@ -688,43 +687,114 @@ def compute_kde_quantiles_point_estimate(  # noqa: PLR0913
         random_seed: An optional random_seed to pass to "np.random.Generator(np.random.PCG64(random_seed))"
             for making probabilistic sampling deterministic.
     """
+    return compute_kde_quantiles_point_estimates(
+        metric_values=np.reshape(metric_values, (-1, 1)),
+        false_positive_rate=false_positive_rate,
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        bw_method=bw_method,
+        random_seed=random_seed,
+    )[0]
+
+
+def compute_kde_quantiles_point_estimates(  # noqa: PLR0913
+    metric_values: np.ndarray,
+    false_positive_rate: np.float64,
+    n_resamples: int,
+    quantile_statistic_interpolation_method: str,
+    bw_method: Union[str, float, Callable],
+    random_seed: Optional[int] = None,
+) -> List[NumericRangeEstimationResult]:
+    """
+    Vectorized form of "compute_kde_quantiles_point_estimate()": estimates lower and upper quantiles for each column of
+    2-dimensional "metric_values" ("N" data samples by "K" independent sample vectors) in one batched NumPy operation.
+
+    Every column is resampled from its own one-dimensional Gaussian kernel density estimate (identical to the model of
+    "scipy.stats.gaussian_kde"): sample index matrix is drawn once (using seeded random number generator) and Gaussian
+    noise, scaled by per-column kernel bandwidth, is added; then "np.quantile()" is computed along resamples axis for
+    both quantiles at once.  Callable "bw_method" cannot be vectorized; it is evaluated by "scipy.stats.gaussian_kde".
+
+    Args:
+        metric_values: 2-dimensional "numpy.ndarray" of "dtype.float" values; rows correspond to "Batch" data samples.
+        false_positive_rate: user-configured fraction between 0 and 1 expressing desired false positive rate.
+        n_resamples: A positive integer indicating the sample size resulting from the resampling procedure.
+        quantile_statistic_interpolation_method: Supplies value of (interpolation) "method" to "np.quantile()".
+        bw_method: The estimator bandwidth as described in:
+            https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.gaussian_kde.html
+        random_seed: An optional random_seed to pass to "np.random.Generator(np.random.PCG64(random_seed))"
+            for making probabilistic sampling deterministic.
+
+    Returns:
+        List of "NumericRangeEstimationResult" objects, one per column of "metric_values".
+    """
     lower_quantile_pct: float = false_positive_rate / 2.0
     upper_quantile_pct: float = 1.0 - (false_positive_rate / 2.0)
 
-    metric_values_density_estimate: stats.gaussian_kde = stats.gaussian_kde(
-        metric_values, bw_method=bw_method
-    )
+    metric_values = np.asarray(metric_values, dtype=np.float64)
+    num_samples: int = metric_values.shape[0]
 
-    metric_values_gaussian_sample: np.ndarray
-    if random_seed:
-        metric_values_gaussian_sample = metric_values_density_estimate.resample(
-            n_resamples,
-            seed=random_seed,
-        )
-    else:
-        metric_values_gaussian_sample = metric_values_density_estimate.resample(
-            n_resamples,
-        )
+    kernel_bandwidths: np.ndarray = np.sqrt(
+        np.var(metric_values, axis=0, ddof=1)
+    ) * _get_kde_bandwidth_factors(
+        metric_values=metric_values,
+        bw_method=bw_method,
+    )
 
-    lower_quantile_point_estimate: Union[
-        np.float64, datetime.datetime
-    ] = numpy.numpy_quantile(
-        metric_values_gaussian_sample,
-        q=lower_quantile_pct,
-        method=quantile_statistic_interpolation_method,
+    random_state: np.random.Generator = np.random.Generator(
+        np.random.PCG64(random_seed)
     )
-    upper_quantile_point_estimate: Union[
-        np.float64, datetime.datetime
-    ] = numpy.numpy_quantile(
-        metric_values_gaussian_sample,
-        q=upper_quantile_pct,
+    resample_indices: np.ndarray = random_state.integers(
+        0, num_samples, size=n_resamples
+    )
+    metric_values_gaussian_samples: np.ndarray = metric_values[
+        resample_indices
+    ] + kernel_bandwidths * random_state.standard_normal(
+        size=(n_resamples, metric_values.shape[1])
+    )
+
+    quantile_point_estimates: np.ndarray = numpy.numpy_quantile(
+        metric_values_gaussian_samples,
+        q=[lower_quantile_pct, upper_quantile_pct],
+        axis=0,
         method=quantile_statistic_interpolation_method,
     )
 
-    return build_numeric_range_estimation_result(
-        metric_values=metric_values,
-        min_value=lower_quantile_point_estimate,
-        max_value=upper_quantile_point_estimate,
+    column_idx: int
+    return [
+        build_numeric_range_estimation_result(
+            metric_values=metric_values[:, column_idx],
+            min_value=quantile_point_estimates[0, column_idx],
+            max_value=quantile_point_estimates[1, column_idx],
+        )
+        for column_idx in range(metric_values.shape[1])
+    ]
+
+
+def _get_kde_bandwidth_factors(
+    metric_values: np.ndarray,
+    bw_method: Union[str, float, Callable],
+) -> np.ndarray:
+    """
+    Returns kernel bandwidth factor for every column of "metric_values", following "scipy.stats.gaussian_kde" rules.
+    """
+    num_samples: int = metric_values.shape[0]
+    num_columns: int = metric_values.shape[1]
+
+    if bw_method is None or bw_method == "scott":
+        return np.full(num_columns, np.power(num_samples, -1.0 / 5))
+
+    if bw_method == "silverman":
+        return np.full(num_columns, np.power(num_samples * 3.0 / 4.0, -1.0 / 5))
+
+    if np.isscalar(bw_method) and not isinstance(bw_method, str):
+        return np.full(num_columns, float(bw_method))
+
+    column_idx: int
+    return np.array(
+        [
+            stats.gaussian_kde(metric_values[:, column_idx], bw_method=bw_method).factor
+            for column_idx in range(num_columns)
+        ]
     )
 
 
@@ -791,59 +861,95 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
     computing the stopping criterion, expressed as the optimal number of bootstrap samples, needed to achieve a maximum
     probability that the value of the statistic of interest will be minimally deviating from its actual (ideal) value.
     """
+    return compute_bootstrap_quantiles_point_estimates(
+        metric_values=np.reshape(metric_values, (-1, 1)),
+        false_positive_rate=false_positive_rate,
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        quantile_bias_correction=quantile_bias_correction,
+        quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+        random_seed=random_seed,
+    )[0]
+
+
+def compute_bootstrap_quantiles_point_estimates(  # noqa: PLR0913
+    metric_values: np.ndarray,
+    false_positive_rate: np.float64,
+    n_resamples: int,
+    quantile_statistic_interpolation_method: str,
+    quantile_bias_correction: bool,
+    quantile_bias_std_error_ratio_threshold: float,
+    random_seed: Optional[int] = None,
+) -> List[NumericRangeEstimationResult]:
+    """
+    Vectorized form of "compute_bootstrap_quantiles_point_estimate()": estimates bias-corrected lower and upper
+    quantiles for each column of 2-dimensional "metric_values" ("N" data samples by "K" independent sample vectors).
+
+    One resample index matrix ("n_resamples" by "N") is drawn (using seeded random number generator) and applied to
+    all columns at once; both quantiles of every bootstrap sample of every column are then obtained with a single call
+    to "np.quantile()" along samples axis, and bias correction is applied element-wise.  For a single column and given
+    "random_seed", resamples (and, hence, results) are identical to those of the original per-vector implementation.
+
+    Args:
+        metric_values: 2-dimensional "numpy.ndarray" of "dtype.float" values; rows correspond to "Batch" data samples.
+        false_positive_rate: user-configured fraction between 0 and 1 expressing desired false positive rate.
+        n_resamples: A positive integer indicating the sample size resulting from the sampling with replacement
+            procedure.
+        quantile_statistic_interpolation_method: Supplies value of (interpolation) "method" to "np.quantile()".
+        quantile_bias_correction: If True, always apply bias correction to bootstrapped quantile point estimates.
+        quantile_bias_std_error_ratio_threshold: Bias to standard error ratio, above which bias correction is applied.
+        random_seed: An optional random_seed to pass to "np.random.Generator(np.random.PCG64(random_seed))"
+            for making probabilistic sampling deterministic.
+
+    Returns:
+        List of "NumericRangeEstimationResult" objects, one per column of "metric_values".
+    """
     lower_quantile_pct: float = false_positive_rate / 2.0
     upper_quantile_pct: float = 1.0 - false_positive_rate / 2.0
+    quantile_pcts: List[float] = [lower_quantile_pct, upper_quantile_pct]
 
-    sample_lower_quantile: np.ndarray = numpy.numpy_quantile(
-        a=metric_values,
-        q=lower_quantile_pct,
-        method=quantile_statistic_interpolation_method,
-    )
-    sample_upper_quantile: np.ndarray = numpy.numpy_quantile(
+    num_samples: int = metric_values.shape[0]
+
+    # Sample quantiles have shape (2, K): lower and upper quantile for each column.
+    sample_quantiles: np.ndarray = numpy.numpy_quantile(
         a=metric_values,
-        q=upper_quantile_pct,
+        q=quantile_pcts,
+        axis=0,
         method=quantile_statistic_interpolation_method,
     )
 
-    bootstraps: np.ndarray
-    if random_seed:
-        random_state: np.random.Generator = np.random.Generator(
-            np.random.PCG64(random_seed)
-        )
-        bootstraps = random_state.choice(
-            metric_values, size=(n_resamples, metric_values.size)
-        )
-    else:
-        bootstraps = np.random.choice(
-            metric_values, size=(n_resamples, metric_values.size)
-        )
+    random_state: np.random.Generator = np.random.Generator(
+        np.random.PCG64(random_seed)
+    )
+    resample_indices: np.ndarray = random_state.integers(
+        0, num_samples, size=(n_resamples, num_samples)
+    )
 
-    lower_quantile_bias_corrected_point_estimate: Union[
-        np.float64, datetime.datetime
-    ] = _determine_quantile_bias_corrected_point_estimate(
-        bootstraps=bootstraps,
-        quantile_pct=lower_quantile_pct,
-        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
-        quantile_bias_correction=quantile_bias_correction,
-        quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
-        sample_quantile=sample_lower_quantile,
+    # Bootstraps have shape (n_resamples, N, K); their quantiles have shape (2, n_resamples, K).
+    bootstraps: np.ndarray = metric_values[resample_indices]
+    bootstrap_quantiles: np.ndarray = numpy.numpy_quantile(
+        bootstraps,
+        q=quantile_pcts,
+        axis=1,
+        method=quantile_statistic_interpolation_method,
     )
-    upper_quantile_bias_corrected_point_estimate: Union[
-        np.float64, datetime.datetime
-    ] = _determine_quantile_bias_corrected_point_estimate(
-        bootstraps=bootstraps,
-        quantile_pct=upper_quantile_pct,
-        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+
+    bias_corrected_point_estimates: np.ndarray = _determine_quantile_bias_corrected_point_estimates(
+        bootstrap_quantiles=bootstrap_quantiles,
+        sample_quantiles=sample_quantiles,
         quantile_bias_correction=quantile_bias_correction,
         quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
-        sample_quantile=sample_upper_quantile,
     )
 
-    return build_numeric_range_estimation_result(
-        metric_values=metric_values,
-        min_value=lower_quantile_bias_corrected_point_estimate,
-        max_value=upper_quantile_bias_corrected_point_estimate,
-    )
+    column_idx: int
+    return [
+        build_numeric_range_estimation_result(
+            metric_values=metric_values[:, column_idx],
+            min_value=bias_corrected_point_estimates[0, column_idx],
+            max_value=bias_corrected_point_estimates[1, column_idx],
+        )
+        for column_idx in range(metric_values.shape[1])
+    ]
 
 
 def build_numeric_range_estimation_result(
@@ -895,43 +1001,49 @@ def build_numeric_range_estimation_result(
     )
 
 
-def _determine_quantile_bias_corrected_point_estimate(  # noqa: PLR0913
-    bootstraps: np.ndarray,
-    quantile_pct: float,
-    quantile_statistic_interpolation_method: str,
+def _determine_quantile_bias_corrected_point_estimates(
+    bootstrap_quantiles: np.ndarray,
+    sample_quantiles: np.ndarray,
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
-    sample_quantile: np.ndarray,
-) -> np.float64:
-    bootstrap_quantiles: Union[np.ndarray, np.float64] = numpy.numpy_quantile(
-        bootstraps,
-        q=quantile_pct,
-        axis=1,
-        method=quantile_statistic_interpolation_method,
+) -> np.ndarray:
+    """
+    Element-wise bias correction of bootstrapped quantiles: "bootstrap_quantiles" has resamples as its axis 1, and
+    remaining axes must match shape of "sample_quantiles"; returned point estimates have shape of "sample_quantiles".
+    """
+    bootstrap_quantile_point_estimates: np.ndarray = np.mean(
+        bootstrap_quantiles, axis=1
+    )
+    bootstrap_quantile_standard_errors: np.ndarray = np.std(bootstrap_quantiles, axis=1)
+    bootstrap_quantile_biases: np.ndarray = (
+        bootstrap_quantile_point_estimates - sample_quantiles
     )
-    bootstrap_quantile_point_estimate: np.ndarray = np.mean(bootstrap_quantiles)
-    bootstrap_quantile_standard_error: np.ndarray = np.std(bootstrap_quantiles)
-    bootstrap_quantile_bias: float = bootstrap_quantile_point_estimate - sample_quantile
 
     # Bias / Standard Error > 0.25 is a rule of thumb for when to apply bias correction.
     # See:
     # Efron, B., & Tibshirani, R. J. (1993). Estimates of bias. An Introduction to the Bootstrap (pp. 128).
     #         Springer Science and Business Media Dordrecht. DOI 10.1007/978-1-4899-4541-9
-    quantile_bias_corrected_point_estimate: np.float64
-
-    if (
-        not quantile_bias_correction
-        and bootstrap_quantile_standard_error > 0.0  # noqa: PLR2004
-        and bootstrap_quantile_bias / bootstrap_quantile_standard_error
-        <= quantile_bias_std_error_ratio_threshold
-    ):
-        quantile_bias_corrected_point_estimate = bootstrap_quantile_point_estimate
-    else:
-        quantile_bias_corrected_point_estimate = (
-            bootstrap_quantile_point_estimate - bootstrap_quantile_bias
+    positive_standard_errors: np.ndarray = (
+        bootstrap_quantile_standard_errors > 0.0  # noqa: PLR2004
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bias_to_standard_error_ratios: np.ndarray = np.where(
+            positive_standard_errors,
+            bootstrap_quantile_biases / bootstrap_quantile_standard_errors,
+            np.inf,
         )
 
-    return quantile_bias_corrected_point_estimate
+    skip_bias_correction: np.ndarray = (
+        (not quantile_bias_correction)
+        & positive_standard_errors
+        & (bias_to_standard_error_ratios <= quantile_bias_std_error_ratio_threshold)
+    )
+
+    return np.where(
+        skip_bias_correction,
+        bootstrap_quantile_point_estimates,
+        bootstrap_quantile_point_estimates - bootstrap_quantile_biases,
+    )
 
 
 def convert_metric_values_to_float_dtype_best_effort(
@@ -35,3 +35,6 @@ from great_expectations.rule_based_profiler.parameter_builder.value_counts_singl
 from great_expectations.rule_based_profiler.parameter_builder.histogram_single_batch_parameter_builder import (  # isort:skip
     HistogramSingleBatchParameterBuilder,
 )
+from great_expectations.rule_based_profiler.parameter_builder.metric_history_parameter_builder import (  # isort:skip
+    MetricHistoryParameterBuilder,
+)
@@ -166,6 +166,9 @@ elements.
             evaluation_parameter_builder_configs=None,
             data_context=self.data_context,
         )
+        column_values_nonnull_count_metric_single_batch_parameter_builder.profiling_session = (
+            self.profiling_session
+        )
         column_values_nonnull_count_metric_single_batch_parameter_builder.build_parameters(
             domain=domain,
             variables=variables,
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from dateutil.parser import parse
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.domain import Domain  # noqa: TCH001
+from great_expectations.core.expectation_validation_result import (
+    get_metric_kwargs_id,
+)
+from great_expectations.data_context.store.metric_store import MetricStore
+from great_expectations.rule_based_profiler.config import (
+    ParameterBuilderConfig,  # noqa: TCH001
+)
+from great_expectations.rule_based_profiler.helpers.util import (
+    get_parameter_value_and_validate_return_type,
+)
+from great_expectations.rule_based_profiler.parameter_builder import ParameterBuilder
+from great_expectations.rule_based_profiler.parameter_container import (
+    DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+    FULLY_QUALIFIED_PARAMETER_NAME_ATTRIBUTED_VALUE_KEY,
+    FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY,
+    FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY,
+    ParameterContainer,
+)
+from great_expectations.types.attributes import Attributes
+
+if TYPE_CHECKING:
+    from great_expectations.data_context.data_context.abstract_data_context import (
+        AbstractDataContext,
+    )
+
+
+class MetricHistoryParameterBuilder(ParameterBuilder):
+    """
+    Reads previously stored values of a validation metric (e.g., recorded by "StoreMetricsAction") from "MetricStore"
+    and returns them as multi-Batch metric values (one per run, oldest first), attributed to their run times.
+
+    Output has the same shape as that of "MetricMultiBatchParameterBuilder"; hence, it can be referenced by
+    "NumericMetricRangeMultiBatchParameterBuilder" (via "metric_multi_batch_parameter_builder_name") in order to estimate
+    ranges from metric history instead of (or in addition to) recomputing metrics on every Batch.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        metric_name: str,
+        metric_kwargs: Optional[
+            Union[str, dict]
+        ] = DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+        metric_store_name: Union[str, None] = "metrics_store",
+        expectation_suite_name: Optional[str] = None,
+        data_asset_name: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        lookback_runs: Optional[Union[str, int]] = None,
+        evaluation_parameter_builder_configs: Optional[
+            List[ParameterBuilderConfig]
+        ] = None,
+        data_context: Optional[AbstractDataContext] = None,
+    ) -> None:
+        """
+        Args:
+            name: the name of this parameter -- this is user-specified parameter name (from configuration);
+            it is not the fully-qualified parameter name; a fully-qualified parameter name must start with "$parameter."
+            and may contain one or more subsequent parts (e.g., "$parameter.<my_param_from_config>.<metric_name>").
+            metric_name: name of stored validation metric (e.g., "expect_column_mean_to_be_between.result.observed_value")
+            metric_kwargs: kwargs, identifying stored metric (default: those of "Domain", such as {"column": "X"})
+            metric_store_name: name of "MetricStore" in DataContext configuration, from which metric values are read
+            expectation_suite_name: if given, only values stored for this Expectation Suite are used
+            data_asset_name: if given, only values stored for this Data Asset are used
+            start_time: if given, only values of runs at or after this time (ISO 8601 string) are used
+            end_time: if given, only values of runs at or before this time (ISO 8601 string) are used
+            lookback_runs: if given, only values of (at most) this many most recent runs are used
+            evaluation_parameter_builder_configs: ParameterBuilder configurations, executing and making whose respective
+            ParameterBuilder objects' outputs available (as fully-qualified parameter names) is pre-requisite.
+            These "ParameterBuilder" configurations help build parameters needed for this "ParameterBuilder".
+            data_context: AbstractDataContext associated with this ParameterBuilder
+        """
+        super().__init__(
+            name=name,
+            evaluation_parameter_builder_configs=evaluation_parameter_builder_configs,
+            data_context=data_context,
+        )
+
+        self._metric_name = metric_name
+        self._metric_kwargs = metric_kwargs
+        self._metric_store_name = metric_store_name
+        self._expectation_suite_name = expectation_suite_name
+        self._data_asset_name = data_asset_name
+        self._start_time = start_time
+        self._end_time = end_time
+        self._lookback_runs = lookback_runs
+
+    @property
+    def metric_name(self) -> str:
+        return self._metric_name
+
+    @property
+    def metric_kwargs(self) -> Optional[Union[str, dict]]:
+        return self._metric_kwargs
+
+    @property
+    def metric_store_name(self) -> Union[str, None]:
+        return self._metric_store_name
+
+    @property
+    def expectation_suite_name(self) -> Optional[str]:
+        return self._expectation_suite_name
+
+    @property
+    def data_asset_name(self) -> Optional[str]:
+        return self._data_asset_name
+
+    @property
+    def start_time(self) -> Optional[str]:
+        return self._start_time
+
+    @property
+    def end_time(self) -> Optional[str]:
+        return self._end_time
+
+    @property
+    def lookback_runs(self) -> Optional[Union[str, int]]:
+        return self._lookback_runs
+
+    def _build_parameters(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Attributes:
+        """
+        Builds ParameterContainer object that holds ParameterNode objects with attribute name-value pairs and details.
+
+        Returns:
+            Attributes object, containing computed parameter values and parameter computation details metadata.
+        """
+        # Obtain metric_store_name from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+        metric_store_name: str = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.metric_store_name,
+            expected_return_type=str,
+            variables=variables,
+            parameters=parameters,
+        )
+        metric_store: Optional[MetricStore] = (
+            self.data_context.stores.get(metric_store_name)
+            if self.data_context
+            else None
+        )
+        if not isinstance(metric_store, MetricStore):
+            raise gx_exceptions.ProfilerExecutionError(
+                message=f"""Utilizing a {self.__class__.__name__} requires a valid MetricStore named \
+"{metric_store_name}" in DataContext configuration.
+"""
+            )
+
+        # Obtain metric_kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+        metric_kwargs: Optional[dict] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.metric_kwargs,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+        metric_kwargs_id: Optional[str] = get_metric_kwargs_id(
+            metric_kwargs=dict(metric_kwargs or {})
+        )
+
+        # Obtain remaining directives from "rule state" (i.e., variables and parameters); from instance variables otherwise.
+        expectation_suite_name: Optional[
+            str
+        ] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.expectation_suite_name,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+        data_asset_name: Optional[str] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.data_asset_name,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+        start_time: Optional[str] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.start_time,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+        end_time: Optional[str] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.end_time,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+        lookback_runs: Optional[int] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.lookback_runs,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        metric_history: List[
+            Tuple[datetime.datetime, Any]
+        ] = metric_store.get_metric_history(
+            metric_name=self.metric_name,
+            metric_kwargs_id=metric_kwargs_id,
+            expectation_suite_name=expectation_suite_name,
+            data_asset_name=data_asset_name,
+            start_time=_parse_utc_datetime(value=start_time),
+            end_time=_parse_utc_datetime(value=end_time),
+            limit=None if lookback_runs is None else int(lookback_runs),
+        )
+        if not metric_history:
+            raise gx_exceptions.ProfilerExecutionError(
+                message=f"""{self.__class__.__name__} found no stored values of metric "{self.metric_name}" \
+(metric_kwargs_id: "{metric_kwargs_id}") in MetricStore "{metric_store_name}".
+"""
+            )
+
+        run_time: datetime.datetime
+        metric_value: Any
+        return Attributes(
+            {
+                FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY: np.asarray(
+                    [metric_value for run_time, metric_value in metric_history]
+                ),
+                FULLY_QUALIFIED_PARAMETER_NAME_ATTRIBUTED_VALUE_KEY: {
+                    run_time.isoformat(): metric_value
+                    for run_time, metric_value in metric_history
+                },
+                FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY: {
+                    "metric_configuration": {
+                        "metric_name": self.metric_name,
+                        "metric_kwargs_id": metric_kwargs_id,
+                        "expectation_suite_name": expectation_suite_name,
+                        "data_asset_name": data_asset_name,
+                    },
+                    "num_runs": len(metric_history),
+                },
+            }
+        )
+
+
+def _parse_utc_datetime(value: Optional[str]) -> Optional[datetime.datetime]:
+    if value is None:
+        return None
+
+    parsed: datetime.datetime = parse(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+
+    return parsed
@@ -612,33 +612,59 @@ detected.
 
         # Traverse indices of sample vectors corresponding to every element of multi-dimensional metric.
         metric_value_vector: np.ndarray
-        metric_value_range_min_idx: tuple
-        metric_value_range_max_idx: tuple
-        metric_value_estimation_histogram_idx: tuple
-        numeric_range_estimation_result: NumericRangeEstimationResult
-        for metric_value_idx in metric_value_vector_indices:
+        metric_value_vector_idx: int
+        numeric_range_estimation_results: List[
+            Optional[NumericRangeEstimationResult]
+        ] = [None] * len(metric_value_vector_indices)
+        estimated_metric_value_vector_idxs: List[int] = []
+        for metric_value_vector_idx, metric_value_idx in enumerate(
+            metric_value_vector_indices
+        ):
             # Obtain "N"-element-long vector of samples for each element of multi-dimensional metric.
             metric_value_vector = metric_values[metric_value_idx]
             if not datetime_detected and np.all(
                 np.isclose(metric_value_vector, metric_value_vector[0])
             ):
                 # Computation is unnecessary if distribution is degenerate.
-                numeric_range_estimation_result = build_numeric_range_estimation_result(
+                numeric_range_estimation_results[
+                    metric_value_vector_idx
+                ] = build_numeric_range_estimation_result(
                     metric_values=metric_value_vector,
                     min_value=metric_value_vector[0],
                     max_value=metric_value_vector[0],
                 )
             else:
-                # Compute low and high estimates for vector of samples for given element of multi-dimensional metric.
-                numeric_range_estimation_result = (
-                    numeric_range_estimator.get_numeric_range_estimate(
-                        metric_values=metric_value_vector,
-                        domain=domain,
-                        variables=variables,
-                        parameters=parameters,
-                    )
-                )
+                estimated_metric_value_vector_idxs.append(metric_value_vector_idx)
+
+        if estimated_metric_value_vector_idxs:
+            # Compute low and high estimates for all non-degenerate vectors of samples in one (vectorized) operation.
+            estimated_metric_value_vectors: np.ndarray = np.stack(
+                [
+                    metric_values[metric_value_vector_indices[metric_value_vector_idx]]
+                    for metric_value_vector_idx in estimated_metric_value_vector_idxs
+                ],
+                axis=1,
+            )
+            for metric_value_vector_idx, numeric_range_estimation_result in zip(
+                estimated_metric_value_vector_idxs,
+                numeric_range_estimator.get_numeric_range_estimates(
+                    metric_values=estimated_metric_value_vectors,
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                ),
+            ):
+                numeric_range_estimation_results[
+                    metric_value_vector_idx
+                ] = numeric_range_estimation_result
 
+        metric_value_range_min_idx: tuple
+        metric_value_range_max_idx: tuple
+        metric_value_estimation_histogram_idx: tuple
+        numeric_range_estimation_result: NumericRangeEstimationResult
+        for metric_value_idx, numeric_range_estimation_result in zip(  # type: ignore[assignment] # all are populated
+            metric_value_vector_indices, numeric_range_estimation_results
+        ):
             min_value = numeric_range_estimation_result.value_range[0]
             if lower_bound is not None:
                 min_value = max(np.float64(min_value), np.float64(lower_bound))
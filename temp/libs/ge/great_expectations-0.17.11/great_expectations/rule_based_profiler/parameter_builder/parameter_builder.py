@@ -35,6 +35,10 @@ from great_expectations.rule_based_profiler.builder import Builder
 from great_expectations.rule_based_profiler.config import (
     ParameterBuilderConfig,  # noqa: TCH001
 )
+from great_expectations.rule_based_profiler.helpers.parallel_metrics_resolution import (
+    get_parallel_batch_workers,
+    resolve_metrics_by_batch_in_parallel,
+)
 from great_expectations.rule_based_profiler.helpers.util import (
     build_metric_domain_kwargs,
     get_parameter_value_and_validate_return_type,
@@ -69,6 +73,9 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.rule_based_profiler.helpers.profiling_session import (
+        ProfilingSession,
+    )
     from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
@@ -306,12 +313,31 @@ class ParameterBuilder(ABC, Builder):
         """
         return f"{PARAMETER_KEY}{self.name}"
 
+    @Builder.profiling_session.setter  # type: ignore[attr-defined]
+    def profiling_session(self, value: Optional[ProfilingSession]) -> None:
+        self._profiling_session = value
+
+        evaluation_parameter_builder: ParameterBuilder
+        for evaluation_parameter_builder in self.evaluation_parameter_builders or []:
+            evaluation_parameter_builder.profiling_session = value
+
     def get_validator(
         self,
         domain: Optional[Domain] = None,
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
     ) -> Optional[Validator]:
+        if self.profiling_session is not None:
+            return self.profiling_session.get_validator(
+                purpose="parameter_builder",
+                data_context=self.data_context,
+                batch_list=self.batch_list,
+                batch_request=self.batch_request,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+
         return get_validator_using_batch_list_or_batch_request(
             purpose="parameter_builder",
             data_context=self.data_context,
@@ -476,26 +502,43 @@ specified (empty "metric_name" value detected)."""
             parameters=parameters,
         )
 
-        graph: ValidationGraph = (
-            validator.metrics_calculator.build_metric_dependency_graph(
-                metric_configurations=metrics_to_resolve,
-                runtime_configuration=runtime_configuration,
-            )
-        )
-
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
         aborted_metrics_info: Dict[
             Tuple[str, str, str],
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ]
-        (
-            resolved_metrics,
-            aborted_metrics_info,
-        ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
-            graph=graph,
+
+        # Multi-Batch metric sets can optionally be computed in parallel, one worker per "Batch" (opt-in directive).
+        max_batch_workers: int = get_parallel_batch_workers(
+            validator=validator,
+            batch_ids=batch_ids,
             runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=0,
         )
+        if max_batch_workers > 1:
+            (
+                resolved_metrics,
+                aborted_metrics_info,
+            ) = resolve_metrics_by_batch_in_parallel(
+                validator=validator,
+                metric_configurations=metrics_to_resolve,
+                max_workers=max_batch_workers,
+                runtime_configuration=runtime_configuration,
+            )
+        else:
+            graph: ValidationGraph = (
+                validator.metrics_calculator.build_metric_dependency_graph(
+                    metric_configurations=metrics_to_resolve,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+            (
+                resolved_metrics,
+                aborted_metrics_info,
+            ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
+                graph=graph,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
+            )
 
         # Step-5: Map resolved metrics to their attributes for identification and recovery by receiver.
 
@@ -1,9 +1,9 @@
+from __future__ import annotations
+
 import copy
 import json
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
-from great_expectations.core.batch import Batch, BatchRequestBase
-from great_expectations.core.domain import Domain
 from great_expectations.core.util import (
     convert_to_json_serializable,
     determine_progress_bar_method_by_environment,
@@ -13,12 +13,6 @@ from great_expectations.rule_based_profiler.config.base import (
     expectationConfigurationBuilderConfigSchema,
     parameterBuilderConfigSchema,
 )
-from great_expectations.rule_based_profiler.domain_builder import (
-    DomainBuilder,
-)
-from great_expectations.rule_based_profiler.expectation_configuration_builder import (
-    ExpectationConfigurationBuilder,
-)
 from great_expectations.rule_based_profiler.helpers.configuration_reconciliation import (
     DEFAULT_RECONCILATION_DIRECTIVES,
     ReconciliationDirectives,
@@ -27,9 +21,6 @@ from great_expectations.rule_based_profiler.helpers.configuration_reconciliation
 from great_expectations.rule_based_profiler.helpers.util import (
     convert_variables_to_dict,
 )
-from great_expectations.rule_based_profiler.parameter_builder import (
-    ParameterBuilder,
-)
 from great_expectations.rule_based_profiler.parameter_container import (
     ParameterContainer,
     build_parameter_container_for_variables,
@@ -41,6 +32,22 @@ from great_expectations.util import (
     measure_execution_time,
 )
 
+if TYPE_CHECKING:
+    from great_expectations.core.batch import Batch, BatchRequestBase
+    from great_expectations.core.domain import Domain
+    from great_expectations.rule_based_profiler.domain_builder import (
+        DomainBuilder,
+    )
+    from great_expectations.rule_based_profiler.expectation_configuration_builder import (
+        ExpectationConfigurationBuilder,
+    )
+    from great_expectations.rule_based_profiler.helpers.profiling_session import (
+        ProfilingSession,
+    )
+    from great_expectations.rule_based_profiler.parameter_builder import (
+        ParameterBuilder,
+    )
+
 
 class Rule(SerializableDictDot):
     def __init__(  # noqa: PLR0913
@@ -96,6 +103,7 @@ class Rule(SerializableDictDot):
         runtime_configuration: Optional[dict] = None,
         reconciliation_directives: Optional[ReconciliationDirectives] = None,
         rule_state: Optional[RuleState] = None,
+        profiling_session: Optional[ProfilingSession] = None,
     ) -> RuleState:
         """
         Builds a list of Expectation Configurations, returning a single Expectation Configuration entry for every
@@ -108,6 +116,7 @@ class Rule(SerializableDictDot):
             runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
             reconciliation_directives: directives for how each rule component should be overwritten
             rule_state: holds "Rule" execution state and responds to "execution_time_property_name" ("execution_time")
+            profiling_session: "ProfilingSession" (shared "Validator" objects and metric cache) for the profiler run
 
         Returns:
             RuleState representing effect of executing Rule
@@ -126,6 +135,26 @@ class Rule(SerializableDictDot):
         if rule_state is None:
             rule_state = RuleState()
 
+        self._set_profiling_session(profiling_session=profiling_session)
+        try:
+            return self._run(
+                variables=variables,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+                rule_state=rule_state,
+            )
+        finally:
+            self._set_profiling_session(profiling_session=None)
+
+    def _run(  # noqa: PLR0913
+        self,
+        variables: ParameterContainer,
+        batch_list: Optional[List[Batch]],
+        batch_request: Optional[Union[BatchRequestBase, dict]],
+        runtime_configuration: Optional[dict],
+        rule_state: RuleState,
+    ) -> RuleState:
         domains: List[Domain] = self._get_rule_domains(
             variables=variables,
             batch_list=batch_list,
@@ -317,6 +346,18 @@ class Rule(SerializableDictDot):
             for expectation_configuration_builder in expectation_configuration_builders
         }
 
+    def _set_profiling_session(
+        self, profiling_session: Optional[ProfilingSession]
+    ) -> None:
+        builder: Union[DomainBuilder, ParameterBuilder, ExpectationConfigurationBuilder]
+        for builder in [
+            self.domain_builder,
+            *(self.parameter_builders or []),
+            *(self.expectation_configuration_builders or []),
+        ]:
+            if builder is not None:
+                builder.profiling_session = profiling_session
+
     # noinspection PyUnusedLocal
     @measure_execution_time(
         execution_time_holder_object_reference_name="rule_state",
@@ -55,6 +55,9 @@ from great_expectations.rule_based_profiler.helpers.configuration_reconciliation
     ReconciliationStrategy,
     reconcile_rule_variables,
 )
+from great_expectations.rule_based_profiler.helpers.profiling_session import (
+    ProfilingSession,
+)
 from great_expectations.rule_based_profiler.helpers.util import (
     convert_variables_to_dict,
 )
@@ -322,6 +325,9 @@ class BaseRuleBasedProfiler(ConfigPeer):
 
         pbar_method: Callable = determine_progress_bar_method_by_environment()
 
+        # One session per run: rules share "Validator" objects and each distinct metric is computed once per Batch.
+        profiling_session = ProfilingSession(data_context=self._data_context)
+
         rule_state: RuleState
         rule: Rule
         for rule in pbar_method(
@@ -340,6 +346,7 @@ class BaseRuleBasedProfiler(ConfigPeer):
                     runtime_configuration=runtime_configuration,
                     reconciliation_directives=reconciliation_directives,
                     rule_state=RuleState(),
+                    profiling_session=profiling_session,
                 )
                 self.rule_states.append(rule_state)
             except Exception as err:
@@ -354,8 +361,11 @@ class BaseRuleBasedProfiler(ConfigPeer):
                     rule_state.exception_traceback = exception_info
                     self.rule_states.append(rule_state)
                 else:
+                    profiling_session.close()
                     raise err
 
+        profiling_session.close()
+
         return RuleBasedProfilerResult(
             fully_qualified_parameter_names_by_domain=self.get_fully_qualified_parameter_names_by_domain(),
             parameter_values_for_fully_qualified_parameter_names_by_domain=self.get_parameter_values_for_fully_qualified_parameter_names_by_domain(),
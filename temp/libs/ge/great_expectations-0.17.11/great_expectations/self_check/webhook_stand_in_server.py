@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+
+class WebhookStandInServer:
+    """
+    Local HTTP server, standing in for notification webhooks (Slack, Microsoft Teams, Opsgenie, etc.) in tests.
+
+    Every POST request is recorded (its path and JSON body) and answered with next status code from "statuses" (the
+    last one is repeated once sequence is exhausted), optionally after "delay_seconds"; this makes it possible to
+    exercise retries (e.g., statuses=(503, 503, 200)) and slow endpoints without network access.
+
+    Usage:
+        with WebhookStandInServer(response_body="ok") as server:
+            send_slack_notification(query, slack_webhook=server.url)
+            assert len(server.requests) == 1
+    """
+
+    def __init__(
+        self,
+        statuses: Sequence[int] = (200,),
+        response_body: str = "ok",
+        delay_seconds: float = 0.0,
+    ) -> None:
+        self._statuses: List[int] = list(statuses) or [200]
+        self._response_body = response_body
+        self._delay_seconds = delay_seconds
+        self._requests: List[dict] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("WebhookStandInServer is not started.")
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/webhook"
+
+    @property
+    def requests(self) -> List[dict]:
+        with self._lock:
+            return list(self._requests)
+
+    def start(self) -> Self:
+        stand_in: WebhookStandInServer = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                content_length = int(self.headers.get("Content-Length") or 0)
+                raw_body: bytes = self.rfile.read(content_length)
+                status: int = stand_in._record(path=self.path, raw_body=raw_body)
+                if stand_in._delay_seconds:
+                    time.sleep(stand_in._delay_seconds)
+
+                body: bytes = stand_in._response_body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="gx-webhook-stand-in-server",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+        self._server = None
+        self._thread = None
+
+    def _record(self, path: str, raw_body: bytes) -> int:
+        try:
+            body: Any = json.loads(raw_body.decode("utf-8")) if raw_body else None
+        except ValueError:
+            body = raw_body.decode("utf-8", errors="replace")
+
+        with self._lock:
+            idx: int = len(self._requests)
+            self._requests.append({"path": path, "json": body})
+            return self._statuses[min(idx, len(self._statuses) - 1)]
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
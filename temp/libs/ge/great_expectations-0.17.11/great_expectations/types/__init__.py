@@ -1,7 +1,7 @@
 import copy
 import logging
 from enum import Enum
-from typing import ClassVar, Dict, Optional, Set
+from typing import ClassVar, Dict, Iterator, Optional, Set
 
 import pandas as pd
 import pydantic
@@ -263,6 +263,10 @@ def safe_deep_copy(data, memo=None):
     ):
         return data
 
+    # One-shot iterators (e.g., of DataFrame chunks) cannot be copied; consuming copy would consume original.
+    if isinstance(data, Iterator):
+        return data
+
     if isinstance(data, (list, tuple)):
         return [safe_deep_copy(data=element, memo=memo) for element in data]
 
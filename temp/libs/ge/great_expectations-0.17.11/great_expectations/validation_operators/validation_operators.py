@@ -9,6 +9,7 @@ import great_expectations.exceptions as gx_exceptions
 from great_expectations.checkpoint.util import send_slack_notification
 from great_expectations.core.async_executor import AsyncExecutor
 from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.tracing import trace_span
 from great_expectations.data_asset.util import parse_result_format
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.types.refs import GXCloudResourceRef
@@ -475,14 +476,19 @@ class ActionListValidationOperator(ValidationOperator):
                     batch_identifier=batch_identifier,
                 )
             try:
-                action_result = self.actions[name].run(
-                    validation_result_suite_identifier=validation_result_id,
-                    validation_result_suite=batch_validation_result,
-                    data_asset=batch,
-                    payload=batch_actions_results,
-                    expectation_suite_identifier=expectation_suite_identifier,
-                    checkpoint_identifier=checkpoint_identifier,
-                )
+                with trace_span(
+                    name,
+                    "action",
+                    action_class_name=action["action"].get("class_name"),
+                ):
+                    action_result = self.actions[name].run(
+                        validation_result_suite_identifier=validation_result_id,
+                        validation_result_suite=batch_validation_result,
+                        data_asset=batch,
+                        payload=batch_actions_results,
+                        expectation_suite_identifier=expectation_suite_identifier,
+                        checkpoint_identifier=checkpoint_identifier,
+                    )
 
                 # Transform action_result if it not a dictionary.
                 if isinstance(action_result, GXCloudResourceRef):
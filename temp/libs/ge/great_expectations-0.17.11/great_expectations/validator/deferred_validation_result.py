@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from great_expectations.core.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+    from great_expectations.core.expectation_validation_result import (
+        ExpectationValidationResult,
+    )
+    from great_expectations.validator.validator import Validator
+
+
+class DeferredExpectationValidationResult:
+    """
+    Handle to result of Expectation, recorded (but not yet validated) by "Validator" in "deferred()" mode.
+
+    All Expectations, recorded in same "deferred()" block, are validated together (as one suite-level "ValidationGraph",
+    so that their metrics are bundled), when block exits or when result of any of them is first accessed.  Attribute
+    access is delegated to resolved "ExpectationValidationResult", which "resolve()" returns (or raises error, with
+    which validation of this Expectation failed).
+    """
+
+    def __init__(
+        self,
+        validator: Validator,
+        configuration: ExpectationConfiguration,
+        stored_configuration: ExpectationConfiguration,
+        runtime_configuration: dict,
+    ) -> None:
+        self._validator = validator
+        self._configuration = configuration
+        self._stored_configuration = stored_configuration
+        self._runtime_configuration = runtime_configuration
+        self._result: Optional[ExpectationValidationResult] = None
+        self._exception: Optional[Exception] = None
+
+    @property
+    def configuration(self) -> ExpectationConfiguration:
+        return self._configuration
+
+    @property
+    def runtime_configuration(self) -> dict:
+        return self._runtime_configuration
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._result is not None or self._exception is not None
+
+    def resolve(self) -> ExpectationValidationResult:
+        """Returns "ExpectationValidationResult", validating all pending Expectations of "Validator" if needed.
+
+        Raises:
+            Exception: Error, with which validation of this Expectation failed.
+        """
+        if not self.is_resolved:
+            self._validator._resolve_deferred_expectations()
+
+        if self._exception is not None:
+            raise self._exception
+
+        return self._result  # type: ignore[return-value] # set by "Validator"
+
+    def _set_result(self, result: ExpectationValidationResult) -> None:
+        # If there was no interactive evaluation, success will not have been computed.
+        if result.success is not None:
+            self._stored_configuration.success_on_last_run = result.success
+
+        self._result = result
+
+    def _set_exception(self, exception: Exception) -> None:
+        self._exception = exception
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return getattr(self.resolve(), name)
+
+    def __eq__(self, other):
+        if isinstance(other, DeferredExpectationValidationResult):
+            other = other.resolve()
+
+        return self.resolve() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    def __repr__(self) -> str:
+        if self._exception is not None:
+            return f"<{self.__class__.__name__} (failed): {self._configuration.expectation_type}>"
+
+        if self._result is None:
+            return f"<{self.__class__.__name__} (pending): {self._configuration.expectation_type}>"
+
+        return repr(self._result)
@@ -5,6 +5,7 @@ from collections.abc import Hashable
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
 from great_expectations.core._docs_decorators import public_api
+from great_expectations.core.tracing import trace_span
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.exception_info import ExceptionInfo  # noqa: TCH001
 from great_expectations.validator.metric_configuration import MetricConfiguration
@@ -29,6 +30,7 @@ class MetricsCalculator:
         self,
         execution_engine: ExecutionEngine,
         show_progress_bars: bool = False,
+        metric_cache: Optional[_MetricsDict] = None,
     ) -> None:
         """
         MetricsCalculator accepts and processes metrics calculation requests.
@@ -36,9 +38,12 @@ class MetricsCalculator:
         Args:
             execution_engine: ExecutionEngine to perform metrics computation.
             show_progress_bars: Directive for whether or not to show progress bars.
+            metric_cache: Optional (shared) dictionary of already resolved metrics, keyed by metric ID; when supplied,
+            metrics found in it are not recomputed, and newly resolved metrics are added to it.
         """
         self._execution_engine: ExecutionEngine = execution_engine
         self._show_progress_bars: bool = show_progress_bars
+        self._metric_cache: Optional[_MetricsDict] = metric_cache
 
     @property
     def show_progress_bars(self) -> bool:
@@ -48,6 +53,14 @@ class MetricsCalculator:
     def show_progress_bars(self, enable: bool) -> None:
         self._show_progress_bars = enable
 
+    @property
+    def metric_cache(self) -> Optional[_MetricsDict]:
+        return self._metric_cache
+
+    @metric_cache.setter
+    def metric_cache(self, value: Optional[_MetricsDict]) -> None:
+        self._metric_cache = value
+
     @public_api
     def columns(self, domain_kwargs: Optional[Dict[str, Any]] = None) -> List[str]:
         """
@@ -200,11 +213,23 @@ class MetricsCalculator:
         )
 
         metric_configuration: MetricConfiguration
-        for metric_configuration in metric_configurations:
-            graph.build_metric_dependency_graph(
-                metric_configuration=metric_configuration,
-                runtime_configuration=runtime_configuration,
-            )
+        with trace_span(
+            "build_metric_dependency_graph",
+            "graph",
+            num_metrics=len(metric_configurations),
+        ) as span:
+            for metric_configuration in metric_configurations:
+                graph.build_metric_dependency_graph(
+                    metric_configuration=metric_configuration,
+                    runtime_configuration=runtime_configuration,
+                )
+
+            span.set_attributes(num_edges=len(graph.edges))
+
+        # IDs are taken after graph is built, since default kwargs are then set.
+        graph.terminal_metric_ids = {
+            metric_configuration.id for metric_configuration in metric_configurations
+        }
 
         return graph
 
@@ -288,5 +313,32 @@ class MetricsCalculator:
             runtime_configuration=runtime_configuration,
             min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
             show_progress_bars=self._show_progress_bars,
+            metrics=self._get_cached_metrics_for_graph(graph=graph),
         )
+        if self._metric_cache is not None:
+            self._metric_cache.update(resolved_metrics)
+
         return resolved_metrics, aborted_metrics_info
+
+    def _get_cached_metrics_for_graph(
+        self, graph: ValidationGraph
+    ) -> Optional[_MetricsDict]:
+        """
+        Returns those entries of "metric_cache" (if configured) that are referenced by edges of "graph" so that graph
+        resolution can treat them as already computed.
+        """
+        if not self._metric_cache:
+            return None
+
+        metric_ids: Set[_MetricKey] = set()
+        for edge in graph.edges:
+            metric_ids.add(edge.left.id)
+            if edge.right is not None:
+                metric_ids.add(edge.right.id)
+
+        metric_id: _MetricKey
+        return {
+            metric_id: self._metric_cache[metric_id]
+            for metric_id in metric_ids
+            if metric_id in self._metric_cache
+        }
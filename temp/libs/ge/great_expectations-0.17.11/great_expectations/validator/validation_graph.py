@@ -17,6 +17,7 @@ from typing import (
 from tqdm.auto import tqdm
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.tracing import trace_span
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
@@ -27,6 +28,9 @@ if TYPE_CHECKING:
         ExpectationConfiguration,
     )
     from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
     from great_expectations.validator.computed_metric import MetricValue
     from great_expectations.validator.metrics_calculator import _MetricKey
@@ -44,6 +48,9 @@ logging.captureWarnings(True)
 
 MAX_METRIC_COMPUTATION_RETRIES: int = 3
 
+# Placeholder of released intermediate metric value (metric remains resolved for purposes of graph traversal).
+_RELEASED_METRIC_VALUE = object()
+
 
 class MetricEdge:
     def __init__(
@@ -76,6 +83,7 @@ class ValidationGraph:
         self,
         execution_engine: ExecutionEngine,
         edges: Optional[List[MetricEdge]] = None,
+        terminal_metric_ids: Optional[Set[_MetricKey]] = None,
     ) -> None:
         self._execution_engine = execution_engine
 
@@ -86,6 +94,8 @@ class ValidationGraph:
 
         self._edge_ids = {edge.id for edge in self._edges}
 
+        self._terminal_metric_ids = terminal_metric_ids
+
     def __eq__(self, other) -> bool:
         """Supports comparing two "ValidationGraph" objects."""
         return self.edge_ids == other.edge_ids
@@ -100,6 +110,18 @@ class ValidationGraph:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as set of two-tuples)."""
         return {edge.id for edge in self._edges}
 
+    @property
+    def terminal_metric_ids(self) -> Optional[Set[_MetricKey]]:
+        """
+        IDs of requested metrics, whose values are returned by "resolve()"; None if unknown, in which case values of all
+        metrics are returned (and intermediate metrics are never released).
+        """
+        return self._terminal_metric_ids
+
+    @terminal_metric_ids.setter
+    def terminal_metric_ids(self, value: Optional[Set[_MetricKey]]) -> None:
+        self._terminal_metric_ids = value
+
     def add(self, edge: MetricEdge) -> None:
         """Adds supplied "MetricEdge" object to this "ValidationGraph" object (if not already present)."""
         if edge.id not in self._edge_ids:
@@ -191,6 +213,7 @@ class ValidationGraph:
         min_graph_edges_pbar_enable: int = 0,
         # Set to low number (e.g., 3) to suppress progress bar for small graphs.
         show_progress_bars: bool = True,
+        metrics: Optional[Dict[_MetricKey, MetricValue]] = None,
     ) -> Tuple[
         Dict[_MetricKey, MetricValue],
         Dict[
@@ -198,21 +221,237 @@ class ValidationGraph:
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ],
     ]:
-        resolved_metrics: Dict[_MetricKey, MetricValue] = {}
+        # Metrics supplied on input (e.g., from cache) are considered resolved and are not recomputed.
+        resolved_metrics: Dict[_MetricKey, MetricValue] = dict(metrics or {})
+
+        # Metrics, computed in earlier runs on same data, are taken from persistent metric cache (if configured), and
+        # only metrics still needed to compute remaining ones are resolved.
+        graph: ValidationGraph = self
+        persisted_metrics: Dict[_MetricKey, MetricValue] = self._get_persisted_metrics(
+            metrics=resolved_metrics
+        )
+        if persisted_metrics:
+            resolved_metrics.update(persisted_metrics)
+            graph = self._get_unresolved_subgraph(metrics=resolved_metrics)
+
+        # Execution engine can prepare Batch data (e.g., materialize queries) for all metrics, which are to be resolved.
+        unresolved_metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        edge: MetricEdge
+        vertex: Optional[MetricConfiguration]
+        for edge in graph.edges:
+            for vertex in (edge.left, edge.right):
+                if vertex is not None and vertex.id not in resolved_metrics:
+                    unresolved_metric_configurations[vertex.id] = vertex
+
+        self._execution_engine.prepare_for_metric_resolution(
+            metric_configurations=unresolved_metric_configurations.values()
+        )
 
         # updates graph with aborted metrics
         aborted_metrics_info: Dict[
             _MetricKey,
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
-        ] = self._resolve(
+        ] = graph._resolve(
             metrics=resolved_metrics,
             runtime_configuration=runtime_configuration,
             min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
             show_progress_bars=show_progress_bars,
         )
 
+        metric_id: _MetricKey
+        for metric_id in [
+            metric_id
+            for metric_id, metric_value in resolved_metrics.items()
+            if metric_value is _RELEASED_METRIC_VALUE
+        ]:
+            del resolved_metrics[metric_id]
+
+        self._persist_metrics(
+            metrics={
+                metric_id: metric_value
+                for metric_id, metric_value in resolved_metrics.items()
+                if metric_id not in persisted_metrics
+                and (metrics is None or metric_id not in metrics)
+            }
+        )
+
         return resolved_metrics, aborted_metrics_info
 
+    def _get_persisted_metrics(
+        self, metrics: Dict[_MetricKey, MetricValue]
+    ) -> Dict[_MetricKey, MetricValue]:
+        """Returns values of metrics of this graph (other than those in "metrics"), found in persistent metric cache."""
+        persistent_metric_cache: Optional[
+            PersistentMetricCache
+        ] = self._execution_engine.persistent_metric_cache
+        if persistent_metric_cache is None:
+            return {}
+
+        persisted_metrics: Dict[_MetricKey, MetricValue] = {}
+        data_version: str
+        metric_configurations: List[MetricConfiguration]
+        for (
+            data_version,
+            metric_configurations,
+        ) in self._get_metric_configurations_by_data_version(
+            exclude_metric_ids=set(metrics.keys())
+        ).items():
+            persisted_metrics.update(
+                persistent_metric_cache.get(
+                    data_version=data_version,
+                    metric_configurations=metric_configurations,
+                )
+            )
+
+        if persisted_metrics:
+            logger.debug(
+                f"Took {len(persisted_metrics)} metrics from persistent metric cache."
+            )
+
+        return persisted_metrics
+
+    def _persist_metrics(self, metrics: Dict[_MetricKey, MetricValue]) -> None:
+        """Stores values of metrics of this graph (computed on Batches with known data version) in persistent cache."""
+        persistent_metric_cache: Optional[
+            PersistentMetricCache
+        ] = self._execution_engine.persistent_metric_cache
+        if persistent_metric_cache is None or not metrics:
+            return
+
+        data_version: str
+        metric_configurations: List[MetricConfiguration]
+        metric_configuration: MetricConfiguration
+        for (
+            data_version,
+            metric_configurations,
+        ) in self._get_metric_configurations_by_data_version(
+            exclude_metric_ids=None
+        ).items():
+            persistent_metric_cache.put(
+                data_version=data_version,
+                metrics=[
+                    (metric_configuration, metrics[metric_configuration.id])
+                    for metric_configuration in metric_configurations
+                    if metric_configuration.id in metrics
+                ],
+            )
+
+    def _get_metric_configurations_by_data_version(
+        self, exclude_metric_ids: Optional[Set[_MetricKey]]
+    ) -> Dict[str, List[MetricConfiguration]]:
+        data_versions_by_batch_id: Dict[Optional[str], Optional[str]] = {}
+        metric_configurations_by_data_version: Dict[str, List[MetricConfiguration]] = {}
+        metric_ids: Set[_MetricKey] = set(exclude_metric_ids or [])
+        metric_ids.update(self._get_non_persistent_metric_ids())
+        batch_id: Optional[str]
+        data_version: Optional[str]
+        edge: MetricEdge
+        vertex: Optional[MetricConfiguration]
+        for edge in self.edges:
+            for vertex in (edge.left, edge.right):
+                if vertex is None or vertex.id in metric_ids:
+                    continue
+
+                metric_ids.add(vertex.id)
+                batch_id = vertex.metric_domain_kwargs.get("batch_id")
+                if batch_id not in data_versions_by_batch_id:
+                    data_versions_by_batch_id[
+                        batch_id
+                    ] = self._execution_engine.get_batch_data_version(batch_id=batch_id)
+
+                data_version = data_versions_by_batch_id[batch_id]
+                if data_version is not None:
+                    metric_configurations_by_data_version.setdefault(
+                        data_version, []
+                    ).append(vertex)
+
+        return metric_configurations_by_data_version
+
+    def _get_non_persistent_metric_ids(self) -> Set[_MetricKey]:
+        """
+        Returns IDs of metrics, whose values must not be reused across runs: metrics of providers, which are not
+        "persistent_cacheable" (e.g., depend on current time), and all metrics depending on them.
+        """
+        dependent_ids_by_metric_id: Dict[_MetricKey, List[_MetricKey]] = {}
+        non_persistent_metric_ids: Set[_MetricKey] = set()
+        checked_metric_names: Dict[str, bool] = {}
+        metric_impl_klass: MetricProvider
+        edge: MetricEdge
+        vertex: Optional[MetricConfiguration]
+        for edge in self.edges:
+            if edge.right is not None:
+                dependent_ids_by_metric_id.setdefault(edge.right.id, []).append(
+                    edge.left.id
+                )
+
+            for vertex in (edge.left, edge.right):
+                if vertex is None:
+                    continue
+
+                if vertex.metric_name not in checked_metric_names:
+                    metric_impl_klass, _ = get_metric_provider(
+                        metric_name=vertex.metric_name,
+                        execution_engine=self._execution_engine,
+                    )
+                    checked_metric_names[vertex.metric_name] = getattr(
+                        metric_impl_klass, "persistent_cacheable", True
+                    )
+
+                if not checked_metric_names[vertex.metric_name]:
+                    non_persistent_metric_ids.add(vertex.id)
+
+        metric_id: _MetricKey
+        metric_ids: List[_MetricKey] = list(non_persistent_metric_ids)
+        while metric_ids:
+            metric_id = metric_ids.pop()
+            for dependent_id in dependent_ids_by_metric_id.get(metric_id, []):
+                if dependent_id not in non_persistent_metric_ids:
+                    non_persistent_metric_ids.add(dependent_id)
+                    metric_ids.append(dependent_id)
+
+        return non_persistent_metric_ids
+
+    def _get_unresolved_subgraph(
+        self, metrics: Dict[_MetricKey, MetricValue]
+    ) -> ValidationGraph:
+        """
+        Returns graph of those edges of this graph, which are needed to resolve metrics not in "metrics" (dependencies
+        of resolved metrics are not needed).
+        """
+        edges_by_left_id: Dict[_MetricKey, List[MetricEdge]] = {}
+        dependency_ids: Set[_MetricKey] = set()
+        edge: MetricEdge
+        for edge in self.edges:
+            edges_by_left_id.setdefault(edge.left.id, []).append(edge)
+            if edge.right is not None:
+                dependency_ids.add(edge.right.id)
+
+        root_ids: Set[_MetricKey] = (
+            self._terminal_metric_ids
+            if self._terminal_metric_ids is not None
+            else set(edges_by_left_id.keys()) - dependency_ids
+        )
+        needed_metric_ids: Set[_MetricKey] = set()
+        metric_id: _MetricKey
+        metric_ids: List[_MetricKey] = [
+            metric_id for metric_id in root_ids if metric_id not in metrics
+        ]
+        while metric_ids:
+            metric_id = metric_ids.pop()
+            if metric_id in needed_metric_ids:
+                continue
+
+            needed_metric_ids.add(metric_id)
+            for edge in edges_by_left_id.get(metric_id, []):
+                if edge.right is not None and edge.right.id not in metrics:
+                    metric_ids.append(edge.right.id)
+
+        return ValidationGraph(
+            execution_engine=self._execution_engine,
+            edges=[edge for edge in self.edges if edge.left.id in needed_metric_ids],
+            terminal_metric_ids=self._terminal_metric_ids,
+        )
+
     def _resolve(  # noqa: C901, PLR0912, PLR0915
         self,
         metrics: Dict[_MetricKey, MetricValue],
@@ -250,6 +489,7 @@ class ValidationGraph:
 
         progress_bar: Optional[tqdm] = None
 
+        pass_index: int = 0
         done: bool = False
         while not done:
             ready_metrics, needed_metrics = self._parse(metrics=metrics)
@@ -279,13 +519,21 @@ class ValidationGraph:
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        runtime_configuration=runtime_configuration,
+                with trace_span(
+                    "resolve_ready_metrics",
+                    "graph",
+                    pass_index=pass_index,
+                    num_ready_metrics=len(computable_metrics),
+                    num_needed_metrics=len(needed_metrics),
+                ):
+                    metrics.update(
+                        self._execution_engine.resolve_metrics(
+                            metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                            metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                            runtime_configuration=runtime_configuration,
+                        )
                     )
-                )
+                self._release_intermediate_metrics(metrics=metrics)
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
@@ -325,10 +573,51 @@ class ValidationGraph:
             ):
                 done = True
 
+            pass_index += 1
+
         progress_bar.close()  # type: ignore[union-attr]  # Incorrect flagging of 'Item "None" of "Optional[Any]" has no attribute "close"' in external package.
 
         return aborted_metrics_info
 
+    def _release_intermediate_metrics(
+        self,
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        """
+        If enabled by "ExecutionEngine" (and requested metrics are known), releases values of metrics, which are not
+        requested, but are dependencies of other metrics, once all metrics depending on them are resolved.  Metric IDs
+        remain in "metrics" (with placeholder value), so that released metrics are not computed again.
+        """
+        if (
+            self._terminal_metric_ids is None
+            or not self._execution_engine.release_intermediate_metrics
+        ):
+            return
+
+        dependents_resolved: Dict[_MetricKey, bool] = {}
+        edge: MetricEdge
+        for edge in self.edges:
+            if edge.right is not None:
+                dependents_resolved[edge.right.id] = (
+                    dependents_resolved.get(edge.right.id, True)
+                    and edge.left.id in metrics
+                )
+
+        metric_id: _MetricKey
+        resolved: bool
+        released_metric_ids: List[_MetricKey] = [
+            metric_id
+            for metric_id, resolved in dependents_resolved.items()
+            if resolved
+            and metric_id not in self._terminal_metric_ids
+            and metric_id in metrics
+            and metrics[metric_id] is not _RELEASED_METRIC_VALUE
+        ]
+        for metric_id in released_metric_ids:
+            metrics[metric_id] = _RELEASED_METRIC_VALUE
+
+        self._execution_engine.discard_cached_metrics(metric_ids=released_metric_ids)
+
     def _parse(
         self,
         metrics: Dict[_MetricKey, MetricValue],
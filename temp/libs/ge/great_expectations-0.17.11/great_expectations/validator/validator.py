@@ -10,12 +10,14 @@ import traceback
 import warnings
 from collections import defaultdict
 from collections.abc import Hashable
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Generator,
     List,
     NamedTuple,
     Optional,
@@ -41,6 +43,7 @@ from great_expectations.core.expectation_validation_result import (
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.core.tracing import trace_span
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_asset.util import recursively_convert_to_json_serializable
 from great_expectations.data_context.types.base import CheckpointValidationConfig
@@ -69,6 +72,9 @@ from great_expectations.rule_based_profiler.rule_based_profiler import (
 )
 from great_expectations.types import ClassConfig
 from great_expectations.util import load_class, verify_dynamic_loading_support
+from great_expectations.validator.deferred_validation_result import (
+    DeferredExpectationValidationResult,
+)
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metrics_calculator import (
     MetricsCalculator,
@@ -222,6 +228,14 @@ class Validator:
         # This special state variable tracks whether a validation run is going on, which will disable
         # saving expectation config objects
         self._active_validation: bool = False
+
+        # Pending results of Expectations, added in "deferred()" block (None outside of "deferred()" block).
+        self._deferred_expectations: Optional[
+            List[DeferredExpectationValidationResult]
+        ] = None
+        self._pending_deferred_expectations: List[
+            DeferredExpectationValidationResult
+        ] = []
         if self._data_context and hasattr(
             self._data_context, "_expectation_explorer_manager"
         ):
@@ -548,6 +562,12 @@ class Validator:
                     self._data_context,
                 )
 
+            defer_validation: bool = (
+                self._deferred_expectations is not None
+                and self.interactive_evaluation
+                and not self._active_validation
+            )
+
             try:
                 expectation = expectation_impl(configuration)
                 """Given an implementation and a configuration for any Expectation, returns its validation result"""
@@ -556,6 +576,9 @@ class Validator:
                     validation_result = ExpectationValidationResult(
                         expectation_config=copy.deepcopy(expectation.configuration)
                     )
+                elif defer_validation:
+                    # Validated together with other Expectations of "deferred()" block.
+                    validation_result = None
                 else:
                     validation_result = expectation.validate(
                         validator=self,
@@ -575,6 +598,13 @@ class Validator:
                         send_usage_event=False,
                     )
 
+                if defer_validation:
+                    return self._defer_expectation_validation(
+                        configuration=copy.deepcopy(expectation.configuration),
+                        stored_configuration=stored_config,
+                        runtime_configuration=basic_runtime_configuration,
+                    )
+
                 # If there was no interactive evaluation, success will not have been computed.
                 if validation_result.success is not None:
                     # Add a "success" object to the config
@@ -606,6 +636,145 @@ class Validator:
 
         return inst_expectation
 
+    @public_api
+    @contextmanager
+    def deferred(self) -> Generator[Validator, None, None]:
+        """Defers validation of Expectations, added (as "validator.expect_*()" calls) inside "with" block.
+
+        Instead of validating each Expectation as soon as it is added (with metric computations of its own), calls
+        return "DeferredExpectationValidationResult" handles; all Expectations of the block are validated together
+        (with metrics of all of them resolved as one graph, so that aggregate metrics are bundled into shared queries)
+        when the block exits, or earlier, when result of any of them is accessed.  Expectations are added to the
+        Expectation Suite immediately, as without "deferred()".
+
+        Nested "deferred()" blocks belong to the outermost one.  If the block raises, its pending Expectations are
+        validated on first access of their results.  If validation of some Expectations fails, the others are still
+        validated; the error is raised when the block exits and again on every access of the failed results.
+
+        Yields:
+            This Validator.
+        """
+        if self._deferred_expectations is not None:
+            yield self
+            return
+
+        self._deferred_expectations = []
+        try:
+            yield self
+            block_expectations: List[DeferredExpectationValidationResult] = list(
+                self._deferred_expectations
+            )
+            self._resolve_deferred_expectations()
+            deferred_result: DeferredExpectationValidationResult
+            for deferred_result in block_expectations:
+                # Raises error of first Expectation, whose validation failed.
+                deferred_result.resolve()
+        finally:
+            pending_expectations: List[
+                DeferredExpectationValidationResult
+            ] = self._deferred_expectations
+            self._deferred_expectations = None
+            if pending_expectations:
+                self._pending_deferred_expectations.extend(pending_expectations)
+
+    def _defer_expectation_validation(
+        self,
+        configuration: ExpectationConfiguration,
+        stored_configuration: ExpectationConfiguration,
+        runtime_configuration: dict,
+    ) -> DeferredExpectationValidationResult:
+        deferred_result = DeferredExpectationValidationResult(
+            validator=self,
+            configuration=configuration,
+            stored_configuration=stored_configuration,
+            runtime_configuration=runtime_configuration,
+        )
+        self._deferred_expectations.append(deferred_result)  # type: ignore[union-attr] # checked by caller
+        return deferred_result
+
+    def _resolve_deferred_expectations(self) -> None:
+        """Validates all pending deferred Expectations, one "graph_validate()" call per distinct runtime configuration.
+
+        Groups are validated independently: error, raised by one "graph_validate()" call, is recorded on results of its
+        group only (and is raised on their access), while other groups are still validated.
+        """
+        pending_expectations: List[DeferredExpectationValidationResult] = []
+        if self._deferred_expectations:
+            pending_expectations.extend(self._deferred_expectations)
+            self._deferred_expectations.clear()
+
+        pending_expectations.extend(self._pending_deferred_expectations)
+        self._pending_deferred_expectations.clear()
+        if not pending_expectations:
+            return
+
+        groups: Dict[str, List[DeferredExpectationValidationResult]] = defaultdict(list)
+        deferred_result: DeferredExpectationValidationResult
+        for deferred_result in pending_expectations:
+            groups[
+                json.dumps(
+                    convert_to_json_serializable(deferred_result.runtime_configuration),
+                    sort_keys=True,
+                )
+            ].append(deferred_result)
+
+        group: List[DeferredExpectationValidationResult]
+        for group in groups.values():
+            self._resolve_deferred_expectation_group(group=group)
+
+    def _resolve_deferred_expectation_group(
+        self, group: List[DeferredExpectationValidationResult]
+    ) -> None:
+        configurations: List[ExpectationConfiguration] = []
+        deferred_result: DeferredExpectationValidationResult
+        configuration: ExpectationConfiguration
+        for deferred_result in group:
+            # Same as "Expectation.validate()".
+            configuration = copy.deepcopy(deferred_result.configuration)
+            configuration.process_evaluation_parameters(
+                self._expectation_suite.evaluation_parameters,
+                True,
+                self._data_context,
+            )
+            configurations.append(configuration)
+
+        try:
+            evrs: List[ExpectationValidationResult] = self.graph_validate(
+                configurations=configurations,
+                runtime_configuration=copy.deepcopy(group[0].runtime_configuration),
+            )
+        except Exception as e:
+            logger.error(
+                f"Validation of {len(group)} deferred Expectations failed: {str(e)}"
+            )
+            for deferred_result in group:
+                deferred_result._set_exception(exception=e)
+
+            return
+
+        # "graph_validate()" does not preserve order of configurations (failures to build metric dependency graph come
+        # first); hence, results are matched to configurations, which they carry (with "batch_id" added).
+        evr: ExpectationValidationResult
+        remaining_evrs: List[ExpectationValidationResult] = list(evrs)
+        for deferred_result, configuration in zip(group, configurations):
+            configuration.kwargs.update({"batch_id": self.active_batch_id})
+            for evr in remaining_evrs:
+                if evr.expectation_config == configuration:
+                    remaining_evrs.remove(evr)
+                    break
+            else:
+                deferred_result._set_exception(
+                    exception=GreatExpectationsError(
+                        f'Missing validation result for deferred Expectation "{configuration.expectation_type}".'
+                    )
+                )
+                continue
+
+            if self._include_rendered_content:
+                evr.render()
+
+            deferred_result._set_result(result=evr)
+
     def _build_expectation_configuration(  # noqa: PLR0913
         self,
         expectation_type: str,
@@ -1024,38 +1193,43 @@ class Validator:
 
         processed_configurations: List[ExpectationConfiguration] = []
 
-        (
-            expectation_validation_graphs,
-            evrs,
-            processed_configurations,
-        ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
-            expectation_configurations=configurations,
-            processed_configurations=processed_configurations,
-            catch_exceptions=catch_exceptions,
-            runtime_configuration=runtime_configuration,
-        )
+        graph: ValidationGraph
+
+        with trace_span(
+            "build_validation_graph", "graph", num_expectations=len(configurations)
+        ) as span:
+            (
+                expectation_validation_graphs,
+                evrs,
+                processed_configurations,
+            ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                expectation_configurations=configurations,
+                processed_configurations=processed_configurations,
+                catch_exceptions=catch_exceptions,
+                runtime_configuration=runtime_configuration,
+            )
 
-        graph: ValidationGraph = (
-            self._generate_suite_level_graph_from_expectation_level_sub_graphs(
+            graph = self._generate_suite_level_graph_from_expectation_level_sub_graphs(
                 expectation_validation_graphs=expectation_validation_graphs
             )
-        )
+            span.set_attributes(num_edges=len(graph.edges))
 
         resolved_metrics: _MetricsDict
 
         try:
-            (
-                resolved_metrics,
-                evrs,
-                processed_configurations,
-            ) = self._resolve_suite_level_graph_and_process_metric_evaluation_errors(
-                graph=graph,
-                runtime_configuration=runtime_configuration,
-                expectation_validation_graphs=expectation_validation_graphs,
-                evrs=evrs,
-                processed_configurations=processed_configurations,
-                show_progress_bars=self._determine_progress_bars(),
-            )
+            with trace_span("resolve_validation_graph", "graph"):
+                (
+                    resolved_metrics,
+                    evrs,
+                    processed_configurations,
+                ) = self._resolve_suite_level_graph_and_process_metric_evaluation_errors(
+                    graph=graph,
+                    runtime_configuration=runtime_configuration,
+                    expectation_validation_graphs=expectation_validation_graphs,
+                    evrs=evrs,
+                    processed_configurations=processed_configurations,
+                    show_progress_bars=self._determine_progress_bars(),
+                )
         except Exception as err:
             # If a general Exception occurs during the execution of "ValidationGraph.resolve()", then
             # all expectations in the suite are impacted, because it is impossible to attribute the failure to a metric.
@@ -1180,8 +1354,22 @@ class Validator:
                 ]
             )
         )
+        terminal_metric_ids: Optional[Set[_MetricKey]] = None
+        if all(
+            expectation_validation_graph.graph.terminal_metric_ids is not None
+            for expectation_validation_graph in expectation_validation_graphs
+        ):
+            terminal_metric_ids = set(
+                itertools.chain.from_iterable(
+                    expectation_validation_graph.graph.terminal_metric_ids  # type: ignore[misc] # checked above
+                    for expectation_validation_graph in expectation_validation_graphs
+                )
+            )
+
         validation_graph = ValidationGraph(
-            execution_engine=self._execution_engine, edges=edges
+            execution_engine=self._execution_engine,
+            edges=edges,
+            terminal_metric_ids=terminal_metric_ids,
         )
         return validation_graph
 